@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Micro-benchmark of the arithmetic operators (number ⊕ number and str + str).
+Usage (from the nougaro root directory): python -m benchmarks.arithmetic [number of operations]"""
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# built-in python imports
+import os
+import sys
+import time
+
+# each iteration of the loop computes a list of 1000 operations
+OPERATIONS_PER_ITERATION = 1000
+CODE = "var s = \"a\"\n" \
+       "var t = \"b\"\n" \
+       "for i = 0 to {iterations} then\n" \
+       "    var l = [" + \
+       ", ".join(["(i + 1) * 2 - i % 7"] * 200 + ["s + t"] * 100 + ["i < 3"] * 100) + \
+       "]\n" \
+       "end\n"
+
+
+def main():
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+    code = CODE.format(iterations=operations // OPERATIONS_PER_ITERATION)
+
+    start = time.perf_counter()
+    _, error, _ = src.nougaro.run("<benchmark>", code, noug_dir, exec_from="<benchmark>", lexer_metas={})
+    end = time.perf_counter()
+    if error is not None:
+        print(error.as_string())
+        sys.exit(1)
+
+    print(f"{operations} operations in {end - start:.3f}s ({(end - start) / operations * 1e9:.0f}ns/op)")
+
+
+if __name__ == "__main__":
+    main()
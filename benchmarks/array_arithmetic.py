@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Scaling, summing and computing a dot product on numbers: arrays vs lists and `for` loops.
+Usage (from the nougaro root directory): python -m benchmarks.array_arithmetic [number of elements]"""
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# built-in python imports
+import os
+import sys
+import time
+
+SETUP = "var list_ = for i = 0 to {size} then i\n" \
+        "var array_ = array(list_)\n"
+# (name, code using a list and for loops, code using an array)
+OPERATIONS = [
+    ("scale and shift", "var result = for x in list_ then x * 2 + 1", "var result = array_ * 2 + 1"),
+    ("sum", "var total = 0\nfor x in list_ then var total += x", "var total = sum(array_)"),
+    ("dot product", "var total = 0\nfor i = 0 to len(list_) then var total += list_(i) * list_(i)",
+     "var total = dot(array_, array_)"),
+]
+
+
+def measure(session: src.nougaro.Session, code: str) -> float:
+    """Returns the duration of `code`, in seconds"""
+    start = time.perf_counter()
+    _, error = session.run(code)
+    end = time.perf_counter()
+    if error is not None:
+        print(error.as_string())
+        sys.exit(1)
+    return end - start
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+    session = src.nougaro.Session(noug_dir)
+    measure(session, SETUP.format(size=size))
+    print(f"{size} numbers")
+    for name, loop_code, array_code in OPERATIONS:
+        loop_duration = measure(session, loop_code)
+        array_duration = measure(session, array_code)
+        print(f"{name + ':':17}for loop {loop_duration:.3f}s, array {array_duration:.4f}s "
+              f"({loop_duration / array_duration:.0f} times faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Memory used by the tokens and the AST of a big source file, per thousand lines of code (KLOC).
+Usage (from the nougaro root directory): python -m benchmarks.ast_memory [number of lines]"""
+
+# IMPORTS
+# nougaro modules imports
+from src.lexer.lexer import Lexer
+from src.parser.parser import Parser
+# built-in python imports
+import gc
+import sys
+import time
+import tracemalloc
+
+# 20 lines of typical code
+BLOCK = """\
+def compute_{n}(first_value, second_value)(optional_value = 12)
+    var result = first_value * 2 + second_value - optional_value
+    if result > 100 then
+        var result = result // 3
+    elif result < 0 then
+        print("negative result in compute_{n}: " + str(result))
+    else
+        var result += 1
+    end
+    return result
+end
+
+var values_{n} = [1, 2, 3, 4, 5, "text", "more text", 3.14]
+for value in values_{n} then
+    if type(value) == "int" then
+        var total = compute_{n}(value, value + 1)
+        print("total: " + str(total))
+    end
+end
+"""
+LINES_PER_BLOCK = BLOCK.count("\n")
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    source = "".join(BLOCK.format(n=i) for i in range(lines // LINES_PER_BLOCK))
+    lines = source.count("\n")
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    tokens, error = Lexer("<benchmark>", source).make_tokens()
+    assert error is None and tokens is not None
+    ast = Parser(tokens).parse()
+    assert ast.error is None and ast.node is not None
+    end = time.perf_counter()
+    del tokens  # only the tokens used in the AST are kept
+    gc.collect()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{lines} lines lexed and parsed in {end - start:.3f}s")
+    print(f"AST memory: {memory / 1024:.0f} KiB ({memory / 1024 / (lines / 1000):.0f} KiB/KLOC)")
+
+
+if __name__ == "__main__":
+    main()
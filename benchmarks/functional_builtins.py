@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""`map`, `filter`, `reduce` and `sum` against the equivalent `for` loops.
+Usage (from the nougaro root directory): python -m benchmarks.functional_builtins [number of elements]"""
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# built-in python imports
+import os
+import sys
+import time
+
+SETUP = "def double(x) -> x * 2\n" \
+        "def is_even(x) -> x % 2 == 0\n" \
+        "def add(a, b) -> a + b\n" \
+        "var numbers = list(range({n}))\n"
+CASES = (
+    ("map (nougaro function)",
+     "var result = map(double, numbers)",
+     "var result = for x in numbers then double(x)"),
+    ("map (built-in function)",
+     "var result = map(str, numbers)",
+     "var result = for x in numbers then str(x)"),
+    ("filter",
+     "var result = filter(is_even, numbers)",
+     "var result = []\nfor x in numbers then if is_even(x) then append(result, x)"),
+    ("reduce",
+     "var result = reduce(add, numbers)",
+     "var result = 0\nfor x in numbers then var result = add(result, x)"),
+    ("sum",
+     "var result = sum(numbers)",
+     "var result = 0\nfor x in numbers then var result += x"),
+)
+
+
+def measure(session: src.nougaro.Session, code: str) -> float:
+    """Returns the duration of `code`, in seconds"""
+    start = time.perf_counter()
+    _, error = session.run(code)
+    end = time.perf_counter()
+    if error is not None:
+        print(error.as_string())
+        sys.exit(1)
+    return end - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**5
+    noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+    session = src.nougaro.Session(noug_dir)
+    session.run(SETUP.format(n=n))
+    print(f"on {n} elements:")
+    for name, builtin, loop in CASES:
+        builtin_duration = measure(session, builtin)
+        builtin_result, _ = session.run("result")
+        loop_duration = measure(session, loop)
+        loop_result, _ = session.run("result")
+        assert builtin_result.elements[0].get_comparison_eq(loop_result.elements[0])[0].is_true()
+        print(f"{name:24} built-in: {builtin_duration:.3f}s, loop: {loop_duration:.3f}s "
+              f"(x{loop_duration / builtin_duration:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""A map/filter pipeline over a generated stream of ints, with generators and with lists.
+Usage (from the nougaro root directory): python -m benchmarks.generator_pipeline [size of the stream] [list size]
+Generators keep one element at a time in memory, lists keep the whole stream. The list pipeline is only measured on
+`list size` elements (10⁵ by default), as it needs memory for all of them."""
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# built-in python imports
+import os
+import sys
+import time
+import tracemalloc
+
+GENERATORS = "def count(n)\n" \
+             "    var i = 0\n" \
+             "    while i < n then\n" \
+             "        yield i\n" \
+             "        var i += 1\n" \
+             "    end\n" \
+             "end\n" \
+             "def evens(source)\n" \
+             "    for x in source then if x % 2 == 0 then yield x\n" \
+             "end\n" \
+             "def squares(source)\n" \
+             "    for x in source then yield x * x\n" \
+             "end\n"
+LISTS = "def count_list(n) -> for i = 0 to n then i\n" \
+        "def evens_list(source)\n" \
+        "    var result = []\n" \
+        "    for x in source then if x % 2 == 0 then append(result, x)\n" \
+        "    return result\n" \
+        "end\n" \
+        "def squares_list(source) -> for x in source then x * x\n"
+CONSUME = "def consume(source)\n" \
+          "    var total = 0\n" \
+          "    for x in source then var total += x\n" \
+          "    return total\n" \
+          "end\n"
+
+
+def measure(session: src.nougaro.Session, code: str, trace_memory: bool) -> tuple[float, int]:
+    """Returns the duration of `code`, in seconds, and the peak of memory allocated while running it, in bytes (0 if
+    `trace_memory` is False)"""
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    _, error = session.run(code)
+    end = time.perf_counter()
+    peak = 0
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    if error is not None:
+        print(error.as_string())
+        sys.exit(1)
+    return end - start, peak
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**7
+    list_size = int(sys.argv[2]) if len(sys.argv) > 2 else 10**5
+    noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+    session = src.nougaro.Session(noug_dir)
+    session.run(GENERATORS + LISTS + CONSUME)
+    for pipeline in ("squares(evens(count({n})))", "squares_list(evens_list(count_list({n})))"):
+        for n in (list_size // 10, list_size):
+            _, peak = measure(session, f"consume({pipeline.format(n=n)})", True)
+            print(f"{pipeline.format(n=n)}: peak memory {peak / 2**20:.2f} MiB")
+
+    duration, _ = measure(session, f"consume(squares(evens(count({size}))))", False)
+    print(f"generators on {size} elements: {duration:.1f}s ({duration / size * 1e6:.1f}µs/element)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Memory used by a range and by the list of the same ints, and the duration of `len`, indexing and `in` on both.
+Usage (from the nougaro root directory): python -m benchmarks.lazy_range [size]"""
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# built-in python imports
+import os
+import sys
+import time
+import tracemalloc
+
+TESTS = 1000
+OPERATIONS = "for i = 0 to {tests} then len({collection}) + {collection}(i) + ({size} - i in {collection})\n"
+
+
+def measure(session: src.nougaro.Session, code: str) -> tuple[float, int]:
+    """Returns the duration of `code`, in seconds, and the peak of memory allocated while running it, in bytes"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    _, error = session.run(code)
+    end = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if error is not None:
+        print(error.as_string())
+        sys.exit(1)
+    return end - start, peak
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+    session = src.nougaro.Session(noug_dir)
+    _, range_memory = measure(session, f"var range_ = range({size})")
+    _, list_memory = measure(session, "var list_ = list(range_)")
+    print(f"{size} ints")
+    print(f"memory: range {range_memory / 2**10:.1f} KiB, list {list_memory / 2**20:.1f} MiB")
+
+    range_duration, _ = measure(session, OPERATIONS.format(tests=TESTS, size=size, collection="range_"))
+    list_duration, _ = measure(session, OPERATIONS.format(tests=TESTS, size=size, collection="list_"))
+    print(f"{TESTS} len, indexing and `in`: range {range_duration:.3f}s, list {list_duration:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Importing every lib of lib_/ with `import`.
+Usage (from the nougaro root directory): python -m benchmarks.lib_import [repetitions]
+The first import of a lib (“cold”) is measured in a new python process, as at the start of a program: the python module
+of the lib is loaded. The next imports (“warm”) only create the module value. The functions of the libs are created
+when they are used for the first time, so that these times do not depend on the number of functions of the lib."""
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# built-in python imports
+import os
+import subprocess
+import sys
+import time
+
+NOUG_DIR = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+LIBS = sorted(
+    file_name[:-4] for file_name in os.listdir(os.path.join(NOUG_DIR, "lib_"))
+    if file_name.endswith("_.py") and file_name != "lib_to_make_libs.py"
+)
+
+
+def measure(session: src.nougaro.Session, code: str, repetitions: int = 1) -> float:
+    """Returns the mean duration of `code`, in seconds"""
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        _, error = session.run(code)
+        if error is not None:
+            print(error.as_string())
+            sys.exit(1)
+    return (time.perf_counter() - start) / repetitions
+
+
+def cold(code: str, repetitions: int) -> float:
+    """Returns the best duration of `code` in a new python process, in seconds"""
+    best = float("inf")
+    for _ in range(repetitions):
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.lib_import", "--cold", code],
+            cwd=NOUG_DIR, capture_output=True, text=True, check=True
+        ).stdout
+        best = min(best, float(output))
+    return best
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--cold":  # run by `cold`
+        session = src.nougaro.Session(NOUG_DIR)
+        print(measure(session, sys.argv[2]))
+        return
+
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    session = src.nougaro.Session(NOUG_DIR)
+    print(f"{'lib':13} {'cold':>9} {'warm':>9}")
+    for lib in LIBS:
+        cold_duration = cold(f"import {lib}", repetitions)
+        measure(session, f"import {lib}")
+        warm_duration = measure(session, f"import {lib}", repetitions * 100)
+        print(f"{lib:13} {cold_duration * 1e3:7.2f}ms {warm_duration * 1e3:7.3f}ms")
+    all_libs = "\n".join(f"import {lib}" for lib in LIBS)
+    print(f"{'all the libs':13} {cold(all_libs, repetitions) * 1e3:7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Equality, `in` and deduplication of lists of lists.
+Usage (from the nougaro root directory): python -m benchmarks.list_equality [number of inner lists] [repetitions]"""
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# built-in python imports
+import os
+import sys
+import time
+
+SETUP = "var a = for i = 0 to {n} then [i, i + 1, \"x\"]\n" \
+        "var b = for i = 0 to {n} then [i, i + 1, \"x\"]\n" \
+        "var last = [{n} - 1, {n}, \"x\"]\n" \
+        "var keys = set(a)\n"
+CASES = (
+    ("a == b", "a == b"),
+    ("last in a", "last in a"),
+    ("len(set(a))", "len(set(a))"),
+    ("last in keys", "last in keys"),
+)
+
+
+def measure(session: src.nougaro.Session, code: str, repetitions: int) -> float:
+    """Returns the mean duration of `code`, in seconds"""
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        _, error = session.run(code)
+        if error is not None:
+            print(error.as_string())
+            sys.exit(1)
+    return (time.perf_counter() - start) / repetitions
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**5
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+    session = src.nougaro.Session(noug_dir)
+    _, error = session.run(SETUP.format(n=n))
+    assert error is None, error
+    print(f"on {n} lists of 3 elements:")
+    for name, code in CASES:
+        print(f"{name:14} {measure(session, code, repetitions) * 1e3:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
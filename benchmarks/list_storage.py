@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Memory and speed of a big list of ints, stored unboxed (see ListStorage) or generically.
+A list is switched to the generic storage by appending `None` to it (and popping it).
+Usage (from the nougaro root directory): python -m benchmarks.list_storage [number of elements]"""
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# built-in python imports
+import os
+import sys
+import time
+import tracemalloc
+
+OPERATIONS = [
+    ("sort", "var sorted_ = sort(list_)"),
+    ("max", "var max_ = max(list_, True)"),
+    ("membership", "var found = -1 in list_"),
+    ("for loop", "for x in list_ then x"),
+]
+
+
+def run(session: src.nougaro.Session, code: str) -> float:
+    """Runs `code` and returns its duration, in seconds"""
+    start = time.perf_counter()
+    _, error = session.run(code)
+    end = time.perf_counter()
+    if error is not None:
+        print(error.as_string())
+        sys.exit(1)
+    return end - start
+
+
+def measure(noug_dir: str, size: int, generic: bool) -> tuple[int, list[float]]:
+    """Returns the memory used by the list (in bytes) and the durations of the operations"""
+    session = src.nougaro.Session(noug_dir)
+    run(session, "var list_ = []")
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    run(session, f"var list_ = for i = 0 to {size} then {size} - i")
+    if generic:
+        run(session, "append(list_, None)\npop(list_)")
+    memory = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return memory, [run(session, code) for _, code in OPERATIONS]
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+    unboxed_memory, unboxed_durations = measure(noug_dir, size, generic=False)
+    generic_memory, generic_durations = measure(noug_dir, size, generic=True)
+    print(f"list of {size} ints")
+    print(f"{'memory:':12}unboxed {unboxed_memory / 2**20:.1f}MiB, generic {generic_memory / 2**20:.1f}MiB")
+    for (name, _), unboxed, generic in zip(OPERATIONS, unboxed_durations, generic_durations):
+        print(f"{name + ':':12}unboxed {unboxed:.3f}s, generic {generic:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Functions of the math lib applied to every element of a list or an array, against calling them in a `for` loop.
+Usage (from the nougaro root directory): python -m benchmarks.math_vectorised [number of elements]"""
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# built-in python imports
+import os
+import sys
+import time
+
+SETUP = "import math\n" \
+        "var numbers = for i = 0 to {n} then (i + 1) / 100\n" \
+        "var numbers_array = array(numbers)\n"
+CASES = (
+    ("math.sin", "for x in numbers then math.sin(x)", "math.sin(numbers)", "math.sin(numbers_array)"),
+    ("math.sqrt", "for x in numbers then math.sqrt(x)", "math.sqrt(numbers)", "math.sqrt(numbers_array)"),
+    ("math.log (base 2)", "for x in numbers then math.log(x, 2)", "math.log(numbers, 2)", "math.log(numbers_array, 2)"),
+    ("math.floor", "for x in numbers then math.floor(x)", "math.floor(numbers)", "math.floor(numbers_array)"),
+)
+
+
+def measure(session: src.nougaro.Session, code: str) -> float:
+    """Returns the duration of `code`, in seconds"""
+    start = time.perf_counter()
+    _, error = session.run(code)
+    end = time.perf_counter()
+    if error is not None:
+        print(error.as_string())
+        sys.exit(1)
+    return end - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+    session = src.nougaro.Session(noug_dir)
+    _, error = session.run(SETUP.format(n=n))
+    assert error is None, error
+    print(f"on {n} elements (millions of elements per second):")
+    for name, loop, on_list, on_array in CASES:
+        throughputs = [n / measure(session, code) / 1e6 for code in (loop, on_list, on_array)]
+        print(f"{name:18} loop: {throughputs[0]:.2f}, list: {throughputs[1]:.2f}, array: {throughputs[2]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
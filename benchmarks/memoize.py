@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Recursive fibonacci and edit distance, with and without `memoize`.
+Usage (from the nougaro root directory): python -m benchmarks.memoize [n for fibonacci] [length of the words]
+Without memoization, fib(n) makes about 1.6 * 1.618^n calls, and the edit distance about 3^length: fib(30) takes several
+minutes."""
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# built-in python imports
+import os
+import sys
+import time
+
+SETUP = "def fib(n) -> if n < 2 then n else fib(n - 1) + fib(n - 2)\n" \
+        "def memo_fib(n) -> if n < 2 then n else memo_fib(n - 1) + memo_fib(n - 2)\n" \
+        "var memo_fib = memoize(memo_fib)\n" \
+        "def distance(a, b, i, j)\n" \
+        "    if i == 0 then return j\n" \
+        "    if j == 0 then return i\n" \
+        "    if a(i - 1) == b(j - 1) then return distance(a, b, i - 1, j - 1)\n" \
+        "    return 1 + min([distance(a, b, i - 1, j), distance(a, b, i, j - 1), distance(a, b, i - 1, j - 1)])\n" \
+        "end\n" \
+        "def memo_distance(a, b, i, j)\n" \
+        "    if i == 0 then return j\n" \
+        "    if j == 0 then return i\n" \
+        "    if a(i - 1) == b(j - 1) then return memo_distance(a, b, i - 1, j - 1)\n" \
+        "    return 1 + min([memo_distance(a, b, i - 1, j), memo_distance(a, b, i, j - 1), " \
+        "memo_distance(a, b, i - 1, j - 1)])\n" \
+        "end\n" \
+        "var memo_distance = memoize(memo_distance)\n" \
+        "var a = \"{a}\"\n" \
+        "var b = \"{b}\"\n"
+CASES = (
+    ("fib", "fib({n})"),
+    ("memoized fib", "memo_fib({n})"),
+    ("edit distance", "distance(a, b, len(a), len(b))"),
+    ("memoized edit distance", "memo_distance(a, b, len(a), len(b))"),
+)
+
+
+def measure(session: src.nougaro.Session, code: str) -> tuple[float, str]:
+    """Returns the duration of `code`, in seconds, and its result"""
+    start = time.perf_counter()
+    result, error = session.run(code)
+    end = time.perf_counter()
+    if error is not None:
+        print(error.as_string())
+        sys.exit(1)
+    return end - start, str(result.elements[-1])
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    length = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+    noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+    # two words of `length` letters with few letters in common
+    a = "".join("abcdefgh"[i * 3 % 8] for i in range(length))
+    b = "".join("abcdefgh"[i * 5 % 7] for i in range(length))
+
+    session = src.nougaro.Session(noug_dir)
+    _, error = session.run(SETUP.format(a=a, b=b))
+    assert error is None, error
+    print(f"fib({n}), edit distance between {a!r} and {b!r}:")
+    for name, code in CASES:
+        duration, result = measure(session, code.format(n=n))
+        print(f"{name:22} {duration:9.3f}s (result: {result})")
+
+    for function in ("memo_fib", "memo_distance"):
+        info, error = session.run(f"memo_info({function})")
+        assert error is None, error
+        print(f"{function}: {info.elements[-1]}")
+
+
+if __name__ == "__main__":
+    main()
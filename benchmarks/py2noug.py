@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Converting python structures of about 10⁶ nodes to nougaro values (py2noug) and back (noug2py).
+Usage (from the nougaro root directory): python -m benchmarks.py2noug [number of nodes]
+The structures are: lists nested one in the other, records (dicts of strs, lists and tuples), a tree of lists of
+numbers, and a list containing the same list many times."""
+
+# IMPORTS
+# nougaro modules imports
+from src.lexer.position import DEFAULT_POSITION
+from src.runtime.values.tools.py2noug import py2noug, noug2py
+# built-in python imports
+from typing import Any
+import sys
+import time
+
+
+def nested(n: int) -> list[Any]:
+    """n lists nested one in the other"""
+    list_: list[Any] = []
+    for _ in range(n - 1):
+        list_ = [list_]
+    return list_
+
+
+def records(n: int) -> list[Any]:
+    """n / 8 dicts of 7 nodes"""
+    return [{"id": i, "name": f"record {i}", "tags": ["a", "b"], "position": (i, i + 1)} for i in range(n // 8)]
+
+
+def tree(n: int) -> list[Any]:
+    """n / 11 lists of 10 numbers, in lists of 10 lists"""
+    leaves = [[float(i + j) for j in range(10)] for i in range(n // 11)]
+    return [leaves[i:i + 10] for i in range(0, len(leaves), 10)]
+
+
+def shared(n: int) -> list[Any]:
+    """The same list of 1000 strs, n / 1000 times"""
+    list_ = [str(i) for i in range(1000)]
+    return [list_] * (n // 1000)
+
+
+STRUCTURES = (("nested lists", nested), ("records", records), ("tree of numbers", tree), ("shared list", shared))
+
+
+def measure(function, *args) -> tuple[float, Any]:
+    """Returns the duration of `function(*args)`, in seconds, and its result"""
+    start = time.perf_counter()
+    try:
+        result = function(*args)
+    except RecursionError:
+        return float("nan"), None
+    return time.perf_counter() - start, result
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    pos_start, pos_end = DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()
+    print(f"on {n} nodes:")
+    for name, make in STRUCTURES:
+        structure = make(n)
+        to_noug_duration, value = measure(py2noug, structure, pos_start, pos_end)
+        if value is None:
+            print(f"{name:16} py2noug: RecursionError")
+            continue
+        to_py_duration, python_value = measure(noug2py, value)
+        if python_value is None:
+            print(f"{name:16} py2noug: {to_noug_duration:6.3f}s   noug2py: RecursionError")
+            continue
+        print(f"{name:16} py2noug: {to_noug_duration:6.3f}s   noug2py: {to_py_duration:6.3f}s")
+
+
+if __name__ == "__main__":
+    main()
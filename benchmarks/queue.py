@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""A first-in first-out queue: every element is appended at the end, then popped from the front (only the pops are
+measured).
+Usage (from the nougaro root directory): python -m benchmarks.queue [sizes of the queue...]
+Popping the first element of a list moves all the other ones, so the list queue takes quadratic time. The deque queue
+takes linear time."""
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# built-in python imports
+import os
+import sys
+import time
+
+FILL = "var queue = {constructor}\n" \
+       "for i = 0 to {n} then append(queue, i)\n"
+EMPTY = "var total = 0\n" \
+        "while queue then var total += pop(queue, 0)\n"
+
+
+def measure(session: src.nougaro.Session, constructor: str, n: int) -> float:
+    """Fills a queue with `n` elements, then returns the duration of emptying it, in seconds, and checks the result"""
+    _, error = session.run(FILL.format(constructor=constructor, n=n))
+    assert error is None
+    start = time.perf_counter()
+    _, error = session.run(EMPTY)
+    end = time.perf_counter()
+    if error is not None:
+        print(error.as_string())
+        sys.exit(1)
+    result, error = session.run("total")
+    assert error is None and result.elements[0].value == n * (n - 1) // 2
+    return end - start
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] if len(sys.argv) > 1 else [10**4, 10**5, 4 * 10**5]
+    noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+    session = src.nougaro.Session(noug_dir)
+    for n in sizes:
+        list_duration = measure(session, "[]", n)
+        deque_duration = measure(session, "deque()", n)
+        print(f"{n} elements: list {list_duration:.3f}s ({list_duration / n * 1e6:.1f}µs/element), "
+              f"deque {deque_duration:.3f}s ({deque_duration / n * 1e6:.1f}µs/element)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Generating random numbers by batches (`random.randints`, `random.randoms`, `random.choices`) against one call per
+number in a `for` loop.
+Usage (from the nougaro root directory): python -m benchmarks.random_batch [number of values]"""
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# built-in python imports
+import os
+import sys
+import time
+
+SETUP = "import random\n" \
+        "var faces = [1, 2, 3, 4, 5, 6]\n"
+CASES = (
+    ("sums of two dices",
+     "var result = for i = 0 to {n} then random.randint(1, 6) + random.randint(1, 6)",
+     "var result = random.randints(1, 6, {n}) + random.randints(1, 6, {n})"),
+    ("floats",
+     "var result = for i = 0 to {n} then random.random()",
+     "var result = random.randoms({n})"),
+    ("elements of a list",
+     "var result = for i = 0 to {n} then random.choice(faces)",
+     "var result = random.choices(faces, {n})"),
+)
+
+
+def measure(session: src.nougaro.Session, code: str) -> float:
+    """Returns the duration of `code`, in seconds"""
+    start = time.perf_counter()
+    _, error = session.run(code)
+    end = time.perf_counter()
+    if error is not None:
+        print(error.as_string())
+        sys.exit(1)
+    return end - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**5
+    noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+    session = src.nougaro.Session(noug_dir)
+    _, error = session.run(SETUP)
+    assert error is None, error
+    print(f"{n} values:")
+    for name, loop, batch in CASES:
+        loop_duration = measure(session, loop.format(n=n))
+        batch_duration = measure(session, batch.format(n=n))
+        print(f"{name:20} loop: {loop_duration:.3f}s, batch: {batch_duration:.3f}s "
+              f"(x{loop_duration / batch_duration:.0f})")
+
+
+if __name__ == "__main__":
+    main()
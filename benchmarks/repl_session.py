@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Per-line latency of a scripted interactive session, where every line defines something new.
+Usage (from the nougaro root directory): python -m benchmarks.repl_session [number of lines] [--run]
+With --run, every line is run using src.nougaro.run, like the shell did before sessions existed."""
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# built-in python imports
+import os
+import sys
+import time
+
+LINES = [
+    "var value_{n} = {n} * 2 + 1",
+    "def function_{n}(x) -> x + value_{n}",
+    "var result_{n} = function_{n}({n})",
+    "if result_{n} > 10 then var big_{n} = True else var big_{n} = False",
+]
+SAMPLE_SIZE = 500  # number of lines used to compute the latency at the beginning and at the end of the session
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    lines_count = int(args[0]) if len(args) > 0 else 10_000
+    use_run = "--run" in sys.argv
+    noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+    session = None if use_run else src.nougaro.Session(noug_dir)
+    metas = None
+    durations: list[float] = []
+    for i in range(lines_count):
+        line = LINES[i % len(LINES)].format(n=i // len(LINES))
+        start = time.perf_counter()
+        if session is None:
+            _, error, metas = src.nougaro.run("<stdin>", line, noug_dir, lexer_metas=metas)
+        else:
+            _, error = session.run(line)
+        durations.append(time.perf_counter() - start)
+        if error is not None:
+            print(error.as_string())
+            sys.exit(1)
+
+    first = sum(durations[:SAMPLE_SIZE]) / SAMPLE_SIZE
+    last = sum(durations[-SAMPLE_SIZE:]) / SAMPLE_SIZE
+    print(f"{lines_count} lines ({'run' if use_run else 'session'}) in {sum(durations):.3f}s")
+    print(f"first {SAMPLE_SIZE} lines: {first * 1e6:.0f}µs/line, last {SAMPLE_SIZE} lines: {last * 1e6:.0f}µs/line")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Latency of running a small script: cold (`python shell.py file`) vs warm (`nougaro --server` and a client).
+Usage (from the nougaro root directory): python -m benchmarks.server_latency [number of runs]"""
+
+# IMPORTS
+# nougaro modules imports
+import src.server
+# built-in python imports
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPT = """var total = 0
+for i = 0 to 100 then var total += i
+print(total)
+"""
+
+
+def measure(runs: int, function) -> float:
+    """Returns the mean duration of `function()`, in seconds"""
+    start = time.perf_counter()
+    for _ in range(runs):
+        function()
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+    shell = os.path.join(noug_dir, "shell.py")
+    client = os.path.join(noug_dir, "client.py")
+
+    with tempfile.TemporaryDirectory() as directory:
+        script = os.path.join(directory, "script.noug")
+        with open(script, "w", encoding="UTF-8") as file:
+            file.write(SCRIPT)
+        socket_path = os.path.join(directory, "nougaro.sock")
+
+        cold = measure(runs, lambda: subprocess.run([sys.executable, shell, script], check=True, capture_output=True))
+
+        server = subprocess.Popen([sys.executable, shell, "--server", socket_path], stdout=subprocess.DEVNULL)
+        try:
+            while not os.path.exists(socket_path):
+                time.sleep(0.01)
+            warm_client = measure(
+                runs, lambda: subprocess.run([sys.executable, client, "--socket", socket_path, script],
+                                             check=True, capture_output=True)
+            )
+            warm_request = measure(runs, lambda: src.server.send_request([script], socket_path, output=io.BytesIO()))
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f"{runs} runs of a small script")
+    print(f"cold (python shell.py file):           {cold * 1000:.1f}ms/run")
+    print(f"warm (python client.py file):          {warm_client * 1000:.1f}ms/run")
+    print(f"warm (request from a running process): {warm_request * 1000:.1f}ms/run")
+
+
+if __name__ == "__main__":
+    main()
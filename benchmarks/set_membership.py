@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Membership tests (`value in collection`) on a set and on a list of the same size.
+Usage (from the nougaro root directory): python -m benchmarks.set_membership [size of the collections] [number of tests]
+The list is much slower, so it is only tested LIST_TESTS_DIVISOR times less often."""
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# built-in python imports
+import os
+import sys
+import time
+
+LIST_TESTS_DIVISOR = 100
+SETUP = "var list_ = for i = 0 to {size} then i\n" \
+        "var set_ = set(list_)\n"
+# half of the tested values are in the collection
+TESTS = "for i = 0 to {tests} then (i * 7919) % ({size} * 2) in {collection}\n"
+
+
+def measure(session: src.nougaro.Session, code: str) -> float:
+    """Returns the duration of `code`, in seconds"""
+    start = time.perf_counter()
+    _, error = session.run(code)
+    end = time.perf_counter()
+    if error is not None:
+        print(error.as_string())
+        sys.exit(1)
+    return end - start
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**5
+    tests = int(sys.argv[2]) if len(sys.argv) > 2 else 10**4
+    list_tests = max(tests // LIST_TESTS_DIVISOR, 1)
+    noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+    session = src.nougaro.Session(noug_dir)
+    measure(session, SETUP.format(size=size))
+    set_duration = measure(session, TESTS.format(tests=tests, size=size, collection="set_"))
+    list_duration = measure(session, TESTS.format(tests=list_tests, size=size, collection="list_"))
+
+    set_per_test = set_duration / tests
+    list_per_test = list_duration / list_tests
+    print(f"membership tests on {size} elements")
+    print(f"set:  {tests} tests in {set_duration:.3f}s ({set_per_test * 1e6:.1f}µs/test)")
+    print(f"list: {list_tests} tests in {list_duration:.3f}s ({list_per_test * 1e6:.1f}µs/test)")
+    print(f"the set is {list_per_test / set_per_test:.0f} times faster")
+
+
+if __name__ == "__main__":
+    main()
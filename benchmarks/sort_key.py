@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Sorting records [id, group] by group with `sort(records, None, key)`, then checking that the sort is stable.
+Usage (from the nougaro root directory): python -m benchmarks.sort_key [number of records]
+The key function is called once per record. With a built-in key function (`len` on the names), no nougaro code runs
+per record."""
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# built-in python imports
+import os
+import sys
+import time
+
+SETUP = "var records = for i = 0 to {n} then [i, (i * 7919) % 1000]\n" \
+        "var names = for i = 0 to {n} then str(i % 997)\n" \
+        "def group(record) -> record(1)\n"
+CASES = (
+    ("nougaro key function", "var result = sort(records, None, group)"),
+    ("built-in key function", "var result = sort(names, None, len)"),
+    ("ints, without key", "var result = sort(map(group, records))"),
+)
+# the ids of the records of a group must still be in increasing order
+CHECK_STABILITY = "var sorted_records = sort(records, None, group)\n" \
+                  "var stable = True\n" \
+                  "for i = 1 to len(sorted_records) then\n" \
+                  "    var previous = sorted_records(i - 1)\n" \
+                  "    var current = sorted_records(i)\n" \
+                  "    if previous(1) == current(1) and previous(0) > current(0) then var stable = False\n" \
+                  "end\n" \
+                  "stable"
+
+
+def measure(session: src.nougaro.Session, code: str) -> float:
+    """Returns the duration of `code`, in seconds"""
+    start = time.perf_counter()
+    _, error = session.run(code)
+    end = time.perf_counter()
+    if error is not None:
+        print(error.as_string())
+        sys.exit(1)
+    return end - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**5
+    noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+    session = src.nougaro.Session(noug_dir)
+    _, error = session.run(SETUP.format(n=n))
+    assert error is None, error
+    print(f"on {n} records:")
+    for name, code in CASES:
+        duration = measure(session, code)
+        print(f"{name:22} {duration:.2f}s ({duration / n * 1e6:.2f}µs/record)")
+
+    result, error = session.run(CHECK_STABILITY)
+    assert error is None and result.elements[-1].is_true(), "the sort is not stable"
+    print("the sort is stable")
+
+
+if __name__ == "__main__":
+    main()
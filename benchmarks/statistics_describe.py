@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""`statistics.describe` against calling `mean`, `median`, `quantiles` and `mode` one after the other, and feeding the
+same samples to the accumulators of the statistics module.
+Usage (from the nougaro root directory): python -m benchmarks.statistics_describe [number of samples]"""
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# built-in python imports
+import os
+import sys
+import time
+
+SETUP = "import statistics\n" \
+        "var samples = for i = 0 to {n} then ((i * 7919) % 10007) / 10\n"
+CASES = (
+    ("mean, median, quantiles, mode",
+     "var result = [statistics.mean(samples), statistics.median(samples), statistics.quantiles(samples), "
+     "statistics.mode(samples)]"),
+    ("describe", "var result = statistics.describe(samples)"),
+    ("running_stats", "var result = statistics.summary(statistics.feed(statistics.running_stats(), samples))"),
+    ("quantile_sketch", "var result = statistics.summary(statistics.feed(statistics.quantile_sketch(), samples))"),
+    ("mode_sketch", "var result = statistics.summary(statistics.feed(statistics.mode_sketch(), samples))"),
+)
+
+
+def measure(session: src.nougaro.Session, code: str) -> float:
+    """Returns the duration of `code`, in seconds"""
+    start = time.perf_counter()
+    _, error = session.run(code)
+    end = time.perf_counter()
+    if error is not None:
+        print(error.as_string())
+        sys.exit(1)
+    return end - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+    session = src.nougaro.Session(noug_dir)
+    _, error = session.run(SETUP.format(n=n))
+    assert error is None, error
+    print(f"on {n} samples:")
+    for name, code in CASES:
+        duration = measure(session, code)
+        print(f"{name:30} {duration:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""`statistics.median` and `statistics.quantiles` on a list of numbers, against the previous implementation (every
+element boxed, copied to a python list, then sorted by the python `statistics` module).
+Usage (from the nougaro root directory): python -m benchmarks.statistics_median [number of samples]"""
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# built-in python imports
+import os
+import statistics
+import sys
+import time
+
+SETUP = "import statistics\n" \
+        "var samples = for i = 0 to {n} then ((i * 7919) % 100003) / 10\n"
+CASES = (
+    ("median", "statistics.median(samples)", lambda data: statistics.median(data)),
+    ("quartiles", "statistics.quantiles(samples)", lambda data: statistics.quantiles(data)),
+    ("percentiles", "statistics.quantiles(samples, 100)", lambda data: statistics.quantiles(data, n=100)),
+)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+    session = src.nougaro.Session(noug_dir)
+    _, error = session.run(SETUP.format(n=n))
+    assert error is None, error
+    samples, _ = session.run("samples")
+    samples = samples.elements[0]
+    print(f"on {n} samples:")
+    for name, code, previous in CASES:
+        start = time.perf_counter()
+        result, error = session.run(code)
+        duration = time.perf_counter() - start
+        if error is not None:
+            print(error.as_string())
+            sys.exit(1)
+
+        start = time.perf_counter()
+        expected = previous([e.value for e in samples.iter_values()])
+        previous_duration = time.perf_counter() - start
+        result = result.elements[0]
+        assert (result.value if name == "median" else [e.value for e in result.iter_values()]) == expected
+        print(f"{name:12} {duration:.3f}s, previously {previous_duration:.3f}s (x{previous_duration / duration:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Building a big str from many small fragments: string builder, `join` and `var s += fragment`.
+Usage (from the nougaro root directory): python -m benchmarks.string_builder [number of fragments]
+`var s += fragment` copies the whole str at every step, so it is only measured on small numbers of fragments, to show
+how its duration grows."""
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# built-in python imports
+import os
+import sys
+import time
+
+FRAGMENT = "0123456789"
+CONCATENATION_SIZES = (10**4, 2 * 10**4, 4 * 10**4)
+BUILDER = "var builder = string_builder()\n" \
+          "for i = 0 to {fragments} then append(builder, fragment)\n" \
+          "var result = build(builder)\n"
+JOIN = "var fragments = for i = 0 to {fragments} then fragment\n" \
+       "var result = join(fragments)\n"
+CONCATENATION = "var result = \"\"\n" \
+                "for i = 0 to {fragments} then var result += fragment\n"
+
+
+def measure(session: src.nougaro.Session, code: str, fragments: int) -> float:
+    """Returns the duration of `code`, in seconds, and checks the length of the result"""
+    start = time.perf_counter()
+    _, error = session.run(code)
+    end = time.perf_counter()
+    if error is not None:
+        print(error.as_string())
+        sys.exit(1)
+    result, error = session.run("len(result)")
+    assert error is None and result.elements[0].value == fragments * len(FRAGMENT)
+    return end - start
+
+
+def main():
+    fragments = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+    session = src.nougaro.Session(noug_dir)
+    session.run(f"var fragment = \"{FRAGMENT}\"")
+    print(f"building a str of {fragments * len(FRAGMENT) / 10**6:g} MB from {fragments} fragments")
+    builder = measure(session, BUILDER.format(fragments=fragments), fragments)
+    print(f"string builder: {builder:.3f}s ({builder / fragments * 1e6:.2f}µs/fragment)")
+    join = measure(session, JOIN.format(fragments=fragments), fragments)
+    print(f"join:           {join:.3f}s ({join / fragments * 1e6:.2f}µs/fragment)")
+
+    print("var s += fragment:")
+    for size in CONCATENATION_SIZES:
+        concatenation = measure(session, CONCATENATION.format(fragments=size), size)
+        print(f"  {size} fragments: {concatenation:.3f}s ({concatenation / size * 1e6:.2f}µs/fragment)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Overhead of `time.bench`: the time per call it measures for a function that does nothing, against the same
+measure done with a `for` loop in nougaro code.
+Usage (from the nougaro root directory): python -m benchmarks.time_bench [number of calls]"""
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# built-in python imports
+import os
+import sys
+
+SETUP = "import time\n" \
+        "def nothing() -> None\n"
+BENCH = "time.bench(nothing, 5, {n})(\"min\")"
+LOOP = "var start = time.perf_counter_ns()\n" \
+       "for i = 0 to {n} then nothing()\n" \
+       "(time.perf_counter_ns() - start) / {n} / 10^9"
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**5
+    noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+    session = src.nougaro.Session(noug_dir)
+    _, error = session.run(SETUP)
+    assert error is None, error
+    results = []
+    for code in (BENCH, LOOP):
+        result, error = session.run(code.format(n=n))
+        if error is not None:
+            print(error.as_string())
+            sys.exit(1)
+        results.append(result.elements[-1].value)
+    print(f"time per call of a function that does nothing, over {n} calls:")
+    print(f"time.bench: {results[0] * 1e6:.2f}µs, for loop: {results[1] * 1e6:.2f}µs")
+
+
+if __name__ == "__main__":
+    main()
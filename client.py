@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Thin client for the Nougaro server (`nougaro --server`).
+Usage: python client.py (--socket [path]) [nougaro arguments]
+The nougaro arguments are the same as the ones of shell.py, except that the shell can not be opened."""
+
+# IMPORTS
+# nougaro modules imports
+from src.server import send_request, DEFAULT_SOCKET_PATH
+# built-in python imports
+import sys
+
+
+def main():
+    args = sys.argv[1:]
+    socket_path = DEFAULT_SOCKET_PATH
+    if len(args) > 0 and args[0] == "--socket":
+        if len(args) < 2:
+            print("[nougaro] expected argument with --socket.")
+            sys.exit(1)
+        socket_path = args[1]
+        del args[:2]
+
+    try:
+        exit_code = send_request(args, socket_path)
+    except OSError as e:
+        print(f"[nougaro] unable to reach the server on '{socket_path}' ({e.__class__.__name__}: {e}). "
+              f"Start it with `nougaro --server`.")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        sys.exit(130)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -145,6 +145,8 @@ class Conffiles(ModuleFunction):
     }
 
 
+# this lib stays a version 4 lib (plain dict table, functions without "param_types"): libs of version 4 are still
+# supported, see tests/test_lib_binding.py
 WHAT_TO_IMPORT = {
     "CONFIG_DIRECTORY": CONFIG_DIRECTORY,
     "access_data": Conffiles('access_data'),
@@ -14,16 +14,184 @@
 from __future__ import annotations
 # nougaro modules imports
 from src.lexer.position import DEFAULT_POSITION
+from src.runtime.values.basevalues.basevalues import DefaultValue
 from src.runtime.values.functions.builtin_function import *
 from src.runtime.values.tools.py2noug import *
 from src.errors.errors import *
 # Note: Context, RTResult, errors and values are imported in builtin_function.py
 # built-in python imports
-# no imports
+from typing import Any, Iterator, Mapping, NamedTuple, Sequence
 
 builtin_function_dict = BuiltinFunctionDict
 default_pos = lambda: (DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
 
+ORDINALS = ("first", "second", "third", "fourth", "fifth", "sixth", "seventh", "eighth", "ninth", "tenth")
+
+
+# TYPED ARGUMENTS
+# In libs of version 5, the dict of a function may have a "param_types" entry: the types of the params, then of the
+# optional params (keys of ARG_TYPES). The function is then called with the python values of the arguments, after
+# `exec_ctx`, instead of finding them in the symbol table: `execute_foo_bar(self, exec_ctx, a, b)`. An optional param
+# that is not given is None. The error messages of the wrong types are generated.
+# Libs of version 4 (functions without "param_types") still work.
+class _WrongArgType(Exception):
+    """Raised by a binder (see ARG_TYPES) when an argument does not have the declared type. If `element_type` is not
+    None, the argument is a list or an array, but it contains an element of this type."""
+    def __init__(self, element_type: str | None = None):
+        super().__init__(element_type)
+        self.element_type = element_type
+
+
+class ArgType(NamedTuple):
+    bind: Callable[[Value], Any]  # returns the python value of the argument, or raises _WrongArgType
+    type_: str  # for the error messages
+    or_: str | None = None
+    elements: str | None = None  # what the elements of a list or an array must be, for the error messages
+
+
+def _bind_number(value: Value) -> int | float:
+    if not isinstance(value, Number):
+        raise _WrongArgType()
+    return value.value
+
+
+def _bind_int(value: Value) -> int:
+    if not (isinstance(value, Number) and isinstance(value.value, int)):
+        raise _WrongArgType()
+    return value.value
+
+
+def _bind_float(value: Value) -> float:
+    if not isinstance(value, Number):
+        raise _WrongArgType()
+    return float(value.value)
+
+
+def _bind_str(value: Value) -> str:
+    if not isinstance(value, String):
+        raise _WrongArgType()
+    return value.value
+
+
+def _bind_number_or_str(value: Value) -> int | float | str:
+    if not (isinstance(value, Number) or isinstance(value, String)):
+        raise _WrongArgType()
+    return value.value
+
+
+def _bind_function(value: Value) -> BaseFunction:
+    if not isinstance(value, BaseFunction):
+        raise _WrongArgType()
+    return value
+
+
+def _bind_list(value: Value) -> List:
+    if not isinstance(value, List):
+        raise _WrongArgType()
+    return value
+
+
+def _bind_sequence(value: Value) -> List | Array:
+    if not (isinstance(value, List) or isinstance(value, Array)):
+        raise _WrongArgType()
+    return value
+
+
+def _numbers(value: Value, ints: bool) -> Sequence[int | float]:
+    """The numbers of a list or an array. The numbers of an array or of an unboxed list are not copied: the returned
+    sequence is the buffer of the array or the `items` of the storage of the list, and must not be changed."""
+    if isinstance(value, Array):
+        if ints and not value.is_int_array():
+            raise _WrongArgType("float")
+        return value.data
+    if not isinstance(value, List):
+        raise _WrongArgType()
+    storage = value.storage
+    if storage.strategy is Number:
+        if ints:
+            for x in storage.items:
+                if not isinstance(x, int):
+                    raise _WrongArgType("float")
+        return storage.items
+    if storage.strategy is String:
+        raise _WrongArgType("str")
+    numbers: list[int | float] = []
+    for element in storage.items:
+        if not isinstance(element, Number) or (ints and not isinstance(element.value, int)):
+            raise _WrongArgType(element.type_)
+        numbers.append(element.value)
+    return numbers
+
+
+def _bind_list_of_numbers(value: Value) -> Sequence[int | float]:
+    return _numbers(value, False)
+
+
+def _bind_list_of_ints(value: Value) -> Sequence[int]:
+    return _numbers(value, True)  # type: ignore
+
+
+def _bind_numbers(value: Value) -> int | float | Sequence[int | float]:
+    if isinstance(value, Number):
+        return value.value
+    return _numbers(value, False)
+
+
+def _bind_ints(value: Value) -> int | Sequence[int]:
+    if isinstance(value, Number):
+        if not isinstance(value.value, int):
+            raise _WrongArgType()
+        return value.value
+    return _numbers(value, True)  # type: ignore
+
+
+ARG_TYPES: dict[str, ArgType] = {
+    "any": ArgType(lambda value: value, "any"),  # the value itself
+    "number": ArgType(_bind_number, "number"),
+    "int": ArgType(_bind_int, "int"),
+    "float": ArgType(_bind_float, "number"),  # ints are converted to floats
+    "str": ArgType(_bind_str, "str"),
+    "number|str": ArgType(_bind_number_or_str, "number", "str"),
+    "function": ArgType(_bind_function, "function"),
+    "list": ArgType(_bind_list, "list"),  # the List itself
+    "sequence": ArgType(_bind_sequence, "list", "array"),  # the List or the Array itself
+    "list[number]": ArgType(_bind_list_of_numbers, "list", "array", "numbers"),  # see `_numbers`
+    "list[int]": ArgType(_bind_list_of_ints, "list", "array of ints", "ints"),
+    # a number, or a list or an array of numbers (see `_numbers`)
+    "numbers": ArgType(_bind_numbers, "number", "list or array", "numbers"),
+    "ints": ArgType(_bind_ints, "int", "list or array of ints", "ints"),
+}
+
+
+# LAZY TABLES
+# In libs of version 5, WHAT_TO_IMPORT may be a LazyTable instead of a dict: the function values are only created
+# when they are used for the first time (`math.sqrt`), then they are cached. Importing a lib with a lot of functions
+# costs nothing more than importing a small one.
+class LazyTable(Mapping[str, Value]):
+    """The constants, then the functions of `function_class` (keys of `function_class.functions`). The modules that
+    import the lib share the same table (see Module)."""
+    def __init__(self, function_class: type[ModuleFunction], constants: dict[str, Value] | None = None):
+        self.function_class = function_class
+        self.values: dict[str, Value] = {} if constants is None else constants.copy()
+        self.names = list(self.values) + [name for name in function_class.functions if name not in self.values]
+
+    def __getitem__(self, name: str) -> Value:
+        value = self.values.get(name)
+        if value is None:
+            if name not in self.function_class.functions:
+                raise KeyError(name)
+            value = self.values[name] = self.function_class(name)  # type: ignore
+        return value
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.values or name in self.function_class.functions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
 
 class ModuleFunction(BaseBuiltInFunction):
     """ Parent class for all the modules """
@@ -39,6 +207,11 @@ class ModuleFunction(BaseBuiltInFunction):
             self.functions: dict[str, BuiltinFunctionDict] = {}
         else:
             self.functions = functions
+        self.cli_args: list[String] = []
+        # what is needed to call a function given as an argument (see `caller`), set in `execute`
+        self.call_env: CallEnv | None = None
+        # the arguments of the call of a function with typed arguments, set in `execute` (see `arg_pos`)
+        self.args: list[Value] = []
 
     def add_function(self, name: str, func_dict: BuiltinFunctionDict):
         self.functions[name] = func_dict
@@ -60,13 +233,23 @@ class ModuleFunction(BaseBuiltInFunction):
         # generate the context and change the symbol table for the context
         exec_context = self.generate_new_context()
         assert exec_context.symbol_table is not None
+        method_dict = self.functions.get(self.name)
+        if method_dict is not None and "param_types" in method_dict:
+            # lib version 5: the arguments are not put in the symbol table
+            self.cli_args = [] if cli_args is None else cli_args.copy()
+            self.call_env = (interpreter_, run, noug_dir, lexer_metas, work_dir)
+            return self.execute_typed(method_dict, args, exec_context)
+
         exec_context.symbol_table.set("__exec_from__", String(exec_from, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()))
         exec_context.symbol_table.set("__actual_context__", String(self.name, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()))
         if cli_args is None:
+            self.cli_args = []
             exec_context.symbol_table.set("__args__", List([], DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()))
         else:
+            self.cli_args = cli_args.copy()
             cli_args_values: list[Value] = list(map(nice_str_from_idk, cli_args))
             exec_context.symbol_table.set("__args__", List(cli_args_values, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()))
+        self.call_env = (interpreter_, run, noug_dir, lexer_metas, work_dir)
 
         # get the method name and the method
         try:
@@ -122,6 +305,66 @@ class ModuleFunction(BaseBuiltInFunction):
         # if all is OK, return what we should return
         return result.success(return_value)
 
+    def execute_typed(self, method_dict: BuiltinFunctionDict, args: list[Value], exec_ctx: Context) -> RTResult:
+        """Checks the number and the types of the arguments, then calls the function with their python values (lib
+        version 5, see ARG_TYPES)"""
+        result = RTResult()
+        param_names = method_dict["param_names"]
+        optional_params: list[tuple[str, Value | None]] = [(param, None) for param in method_dict["optional_params"]]
+        result.register(self.check_args(
+            param_names, args, optional_params, should_respect_args_number=method_dict["should_respect_args_number"]
+        ))
+        if result.should_return():
+            return result
+
+        self.args = args
+        bound: list[Any] = []
+        for index, (type_name, arg) in enumerate(zip(method_dict["param_types"], args)):
+            if isinstance(arg, DefaultValue):
+                bound.append(None)
+                continue
+            arg_type = ARG_TYPES[type_name]
+            try:
+                bound.append(arg_type.bind(arg))
+            except _WrongArgType as exception:
+                return result.failure(self.arg_type_error(index, arg, arg_type, exception.element_type, exec_ctx))
+        bound.extend([None] * (len(method_dict["param_types"]) - len(bound)))  # optional params that are not given
+
+        return_value = result.register(method_dict["function"](self, exec_ctx, *bound))
+        if result.should_return() or return_value is None:
+            return result
+        return result.success(return_value)
+
+    def arg_type_error(self, index: int, arg: Value, arg_type: ArgType, element_type: str | None,
+                       exec_ctx: Context) -> RunTimeError:
+        """The error of an argument that does not have the declared type"""
+        ordinal = ORDINALS[index] if index < len(ORDINALS) else f"{index + 1}th"
+        func_name = f"{self.module_name}.{self.name}"
+        origin_file = f"lib_.{self.module_name}_.{type(self).__name__}.execute_{self.module_name}_{self.name}"
+        if element_type is None:
+            return RTTypeErrorF(
+                arg.pos_start, arg.pos_end, ordinal, func_name, arg_type.type_, arg, exec_ctx, origin_file,
+                or_=arg_type.or_
+            )
+        return RTTypeError(
+            arg.pos_start, arg.pos_end,
+            f"{ordinal} argument of built-in function '{func_name}' must only contain {arg_type.elements}, but found an "
+            f"element of type '{element_type}'.", exec_ctx, origin_file
+        )
+
+    def arg_pos(self, index: int) -> tuple[Position, Position]:
+        """The positions of an argument of the current call of a function with typed arguments (the positions of the
+        function if the argument is not given), for the error messages"""
+        if index < len(self.args) and not isinstance(self.args[index], DefaultValue):
+            return self.args[index].pos_start, self.args[index].pos_end
+        return self.pos_start, self.pos_end
+
+    def caller(self, function: BaseFunction, exec_ctx: Context) -> Callable[[list[Value]], RTResult]:
+        """Returns a python function that calls `function` (given as an argument to this function) with a list of
+        arguments, without the overhead of a call from nougaro code (see `function_caller`)"""
+        assert self.call_env is not None
+        return function_caller(function, exec_ctx, self.call_env, self.cli_args)
+
     def no_visit_method(self, exec_ctx: Context):
         """
             Method called when the func name given through self.name is not
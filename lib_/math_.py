@@ -17,10 +17,14 @@
 # nougaro modules imports
 from lib_.lib_to_make_libs import *
 # Above line : Context, RTResult, errors and values are imported in lib_to_make_libs.py
+from src.runtime.values.basevalues.basevalues import ListStorage
 # built-in python imports
+from typing import Callable, Iterable, Sequence
+import array
+import itertools
 import math
 
-__LIB_VERSION__ = 4
+__LIB_VERSION__ = 5
 
 # constants
 PI = Number(math.pi, *default_pos())
@@ -29,6 +33,22 @@ SQRT_PI = Number(math.sqrt(math.pi), *default_pos())
 SQRT_TAU = Number(math.sqrt(math.tau), *default_pos())
 E = Number(math.e, *default_pos())
 
+# the python values of the arguments of the "numbers" and "ints" types (see lib_.lib_to_make_libs.ARG_TYPES)
+_Numbers = int | float | Sequence[int | float]
+_Ints = int | Sequence[int]
+
+
+def _root(value: int | float, n: int | float) -> float:
+    """Same as `math.root`, for the elements of a list or an array"""
+    if value < 0:
+        raise ValueError("must be greater than (or equal to) 0")
+    return value ** (1 / n)
+
+
+def _iroot(value: int | float, n: int | float) -> int:
+    """Same as `math.iroot`, for the elements of a list or an array"""
+    return int(_root(value, n))
+
 
 class Math(ModuleFunction):
     """ Math module """
@@ -45,32 +65,103 @@ class Math(ModuleFunction):
     def is_eq(self, other: Value):
         return isinstance(other, Math) and self.name == other.name
 
+    def map_elements(self, function: Callable[..., int | float], arguments: list[_Numbers], func_name: str,
+                     exec_context: Context, ints: bool | None = False) -> RTResult | None:
+        """If one of the `arguments` (bound with the "numbers" or "ints" types) is a list or an array, applies
+        `function` to their elements in one python loop, without calling the nougaro function for every element.
+        Numbers are broadcast (used with every element). The result is an array if one of the arguments is an array,
+        else a list. The elements of an array result are ints if `ints` is True, floats if it is False, and the same as
+        the first array if it is None.
+        Returns None if there is no list nor array in the arguments."""
+        if not any(isinstance(argument, Sequence) for argument in arguments):  # arrays are sequences too
+            return None
+        origin_file = f"lib_.math_.Math.execute_{func_name.replace('.', '_')}"
+
+        iterables: list[Iterable[int | float]] = []
+        length: int | None = None
+        first_array: array.array | None = None
+        for index, argument in enumerate(arguments):
+            if isinstance(argument, int) or isinstance(argument, float):
+                iterables.append(itertools.repeat(argument))
+                continue
+            if first_array is None and isinstance(argument, array.array):
+                first_array = argument
+            if length is not None and len(argument) != length:
+                return RTResult().failure(RTIndexError(
+                    self.arg_pos(0)[0], self.arg_pos(index)[1],
+                    f"the arguments of built-in function '{func_name}' must have the same length.",
+                    exec_context, origin_file
+                ))
+            length = len(argument)
+            iterables.append(argument)
+
+        try:
+            results = list(map(function, *iterables))
+        except (ValueError, ZeroDivisionError, OverflowError) as exception:
+            # find the elements that caused the error, to tell them in the error message
+            for index, elements in enumerate(zip(*iterables)):
+                try:
+                    function(*elements)
+                except (ValueError, ZeroDivisionError, OverflowError):
+                    break
+            else:
+                index, elements = -1, ()
+            error_class = RTOverflowError if isinstance(exception, OverflowError) else RTArithmeticError
+            return RTResult().failure(error_class(
+                self.arg_pos(0)[0], self.arg_pos(len(arguments) - 1)[1],
+                f"built-in function '{func_name}' failed on element {index} ({', '.join(map(str, elements))}): "
+                f"{exception}.", exec_context, origin_file
+            ))
+
+        if first_array is not None:
+            try:
+                data = array_data(results, first_array.typecode == 'q' if ints is None else ints)
+            except OverflowError:
+                return RTResult().failure(RTOverflowError(
+                    self.pos_start, self.pos_end,
+                    f"the result of built-in function '{func_name}' contains an int that does not fit in an array "
+                    f"(64 bits).", exec_context, origin_file
+                ))
+            return RTResult().success(Array(data, self.pos_start, self.pos_end))
+        result = List([], self.pos_start, self.pos_end)
+        if len(results) != 0:
+            result.storage = ListStorage(Number, results)
+        return RTResult().success(result)
+
+    def apply_to_numbers(self, function: Callable[..., int | float], arguments: list[int | float], func_name: str,
+                         exec_context: Context) -> RTResult:
+        """Applies `function` to the numbers of the `arguments`, when `map_elements` returned None. The python errors
+        are reported like in `map_elements` (e.g. an OverflowError if an int is too large to be converted to a float)."""
+        try:
+            result = function(*arguments)
+        except (ValueError, ZeroDivisionError, OverflowError) as exception:
+            error_class = RTOverflowError if isinstance(exception, OverflowError) else RTArithmeticError
+            return RTResult().failure(error_class(
+                self.arg_pos(0)[0], self.arg_pos(len(arguments) - 1)[1],
+                f"built-in function '{func_name}' failed: {exception}.",
+                exec_context, f"lib_.math_.Math.execute_{func_name.replace('.', '_')}"
+            ))
+        return RTResult().success(Number(result, self.pos_start, self.pos_end))
+
     # =========
     # FUNCTIONS
     # =========
-    def execute_math_sqrt(self, exec_context: Context):
+
+    def execute_math_sqrt(self, exec_context: Context, value: _Numbers):
         """Calculates square root of 'value'
         It returns the same as math.root(value, 2)"""
-        # Params:
-        # * value
-        assert exec_context.symbol_table is not None
-        value = exec_context.symbol_table.getf('value')  # we get the value
-        if not isinstance(value, Number):  # we check if the value is a number
-            assert value is not None
-            return RTResult().failure(RTTypeErrorF(
-                value.pos_start, value.pos_end, "first", "math.sqrt", "number", value,
-                exec_context, "lib_.math_.Math.execute_math_sqrt"
-            ))
+        vectorised = self.map_elements(math.sqrt, [value], "math.sqrt", exec_context)
+        if vectorised is not None:  # value is a list or an array
+            return vectorised
+        assert not isinstance(value, Sequence)
 
-        if value.value < 0:  # we check if the value is greater than (or equal to) 0
+        if value < 0:  # we check if the value is greater than (or equal to) 0
             return RTResult().failure(RTArithmeticError(
-                value.pos_start, value.pos_end,
+                *self.arg_pos(0),
                 "first argument of the built-in function 'math.sqrt' must be greater than (or equal to) 0.",
                 exec_context, "lib_.math_.Math.execute_math_sqrt"
             ))
-
-        sqrt_ = math.sqrt(value.value)  # we calculate the square root
-        return RTResult().success(Number(sqrt_, self.pos_start, self.pos_end))
+        return self.apply_to_numbers(math.sqrt, [value], "math.sqrt", exec_context)
 
     functions["sqrt"] = {
         "function": execute_math_sqrt,
@@ -78,32 +169,26 @@ class Math(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["numbers"]
     }
 
-    def execute_math_isqrt(self, exec_context: Context):
+    def execute_math_isqrt(self, exec_context: Context, value: _Ints):
         """Calculates the integer part of the square root of 'value'
         It returns the same as math.iroot(value, 2)"""
-        # Params:
-        # * value
-        assert exec_context.symbol_table is not None
-        value = exec_context.symbol_table.getf('value')  # we get the value
-        if not (isinstance(value, Number) and isinstance(value.value, int)):  # we check if the value is a number
-            assert value is not None
-            return RTResult().failure(RTTypeErrorF(
-                value.pos_start, value.pos_end, "first", "math.isqrt", "int", value,
-                exec_context, "lib_.math_.Math.execute_math_isqrt"
-            ))
+        vectorised = self.map_elements(math.isqrt, [value], "math.isqrt", exec_context, ints=True)
+        if vectorised is not None:  # value is a list or an array
+            return vectorised
+        assert not isinstance(value, Sequence)
 
-        if value.value < 0:  # we check if the value is greater than (or equal to) 0
+        if value < 0:  # we check if the value is greater than (or equal to) 0
             return RTResult().failure(RTArithmeticError(
-                value.pos_start, value.pos_end,
+                *self.arg_pos(0),
                 "first argument of the built-in function 'math.isqrt' must be greater than (or equal to) 0.",
                 exec_context, "lib_.math_.Math.execute_math_isqrt"
             ))
 
-        sqrt_ = math.isqrt(value.value)  # we calculate the square root
-        return RTResult().success(Number(sqrt_, self.pos_start, self.pos_end))
+        return self.apply_to_numbers(math.isqrt, [value], "math.isqrt", exec_context)
 
     functions["isqrt"] = {
         "function": execute_math_isqrt,
@@ -111,45 +196,28 @@ class Math(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["ints"]
     }
 
-    def execute_math_root(self, exec_context: Context):
+    def execute_math_root(self, exec_context: Context, value: _Numbers, n: _Numbers | None):
         """Calculates the n-root of 'value' (ⁿ√value)
         Default value for 'n' is 2 (sqrt)."""
-        # Params:
-        # * value
-        # Optional params:
-        # * n
-        assert exec_context.symbol_table is not None
-        value = exec_context.symbol_table.getf('value')  # we get the value
-        if not isinstance(value, Number):  # we check if the value is a number
-            assert value is not None
-            return RTResult().failure(RTTypeErrorF(
-                value.pos_start, value.pos_end, "first", "math.root", "number", value,
-                exec_context, "lib_.math_.Math.execute_math_root"
-            ))
+        if n is None:  # if 'n' parameter is not filled, we set it to 2
+            n = 2
+        vectorised = self.map_elements(_root, [value, n], "math.root", exec_context)
+        if vectorised is not None:  # value or n is a list or an array
+            return vectorised
+        assert not isinstance(value, Sequence) and not isinstance(n, Sequence)
 
-        if value.value < 0:  # we check if the value is greater than (or equal to) 0
+        if value < 0:  # we check if the value is greater than (or equal to) 0
             return RTResult().failure(RTArithmeticError(
-                value.pos_start, value.pos_end,
+                *self.arg_pos(0),
                 "first argument of the built-in function ‘math.root’ must be greater than (or equal to) 0.",
                 exec_context, "lib_.math_.Math.execute_math_root"
             ))
 
-        n = exec_context.symbol_table.getf('n')  # we get 'n'
-        if n is None:  # if 'n' parameter is not filled, we set it to 2
-            n = Number(2, value.pos_end, self.pos_end)
-
-        if not isinstance(n, Number):  # we check if 'n' is a number
-            return RTResult().failure(RTTypeErrorF(
-                n.pos_start, n.pos_end, "second", "math.root", "number", n,
-                exec_context, "lib_.math_.Math.execute_math_root"
-            ))
-
-        value_to_return = Number(value.value ** (1 / n.value), self.pos_start, self.pos_end)  # we calculate the root
-
-        return RTResult().success(value_to_return)
+        return self.apply_to_numbers(_root, [value, n], "math.root", exec_context)  # we calculate the root
 
     functions["root"] = {
         "function": execute_math_root,
@@ -157,45 +225,28 @@ class Math(ModuleFunction):
         "optional_params": ["n"],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["numbers", "numbers"]
     }
 
-    def execute_math_iroot(self, exec_context: Context):
+    def execute_math_iroot(self, exec_context: Context, value: _Numbers, n: _Numbers | None):
         """Calculates the integer part of the n-root of 'value' (ⁿ√value)
         Default value for 'n' is 2 (isqrt)."""
-        # Params:
-        # * value
-        # Optional params:
-        # * n
-        assert exec_context.symbol_table is not None
-        value = exec_context.symbol_table.getf('value')  # we get the value
-        if not isinstance(value, Number):  # we check if the value is a number
-            assert value is not None
-            return RTResult().failure(RTTypeErrorF(
-                value.pos_start, value.pos_end, "first", "math.iroot", "number", value,
-                exec_context, "lib_.math_.Math.execute_math_root"
-            ))
+        if n is None:  # if 'n' parameter is not filled, we set it to 2
+            n = 2
+        vectorised = self.map_elements(_iroot, [value, n], "math.iroot", exec_context, ints=True)
+        if vectorised is not None:  # value or n is a list or an array
+            return vectorised
+        assert not isinstance(value, Sequence) and not isinstance(n, Sequence)
 
-        if value.value < 0:  # we check if the value is greater than (or equal to) 0
+        if value < 0:  # we check if the value is greater than (or equal to) 0
             return RTResult().failure(RTArithmeticError(
-                value.pos_start, value.pos_end,
+                *self.arg_pos(0),
                 "first argument of the built-in function ‘math.iroot’ must be greater than (or equal to) 0.",
-                exec_context, "lib_.math_.Math.execute_math_root"
+                exec_context, "lib_.math_.Math.execute_math_iroot"
             ))
 
-        n = exec_context.symbol_table.getf('n')  # we get 'n'
-        if n is None:  # if 'n' parameter is not filled, we set it to 2
-            n = Number(2, value.pos_end, self.pos_end)
-
-        if not isinstance(n, Number):  # we check if 'n' is a number
-            return RTResult().failure(RTTypeErrorF(
-                n.pos_start, n.pos_end, "second", "math.iroot", "number", n,
-                exec_context, "lib_.math_.Math.execute_math_root"
-            ))
-
-        value_to_return = Number(int(value.value ** (1 / n.value)), self.pos_start, self.pos_end)  # we calculate the root
-
-        return RTResult().success(value_to_return)
+        return self.apply_to_numbers(_iroot, [value, n], "math.iroot", exec_context)  # we calculate the root
 
     functions["iroot"] = {
         "function": execute_math_iroot,
@@ -203,23 +254,18 @@ class Math(ModuleFunction):
         "optional_params": ["n"],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["numbers", "numbers"]
     }
 
-    def execute_math_degrees(self, exec_context: Context):
+    def execute_math_degrees(self, exec_context: Context, value: _Numbers):
         """Converts 'value' (radians) to degrees"""
-        # Params:
-        # * value
-        assert exec_context.symbol_table is not None
-        value = exec_context.symbol_table.getf('value')  # we get the value
-        if not isinstance(value, Number):  # we check if the value is a number
-            assert value is not None
-            return RTResult().failure(RTTypeErrorF(
-                value.pos_start, value.pos_end, "first", "math.degrees", "number", value,
-                exec_context, "lib_.math_.Math.execute_math_degrees"
-            ))
-        degrees = math.degrees(value.value)
-        return RTResult().success(Number(degrees, self.pos_start, self.pos_end))
+        vectorised = self.map_elements(math.degrees, [value], "math.degrees", exec_context)
+        if vectorised is not None:  # value is a list or an array
+            return vectorised
+        assert not isinstance(value, Sequence)
+
+        return self.apply_to_numbers(math.degrees, [value], "math.degrees", exec_context)
 
     functions["degrees"] = {
         "function": execute_math_degrees,
@@ -227,23 +273,18 @@ class Math(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["numbers"]
     }
 
-    def execute_math_radians(self, exec_context: Context):
+    def execute_math_radians(self, exec_context: Context, value: _Numbers):
         """Converts 'value' (degrees) to radians"""
-        # Params:
-        # * value
-        assert exec_context.symbol_table is not None
-        value = exec_context.symbol_table.getf('value')  # we get the value
-        if not isinstance(value, Number):  # we check if the value is a number
-            assert value is not None
-            return RTResult().failure(RTTypeErrorF(
-                value.pos_start, value.pos_end, "first", "math.radians", "number", value,
-                exec_context, "lib_.math_.Math.execute_math_radians"
-            ))
-        radians = math.radians(value.value)
-        return RTResult().success(Number(radians, self.pos_start, self.pos_end))
+        vectorised = self.map_elements(math.radians, [value], "math.radians", exec_context)
+        if vectorised is not None:  # value is a list or an array
+            return vectorised
+        assert not isinstance(value, Sequence)
+
+        return self.apply_to_numbers(math.radians, [value], "math.radians", exec_context)
 
     functions["radians"] = {
         "function": execute_math_radians,
@@ -251,23 +292,18 @@ class Math(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["numbers"]
     }
 
-    def execute_math_sin(self, exec_context: Context):
+    def execute_math_sin(self, exec_context: Context, value: _Numbers):
         """Calculates sin('value')"""
-        # Params:
-        # * value
-        assert exec_context.symbol_table is not None
-        value = exec_context.symbol_table.getf('value')  # we get the value
-        if not isinstance(value, Number):  # we check if the value is a number
-            assert value is not None
-            return RTResult().failure(RTTypeErrorF(
-                value.pos_start, value.pos_end, "first", "math.sin", "number", value,
-                exec_context, "lib_.math_.Math.execute_math_sin"
-            ))
-        sin = math.sin(value.value)
-        return RTResult().success(Number(sin, self.pos_start, self.pos_end))
+        vectorised = self.map_elements(math.sin, [value], "math.sin", exec_context)
+        if vectorised is not None:  # value is a list or an array
+            return vectorised
+        assert not isinstance(value, Sequence)
+
+        return self.apply_to_numbers(math.sin, [value], "math.sin", exec_context)
 
     functions["sin"] = {
         "function": execute_math_sin,
@@ -275,23 +311,18 @@ class Math(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["numbers"]
     }
 
-    def execute_math_cos(self, exec_context: Context):
+    def execute_math_cos(self, exec_context: Context, value: _Numbers):
         """Calculates cos('value')"""
-        # Params:
-        # * value
-        assert exec_context.symbol_table is not None
-        value = exec_context.symbol_table.getf('value')  # we get the value
-        if not isinstance(value, Number):  # we check if the value is a number
-            assert value is not None
-            return RTResult().failure(RTTypeErrorF(
-                value.pos_start, value.pos_end, "first", "math.cos", "number", value,
-                exec_context, "lib_.math_.Math.execute_math_cos"
-            ))
-        cos = math.cos(value.value)
-        return RTResult().success(Number(cos, self.pos_start, self.pos_end))
+        vectorised = self.map_elements(math.cos, [value], "math.cos", exec_context)
+        if vectorised is not None:  # value is a list or an array
+            return vectorised
+        assert not isinstance(value, Sequence)
+
+        return self.apply_to_numbers(math.cos, [value], "math.cos", exec_context)
 
     functions["cos"] = {
         "function": execute_math_cos,
@@ -299,23 +330,18 @@ class Math(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["numbers"]
     }
 
-    def execute_math_tan(self, exec_context: Context):
+    def execute_math_tan(self, exec_context: Context, value: _Numbers):
         """Calculates tan('value')"""
-        # Params:
-        # * value
-        assert exec_context.symbol_table is not None
-        value = exec_context.symbol_table.getf('value')  # we get the value
-        if not isinstance(value, Number):  # we check if the value is a number
-            assert value is not None
-            return RTResult().failure(RTTypeErrorF(
-                value.pos_start, value.pos_end, "first", "math.tan", "number", value,
-                exec_context, "lib_.math_.Math.execute_math_tan"
-            ))
-        tan = math.tan(value.value)
-        return RTResult().success(Number(tan, self.pos_start, self.pos_end))
+        vectorised = self.map_elements(math.tan, [value], "math.tan", exec_context)
+        if vectorised is not None:  # value is a list or an array
+            return vectorised
+        assert not isinstance(value, Sequence)
+
+        return self.apply_to_numbers(math.tan, [value], "math.tan", exec_context)
 
     functions["tan"] = {
         "function": execute_math_tan,
@@ -323,30 +349,24 @@ class Math(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["numbers"]
     }
 
-    def execute_math_asin(self, exec_context: Context):
+    def execute_math_asin(self, exec_context: Context, value: _Numbers):
         """Calculates asin('value')"""
-        # Params:
-        # * value
-        assert exec_context.symbol_table is not None
-        value = exec_context.symbol_table.getf('value')  # we get the value
-        if not isinstance(value, Number):  # we check if the value is a number
-            assert value is not None
-            return RTResult().failure(RTTypeErrorF(
-                value.pos_start, value.pos_end, "first", "math.asin", "number", value,
-                exec_context, "lib_.math_.Math.execute_math_asin"
-            ))
-        try:
-            asin = math.asin(value.value)
-        except ValueError:
+        vectorised = self.map_elements(math.asin, [value], "math.asin", exec_context)
+        if vectorised is not None:  # value is a list or an array
+            return vectorised
+        assert not isinstance(value, Sequence)
+
+        if not -1 <= value <= 1:
             return RTResult().failure(RTArithmeticError(
-                value.pos_start, value.pos_end,
+                *self.arg_pos(0),
                 "first argument of the built-in function ‘math.asin’ must be a number between -1 and 1.",
                 exec_context, "lib_.math_.Math.execute_math_asin"
             ))
-        return RTResult().success(Number(asin, self.pos_start, self.pos_end))
+        return self.apply_to_numbers(math.asin, [value], "math.asin", exec_context)
 
     functions["asin"] = {
         "function": execute_math_asin,
@@ -354,30 +374,24 @@ class Math(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["numbers"]
     }
 
-    def execute_math_acos(self, exec_context: Context):
+    def execute_math_acos(self, exec_context: Context, value: _Numbers):
         """Calculates acos('value')"""
-        # Params:
-        # * value
-        assert exec_context.symbol_table is not None
-        value = exec_context.symbol_table.getf('value')  # we get the value
-        if not isinstance(value, Number):  # we check if the value is a number
-            assert value is not None
-            return RTResult().failure(RTTypeErrorF(
-                value.pos_start, value.pos_end, "first", "math.acos", "number", value,
-                exec_context, "lib_.math_.Math.execute_math_acos"
-            ))
-        try:
-            acos = math.acos(value.value)
-        except ValueError:  # 1 < value or value < -1
+        vectorised = self.map_elements(math.acos, [value], "math.acos", exec_context)
+        if vectorised is not None:  # value is a list or an array
+            return vectorised
+        assert not isinstance(value, Sequence)
+
+        if not -1 <= value <= 1:
             return RTResult().failure(RTArithmeticError(
-                value.pos_start, value.pos_end,
+                *self.arg_pos(0),
                 "first argument of the built-in function ‘math.acos’ must be a number between -1 and 1.",
                 exec_context, "lib_.math_.Math.execute_math_acos"
             ))
-        return RTResult().success(Number(acos, self.pos_start, self.pos_end))
+        return self.apply_to_numbers(math.acos, [value], "math.acos", exec_context)
 
     functions["acos"] = {
         "function": execute_math_acos,
@@ -385,23 +399,18 @@ class Math(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["numbers"]
     }
 
-    def execute_math_atan(self, exec_context: Context):
+    def execute_math_atan(self, exec_context: Context, value: _Numbers):
         """Calculates atan('value')"""
-        # Params:
-        # * value
-        assert exec_context.symbol_table is not None
-        value = exec_context.symbol_table.getf('value')  # we get the value
-        if not isinstance(value, Number):  # we check if the value is a number
-            assert value is not None
-            return RTResult().failure(RTTypeErrorF(
-                value.pos_start, value.pos_end, "first", "math.atan", "number", value,
-                exec_context, "lib_.math_.Math.execute_math_atan"
-            ))
-        atan = math.atan(value.value)
-        return RTResult().success(Number(atan, self.pos_start, self.pos_end))
+        vectorised = self.map_elements(math.atan, [value], "math.atan", exec_context)
+        if vectorised is not None:  # value is a list or an array
+            return vectorised
+        assert not isinstance(value, Sequence)
+
+        return self.apply_to_numbers(math.atan, [value], "math.atan", exec_context)
 
     functions["atan"] = {
         "function": execute_math_atan,
@@ -409,27 +418,18 @@ class Math(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["numbers"]
     }
 
-    def execute_math_abs(self, exec_context: Context):
+    def execute_math_abs(self, exec_context: Context, value: _Numbers):
         """Exactly like python `abs()` (absolute value)"""
-        # Params:
-        # * value
-        assert exec_context.symbol_table is not None
-        value = exec_context.symbol_table.getf('value')  # we get the value
-        if not isinstance(value, Number):  # we check if the value is a number
-            assert value is not None
-            return RTResult().failure(RTTypeErrorF(
-                value.pos_start, value.pos_end, "first", "math.abs", "number", value,
-                exec_context, "lib_.math_.Math.execute_math_abs"
-            ))
+        vectorised = self.map_elements(abs, [value], "math.abs", exec_context, ints=None)
+        if vectorised is not None:  # value is a list or an array
+            return vectorised
+        assert not isinstance(value, Sequence)
 
-        value_to_return, error = value.abs_()
-        if error is not None:
-            return RTResult().failure(error)
-
-        return RTResult().success(value_to_return)
+        return RTResult().success(Number(abs(value), self.pos_start, self.pos_end))
 
     functions["abs"] = {
         "function": execute_math_abs,
@@ -437,89 +437,28 @@ class Math(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["numbers"]
     }
 
-    def execute_math_log(self, exec_context: Context):
+    def execute_math_log(self, exec_context: Context, value: _Numbers, base: _Numbers | None):
         """Exactly like python 'log()'. Default base is 'e' (math_e)."""
-        # Params:
-        # * value
-        # Optional params:
-        # * base
-        assert exec_context.symbol_table is not None
-        value = exec_context.symbol_table.getf('value')  # we get the value
-        if not isinstance(value, Number):  # we check if the value is a number
-            assert value is not None
-            return RTResult().failure(RTTypeErrorF(
-                value.pos_start, value.pos_end, "first", "math.log", "number", value,
-                exec_context, "lib_.math_.Math.execute_math_log"
-            ))
-
-        base = exec_context.symbol_table.getf('base')  # we get the base
-        if base is None:
-            if value.value <= 0:
-                return RTResult().failure(RunTimeError(
-                    value.pos_start, value.pos_end,
-                    f"math domain error: illegal value for logarithm: {value.value}.",
-                    exec_context, origin_file="lib_.math.Math.execute_math_log"
-                ))
-            value_to_return = Number(math.log(value.value), self.pos_start, self.pos_end)
-        else:
-            if not isinstance(base, Number):  # we check if the base is a number
-                return RTResult().failure(RTTypeErrorF(
-                    base.pos_start, base.pos_end, "second", "math.log", "number", base,
-                    exec_context, "lib_.math_.Math.execute_math_log"
-                ))
-            try:
-                value_to_return = Number(math.log(value.value, base.value), self.pos_start, self.pos_end)
-            except ValueError as e:
-                return RTResult().failure(RunTimeError(
-                    self.pos_start, self.pos_end,
-                    f"Python ValueError: {e}",
-                    exec_context,
-                    origin_file="lib_.math_.Math.execute_math_log"
-                ))
-            except ZeroDivisionError as e:
-                return RTResult().failure(RTArithmeticError(
-                    self.pos_start, self.pos_end,
-                    f"Python ZeroDivisionError: {e}",
-                    exec_context,
-                    origin_file="lib_.math_.Math.execute_math_log"
-                ))
-
-        return RTResult().success(value_to_return)
-
-    functions["log"] = {
-        "function": execute_math_log,
-        "param_names": ["value"],
-        "optional_params": ["base"],
-        "should_respect_args_number": True,
-        "run_noug_dir": False,
-        "noug_dir": False
-    }
-
-    def execute_math_log2(self, exec_context: Context):
-        """Exactly like python 'log2()', is log(n, 2)"""
-        # Params:
-        # * value
-        assert exec_context.symbol_table is not None
-        value = exec_context.symbol_table.getf('value')  # we get the value
-        if not isinstance(value, Number):  # we check if the value is a number
-            assert value is not None
-            return RTResult().failure(RTTypeErrorF(
-                value.pos_start, value.pos_end, "first", "math.log2", "number", value,
-                exec_context, "lib_.math_.Math.execute_math_log2"
-            ))
+        vectorised = self.map_elements(
+            math.log, [value] if base is None else [value, base], "math.log", exec_context
+        )
+        if vectorised is not None:  # value or base is a list or an array
+            return vectorised
+        assert not isinstance(value, Sequence) and not isinstance(base, Sequence)
 
-        if value.value <= 0:
+        if value <= 0:
             return RTResult().failure(RunTimeError(
-                value.pos_start, value.pos_end,
-                f"math domain error: illegal value for logarithm: {value.value}.",
-                exec_context, origin_file="lib_.math.Math.execute_math_log"
+                *self.arg_pos(0),
+                f"math domain error: illegal value for logarithm: {value}.",
+                exec_context, origin_file="lib_.math_.Math.execute_math_log"
             ))
 
         try:
-            value_to_return = Number(math.log2(value.value), self.pos_start, self.pos_end)
+            log = math.log(value) if base is None else math.log(value, base)
         except ValueError as e:
             return RTResult().failure(RunTimeError(
                 self.pos_start, self.pos_end,
@@ -534,8 +473,32 @@ class Math(ModuleFunction):
                 exec_context,
                 origin_file="lib_.math_.Math.execute_math_log"
             ))
+        return RTResult().success(Number(log, self.pos_start, self.pos_end))
 
-        return RTResult().success(value_to_return)
+    functions["log"] = {
+        "function": execute_math_log,
+        "param_names": ["value"],
+        "optional_params": ["base"],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False,
+        "param_types": ["numbers", "numbers"]
+    }
+
+    def execute_math_log2(self, exec_context: Context, value: _Numbers):
+        """Exactly like python 'log2()', is log(n, 2)"""
+        vectorised = self.map_elements(math.log2, [value], "math.log2", exec_context)
+        if vectorised is not None:  # value is a list or an array
+            return vectorised
+        assert not isinstance(value, Sequence)
+
+        if value <= 0:
+            return RTResult().failure(RunTimeError(
+                *self.arg_pos(0),
+                f"math domain error: illegal value for logarithm: {value}.",
+                exec_context, origin_file="lib_.math_.Math.execute_math_log2"
+            ))
+        return self.apply_to_numbers(math.log2, [value], "math.log2", exec_context)
 
     functions["log2"] = {
         "function": execute_math_log2,
@@ -543,34 +506,29 @@ class Math(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["numbers"]
     }
 
-    def execute_math_factorial(self, exec_context: Context):
+    def execute_math_factorial(self, exec_context: Context, value: _Ints):
         """Exactly like python 'factorial()'"""
-        # Params:
-        # * value
-        assert exec_context.symbol_table is not None
-        value = exec_context.symbol_table.getf('value')  # we get the value
-        if not (isinstance(value, Number) and isinstance(value.value, int)):  # we check if the value is a number
-            assert value is not None
-            return RTResult().failure(RTTypeErrorF(
-                value.pos_start, value.pos_end, "first", "math.factorial", "non-negative integer (int)", value,
-                exec_context, "lib_.math_.Math.execute_math_factorial"
-            ))
+        vectorised = self.map_elements(math.factorial, [value], "math.factorial", exec_context, ints=True)
+        if vectorised is not None:  # value is a list or an array
+            return vectorised
+        assert not isinstance(value, Sequence)
 
-        if value.value < 0:
+        if value < 0:
             return RTResult().failure(RunTimeError(
-                value.pos_start, value.pos_end,
+                *self.arg_pos(0),
                 "first argument of function math.factorial should be a non-negative integer.",
                 exec_context, origin_file="lib_.math_.Math.execute_math_factorial"
             ))
 
         try:
-            value_to_return = Number(math.factorial(value.value), self.pos_start, self.pos_end)
+            value_to_return = Number(math.factorial(value), self.pos_start, self.pos_end)
         except OverflowError as e:
             return RTResult().failure(RTOverflowError(
-                value.pos_start, value.pos_end, str(e) + ".", exec_context, origin_file="lib_.math_.Math.execute_math_factorial"
+                *self.arg_pos(0), str(e) + ".", exec_context, origin_file="lib_.math_.Math.execute_math_factorial"
             ))
 
         return RTResult().success(value_to_return)
@@ -581,32 +539,20 @@ class Math(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["ints"]
     }
 
-    def execute_math_gcd(self, exec_context: Context):
+    def execute_math_gcd(self, exec_context: Context, a: _Ints, b: _Ints):
         """Takes two arguments a and b, both relative integers, and return
            their GCD. If one of them is zero, return the other. If both are 0,
            return 0."""
-        assert exec_context.symbol_table is not None
-        a = exec_context.symbol_table.getf("a")
-        b = exec_context.symbol_table.getf("b")
-        if not (isinstance(a, Number) and isinstance(a.value, int)):
-            assert a is not None
-            return RTResult().failure(RTTypeErrorF(
-                a.pos_start, a.pos_end, "first", "math.gcd", "int", a,
-                exec_context, "lib_.math_.Math.execute_math_gcd"
-            ))
-        if not (isinstance(b, Number) and isinstance(b.value, int)):
-            assert b is not None
-            return RTResult().failure(RTTypeErrorF(
-                b.pos_start, b.pos_end, "second", "math.gcd", "int", b,
-                exec_context, "lib_.math_.Math.execute_math_gcd"
-            ))
-        result = Number(
-            math.gcd(a.value, b.value), self.pos_start, self.pos_end
-        )
-        return RTResult().success(result)
+        vectorised = self.map_elements(math.gcd, [a, b], "math.gcd", exec_context, ints=True)
+        if vectorised is not None:  # a or b is a list or an array
+            return vectorised
+        assert not isinstance(a, Sequence) and not isinstance(b, Sequence)
+
+        return RTResult().success(Number(math.gcd(a, b), self.pos_start, self.pos_end))
 
     functions["gcd"] = {
         "function": execute_math_gcd,
@@ -614,21 +560,18 @@ class Math(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["ints", "ints"]
     }
 
-    def execute_math_floor(self, exec_context: Context):
+    def execute_math_floor(self, exec_context: Context, a: _Numbers):
         """Takes one argument (type number) and returns its floor."""
-        assert exec_context.symbol_table is not None
-        a = exec_context.symbol_table.getf("a")
-        if not (isinstance(a, Number)):
-            assert a is not None
-            return RTResult().failure(RTTypeErrorF(
-                a.pos_start, a.pos_end, "first", "math.floor", "number", a,
-                exec_context, "lib_.math_.Math.execute_math_floor"
-            ))
-        result = Number(math.floor(a.value), self.pos_start, self.pos_end)
-        return RTResult().success(result)
+        vectorised = self.map_elements(math.floor, [a], "math.floor", exec_context, ints=True)
+        if vectorised is not None:  # a is a list or an array
+            return vectorised
+        assert not isinstance(a, Sequence)
+
+        return self.apply_to_numbers(math.floor, [a], "math.floor", exec_context)
 
     functions["floor"] = {
         "function": execute_math_floor,
@@ -636,21 +579,18 @@ class Math(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["numbers"]
     }
 
-    def execute_math_ceil(self, exec_context: Context):
+    def execute_math_ceil(self, exec_context: Context, a: _Numbers):
         """Takes one argument (type number) and returns its ceil."""
-        assert exec_context.symbol_table is not None
-        a = exec_context.symbol_table.getf("a")
-        if not (isinstance(a, Number)):
-            assert a is not None
-            return RTResult().failure(RTTypeErrorF(
-                a.pos_start, a.pos_end, "first", "math.ceil", "number", a,
-                exec_context, "lib_.math_.Math.execute_math_ceil"
-            ))
-        result = Number(math.ceil(a.value), self.pos_start, self.pos_end)
-        return RTResult().success(result)
+        vectorised = self.map_elements(math.ceil, [a], "math.ceil", exec_context, ints=True)
+        if vectorised is not None:  # a is a list or an array
+            return vectorised
+        assert not isinstance(a, Sequence)
+
+        return self.apply_to_numbers(math.ceil, [a], "math.ceil", exec_context)
 
     functions["ceil"] = {
         "function": execute_math_ceil,
@@ -658,37 +598,15 @@ class Math(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["numbers"]
     }
 
 
-
-WHAT_TO_IMPORT = {  # what are the new entries in the symbol table when the module is imported
-    # Constants
+WHAT_TO_IMPORT = LazyTable(Math, {  # the constants, then the functions of Math (see LazyTable)
     "pi": PI,
     "tau": TAU,
     "sqrt_pi": SQRT_PI,
     "sqrt_tau": SQRT_TAU,
     "e": E,
-
-    # Functions
-    "sqrt": Math("sqrt"),
-    "isqrt": Math("isqrt"),
-    "root": Math("root"),
-    "iroot": Math("iroot"),
-    "radians": Math("radians"),
-    "degrees": Math("degrees"),
-    "sin": Math("sin"),
-    "cos": Math("cos"),
-    "tan": Math("tan"),
-    "asin": Math("asin"),
-    "acos": Math("acos"),
-    "atan": Math("atan"),
-    "abs": Math("abs"),
-    "log": Math("log"),
-    "log2": Math("log2"),
-    "factorial": Math("factorial"),
-    "gcd": Math("gcd"),
-    "floor": Math("floor"),
-    "ceil": Math("ceil"),
-}
+})
@@ -16,62 +16,61 @@
 # nougaro modules imports
 from lib_.lib_to_make_libs import *
 # Comment about the above line : Context, RTResult, errors and values are imported in lib_to_make_libs.py
+from src.runtime.values.basevalues.basevalues import ListStorage
 # built-in python imports
+from typing import Sequence
 import random
 
-__LIB_VERSION__ = 4
+__LIB_VERSION__ = 5
+
+# the python generator used by the functions of the module. `random.generator()` creates independent ones.
+_global_generator = random.Random()
 
 
 class Random(ModuleFunction):
     """ Random module """
     functions: dict[str, BuiltinFunctionDict] = {}
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, generator: random.Random | None = None):
+        """`generator` is the python generator of the numbers: the one of the module by default, or the one of a
+        RandomGenerator value"""
         super().__init__("random", name, functions=self.functions)
+        self.generator = generator if generator is not None else _global_generator
 
     def copy(self):
         """Return a copy of self"""
-        copy = Random(self.name)
+        copy = Random(self.name, self.generator)
         return self.set_context_and_pos_to_a_copy(copy)
 
     def is_eq(self, other: Value):
-        return isinstance(other, Random) and self.name == other.name
+        return isinstance(other, Random) and self.name == other.name and self.generator is other.generator
+
+    def check_count(self, count: int, index: int, exec_ctx: Context) -> RTResult | None:
+        """Returns an error if `count` (the number of values to generate, the argument of index `index`) is negative,
+        else None"""
+        if count < 0:
+            return RTResult().failure(RunTimeError(
+                *self.arg_pos(index),
+                f"{ORDINALS[index]} argument of the built-in function 'random.{self.name}' must be greater than or "
+                f"equal to 0.",
+                exec_ctx, origin_file=f"lib_.random_.Random.execute_random_{self.name}"
+            ))
+        return None
 
     # =========
     # FUNCTIONS
     # =========
-    def execute_random_randint(self, exec_ctx: Context):
+    def execute_random_randint(self, exec_ctx: Context, a: int, b: int):
         """Pick a random integer number in [a, b] mathematical range. a SHOULD BE lesser than b"""
-        # Params:
-        # * a
-        # * b
-        # we get 'a' and 'b' values
-        assert exec_ctx.symbol_table is not None
-        a = exec_ctx.symbol_table.getf("a")
-        b = exec_ctx.symbol_table.getf("b")
-        if not (isinstance(a, Number) and isinstance(a.value, int)):  # we check if 'a' is an integer
-            assert a is not None
-            return RTResult().failure(RTTypeErrorF(
-                a.pos_start, a.pos_end, "first", "random.randint", "int", a,
-                exec_ctx, "lib_.random_.Random.execute_random_randint"
-            ))
-
-        if not (isinstance(b, Number) and isinstance(b.value, int)):  # we check if 'b' is an integer
-            assert b is not None
-            return RTResult().failure(RTTypeErrorF(
-                b.pos_start, b.pos_end, "second", "random.randint", "int", b,
-                exec_ctx, "lib_.random_.Random.execute_random_randint"
-            ))
-
-        if a.value > b.value:  # e.g. randint(4, -3)
+        if a > b:  # e.g. randint(4, -3)
             return RTResult().failure(RunTimeError(
-                a.pos_start, b.pos_end,
+                self.arg_pos(0)[0], self.arg_pos(1)[1],
                 "first argument of the built-in function 'random.randint' MUST be less than or equal to its second"
                 " argument.",
                 exec_ctx, origin_file="lib_.random_.Random.execute_random_randint"
             ))
 
-        random_number = random.randint(a.value, b.value)
+        random_number = self.generator.randint(a, b)
         return RTResult().success(Number(random_number, self.pos_start, self.pos_end))
 
     functions["randint"] = {
@@ -80,13 +79,14 @@ class Random(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["int", "int"]
     }
 
-    def execute_random_random(self):
+    def execute_random_random(self, exec_ctx: Context):
         """Pick randomly a 16-digits float between 0 included and 1 included"""
         # No params.
-        return RTResult().success(Number(random.random(), self.pos_start, self.pos_end))
+        return RTResult().success(Number(self.generator.random(), self.pos_start, self.pos_end))
 
     functions["random"] = {
         "function": execute_random_random,
@@ -94,28 +94,19 @@ class Random(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": []
     }
 
-    def execute_random_choice(self, exec_ctx: Context):
+    def execute_random_choice(self, exec_ctx: Context, list_: List):
         """Return a random element of a list"""
-        # Params:
-        # * list_
-        assert exec_ctx.symbol_table is not None
-        list_ = exec_ctx.symbol_table.getf("list_")  # we get the 'list' argument
-        if not isinstance(list_, List):  # we check if it is a list
-            assert list_ is not None
-            return RTResult().failure(RTTypeErrorF(
-                list_.pos_start, list_.pos_end, "first", "random.choice", "list", list_,
-                exec_ctx, "lib_.random_.Random.execute_random_choice"
-            ))
-        if len(list_.elements) == 0:  # if the list is empty, we raise an error
+        if len(list_) == 0:  # if the list is empty, we raise an error
             return RTResult().failure(RunTimeError(
                 list_.pos_start, list_.pos_end,
                 "list is empty.",
                 exec_ctx, origin_file="lib_.random_.Random.execute_random_choice"
             ))
-        return RTResult().success(random.choice(list_.elements))  # then we return a random element of the list
+        return RTResult().success(self.generator.choice(list_))  # then we return a random element of the list
 
     functions["choice"] = {
         "function": execute_random_choice,
@@ -123,25 +114,15 @@ class Random(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["list"]
     }
 
-    def execute_random_shuffle(self, exec_ctx: Context):
+    def execute_random_shuffle(self, exec_ctx: Context, list_: List):
         """Shuffle a list and returns it."""
-        # Params:
-        # * list_
-        assert exec_ctx.symbol_table is not None
-        list_ = exec_ctx.symbol_table.getf("list_")  # we get the 'list' argument
-        if not isinstance(list_, List):  # we check if it is a list
-            assert list_ is not None
-            return RTResult().failure(RTTypeErrorF(
-                list_.pos_start, list_.pos_end, "first", "random.shuffle", "list", list_,
-                exec_ctx, "lib_.random_.Random.execute_random_shuffle"
-            ))
-
-        py_list = list_.elements.copy()
-        random.shuffle(py_list)
-        list_.elements = py_list
+        storage = list_.storage.copy()
+        self.generator.shuffle(storage.items)
+        list_.storage = storage
 
         return RTResult().success(list_)
 
@@ -151,22 +132,13 @@ class Random(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["list"]
     }
 
-    def execute_random_seed(self, exec_ctx: Context):
+    def execute_random_seed(self, exec_ctx: Context, seed: int | float | str):
         """Set the seed to generate pseudo-random numbers."""
-        # Params:
-        # * seed
-        assert exec_ctx.symbol_table is not None
-        seed = exec_ctx.symbol_table.getf("seed")
-        if not (isinstance(seed, Number) or isinstance(seed, String)):
-            assert seed is not None
-            return RTResult().failure(RTTypeErrorF(
-                seed.pos_start, seed.pos_end, "first", "random.seed", "number or string", seed,
-                exec_ctx, "lib_.random_.Random.execute_random_seed"
-            ))
-        random.seed(seed.value)
+        self.generator.seed(seed)
         return RTResult().success(NoneValue(self.pos_start, self.pos_end, False))
 
     functions["seed"] = {
@@ -175,15 +147,207 @@ class Random(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["number|str"]
+    }
+
+    def execute_random_randints(self, exec_ctx: Context, a: int, b: int, n: int):
+        """Returns an array of `n` random integer numbers in [a, b] mathematical range"""
+        if a > b:  # e.g. randints(4, -3, 10)
+            return RTResult().failure(RunTimeError(
+                self.arg_pos(0)[0], self.arg_pos(1)[1],
+                "first argument of the built-in function 'random.randints' MUST be less than or equal to its second"
+                " argument.",
+                exec_ctx, origin_file="lib_.random_.Random.execute_random_randints"
+            ))
+
+        error = self.check_count(n, 2, exec_ctx)
+        if error is not None:
+            return error
+
+        if b - a < 2 ** 53:
+            # `choices` picks each number with one call to `random()`, instead of several calls in `randint`
+            numbers = self.generator.choices(range(a, b + 1), k=n)
+        else:  # a float does not have enough precision to pick the numbers uniformly
+            numbers = [self.generator.randint(a, b) for _ in range(n)]
+        try:
+            return RTResult().success(Array(array_data(numbers, True), self.pos_start, self.pos_end))
+        except OverflowError:  # the numbers do not fit in 64 bits
+            list_ = List([], self.pos_start, self.pos_end)
+            if len(numbers) != 0:
+                list_.storage = ListStorage(Number, numbers)
+            return RTResult().success(list_)
+
+    functions["randints"] = {
+        "function": execute_random_randints,
+        "param_names": ["a", "b", "n"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False,
+        "param_types": ["int", "int", "int"]
     }
 
+    def execute_random_randoms(self, exec_ctx: Context, n: int):
+        """Returns an array of `n` random floats between 0 included and 1 excluded"""
+        error = self.check_count(n, 0, exec_ctx)
+        if error is not None:
+            return error
+
+        random_ = self.generator.random
+        data = array_data([random_() for _ in range(n)], False)
+        return RTResult().success(Array(data, self.pos_start, self.pos_end))
+
+    functions["randoms"] = {
+        "function": execute_random_randoms,
+        "param_names": ["n"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False,
+        "param_types": ["int"]
+    }
+
+    def execute_random_sample(self, exec_ctx: Context, list_: List | Array, k: int):
+        """Returns `k` elements of a list (or an array) taken at random, without taking an element twice"""
+        error = self.check_count(k, 1, exec_ctx)
+        if error is not None:
+            return error
+
+        if k > len(list_):
+            return RTResult().failure(RunTimeError(
+                *self.arg_pos(1),
+                f"can not take {k} elements of a {list_.type_} of {len(list_)} elements.",
+                exec_ctx, origin_file="lib_.random_.Random.execute_random_sample"
+            ))
+
+        if isinstance(list_, Array):
+            data = array_data(self.generator.sample(list_.data, k), list_.is_int_array())
+            return RTResult().success(Array(data, self.pos_start, self.pos_end))
+        sample = List([], self.pos_start, self.pos_end)
+        # the numbers and strs of the list may be unboxed: they stay unboxed
+        sample.storage = ListStorage(list_.storage.strategy if k != 0 else None,
+                                     self.generator.sample(list_.storage.items, k))
+        return RTResult().success(sample)
+
+    functions["sample"] = {
+        "function": execute_random_sample,
+        "param_names": ["list_", "k"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False,
+        "param_types": ["sequence", "int"]
+    }
+
+    def execute_random_choices(self, exec_ctx: Context, list_: List | Array, k: int,
+                               weights: Sequence[int | float] | None):
+        """Returns `k` elements of a list (or an array) taken at random, with replacement. If `weights` (a list of
+        numbers) is given, the elements are taken with the relative weights."""
+        error = self.check_count(k, 1, exec_ctx)
+        if error is not None:
+            return error
+
+        if len(list_) == 0 and k != 0:  # if the list is empty, we raise an error
+            return RTResult().failure(RunTimeError(
+                list_.pos_start, list_.pos_end,
+                f"{list_.type_} is empty.",
+                exec_ctx, origin_file="lib_.random_.Random.execute_random_choices"
+            ))
+
+        if weights is not None:
+            if len(weights) != len(list_):
+                return RTResult().failure(RTIndexError(
+                    list_.pos_start, self.arg_pos(2)[1],
+                    "the first and third arguments of built-in function 'random.choices' must have the same length.",
+                    exec_ctx, "lib_.random_.Random.execute_random_choices"
+                ))
+            for weight in weights:
+                if weight < 0:
+                    return RTResult().failure(RTTypeError(
+                        *self.arg_pos(2),
+                        "third argument of built-in function 'random.choices' must be a list of positive numbers, "
+                        f"but found {weight}.",
+                        exec_ctx, "lib_.random_.Random.execute_random_choices"
+                    ))
+            if len(weights) != 0 and sum(weights) <= 0:
+                return RTResult().failure(RunTimeError(
+                    *self.arg_pos(2),
+                    "the sum of the weights must be greater than 0.",
+                    exec_ctx, origin_file="lib_.random_.Random.execute_random_choices"
+                ))
+
+        if isinstance(list_, Array):
+            choices = self.generator.choices(list_.data, weights, k=k)
+            return RTResult().success(Array(array_data(choices, list_.is_int_array()), self.pos_start, self.pos_end))
+        choices_list = List([], self.pos_start, self.pos_end)
+        # the numbers and strs of the list may be unboxed: they stay unboxed
+        choices_list.storage = ListStorage(list_.storage.strategy if k != 0 else None,
+                                           self.generator.choices(list_.storage.items, weights, k=k))
+        return RTResult().success(choices_list)
+
+    functions["choices"] = {
+        "function": execute_random_choices,
+        "param_names": ["list_", "k"],
+        "optional_params": ["weights"],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False,
+        "param_types": ["sequence", "int", "list[number]"]
+    }
+
+    def execute_random_generator(self, exec_ctx: Context, seed: int | float | str | None):
+        """Returns a new random generator, with its own state: the numbers it generates do not depend on the other
+        generators. Its attributes are the functions of this module (`rng.randint(1, 6)`)."""
+        generator = random.Random(seed)
+        return RTResult().success(RandomGenerator(generator, self.pos_start, self.pos_end))
+
+    functions["generator"] = {
+        "function": execute_random_generator,
+        "param_names": [],
+        "optional_params": ["seed"],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False,
+        "param_types": ["number|str"]
+    }
+
+
+class RandomGenerator(Value):
+    """A random generator with its own state, returned by `random.generator`"""
+    def __init__(self, generator: random.Random, pos_start: Position, pos_end: Position):
+        super().__init__(pos_start, pos_end)
+        self.generator = generator
+        self.type_ = 'random_generator'
+        self.attributes = {name: Random(name, generator) for name in Random.functions if name != "generator"}
+
+    def __repr__(self):
+        return "<random_generator>"
+
+    def to_python_str(self) -> str:
+        return self.__repr__()
+
+    def to_str(self):
+        return String(self.__repr__(), self.pos_start, self.pos_end).set_context(self.context), None
+
+    def is_true(self):
+        return True
+
+    def get_comparison_eq(self, other: Value):
+        is_eq = isinstance(other, RandomGenerator) and other.generator is self.generator
+        return Number(is_eq, self.pos_start, other.pos_end).set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        is_eq = isinstance(other, RandomGenerator) and other.generator is self.generator
+        return Number(not is_eq, self.pos_start, other.pos_end).set_context(self.context), None
+
+    def copy(self):
+        """Return a copy of self (sharing the same python generator)"""
+        copy = RandomGenerator(self.generator, self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
 
-WHAT_TO_IMPORT = {  # what are the new entries in the symbol table when the module is imported
-    # functions
-    "randint": Random("randint"),
-    "random": Random("random"),
-    "choice": Random("choice"),
-    "shuffle": Random("shuffle"),
-    "seed": Random("seed"),
-}
+WHAT_TO_IMPORT = LazyTable(Random)
@@ -17,9 +17,20 @@
 from lib_.lib_to_make_libs import *
 # Comment about the above line : Context, RTResult and values are imported in lib_to_make_libs.py
 # built-in python imports
+from typing import Iterable, Sequence
+import array
+import bisect
+import itertools
+import math
+import operator
+import random
 import statistics
 
-__LIB_VERSION__ = 4
+__LIB_VERSION__ = 5
+
+# above this number of groups of neighbouring ranks, `_order_statistics` sorts the data instead of selecting the values
+_MAX_SELECTIONS = 3
+_sampler = random.Random(0)  # the `random` module (and the nougaro random lib) keeps its own state
 
 
 class RTStatisticsError(RunTimeError):
@@ -30,6 +41,249 @@ class RTStatisticsError(RunTimeError):
                          origin_file=origin_file)
 
 
+class _RunningStats:
+    """Count, mean, variance, min and max of a series, updated with each value (Welford's algorithm)"""
+    accepts_str = False
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # sum of the squared differences to the mean
+        self.min: int | float | None = None
+        self.max: int | float | None = None
+
+    def add(self, x: int | float):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+
+    def summary(self) -> dict[str, int | float | None]:
+        if self.count == 0:
+            return {"count": 0, "mean": None, "variance": None, "stdev": None, "min": None, "max": None}
+        variance = self.m2 / (self.count - 1) if self.count > 1 else None  # sample variance, like statistics.variance
+        return {
+            "count": self.count, "mean": self.mean, "variance": variance,
+            "stdev": math.sqrt(variance) if variance is not None else None, "min": self.min, "max": self.max
+        }
+
+
+class _QuantileSketch:
+    """Estimation of the `p` quantile of a series, using 5 markers only (P² algorithm, Jain and Chlamtac 1985)"""
+    accepts_str = False
+
+    def __init__(self, p: float):
+        self.p = p
+        self.count = 0
+        self.heights: list[int | float] = []  # the first 5 values, then the heights of the markers
+        self.positions = [0, 1, 2, 3, 4]
+        self.desired = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, x: int | float):
+        self.count += 1
+        heights = self.heights
+        if self.count <= 5:
+            bisect.insort(heights, x)
+            return
+
+        # find the cell containing x, and move the markers above it
+        if x < heights[0]:
+            heights[0] = x
+            k = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            k = 3
+        else:
+            k = bisect.bisect_right(heights, x) - 1
+        positions = self.positions
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        # adjust the heights of the middle markers if they are too far from their desired positions
+        for i in range(1, 4):
+            d = self.desired[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or (d <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if d > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + step * (heights[i + step] - heights[i]) / (positions[i + step] - positions[i])
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        heights, positions = self.heights, self.positions
+        return heights[i] + step / (positions[i + 1] - positions[i - 1]) * (
+            (positions[i] - positions[i - 1] + step) * (heights[i + 1] - heights[i]) / (positions[i + 1] - positions[i])
+            + (positions[i + 1] - positions[i] - step) * (heights[i] - heights[i - 1])
+            / (positions[i] - positions[i - 1])
+        )
+
+    def summary(self) -> dict[str, int | float | None]:
+        if self.count == 0:
+            quantile = None
+        elif self.count <= 5:  # the values are all known: linear interpolation between the two closest ones
+            index = self.p * (self.count - 1)
+            lower = int(index)
+            upper = min(lower + 1, self.count - 1)
+            quantile = self.heights[lower] + (self.heights[upper] - self.heights[lower]) * (index - lower)
+        else:
+            quantile = self.heights[2]
+        return {"count": self.count, "p": self.p, "quantile": quantile}
+
+
+class _ModeSketch:
+    """Estimation of the mode of a series, counting the values in a count-min sketch of `depth` rows of `width`
+    counters. The counts can only be overestimated, when different values share the same counters."""
+    accepts_str = True
+
+    def __init__(self, width: int, depth: int):
+        self.width = width
+        self.rows = [[0] * width for _ in range(depth)]
+        self.count = 0
+        self.mode: int | float | str | None = None
+        self.mode_count = 0
+
+    def add(self, x: int | float | str):
+        self.count += 1
+        estimate = self.count
+        for seed, row in enumerate(self.rows):
+            index = hash((seed, x)) % self.width
+            row[index] += 1
+            if row[index] < estimate:
+                estimate = row[index]
+        if estimate > self.mode_count:
+            self.mode = x
+            self.mode_count = estimate
+
+    def summary(self) -> dict[str, int | float | str | None]:
+        return {"count": self.count, "mode": self.mode, "mode_count": self.mode_count}
+
+
+class StatisticsAccumulator(Value):
+    """An accumulator of the statistics module: `sketch` is a _RunningStats, a _QuantileSketch or a _ModeSketch. Values
+    are given to it one by one or by batches with `statistics.feed`, and are not kept."""
+    def __init__(self, sketch: _RunningStats | _QuantileSketch | _ModeSketch, pos_start: Position, pos_end: Position):
+        super().__init__(pos_start, pos_end)
+        self.sketch = sketch
+        self.type_ = 'statistics_accumulator'
+
+    def __repr__(self):
+        return f"<statistics_accumulator ({self.sketch.count} values)>"
+
+    def to_python_str(self) -> str:
+        return self.__repr__()
+
+    def to_str(self):
+        return String(self.__repr__(), self.pos_start, self.pos_end).set_context(self.context), None
+
+    def get_comparison_eq(self, other: Value):
+        is_eq = isinstance(other, StatisticsAccumulator) and other.sketch is self.sketch
+        return Number(is_eq, self.pos_start, other.pos_end).set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        is_eq = isinstance(other, StatisticsAccumulator) and other.sketch is self.sketch
+        return Number(not is_eq, self.pos_start, other.pos_end).set_context(self.context), None
+
+    def is_true(self):
+        return self.sketch.count != 0
+
+    def copy(self):
+        """Return a copy of self (sharing the same sketch)"""
+        copy = StatisticsAccumulator(self.sketch, self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+
+def _elements(data: Value) -> Iterable[Value | int | float | str] | None:
+    """Returns the python iterable over the elements of `data`, or None if it is not a series of values. The numbers and
+    strs of unboxed lists, arrays and ranges are not boxed."""
+    if isinstance(data, List):
+        return data.storage.items
+    if isinstance(data, Array):
+        return data.data
+    if isinstance(data, Range):
+        return data.range_
+    if isinstance(data, Deque):
+        return list(data.elements)
+    if isinstance(data, Generator):
+        return data.iterate()  # the error of the generator, if any, is then in `data.error`
+    return None
+
+
+def _order_statistics(data: Sequence[int | float], ranks: list[int]) -> dict[int, int | float]:
+    """Returns the values of rank `ranks` in `data` (the value of rank 0 is the smallest one), like `sorted(data)[rank]`
+    for every rank, but in linear time when the ranks form few groups of neighbouring ranks (Floyd-Rivest selection).
+    `data` is not changed nor copied."""
+    n = len(data)
+    groups: list[list[int]] = []
+    for rank in sorted(set(ranks)):
+        if len(groups) != 0 and rank - groups[-1][-1] <= 1:
+            groups[-1].append(rank)
+        else:
+            groups.append([rank])
+    if n < 1000 or len(groups) > _MAX_SELECTIONS:
+        sorted_data = sorted(data)
+        return {rank: sorted_data[rank] for rank in ranks}
+
+    # the values of a group are between two values of a sorted sample, which are close to the group in the sample
+    sample_size = int(n ** (2 / 3))
+    sample = sorted(_sampler.sample(data, sample_size))
+    margin = 3 * math.isqrt(sample_size) + 1
+    result: dict[int, int | float] = {}
+    for group in groups:
+        low = sample[max(0, group[0] * sample_size // n - margin)]
+        high = sample[min(sample_size - 1, group[-1] * sample_size // n + margin)]
+        below = sum(map(operator.lt, data, itertools.repeat(low)))  # number of values lower than `low`
+        between = [x for x in data if low <= x <= high]
+        if not below <= group[0] <= group[-1] < below + len(between):  # unlucky sample: the values are not between
+            sorted_data = sorted(data)
+            return {rank: sorted_data[rank] for rank in ranks}
+        between.sort()
+        for rank in group:
+            result[rank] = between[rank - below]
+    return result
+
+
+def _median(data: Sequence[int | float]) -> int | float:
+    """Like `statistics.median`, without sorting `data`. `data` must not be empty."""
+    middle = len(data) // 2
+    if len(data) % 2 == 1:
+        return _order_statistics(data, [middle])[middle]
+    values = _order_statistics(data, [middle - 1, middle])
+    return (values[middle - 1] + values[middle]) / 2
+
+
+def _quantiles(data: Sequence[int | float], n: int, method: str) -> list[int | float]:
+    """Like `statistics.quantiles`, without sorting `data` when there are few cut points. `data` must have at least two
+    elements and `n` must be at least 1."""
+    length = len(data)
+    # the two ranks between which each cut point is interpolated, and the weight of the second one
+    cuts: list[tuple[int, int, int]] = []
+    if method == "inclusive":
+        m = length - 1
+        for i in range(1, n):
+            j, delta = divmod(i * m, n)
+            cuts.append((j, j + 1, delta))
+    else:
+        m = length + 1
+        for i in range(1, n):
+            j = i * m // n  # rescale i to m/n
+            j = 1 if j < 1 else length - 1 if j > length - 1 else j  # clamp to 1 .. length-1
+            cuts.append((j - 1, j, i * m - j * n))
+
+    values = _order_statistics(data, [rank for cut in cuts for rank in cut[:2]])
+    return [(values[lower] * (n - delta) + values[upper] * delta) / n for lower, upper, delta in cuts]
+
+
 class Statistics(ModuleFunction):
     """ Statistics module """
     functions: dict[str, BuiltinFunctionDict] = {}
@@ -48,39 +302,18 @@ class Statistics(ModuleFunction):
     # =========
     # FUNCTIONS
     # =========
-    def execute_statistics_mean(self, exec_ctx: Context):
+    def execute_statistics_mean(self, exec_ctx: Context, data: Sequence[int | float]):
         """Returns the mean of a statistical series"""
-        # Params:
-        # * data
-        assert exec_ctx.symbol_table is not None
-        data = exec_ctx.symbol_table.getf('data')  # we get the data
-        if not isinstance(data, List):  # we check if the data is under the form of a list
-            assert data is not None
-            return RTResult().failure(RTTypeErrorF(
-                data.pos_start, data.pos_end, "first", "statistics.mean", "list", data,
-                exec_ctx, "lib_.statistics_.Statistics.execute_statistics_mean"
-            ))
-
-        data_: list[int | float] = []
-        for e in data.elements:
-            if not isinstance(e, Number):  # the data must contain only numbers
-                return RTResult().failure(RTTypeError(
-                    e.pos_start, e.pos_end,
-                    f"first argument of built-in function 'statistics.mean' must be a list of numbers, but found an"
-                    f" element of type '{e.type_}'.",
-                    exec_ctx, "lib_.statistics_.Statistics.execute_statistics_mean"
-                ))
-            data_.append(e.value)
-
-        if len(data_) == 0:  # data must not be empty
+        if len(data) == 0:  # data must not be empty
             return RTResult().failure(RTStatisticsError(
-                data.pos_start, data.pos_end,
-                "first argument of built-in function 'statistics.mean' must not be empty.",
+                *self.arg_pos(0), "first argument of built-in function 'statistics.mean' must not be empty.",
                 exec_ctx, "lib_.statistics_.Statistics.execute_statistics_mean"
             ))
 
+        if isinstance(data, array.array):  # arrays only contain numbers, so the mean is computed directly
+            return RTResult().success(Number(sum(data) / len(data), self.pos_start, self.pos_end))
         try:
-            mean_ = statistics.mean(data_)  # we try to calculate the mean of our list
+            mean_ = statistics.mean(data)  # we try to calculate the mean of our list
         except statistics.StatisticsError as exception:
             return RTResult().failure(RTStatisticsError(
                 self.pos_start, self.pos_end, str(exception) + '.', exec_ctx
@@ -94,49 +327,29 @@ class Statistics(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["list[number]"]
     }
 
-    def execute_statistics_geometric_mean(self, exec_ctx: Context):
+    def execute_statistics_geometric_mean(self, exec_ctx: Context, data: Sequence[int | float]):
         """Returns the geometric mean of a statistical series"""
-        # Params:
-        # * data
-        assert exec_ctx.symbol_table is not None
-        data = exec_ctx.symbol_table.getf('data')  # we get the data
-        if not isinstance(data, List):  # the data must be a list
-            assert data is not None
-            return RTResult().failure(RTTypeErrorF(
-                data.pos_start, data.pos_end, "first", "statistics.geometric_mean", "list", data,
-                exec_ctx, "lib_.statistics_.Statistics.execute_statistics_geometric_mean"
-            ))
-
-        data_: list[int | float] = []
-        for e in data.elements:
-            if not isinstance(e, Number):
+        for x in data:
+            if x < 0:
                 return RTResult().failure(RTTypeError(
-                    e.pos_start, e.pos_end,
-                    f"first argument of built-in function 'statistics.geometric_mean' must be a list of "
-                    f"positive numbers, but found an element of type '{e.type_}'.",
+                    *self.arg_pos(0),
+                    f"first argument of built-in function 'statistics.geometric_mean' must be a list of positive "
+                    f"numbers, but found a negative number of value {x}.",
                     exec_ctx, "lib_.statistics_.Statistics.execute_statistics_geometric_mean"
                 ))
-            if e.value < 0:
-                return RTResult().failure(RTTypeError(
-                    e.pos_start, e.pos_end,
-                    f"first argument of built-in function 'statistics.geometric_mean' must be a list of "
-                    f"positive numbers, but found a negative number of value {e.value}.",
-                    exec_ctx, "lib_.statistics_.Statistics.execute_statistics_geometric_mean"
-                ))
-            data_.append(e.value)
 
-        if len(data_) == 0:  # data must not be empty
+        if len(data) == 0:  # data must not be empty
             return RTResult().failure(RTStatisticsError(
-                data.pos_start, data.pos_end,
-                "first argument of built-in function 'statistics.geometric_mean' must not be empty.",
+                *self.arg_pos(0), "first argument of built-in function 'statistics.geometric_mean' must not be empty.",
                 exec_ctx, "lib_.statistics_.Statistics.execute_statistics_geometric_mean"
             ))
 
         try:
-            geometric_mean_ = statistics.geometric_mean(data_)  # we try to calculate the geometric mean
+            geometric_mean_ = statistics.geometric_mean(data)  # we try to calculate the geometric mean
         except Exception as exception:
             return RTResult().failure(RunTimeError(
                 self.pos_start, self.pos_end,
@@ -154,90 +367,51 @@ class Statistics(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["list[number]"]
     }
 
-    def execute_statistics_harmonic_mean(self, exec_ctx: Context):
+    def execute_statistics_harmonic_mean(self, exec_ctx: Context, data: Sequence[int | float],
+                                         weights: Sequence[int | float] | None):
         """Returns the harmonic mean of a statistical series"""
-        # Params:
-        # * data
-        # Optional params:
-        # * weights
-        assert exec_ctx.symbol_table is not None
-        data = exec_ctx.symbol_table.getf('data')  # we get the data
-        if not isinstance(data, List):  # the data must be a list
-            assert data is not None
-            return RTResult().failure(RTTypeErrorF(
-                data.pos_start, data.pos_end, "first", "statistics.harmonic_mean", "list", data,
-                exec_ctx, "lib_.statistics_.Statistics.execute_statistics_harmonic_mean"
-            ))
-
-        weights = exec_ctx.symbol_table.getf('weights')  # we get the list of weights
-        if weights is not None and not isinstance(weights, List):  # if the weights list is defined but not a list
-            return RTResult().failure(RTTypeErrorF(
-                weights.pos_start, weights.pos_end, "second", "statistics.harmonic_mean", "list", weights,
-                exec_ctx, "lib_.statistics_.Statistics.execute_statistics_harmonic_mean"
-            ))
-
-        if weights is not None and len(weights.elements) != len(data.elements):
+        if weights is not None and len(weights) != len(data):
             # if the weights list is defined but doesn't match with the data
             return RTResult().failure(RTIndexError(
-                data.pos_start, weights.pos_end,
+                self.arg_pos(0)[0], self.arg_pos(1)[1],
                 "the two arguments of built-in function 'statistics_harmonic_mean' must have the same length.",
                 exec_ctx, "lib_.statistics_.Statistics.execute_statistics_harmonic_mean"
             ))
 
-        data_: list[int | float] = []
-        for e in data.elements:
-            if not isinstance(e, Number):  # the data must contain only numbers
-                return RTResult().failure(RTTypeError(
-                    e.pos_start, e.pos_end,
-                    f"first argument of built-in function 'statistics.harmonic_mean' must be a list of positive"
-                    f" numbers, but found an element of type '{e.type_}'.",
-                    exec_ctx, "lib_.statistics_.Statistics.execute_statistics_harmonic_mean"
-                ))
-            if e.value < 0:  # the data must contain only positive numbers
+        for x in data:
+            if x < 0:
                 return RTResult().failure(RTTypeError(
-                    e.pos_start, e.pos_end,
-                    "first argument of built-in function 'statistics.harmonic_mean' must be a list of "
-                    f"positives numbers, but found a negative element of value '{e.value}'.",
+                    *self.arg_pos(0),
+                    f"first argument of built-in function 'statistics.harmonic_mean' must be a list of positive "
+                    f"numbers, but found a negative number of value {x}.",
                     exec_ctx, "lib_.statistics_.Statistics.execute_statistics_harmonic_mean"
                 ))
-            data_.append(e.value)
 
-        if len(data_) == 0:  # data must not be empty
+        if len(data) == 0:  # data must not be empty
             return RTResult().failure(RTStatisticsError(
-                data.pos_start, data.pos_end,
-                "first argument of built-in function 'statistics.harmonic_mean' must not be empty.",
+                *self.arg_pos(0), "first argument of built-in function 'statistics.harmonic_mean' must not be empty.",
                 exec_ctx, "lib_.statistics_.Statistics.execute_statistics_harmonic_mean"
             ))
 
-        if weights is not None:  # if there is weights
-            weights_: list[int | float] | None = []
-            for e in weights.elements:
-                if not isinstance(e, Number):  # a weight must be a positive number
-                    return RTResult().failure(RTTypeError(
-                        e.pos_start, e.pos_end,
-                        f"first argument of built-in function 'statistics.harmonic_mean' must be a list of "
-                        f"positive numbers, but found an element of type '{e.type_}'.",
-                        exec_ctx, "lib_.statistics_.Statistics.execute_statistics_harmonic_mean"
-                    ))
-                if e.value < 0:  # a weight must be a positive number
+        if weights is not None:  # if there is weights, they must be positive numbers
+            for x in weights:
+                if x < 0:
                     return RTResult().failure(RTTypeError(
-                        e.pos_start, e.pos_end,
-                        "first argument of built-in function 'statistics.harmonic_mean' must be a list of "
-                        f"positives numbers, but found a negative element of value '{e.value}'.",
+                        *self.arg_pos(1),
+                        f"second argument of built-in function 'statistics.harmonic_mean' must be a list of positive "
+                        f"numbers, but found a negative number of value {x}.",
                         exec_ctx, "lib_.statistics_.Statistics.execute_statistics_harmonic_mean"
                     ))
-                weights_.append(e.value)
-        else:  # weights list is not defined, so all the weights are 1
-            weights_ = None
 
         try:  # we try to calculate the harmonic mean
-            if weights_ is None:  # weights aren't defined
-                harmonic_mean_ = statistics.harmonic_mean(data_)
+            if weights is None:  # weights aren't defined
+                harmonic_mean_ = statistics.harmonic_mean(data)
             else:  # they are
-                harmonic_mean_ = statistics.harmonic_mean(data_, weights=weights_)
+                harmonic_mean_ = statistics.harmonic_mean(data, weights=weights)
         except Exception as exception:
             return RTResult().failure(RunTimeError(
                 self.pos_start, self.pos_end,
@@ -255,47 +429,19 @@ class Statistics(ModuleFunction):
         "optional_params": ["weights"],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["list[number]", "list[number]"]
     }
 
-    def execute_statistics_median(self, exec_ctx: Context):
+    def execute_statistics_median(self, exec_ctx: Context, data: Sequence[int | float]):
         """Calculates the median of a statistical series"""
-        # Params:
-        # * data
-        assert exec_ctx.symbol_table is not None
-        data = exec_ctx.symbol_table.getf('data')  # we get the data
-        if not isinstance(data, List):  # data must be a list
-            assert data is not None
-            return RTResult().failure(RTTypeErrorF(
-                data.pos_start, data.pos_end, "first", "statistics.median", "list", data,
-                exec_ctx, "lib_.statistics_.Statistics.execute_statistics_median"
-            ))
-
-        data_: list[int | float] = []
-        for e in data.elements:
-            if not isinstance(e, Number):  # data must contain only numbers
-                return RTResult().failure(RTTypeError(
-                    e.pos_start, e.pos_end,
-                    f"first argument of built-in function 'statistics.median' must be a list of numbers, not "
-                    f"{e.type_}.", exec_ctx, "lib_.statistics_.Statistics.execute_statistics_median"
-                ))
-            data_.append(e.value)
-
-        if len(data_) == 0:  # data must not be empty
+        if len(data) == 0:  # data must not be empty
             return RTResult().failure(RTStatisticsError(
-                data.pos_start, data.pos_end,
-                "first argument of built-in function 'statistics.median' must not be empty.",
+                *self.arg_pos(0), "first argument of built-in function 'statistics.median' must not be empty.",
                 exec_ctx, "lib_.statistics_.Statistics.execute_statistics_median"
             ))
 
-        try:  # we try to calculate the median
-            median_ = statistics.median(data_)
-        except statistics.StatisticsError as exception:
-            return RTResult().failure(RTStatisticsError(
-                self.pos_start, self.pos_end, str(exception) + '.', exec_ctx,
-                "lib_.statistics_.Statistics.execute_statistics_median"
-            ))
-
+        median_ = _median(data)  # selects the middle values instead of sorting the data
         return RTResult().success(Number(median_, self.pos_start, self.pos_end))
 
     functions["median"] = {
@@ -304,7 +450,8 @@ class Statistics(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["list[number]"]
     }
 
     # HERE THE DISCLAIMER BEFORE THE DECLARATION OF PYTHON statistics.quantiles FUNCTION:
@@ -348,7 +495,8 @@ class Statistics(ModuleFunction):
 
     # THAT WAS THE DISCLAIMER BEFORE THE DECLARATION OF PYTHON statistics.quantiles FUNCTION :)
 
-    def execute_statistics_quantiles(self, exec_ctx: Context):
+    def execute_statistics_quantiles(self, exec_ctx: Context, data: Sequence[int | float], n: int | None,
+                                     method: str | None):
         """Like python statistics.quantiles()
         Here the doc of statistics.quantiles() python function:
 
@@ -367,87 +515,39 @@ class Statistics(ModuleFunction):
         data.  The minimum value is treated as the 0th percentile and the
         maximum value is treated as the 100th percentile.
         """
-        # Params:
-        # * data
-        # Optional params:
-        # * n
-        # * method
         # By default, n=4 and method='exclusive'
-
-        assert exec_ctx.symbol_table is not None
-        data = exec_ctx.symbol_table.getf('data')  # we get the data
-        if not isinstance(data, List):  # the data must be a list
-            assert data is not None
-            return RTResult().failure(RTTypeErrorF(
-                data.pos_start, data.pos_end, "first", "statistics.quantiles", "list", data,
-                exec_ctx, "lib_.statistics_.Statistics.execute_statistics_quantiles"
-            ))
-
-        n = exec_ctx.symbol_table.getf('n')  # we get 'n' (the number of quantiles we want)
         if n is None:  # if it's not defined, we want quartiles by default
-            n = Number(4, self.pos_start, self.pos_end)
-
-        if not (isinstance(n, Number) and isinstance(n.value, int)):  # 'n' must be a number
-            return RTResult().failure(RTTypeErrorF(
-                n.pos_start, n.pos_end, "second", "statistics.quantiles", "int", n,
-                exec_ctx, "lib_.statistics_.Statistics.execute_statistics_quantiles"
-            ))
-
-        if n.value < 1:  # 'n' must be at least 1
+            n = 4
+        if n < 1:  # 'n' must be at least 1
             return RTResult().failure(RTStatisticsError(
-                n.pos_start, n.pos_end,
+                *self.arg_pos(1),
                 "second argument of built-in function 'statistics.quantiles' must be greater than or equal to 1.",
                 exec_ctx, "lib_.statistics_.Statistics.execute_statistics_quantiles"
             ))
 
-        method = exec_ctx.symbol_table.getf('method')  # we get the method we use
         if method is None:
-            method = String('exclusive', self.pos_start, self.pos_end)  # if the method is not defined we use the exclusive method
-
-        if not isinstance(method, String):  # the method must be a string
-            return RTResult().failure(RTTypeErrorF(
-                method.pos_start, method.pos_end, "third", "statistics.quantiles", "str", method,
-                exec_ctx, "lib_.statistics_.Statistics.execute_statistics_quantiles"
-            ))
-
-        method_name = method.value
+            method = 'exclusive'  # if the method is not defined we use the exclusive method
         # the following is dumb but not as much as VScode type checking extension
-        if method_name == "inclusive":
+        if method == "inclusive":
             method_name_correct = "inclusive"
-        elif method_name == "exclusive":
+        elif method == "exclusive":
             method_name_correct = "exclusive"
         else:
             return RTResult().failure(RTStatisticsError(
-                method.pos_start, method.pos_end,
-                f"unknown method: {method.value}.",
+                *self.arg_pos(2),
+                f"unknown method: {method}.",
                 exec_ctx, "lib_.statistics_.Statistics.execute_statistics_quantiles"
             ))
 
-        data_: list[int | float] = []
-        for e in data.elements:
-            if not isinstance(e, Number):  # the data must contain only numbers
-                return RTResult().failure(RTTypeError(
-                    e.pos_start, e.pos_end,
-                    f"first argument of built-in function 'statistics.quantiles' must be a list of numbers, but "
-                    f"found an element of type '{e.type_}'.",
-                    exec_ctx, "lib_.statistics_.Statistics.execute_statistics_quantiles"
-                ))
-            data_.append(e.value)
-
-        if len(data_) in [0, 1]:
+        if len(data) in [0, 1]:
             return RTResult().failure(RTStatisticsError(
-                data.pos_start, data.pos_end,
+                *self.arg_pos(0),
                 "first argument of built-in function 'statistics.quantiles' must have at least two elements.",
                 exec_ctx, "lib_.statistics_.Statistics.execute_statistics_quantiles"
             ))
 
-        try:  # we try to calculate quantiles
-            quantiles_ = statistics.quantiles(data_, n=n.value, method=method_name_correct)
-        except statistics.StatisticsError as exception:
-            return RTResult().failure(RTStatisticsError(
-                self.pos_start, self.pos_end, str(exception) + '.', exec_ctx,
-                "lib_.statistics_.Statistics.execute_statistics_quantiles"
-            ))
+        # selects the values around the cut points instead of sorting the data (if there are only a few cut points)
+        quantiles_ = _quantiles(data, n, method_name_correct)
 
         new_quantiles = [py2noug(q, self.pos_start, self.pos_end) for q in quantiles_]
         return RTResult().success(List(new_quantiles, self.pos_start, self.pos_end))
@@ -458,40 +558,19 @@ class Statistics(ModuleFunction):
         "optional_params": ["n", "method"],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["list[number]", "int", "str"]
     }
 
-    def execute_statistics_scope(self, exec_ctx: Context):
+    def execute_statistics_scope(self, exec_ctx: Context, data: Sequence[int | float]):
         """Returns the scope of a list, i.e. the difference between the max and the min value."""
-        # Params:
-        # * data
-        assert exec_ctx.symbol_table is not None
-        data = exec_ctx.symbol_table.getf('data')  # we get the data
-        if not isinstance(data, List):  # data must be a list
-            assert data is not None
-            return RTResult().failure(RTTypeErrorF(
-                data.pos_start, data.pos_end, "first", "statistics.scope", "list", data,
-                exec_ctx, "lib_.statistics_.Statistics.execute_statistics_scope"
-            ))
-
-        data_: list[int | float] = []
-        for e in data.elements:
-            if not isinstance(e, Number):  # data must contain only numbers
-                return RTResult().failure(RTTypeError(
-                    e.pos_start, e.pos_end,
-                    f"first argument of built-in function 'statistics.scope' must be a list of numbers, but found an "
-                    f"element of type '{e.type_}'.", exec_ctx, "lib_.statistics_.Statistics.execute_statistics_scope"
-                ))
-            data_.append(e.value)
-
-        if len(data_) < 1:  # data must not be empty
+        if len(data) == 0:  # data must not be empty
             return RTResult().failure(RTTypeError(
-                data.pos_start, data.pos_end,
-                "first argument of built-in function 'statistics.scope' must not be empty.", exec_ctx,
-                "lib_.statistics_.Statistics.execute_statistics_scope"
+                *self.arg_pos(0), "first argument of built-in function 'statistics.scope' must not be empty.",
+                exec_ctx, "lib_.statistics_.Statistics.execute_statistics_scope"
             ))
 
-        scope = max(data_) - min(data_)  # we calculate the scope
+        scope = max(data) - min(data)  # we calculate the scope
         return RTResult().success(Number(scope, self.pos_start, self.pos_end))
 
     functions["scope"] = {
@@ -500,40 +579,19 @@ class Statistics(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["list[number]"]
     }
 
-    def execute_statistics_mode(self, exec_ctx: Context):
+    def execute_statistics_mode(self, exec_ctx: Context, data: Sequence[int | float]):
         """The mode of a list, i.e. the most common value."""
-        # Params:
-        # * data
-        assert exec_ctx.symbol_table is not None
-        data = exec_ctx.symbol_table.getf('data')  # we get the data
-        if not isinstance(data, List):  # the data must be a list
-            assert data is not None
-            return RTResult().failure(RTTypeErrorF(
-                data.pos_start, data.pos_end, "first", "statistics.mode", "list", data,
-                exec_ctx, "lib_.statistics_.Statistics.execute_statistics_mode"
-            ))
-
-        data_: list[int | float] = []
-        for e in data.elements:
-            if not isinstance(e, Number):  # the data must contain only numbers
-                return RTResult().failure(RTTypeError(
-                    e.pos_start, e.pos_end,
-                    f"first argument of built-in function 'statistics.mode' must be a list of numbers, but found an "
-                    f"element of type '{e.type_}'.", exec_ctx, "lib_.statistics_.Statistics.execute_statistics_mode"
-                ))
-            data_.append(e.value)
-
-        if len(data_) < 1:  # the data must not be empty
+        if len(data) == 0:  # data must not be empty
             return RTResult().failure(RTTypeError(
-                data.pos_start, data.pos_end,
-                "first argument of built-in function 'statistics.mode' must not be empty.", exec_ctx,
-                "lib_.statistics_.Statistics.execute_statistics_mode"
+                *self.arg_pos(0), "first argument of built-in function 'statistics.mode' must not be empty.",
+                exec_ctx, "lib_.statistics_.Statistics.execute_statistics_mode"
             ))
 
-        mode = statistics.mode(data_)  # we calculate the mode
+        mode = statistics.mode(data)  # we calculate the mode
         return RTResult().success(Number(mode, self.pos_start, self.pos_end))
 
     functions["mode"] = {
@@ -542,17 +600,13 @@ class Statistics(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["list[number]"]
     }
 
-    def execute_statistics_multimode(self, exec_ctx: Context):
+    def execute_statistics_multimode(self, exec_ctx: Context, data: Value):
         """The list of the modes of a list/str, i.e. the most common values."""
-        # Params:
-        # * data
-        assert exec_ctx.symbol_table is not None
-        data = exec_ctx.symbol_table.getf('data')  # we get the data
         if not (isinstance(data, List) or isinstance(data, String)):  # we check if the data is a list or a str
-            assert data is not None
             return RTResult().failure(RTTypeErrorF(
                 data.pos_start, data.pos_end, "first", "statistics.multimode", "list", data,
                 exec_ctx, "lib_.statistics_.Statistics.execute_statistics_multimode", or_="str"
@@ -560,7 +614,7 @@ class Statistics(ModuleFunction):
 
         if isinstance(data, List):
             data_: list[int | float | str] | str = []
-            for e in data.elements:
+            for e in data.iter_values():
                 if not (isinstance(e, Number) or isinstance(e, String)):  # data must contain only str and nums
                     return RTResult().failure(RTTypeError(
                         e.pos_start, e.pos_end,
@@ -582,18 +636,217 @@ class Statistics(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["any"]
+    }
+
+    def execute_statistics_describe(self, exec_ctx: Context, data: Value):
+        """Returns a dict with the count, the mean, the variance, the standard deviation, the min, the max, the median,
+        the quartiles and the mode of a statistical series. The series is converted only once for all of them."""
+        elements = _elements(data)
+        if elements is None:
+            return RTResult().failure(RTTypeErrorF(
+                data.pos_start, data.pos_end, "first", "statistics.describe", "list", data,
+                exec_ctx, "lib_.statistics_.Statistics.execute_statistics_describe", or_="array"
+            ))
+
+        if isinstance(data, List) and data.storage.strategy is Number:
+            data_: Sequence[int | float] = data.storage.items  # the numbers are not boxed: they are not copied
+        elif isinstance(data, Array):
+            data_ = data.data
+        elif isinstance(data, Range):
+            data_ = data.range_
+        else:
+            data_ = []
+            for e in elements:
+                if not isinstance(e, Number):  # the data must contain only numbers
+                    return RTResult().failure(RTTypeError(
+                        data.pos_start if not isinstance(e, Value) else e.pos_start,
+                        data.pos_end if not isinstance(e, Value) else e.pos_end,
+                        f"first argument of built-in function 'statistics.describe' must be a list of numbers, but "
+                        f"found an element of type '{e.type_ if isinstance(e, Value) else 'str'}'.",
+                        exec_ctx, "lib_.statistics_.Statistics.execute_statistics_describe"
+                    ))
+                data_.append(e.value)
+            if isinstance(data, Generator) and data.error is not None:  # the body of the generator failed
+                return RTResult().failure(data.error)
+
+        count = len(data_)
+        if count == 0:  # data must not be empty
+            return RTResult().failure(RTStatisticsError(
+                data.pos_start, data.pos_end,
+                "first argument of built-in function 'statistics.describe' must not be empty.",
+                exec_ctx, "lib_.statistics_.Statistics.execute_statistics_describe"
+            ))
+
+        mean_ = math.fsum(data_) / count
+        variance = math.fsum((x - mean_) ** 2 for x in data_) / (count - 1) if count > 1 else None
+        # the quartiles are computed like `statistics.quantiles(data)`
+        quartiles = _quantiles(data_, 4, "exclusive") if count > 1 else [None, None, None]
+
+        description = {
+            "count": count, "mean": mean_, "variance": variance,
+            "stdev": math.sqrt(variance) if variance is not None else None,
+            "min": min(data_), "max": max(data_), "median": _median(data_),
+            "q1": quartiles[0], "q3": quartiles[2], "mode": statistics.mode(data_)
+        }
+        return RTResult().success(py2noug(description, self.pos_start, self.pos_end))
+
+    functions["describe"] = {
+        "function": execute_statistics_describe,
+        "param_names": ["data"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False,
+        "param_types": ["any"]
+    }
+
+    def execute_statistics_running_stats(self, exec_ctx: Context):
+        """Returns an accumulator of the count, the mean, the variance, the min and the max of the values given to
+        `statistics.feed`"""
+        return RTResult().success(StatisticsAccumulator(_RunningStats(), self.pos_start, self.pos_end))
+
+    functions["running_stats"] = {
+        "function": execute_statistics_running_stats,
+        "param_names": [],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False,
+        "param_types": []
+    }
+
+    def execute_statistics_quantile_sketch(self, exec_ctx: Context, p: int | float | None):
+        """Returns an accumulator estimating the `p` quantile (0.5 by default, i.e. the median) of the values given to
+        `statistics.feed`, with constant memory"""
+        if p is None:
+            p = 0.5
+        if not 0 < p < 1:
+            return RTResult().failure(RTStatisticsError(
+                *self.arg_pos(0),
+                "first argument of built-in function 'statistics.quantile_sketch' must be between 0 and 1 (excluded).",
+                exec_ctx, "lib_.statistics_.Statistics.execute_statistics_quantile_sketch"
+            ))
+
+        return RTResult().success(StatisticsAccumulator(_QuantileSketch(p), self.pos_start, self.pos_end))
+
+    functions["quantile_sketch"] = {
+        "function": execute_statistics_quantile_sketch,
+        "param_names": [],
+        "optional_params": ["p"],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False,
+        "param_types": ["number"]
+    }
+
+    def execute_statistics_mode_sketch(self, exec_ctx: Context, width: int | None, depth: int | None):
+        """Returns an accumulator estimating the mode of the values (numbers or strs) given to `statistics.feed`, with
+        `depth` rows of `width` counters (2048 and 4 by default)"""
+        if width is None:
+            width = 2048
+        if depth is None:
+            depth = 4
+        for index, size in enumerate((width, depth)):
+            if size < 1:
+                return RTResult().failure(RTStatisticsError(
+                    *self.arg_pos(index),
+                    f"{ORDINALS[index]} argument of built-in function 'statistics.mode_sketch' must be greater than or "
+                    f"equal to 1.",
+                    exec_ctx, "lib_.statistics_.Statistics.execute_statistics_mode_sketch"
+                ))
+
+        sketch = _ModeSketch(width, depth)
+        return RTResult().success(StatisticsAccumulator(sketch, self.pos_start, self.pos_end))
+
+    functions["mode_sketch"] = {
+        "function": execute_statistics_mode_sketch,
+        "param_names": [],
+        "optional_params": ["width", "depth"],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False,
+        "param_types": ["int", "int"]
+    }
+
+    def execute_statistics_feed(self, exec_ctx: Context, accumulator: Value, data: Value):
+        """Gives a value, or all the values of a list, an array, a range, a deque or a generator, to an accumulator.
+        Returns the accumulator."""
+        if not isinstance(accumulator, StatisticsAccumulator):
+            return RTResult().failure(RTTypeErrorF(
+                accumulator.pos_start, accumulator.pos_end, "first", "statistics.feed", "statistics_accumulator",
+                accumulator, exec_ctx, "lib_.statistics_.Statistics.execute_statistics_feed"
+            ))
+        sketch = accumulator.sketch
+        add = sketch.add
+
+        if isinstance(data, Number) or isinstance(data, String):  # a single value
+            elements: Iterable[Value | int | float | str] | None = [data]
+        else:
+            elements = _elements(data)
+        if elements is None:
+            return RTResult().failure(RTTypeErrorF(
+                data.pos_start, data.pos_end, "second", "statistics.feed", "number", data,
+                exec_ctx, "lib_.statistics_.Statistics.execute_statistics_feed",
+                or_="list, array, range, deque or generator"
+            ))
+
+        if isinstance(data, Array) or isinstance(data, Range) or (
+                isinstance(data, List) and data.storage.strategy is Number):
+            for x in elements:  # the numbers are not boxed
+                add(x)
+            return RTResult().success(accumulator)
+
+        accepts_str = sketch.accepts_str
+        for e in elements:
+            if isinstance(e, Number) or (accepts_str and isinstance(e, String)):
+                add(e.value)
+            elif accepts_str and isinstance(e, str):  # element of an unboxed list of strs
+                add(e)
+            else:
+                return RTResult().failure(RTTypeError(
+                    data.pos_start if not isinstance(e, Value) else e.pos_start,
+                    data.pos_end if not isinstance(e, Value) else e.pos_end,
+                    f"second argument of built-in function 'statistics.feed' must be "
+                    f"{'a number or a str' if accepts_str else 'a number'}, or contain only "
+                    f"{'numbers and strs' if accepts_str else 'numbers'}, but found an element of type "
+                    f"'{e.type_ if isinstance(e, Value) else 'str'}'.",
+                    exec_ctx, "lib_.statistics_.Statistics.execute_statistics_feed"
+                ))
+        if isinstance(data, Generator) and data.error is not None:  # the body of the generator failed
+            return RTResult().failure(data.error)
+        return RTResult().success(accumulator)
+
+    functions["feed"] = {
+        "function": execute_statistics_feed,
+        "param_names": ["accumulator", "data"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False,
+        "param_types": ["any", "any"]
+    }
+
+    def execute_statistics_summary(self, exec_ctx: Context, accumulator: Value):
+        """Returns a dict with the statistics computed by an accumulator. The statistics that can not be computed yet
+        (e.g. the mean of no values) are None."""
+        if not isinstance(accumulator, StatisticsAccumulator):
+            return RTResult().failure(RTTypeErrorF(
+                accumulator.pos_start, accumulator.pos_end, "first", "statistics.summary", "statistics_accumulator",
+                accumulator, exec_ctx, "lib_.statistics_.Statistics.execute_statistics_summary"
+            ))
+        return RTResult().success(py2noug(accumulator.sketch.summary(), self.pos_start, self.pos_end))
+
+    functions["summary"] = {
+        "function": execute_statistics_summary,
+        "param_names": ["accumulator"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False,
+        "param_types": ["any"]
     }
 
 
-WHAT_TO_IMPORT = {  # what are the new entries in the symbol table when the module is imported
-    # functions
-    "mean": Statistics("mean"),
-    "geometric_mean": Statistics("geometric_mean"),
-    "harmonic_mean": Statistics("harmonic_mean"),
-    "median": Statistics("median"),
-    "quantiles": Statistics("quantiles"),
-    "scope": Statistics("scope"),
-    "mode": Statistics("mode"),
-    "multimode": Statistics("multimode"),
-}
+WHAT_TO_IMPORT = LazyTable(Statistics)
@@ -17,9 +17,10 @@
 from lib_.lib_to_make_libs import *
 # Comment about the above line : Context, RTResult and values are imported in lib_to_make_libs.py
 # built-in python imports
+import statistics
 import time
 
-__LIB_VERSION__ = 4
+__LIB_VERSION__ = 5
 
 # CONSTANTS
 TIMEZONE = Number(time.timezone, *default_pos())
@@ -43,20 +44,9 @@ class Time(ModuleFunction):
     # =========
     # FUNCTIONS
     # =========
-    def execute_time_sleep(self, exec_ctx: Context):
+    def execute_time_sleep(self, exec_ctx: Context, seconds: int | float):
         """Like python time.sleep()"""
-        # Params:
-        # * seconds
-        assert exec_ctx.symbol_table is not None
-        seconds = exec_ctx.symbol_table.getf('seconds')  # we get the number of seconds we have to sleep
-        if not isinstance(seconds, Number):  # we check if it is a number
-            assert seconds is not None
-            return RTResult().failure(RTTypeErrorF(
-                seconds.pos_start, seconds.pos_end, "first", "time.sleep", "number", seconds,
-                exec_ctx, "lib_.time_.Time.execute_time_sleep"
-            ))
-
-        time.sleep(seconds.value)  # we sleep
+        time.sleep(seconds)  # we sleep
         return RTResult().success(NoneValue(self.pos_start, self.pos_end, False))
 
     functions["sleep"] = {
@@ -65,24 +55,13 @@ class Time(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["number"]
     }
 
-    def execute_time_sleep_milliseconds(self, exec_ctx: Context):
+    def execute_time_sleep_milliseconds(self, exec_ctx: Context, milliseconds: int):
         """Like python time.sleep() but the value is in milliseconds"""
-        # Params:
-        # * milliseconds
-        assert exec_ctx.symbol_table is not None
-        milliseconds = exec_ctx.symbol_table.getf('milliseconds')  # we get the number of milliseconds we have to sleep
-        if not isinstance(milliseconds, Number) or not milliseconds.is_int():  # we check if it is a number
-            assert milliseconds is not None
-            return RTResult().failure(RTTypeErrorF(
-                milliseconds.pos_start, milliseconds.pos_end, "first", "time.sleep_milliseconds", "integer",
-                milliseconds,
-                exec_ctx, "lib_.time_.Time.execute_time_sleep_milliseconds"
-            ))
-
-        time.sleep(milliseconds.value / 1000)  # ms/1000 = sec
+        time.sleep(milliseconds / 1000)  # ms/1000 = sec
         return RTResult().success(NoneValue(self.pos_start, self.pos_end, False))
 
     functions["sleep_milliseconds"] = {
@@ -91,10 +70,11 @@ class Time(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": ["int"]
     }
 
-    def execute_time_time(self):
+    def execute_time_time(self, exec_ctx: Context):
         """Like python time.time()"""
         return RTResult().success(Number(time.time(), self.pos_start, self.pos_end))
 
@@ -104,10 +84,11 @@ class Time(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": []
     }
 
-    def execute_time_epoch(self):
+    def execute_time_epoch(self, exec_ctx: Context):
         """Like python time.gmtime(0), but returns a string"""
         epoch = time.gmtime(0)
         return RTResult().success(
@@ -123,16 +104,101 @@ class Time(ModuleFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "param_types": []
     }
 
+    def execute_time_perf_counter_ns(self, exec_ctx: Context):
+        """Like python time.perf_counter_ns(): the value (in nanoseconds) of the clock with the highest resolution, to
+        measure short durations. Only the difference between two values is meaningful."""
+        return RTResult().success(Number(time.perf_counter_ns(), self.pos_start, self.pos_end))
 
-WHAT_TO_IMPORT = {  # what are the new entries in the symbol table when the module is imported
-    # functions
-    "sleep": Time("sleep"),
-    "sleep_milliseconds": Time("sleep_milliseconds"),
-    "time": Time("time"),
-    "epoch": Time("epoch"),
-    # constants
-    "timezone": TIMEZONE,
-}
+    functions["perf_counter_ns"] = {
+        "function": execute_time_perf_counter_ns,
+        "param_names": [],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False,
+        "param_types": []
+    }
+
+    def execute_time_monotonic_ns(self, exec_ctx: Context):
+        """Like python time.monotonic_ns(): the value (in nanoseconds) of a clock that can not go backwards. Only the
+        difference between two values is meaningful."""
+        return RTResult().success(Number(time.monotonic_ns(), self.pos_start, self.pos_end))
+
+    functions["monotonic_ns"] = {
+        "function": execute_time_monotonic_ns,
+        "param_names": [],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False,
+        "param_types": []
+    }
+
+    def execute_time_process_time_ns(self, exec_ctx: Context):
+        """Like python time.process_time_ns(): the CPU time of the process (in nanoseconds), without the time spent
+        sleeping. Only the difference between two values is meaningful."""
+        return RTResult().success(Number(time.process_time_ns(), self.pos_start, self.pos_end))
+
+    functions["process_time_ns"] = {
+        "function": execute_time_process_time_ns,
+        "param_names": [],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False,
+        "param_types": []
+    }
+
+    def execute_time_bench(self, exec_ctx: Context, func: BaseFunction, repeat: int | None, number: int | None):
+        """Calls `func` (without arguments) `number` times in a row, `repeat` times, after one call to warm up. Returns
+        a dict with the min, the median and the standard deviation of the durations of one call (in seconds), over the
+        `repeat` measures. By default, repeat is 5 and number is 1."""
+        if repeat is None:
+            repeat = 5
+        if number is None:
+            number = 1
+        for index, count in ((1, repeat), (2, number)):
+            if count < 1:
+                return RTResult().failure(RunTimeError(
+                    *self.arg_pos(index),
+                    f"{ORDINALS[index]} argument of built-in function 'time.bench' must be greater than or equal to 1.",
+                    exec_ctx, origin_file="lib_.time_.Time.execute_time_bench"
+                ))
+
+        result = RTResult()
+        call = self.caller(func, exec_ctx)
+        result.register(call([]))  # warm up
+        if result.should_return():
+            return result
+
+        durations: list[float] = []
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            for _ in range(number):
+                result.register(call([]))
+                if result.should_return():
+                    return result
+            durations.append((time.perf_counter_ns() - start) / number / 1e9)
+
+        bench = {
+            "min": min(durations), "median": statistics.median(durations),
+            "stdev": statistics.stdev(durations) if repeat > 1 else 0, "repeat": repeat, "number": number
+        }
+        return result.success(py2noug(bench, self.pos_start, self.pos_end))
+
+    functions["bench"] = {
+        "function": execute_time_bench,
+        "param_names": ["func"],
+        "optional_params": ["repeat", "number"],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False,
+        "param_types": ["function", "int", "int"]
+    }
+
+
+WHAT_TO_IMPORT = LazyTable(Time, {"timezone": TIMEZONE})
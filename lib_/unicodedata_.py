@@ -19,7 +19,7 @@ from lib_.lib_to_make_libs import *
 # built-in python imports
 import unicodedata
 
-__LIB_VERSION__ = 4
+__LIB_VERSION__ = 5
 UNICODEDATA_VERSION = unicodedata.unidata_version
 
 
@@ -357,18 +357,4 @@ class UnicodeData(ModuleFunction):
     }
 
 
-WHAT_TO_IMPORT = {  # what are the new entries in the symbol table when the module is imported
-    # constants
-    "unicodedata_version": String(UNICODEDATA_VERSION, *default_pos()),
-    # functions
-    "lookup": UnicodeData("lookup"),
-    "name": UnicodeData("name"),
-    "category": UnicodeData("category"),
-    "bidirectional": UnicodeData("bidirectional"),
-    "combining": UnicodeData("combining"),
-    "east_asian_width": UnicodeData("east_asian_width"),
-    "mirrored": UnicodeData("mirrored"),
-    "decomposition": UnicodeData("decomposition"),
-    "normalize": UnicodeData("normalize"),
-    "is_normalized": UnicodeData("is_normalized")
-}
+WHAT_TO_IMPORT = LazyTable(UnicodeData, {"unicodedata_version": String(UNICODEDATA_VERSION, *default_pos())})
@@ -19,7 +19,7 @@ from lib_.lib_to_make_libs import *  # useful stuff to make libs.
 # built-in python imports
 import webbrowser
 
-__LIB_VERSION__ = 4
+__LIB_VERSION__ = 5
 
 
 class WebBrowserError(RunTimeError):
@@ -107,6 +107,4 @@ class WebBrowser(ModuleFunction):
     }
 
 
-WHAT_TO_IMPORT = {
-    "open": WebBrowser("open")
-}
+WHAT_TO_IMPORT = LazyTable(WebBrowser)
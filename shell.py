@@ -28,6 +28,7 @@ from src.runtime.values.basevalues.basevalues import List
 from src.errors.errors import Error
 from src.noug_version import VERSION, VERSION_ID, DATA_VERSION, LIB_VERSION
 import src.conffiles
+import src.server
 # built in python imports
 import sys
 import os
@@ -144,6 +145,69 @@ def execute_file(path: str, debug_on: bool, noug_dir: str, version: str,
             sys.exit(1)
 
 
+def execute_command(line_to_exec: str, noug_dir: str, args: list[str],
+                    work_dir: str, dont_verbose: bool):
+    if line_to_exec == "":
+        sys.exit()
+
+    try:  # we try to run it
+        result, error, _ = nougaro.run(
+            '<commandline>', line_to_exec, noug_dir, VERSION, args=args,
+            work_dir=work_dir
+        )
+    except KeyboardInterrupt:
+        # if CTRL+C, just stop to run the line and ask for another input
+        print_in_red("\nKeyboardInterrupt")
+        sys.exit()
+    except EOFError:
+        print_in_red("\nEOF")
+        sys.exit()
+
+    print_result_and_error(result, error, dont_verbose, True)
+    if error is not None:
+        sys.exit(1)
+
+
+def run_server_request(args: list[str], noug_dir: str, debug_on: bool):
+    """Runs the arguments sent by a client of the Nougaro server, in the
+    (forked) process of the server"""
+    path, line_to_exec, dont_verbose, interactive = check_arguments(
+        args, noug_dir, VERSION
+    )
+    if path == "<stdin>" or interactive:
+        print_in_red("[nougaro] the shell can not be opened through the server.")
+        sys.exit(1)
+
+    if path == "<commandline>":
+        assert line_to_exec is not None
+        work_dir = os.getcwd()
+        if not (work_dir.endswith("/") or work_dir.endswith("\\")):
+            work_dir += "/"
+        execute_command(line_to_exec, noug_dir, args, work_dir, dont_verbose)
+    else:
+        execute_file(path, debug_on, noug_dir, VERSION, args, False)
+
+
+def run_server(args: list[str], noug_dir: str, debug_on: bool):
+    """Runs the Nougaro server (`--server [socket path]`)"""
+    if not src.server.is_available():
+        print_in_red("[nougaro] the server is only available on Unix-like systems.")
+        sys.exit(1)
+    socket_path = args[1] if len(args) > 1 else src.server.DEFAULT_SOCKET_PATH
+    print(f"[nougaro] server listening on {socket_path}")
+    sys.stdout.flush()
+    try:
+        src.server.serve(
+            socket_path,
+            lambda request_args: run_server_request(request_args, noug_dir, debug_on)
+        )
+    except (FileExistsError, PermissionError) as e:
+        print_in_red(f"[nougaro] {e}.")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print_in_red("\nKeyboardInterrupt")
+
+
 def print_result_and_error(
         result: Value | None, error: Error | None, dont_verbose: bool,
         exit_on_cd: bool = False, should_print_stuff: bool = True
@@ -252,7 +316,7 @@ def run_shell(
     if should_print_stuff and not interactive:
         print_greet_text(debug_on, noug_dir, work_dir, print_context, print_time)
 
-    previous_metas = None
+    session = nougaro.Session(noug_dir, args=args, work_dir=work_dir)
     while True:  # the shell loop
         try:  # we ask for an input to be interpreted
             if should_print_stuff:
@@ -271,10 +335,7 @@ def run_shell(
             result, error = None, None
             continue
         try:
-            result, error, previous_metas = nougaro.run(
-                '<stdin>', text, noug_dir, VERSION, args=args,
-                work_dir=work_dir, lexer_metas=previous_metas
-            )
+            result, error = session.run(text)
         except KeyboardInterrupt:
             # if CTRL+C, just stop to run the line and ask for another input
             print_in_red("\nKeyboardInterrupt")
@@ -335,6 +396,10 @@ def main():
     # Windows and GNU/Linux.
     del args[0]
 
+    if len(args) > 0 and args[0] == "--server":
+        run_server(args, noug_dir, debug_on)
+        return
+
     path, line_to_exec, dont_verbose, interactive = check_arguments(
         args, noug_dir, VERSION
     )
@@ -369,25 +434,8 @@ def main():
             dont_verbose
         )
     elif path == "<commandline>":
-        if line_to_exec == "":
-            sys.exit()
-
-        try:  # we try to run it
-            result, error, _ = nougaro.run(
-                '<commandline>', line_to_exec, noug_dir, VERSION, args=args,
-                work_dir=work_dir
-            )
-        except KeyboardInterrupt:
-            # if CTRL+C, just stop to run the line and ask for another input
-            print_in_red("\nKeyboardInterrupt")
-            sys.exit()
-        except EOFError:
-            print_in_red("\nEOF")
-            sys.exit()
-
-        print_result_and_error(result, error, dont_verbose, True)
-        if error is not None:
-            sys.exit(1)
+        assert line_to_exec is not None
+        execute_command(line_to_exec, noug_dir, args, work_dir, dont_verbose)
 
 
 if __name__ == '__main__':
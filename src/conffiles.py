@@ -180,6 +180,8 @@ def _create_or_copy_files():
         print_context_nnf.write(print_context)
     with open(CONFIG_DIRECTORY + "print_time.nconf", "w+", encoding="UTF-8") as print_context_nnf:
         print_context_nnf.write("0")
+    with open(CONFIG_DIRECTORY + "optimize.nconf", "w+", encoding="UTF-8") as optimize_nnf:
+        optimize_nnf.write("1")
 
 
 def create_config_files():
@@ -190,6 +192,7 @@ def create_config_files():
     define_expected_type("debug", "int")
     define_expected_type("print_context", "int")
     define_expected_type("print_time", "int")
+    define_expected_type("optimize", "int")
 
 
 def access_data(config_file: str):
@@ -202,7 +205,12 @@ def access_data(config_file: str):
         return file.read()
 
 
+# incremented every time a config file is written, so that the data read before can be read again only when needed
+write_count = 0
+
+
 def write_data(config_file: str, data: str, silent: bool = False, return_error_messages: bool = False):
+    global write_count
     if config_file == "DATA_VERSION":
         errmsg = "[CONFFILES] Can not write in DATA_VERSION: name is reserved."
         if not silent:
@@ -221,6 +229,7 @@ def write_data(config_file: str, data: str, silent: bool = False, return_error_m
             return
     with open(CONFIG_DIRECTORY + config_file + ".nconf", "w+", encoding="UTF-8") as file:
         file.write(data)
+    write_count += 1
 
 
 def define_expected_type(config_file: str, data_type: str):
@@ -190,6 +190,14 @@ class RTIndexError(RunTimeError):
                          origin_file=origin_file)
 
 
+class RTKeyError(RunTimeError):
+    """Key error (like '{"a": 1}("b")')"""
+    def __init__(self, pos_start: Position, pos_end: Position, details: str, context: Context,
+                 origin_file: str = "(undetermined)"):
+        super().__init__(pos_start, pos_end, details, context, rt_error=False, error_name="KeyError",
+                         origin_file=origin_file)
+
+
 class RTArithmeticError(RunTimeError):
     """Arithmetic error (like 1/0)"""
     def __init__(self, pos_start: Position, pos_end: Position, details: str, context: Context,
@@ -17,6 +17,7 @@ from src.errors.errors import InvalidSyntaxError, IllegalCharError, Error
 import src.conffiles
 # built-in python imports
 import unicodedata
+import sys
 
 
 # ##########
@@ -233,6 +234,14 @@ class Lexer:
                 there_is_a_space_or_a_tab_or_a_comment = False
                 tokens.append(Token(TT["RSQUARE"], pos_start=self.pos))
                 self.advance()
+            elif self.current_char == '{':
+                there_is_a_space_or_a_tab_or_a_comment = False
+                tokens.append(Token(TT["LBRACE"], pos_start=self.pos))
+                self.advance()
+            elif self.current_char == '}':
+                there_is_a_space_or_a_tab_or_a_comment = False
+                tokens.append(Token(TT["RBRACE"], pos_start=self.pos))
+                self.advance()
 
             # equals (+=, -=, ... are generated above, in the 'basic math stuff' category)
             elif self.current_char == '!':
@@ -694,7 +703,9 @@ class Lexer:
             self.advance()
 
         token_type = TT["KEYWORD"] if id_str in KEYWORDS else TT["IDENTIFIER"]  # KEYWORDS is the keywords list
-        return Token(token_type, pos_start, self.pos, id_str)
+        # all the occurrences of a name share the same python str: less memory used, and faster dict lookups in the
+        # symbol tables
+        return Token(token_type, pos_start, self.pos, sys.intern(id_str))
 
     def make_number(
             self,
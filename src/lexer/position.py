@@ -15,6 +15,8 @@
 # ##########
 class Position:
     """Contain file name, index in file, line number and colon"""
+    __slots__ = ("index", "line_number", "colon", "file_name", "file_txt")
+
     def __init__(self, index: int, line_number: int, colon: int, file_name: str, file_txt: str):
         """
         index       starts at 0
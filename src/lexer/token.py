@@ -22,6 +22,8 @@ class Token:
     A token have a type (keyword, int, str, identifier...) and sometimes a value ("foo", 123, break)
     Types are listed in src.lexer.token_types
     """
+    __slots__ = ("type", "value", "pos_start", "pos_end")
+
     def __init__(self, type_: str, pos_start: Position, pos_end: Position | None = None, value: str | int | float | None = None):
         self.type = type_  # type
         self.value = value  # value
@@ -75,6 +75,8 @@ TT = {
     "LPAREN": '(',               # (
     "RSQUARE": ']',              # ]
     "LSQUARE": '[',              # [
+    "RBRACE": '}',               # }
+    "LBRACE": '{',               # {
 
     "COMMA": ',',                # ,
     "COLON": ':',                # :
@@ -114,6 +116,7 @@ KEYWORDS = [                        # List of all the keywords (TT["KEYWORD"])
     # functions
     'def',
     'return',
+    'yield',
     # classes
     'class',
     # modules
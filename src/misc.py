@@ -18,7 +18,7 @@ from src.runtime.values.basevalues.basevalues import String
 from src.runtime.values.basevalues.value import Value
 from src.runtime.runtime_result import RTResult
 # built-in python imports
-from typing import Protocol, Any, TypedDict, Sequence, Callable
+from typing import Protocol, Any, TypedDict, NotRequired, Sequence, Callable
 import os
 try:
     from colorama import init as colorama_init, Fore
@@ -127,3 +127,5 @@ class BuiltinFunctionDict(TypedDict):
     should_respect_args_number: bool
     run_noug_dir: bool
     noug_dir: bool  # if run_noug_dir is True then this is False
+    # lib version 5: the types of the params, then of the optional params (see lib_.lib_to_make_libs.ARG_TYPES)
+    param_types: NotRequired[list[str]]
@@ -41,3 +41,5 @@ def _read_noug_version_json():
 
 
 MAJOR, MINOR, PATCH, PHASE, RELEASE_SERIAL, VERSION, VERSION_ID, DATA_VERSION, LIB_VERSION = _read_noug_version_json()
+# libs of this version or of a later one (up to LIB_VERSION) can be imported: version 5 only added typed arguments
+OLDEST_LIB_VERSION = 4
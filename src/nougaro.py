@@ -20,8 +20,9 @@
 # IMPORTS
 # nougaro modules imports
 from src.lexer.lexer import Lexer
-from src.lexer.position import DEFAULT_POSITION
+from src.lexer.position import DEFAULT_POSITION, Position
 from src.parser.parser import Parser
+from src.parser.optimizer import Optimizer
 import src.runtime.interpreter
 from src.runtime.symbol_table import SymbolTable
 from src.runtime.set_symbol_table import set_symbol_table
@@ -34,7 +35,7 @@ from src.constants import NOUGARO_IGNORE
 import src.noug_version
 import src.conffiles
 # built-in python imports
-from typing import Sequence
+from typing import Callable, Sequence
 import time
 
 # ##########
@@ -49,61 +50,16 @@ default_symbol_table = global_symbol_table.copy()
 # ##########
 # RUN
 # ##########
-def run(
-        file_name: str,
-        text: str | None,
-        noug_dir: str,
-        version: str | None = None,
-        exec_from: str | None = "(shell)",
-        actual_context: str = "<program>",
-        use_default_symbol_table: bool = False,
-        use_context: Context | None = None,
-        args: Sequence[str | String] | None = None,
-        work_dir: str | None = None,
-        lexer_metas: dict[str, str | bool] | None = None
-) -> tuple[Value, None, dict[str, str | bool] | None] | tuple[None, Error, dict[str, str | bool] | None]:
-    """Run the given code.
-    The code is given through the `text` argument."""
-    debug = src.conffiles.access_data("debug")
-    if debug is None:
-        debug = 0
-    debug_on = bool(int(debug))
+def config_option(config_file: str, default: bool = False) -> bool:
+    """Read a config file that contains 0 or 1. `default` is returned if the file does not exist."""
+    data = src.conffiles.access_data(config_file)
+    if data is None:
+        return default
+    return bool(int(data))
 
-    print_context = src.conffiles.access_data("print_context")
-    if print_context is None:
-        print_context = 0
-    print_context = bool(int(print_context))
 
-    print_time = src.conffiles.access_data("print_time")
-    if print_time is None:
-        print_time = 0
-    print_time = bool(int(print_time))
-
-    if version is None:
-        version = src.noug_version.VERSION
-
-    # we set version and context in the symbol table
-    if args is None:
-        new_args_values: list[Value] = []
-        new_args_strings: list[String] = []
-        global_symbol_table.set("__args__", List([], DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()))
-    else:
-        new_args_values: list[Value] = list(map(nice_str_from_idk, args))
-        new_args_strings: list[String] = list(map(nice_str_from_idk, args))
-        global_symbol_table.set("__args__", List(new_args_values, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()))
-    global_symbol_table.set("__exec_from__", String(str(exec_from), DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()))
-    global_symbol_table.set(
-        "__actual_context__", String(actual_context, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
-    )
-    global_symbol_table.set("__noug_dir__", String(noug_dir, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()))
-
-    lexer_start_time = time.time()
-
-    # we make tokens with the Lexer
-    if text is None:
-        return NoneValue(DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy(), False), None, lexer_metas
-
-    # Skip the NOUGAROIGNORE comments ###############
+def skip_nougaro_ignore(text: str) -> str:
+    """Replace the lines between NOUGAROIGNORE comments by comments"""
     lines = text.split("\n")
     new_lines: list[str] = []
     should_skip_lines = False
@@ -119,8 +75,44 @@ def run(
             new_lines.append(line)
         else:
             new_lines.append("#"*len(line))
-    text = "\n".join(new_lines)
-    # ###############################################
+    return "\n".join(new_lines)
+
+
+def set_the_test_value(lexer_metas: dict[str, str | bool], context: Context):
+    """Set `__the_test_value__` if the `setTheTestValueTo` meta is used"""
+    if lexer_metas.get("setTheTestValueTo") is not None:
+        if isinstance(lexer_metas["setTheTestValueTo"], bool):
+            value_to_set = NoneValue(DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy(), True)
+        else:
+            value_to_set = String(lexer_metas["setTheTestValueTo"], DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
+        assert context.symbol_table is not None
+        context.symbol_table.set("__the_test_value__", value_to_set)
+
+
+class _ConfigOptions:
+    """The options of the config files that change how the code is run"""
+    def __init__(self):
+        self.debug_on = config_option("debug")
+        self.print_context = config_option("print_context")
+        self.print_time = config_option("print_time")
+        self.optimize = config_option("optimize", True)
+
+
+def _execute(
+        file_name: str,
+        text: str,
+        exec_from: str | None,
+        lexer_metas: dict[str, str | bool] | None,
+        options: _ConfigOptions,
+        prepare: Callable[[dict[str, str | bool], Position], tuple[src.runtime.interpreter.Interpreter, Context]]
+) -> tuple[Value, None, dict[str, str | bool] | None] | tuple[None, Error, dict[str, str | bool] | None]:
+    """Lex, parse, optimize and interpret the code, for `run` and `Session.run`.
+    `prepare(lexer_metas, start_position)` is called after the code is parsed, and returns the interpreter and the
+    context that run it."""
+    lexer_start_time = time.time()
+
+    # we make tokens with the Lexer
+    text = skip_nougaro_ignore(text)
 
     lexer = Lexer(file_name, text, previous_metas=lexer_metas)
     tokens, error = lexer.make_tokens()
@@ -128,7 +120,7 @@ def run(
     if error is not None:  # if there is any error, we just stop
         return None, error, lexer_metas
     assert tokens is not None
-    if debug_on:
+    if options.debug_on:
         print(tokens)
 
     parser_start_time = time.time()
@@ -139,33 +131,110 @@ def run(
     if ast.error is not None:  # if there is any error, we just stop
         return None, ast.error, lexer_metas
     assert ast.node is not None
-    if debug_on:
+    if options.debug_on:
         print(ast)
 
+    optimizer_start_time = time.time()
+
+    # fold the constants and remove the dead branches of the AST
+    # this can be disabled with the `noOptimize` meta or with the `optimize` config file
+    optimized_node = ast.node
+    if options.optimize and lexer_metas.get("noOptimize") is None:
+        optimized_node = Optimizer().optimize(ast.node)
+        if options.debug_on:
+            print(optimized_node)
+
     interpreter_start_time = time.time()
 
     # run the code (interpreter)
+    interpreter, context = prepare(lexer_metas, tokens[0].pos_start)
+    interpreter.update_symbol_table(context)
+
+    set_the_test_value(lexer_metas, context)
+
+    # visit the main node of the AST with the created context
+    assert not isinstance(optimized_node, list)
+    result = interpreter.visit(optimized_node, context, False, main_visit=True)
+    if options.print_context:
+        print(context.__str__())
+    if result.error is not None:
+        return None, result.error, lexer_metas
+    assert result.value is not None
+
+    end_time = time.time()
+
+    if options.print_time:
+        print("=== PRINT TIME DEBUG OPTION ===")
+        print(f"({file_name=}, {exec_from=})")
+        print(f" Lexer took {parser_start_time-lexer_start_time}s")
+        print(f" Parser took {optimizer_start_time-parser_start_time}s")
+        print(f" Optimizer took {interpreter_start_time-optimizer_start_time}s")
+        print(f" Runtime took {end_time-interpreter_start_time}s")
+        print(f" Total time: {end_time-lexer_start_time}s")
+        print("===============================")
+
+    return result.value, None, lexer_metas
+
+
+def run(
+        file_name: str,
+        text: str | None,
+        noug_dir: str,
+        version: str | None = None,
+        exec_from: str | None = "(shell)",
+        actual_context: str = "<program>",
+        use_default_symbol_table: bool = False,
+        use_context: Context | None = None,
+        args: Sequence[str | String] | None = None,
+        work_dir: str | None = None,
+        lexer_metas: dict[str, str | bool] | None = None
+) -> tuple[Value, None, dict[str, str | bool] | None] | tuple[None, Error, dict[str, str | bool] | None]:
+    """Run the given code.
+    The code is given through the `text` argument."""
+    options = _ConfigOptions()
+
+    if version is None:
+        version = src.noug_version.VERSION
+
+    # we set version and context in the symbol table
+    if args is None:
+        new_args_values: list[Value] = []
+        new_args_strings: list[String] = []
+        global_symbol_table.set("__args__", List([], DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()))
+    else:
+        new_args_values: list[Value] = list(map(nice_str_from_idk, args))
+        new_args_strings: list[String] = list(map(nice_str_from_idk, args))
+        global_symbol_table.set("__args__", List(new_args_values, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()))
+    global_symbol_table.set("__exec_from__", String(str(exec_from), DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()))
+    global_symbol_table.set(
+        "__actual_context__", String(actual_context, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
+    )
+    global_symbol_table.set("__noug_dir__", String(noug_dir, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()))
+
+    if text is None:
+        return NoneValue(DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy(), False), None, lexer_metas
+
     if work_dir is None:
         work_dir = noug_dir
-    interpreter = src.runtime.interpreter.Interpreter(
-        run, noug_dir, new_args_strings, work_dir, lexer_metas, file_name
-    )
-    if use_context is None:
-        context = Context('<program>', tokens[0].pos_start, None)  # create the context of the interpreter
+
+    def prepare(
+            lexer_metas_: dict[str, str | bool], start_position: Position
+    ) -> tuple[src.runtime.interpreter.Interpreter, Context]:
+        """Create the interpreter and the context that run the code"""
+        interpreter = src.runtime.interpreter.Interpreter(
+            run, noug_dir, new_args_strings, work_dir, lexer_metas_, file_name
+        )
+        if use_context is not None:
+            return interpreter, use_context  # do not .copy() here
+
+        context = Context('<program>', start_position, None)  # create the context of the interpreter
         # don't forget to change the context symbol table to the global symbol table
         if use_default_symbol_table:
             context.symbol_table = default_symbol_table.copy()
 
-            if args is None:
-                new_args_values: list[Value] = []
-                new_args_strings: list[String] = []
-                context.symbol_table.set("__args__", List([], DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()))
-            else:
-                new_args_values: list[Value] = list(map(nice_str_from_idk, args))
-                new_args_strings: list[String] = list(map(nice_str_from_idk, args))
-                context.symbol_table.set(
-                    "__args__", List(new_args_values, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
-                )
+            context.symbol_table.set(
+                "__args__", List(list(new_args_values), DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
+            )
             context.symbol_table.set(
                 "__exec_from__", String(str(exec_from), DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
             )
@@ -177,41 +246,77 @@ def run(
             )
         else:  # this is how the shell “remember” the values
             context.symbol_table = global_symbol_table
-    else:
-        context = use_context  # do not .copy() here
-    interpreter.update_symbol_table(context)
+        return interpreter, context
 
-    if lexer_metas.get("setTheTestValueTo") is not None:
-        if isinstance(lexer_metas["setTheTestValueTo"], bool):
-            value_to_set = NoneValue(DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy(), True)
-        else:
-            value_to_set = String(lexer_metas["setTheTestValueTo"], DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
-        assert context.symbol_table is not None
-        context.symbol_table.set("__the_test_value__", value_to_set)
+    # errors are managed by the shell.py file that calls this `run` function
+    return _execute(file_name, text, exec_from, lexer_metas, options, prepare)
 
-    # visit the main node of the AST with the created context
-    assert not isinstance(ast.node, list)
-    result = interpreter.visit(ast.node, context, False, main_visit=True)
-    if print_context:
-        print(context.__str__())
-    if result.error is not None:
-        return None, result.error, lexer_metas
-    assert result.value is not None
 
-    end_time = time.time()
+# ##########
+# SESSION
+# ##########
+class Session:
+    """A persistent session, used by the interactive shell (and after a file is executed with `-i`).
+    Unlike `run`, the interpreter, the context and the config are kept between two lines, so that running a line does
+    not get slower as the symbol table grows."""
+    def __init__(
+            self,
+            noug_dir: str,
+            args: Sequence[str | String] | None = None,
+            work_dir: str | None = None,
+            file_name: str = "<stdin>",
+            exec_from: str = "(shell)",
+            lexer_metas: dict[str, str | bool] | None = None
+    ):
+        self.noug_dir = noug_dir
+        self.file_name = file_name
+        self.exec_from = exec_from
+        if work_dir is None:
+            work_dir = noug_dir
+        # the lexer adds the metas directly in this dict, which is shared with the interpreter
+        self.lexer_metas: dict[str, str | bool] = {} if lexer_metas is None else lexer_metas
 
-    if print_time:
-        print("=== PRINT TIME DEBUG OPTION ===")
-        print(f"({file_name=}, {exec_from=})")
-        print(f" Lexer took {parser_start_time-lexer_start_time}s")
-        print(f" Parser took {interpreter_start_time-parser_start_time}s")
-        print(f" Runtime took {end_time-interpreter_start_time}s")
-        print(f" Total time: {end_time-lexer_start_time}s")
-        print("===============================")
+        self.options = _ConfigOptions()
+        self._config_write_count = src.conffiles.write_count
 
-    # finally, return the value and the error given by the interpreter
-    # errors are managed by the shell.py file that calls this `run` function
-    return result.value, None, lexer_metas
+        # magic variables, set again before each line because imported files may change them
+        if args is None:
+            args = []
+        args_strings: list[String] = list(map(nice_str_from_idk, args))
+        self._magic_variables: dict[str, Value] = {
+            "__args__": List(list(args_strings), DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()),
+            "__exec_from__": String(exec_from, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()),
+            "__actual_context__": String("<program>", DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()),
+            "__noug_dir__": String(noug_dir, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()),
+        }
+
+        self.interpreter = src.runtime.interpreter.Interpreter(
+            run, noug_dir, args_strings, work_dir, self.lexer_metas, file_name
+        )
+        self.context = Context('<program>', DEFAULT_POSITION.copy(), None)
+        self.context.symbol_table = global_symbol_table  # this is how the shell “remember” the values
+
+    def _read_config(self):
+        """Read the config files again, only if they changed since the last time."""
+        if self._config_write_count == src.conffiles.write_count:
+            return
+        self._config_write_count = src.conffiles.write_count
+        self.options = _ConfigOptions()
+
+    def run(self, text: str) -> tuple[Value, None] | tuple[None, Error]:
+        """Run a line (or several lines) of code in this session."""
+        self._read_config()
+        for name, value in self._magic_variables.items():
+            global_symbol_table.set(name, value)
+
+        value, error, _ = _execute(
+            self.file_name, text, self.exec_from, self.lexer_metas, self.options,
+            lambda lexer_metas, start_position: (self.interpreter, self.context)
+        )
+        if error is not None:
+            return None, error
+        assert value is not None
+        return value, None
 
 
 if __name__ == "__main__":
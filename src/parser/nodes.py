@@ -13,16 +13,122 @@ from src.lexer.position import Position as _Position
 from src.lexer.token import Token as _Token
 from src.lexer.token_types import TT as _TT
 # built-in python imports
-# no imports
+import operator as _operator
+
+
+# ##########
+# OPERATORS
+# ##########
+# Operators are resolved once, when the node is created, and not every time the node is visited.
+# Name of the Value method to call for each binary operator, by token type (or by keyword for `and`, `or`, `xor` and
+# `in`)
+BIN_OP_METHODS: dict[str, str] = {
+    _TT["PLUS"]: "added_to",
+    _TT["MINUS"]: "subbed_by",
+    _TT["MUL"]: "multiplied_by",
+    _TT["DIV"]: "divided_by",
+    _TT["PERC"]: "modded_by",
+    _TT["FLOORDIV"]: "floor_divided_by",
+    _TT["POW"]: "powered_by",
+    _TT["EE"]: "get_comparison_eq",
+    _TT["NE"]: "get_comparison_ne",
+    _TT["LT"]: "get_comparison_lt",
+    _TT["GT"]: "get_comparison_gt",
+    _TT["LTE"]: "get_comparison_lte",
+    _TT["GTE"]: "get_comparison_gte",
+    _TT["BITWISEAND"]: "bitwise_and",
+    _TT["BITWISEOR"]: "bitwise_or",
+    _TT["BITWISEXOR"]: "bitwise_xor",
+}
+BIN_OP_KEYWORD_METHODS: dict[str, str] = {
+    "and": "and_",
+    "or": "or_",
+    "xor": "xor_",
+    "in": "is_in",
+}
+# Same for the assignment operators (`+=`, `-=`, `++`, ...). `=` is not in this dict.
+ASSIGN_OP_METHODS: dict[str, str] = {
+    _TT["PLUSEQ"]: "added_to",
+    _TT["INCREMENT"]: "added_to",
+    _TT["MINUSEQ"]: "subbed_by",
+    _TT["DECREMENT"]: "subbed_by",
+    _TT["MULTEQ"]: "multiplied_by",
+    _TT["DIVEQ"]: "divided_by",
+    _TT["POWEQ"]: "powered_by",
+    _TT["FLOORDIVEQ"]: "floor_divided_by",
+    _TT["PERCEQ"]: "modded_by",
+    _TT["OREQ"]: "or_",
+    _TT["XOREQ"]: "xor_",
+    _TT["ANDEQ"]: "and_",
+    _TT["BITWISEANDEQ"]: "bitwise_and",
+    _TT["BITWISEOREQ"]: "bitwise_or",
+    _TT["BITWISEXOREQ"]: "bitwise_xor",
+    _TT["EEEQ"]: "get_comparison_eq",
+    _TT["LTEQ"]: "get_comparison_lt",
+    _TT["GTEQ"]: "get_comparison_gt",
+    _TT["LTEEQ"]: "get_comparison_lte",
+    _TT["GTEEQ"]: "get_comparison_gte",
+}
+# Python operator that gives the same result as the Value method when both operands are numbers. If the python operator
+# raises an exception, the Value method should be called instead to get the proper Nougaro error.
+NUMBER_OPERATORS = {
+    "added_to": _operator.add,
+    "subbed_by": _operator.sub,
+    "multiplied_by": _operator.mul,
+    "divided_by": _operator.truediv,
+    "modded_by": _operator.mod,
+    "floor_divided_by": _operator.floordiv,
+    "powered_by": _operator.pow,
+    "get_comparison_eq": _operator.eq,
+    "get_comparison_ne": _operator.ne,
+    "get_comparison_lt": _operator.lt,
+    "get_comparison_gt": _operator.gt,
+    "get_comparison_lte": _operator.le,
+    "get_comparison_gte": _operator.ge,
+    "bitwise_and": _operator.and_,
+    "bitwise_or": _operator.or_,
+    "bitwise_xor": _operator.xor,
+}
+# Unary operators
+UNARY_OP_MINUS = "minus"
+UNARY_OP_PLUS = "plus"
+UNARY_OP_NOT = "not"
+UNARY_OP_BITWISENOT = "bitwisenot"
+
+
+def _bin_op_method_name(op_token: _Token) -> str | None:
+    """Returns the name of the Value method to call for this operator token, or None if it is not an operator."""
+    if op_token.type == _TT["KEYWORD"]:
+        return BIN_OP_KEYWORD_METHODS.get(str(op_token.value))
+    return BIN_OP_METHODS.get(op_token.type)
+
+
+def _unary_op_kind(op_token: _Token) -> str | None:
+    """Returns the UNARY_OP_* constant corresponding to this operator token"""
+    if op_token.type == _TT["MINUS"]:
+        return UNARY_OP_MINUS
+    if op_token.type == _TT["PLUS"]:
+        return UNARY_OP_PLUS
+    if op_token.matches(_TT["KEYWORD"], 'not'):
+        return UNARY_OP_NOT
+    if op_token.type == _TT["BITWISENOT"]:
+        return UNARY_OP_BITWISENOT
+    return None
 
 
 # ##########
 # NODES
 # ##########
 class Node:
+    __slots__ = ("pos_start", "pos_end", "attr")
     pos_start: _Position
     pos_end: _Position
-    attr = False
+    attr: bool  # True when the node is an attribute of a value (`a.b` or `a.b()`)
+
+    def __new__(cls, *args, **kwargs):
+        node = super().__new__(cls)
+        node.attr = False
+        return node
 
     def __eq__(self, other: object) -> bool:
         return False
@@ -34,6 +140,8 @@ class Node:
 # VALUE NODES
 class NumberNode(Node):
     """Node for numbers (both int and float). The tok type can be TT_INT or TT_FLOAT"""
+    __slots__ = ("token",)
+
     def __init__(self, token: _Token):
         self.token = token
         self.pos_start = self.token.pos_start
@@ -52,6 +160,8 @@ class NumberNode(Node):
 
 class NumberENumberNode(Node):
     """Node for numbers like 10e2 or 4e-5"""
+    __slots__ = ("num_token", "exponent_token")
+
     def __init__(self, num_token: _Token, exponent_token: _Token):
         self.num_token = num_token
         self.exponent_token = exponent_token
@@ -72,6 +182,8 @@ class NumberENumberNode(Node):
 
 class StringNode(Node):
     """Node for strings. Tok type can be TT_STRING"""
+    __slots__ = ("token",)
+
     def __init__(self, token: _Token):
         self.token = token
         self.pos_start = self.token.pos_start
@@ -90,6 +202,8 @@ class StringNode(Node):
 
 class ListNode(Node):
     """Node for list. self.element_nodes is a list of nodes. Needs pos_start and pos_end when init."""
+    __slots__ = ("element_nodes",)
+
     def __init__(self, element_nodes: list[tuple[Node, bool]], pos_start: _Position, pos_end: _Position):
         self.element_nodes = element_nodes
         self.pos_start = pos_start
@@ -106,10 +220,53 @@ class ListNode(Node):
         return self.element_nodes == other.element_nodes
 
 
+class DictNode(Node):
+    """Node for dict. self.key_value_nodes is a list of (key node, value node). Needs pos_start and pos_end when
+    init."""
+    __slots__ = ("key_value_nodes",)
+
+    def __init__(self, key_value_nodes: list[tuple[Node, Node]], pos_start: _Position, pos_end: _Position):
+        self.key_value_nodes = key_value_nodes
+        self.pos_start = pos_start
+        self.pos_end = pos_end
+
+    def __repr__(self):
+        return f'dict:{str(self.key_value_nodes)}'
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DictNode):
+            return False
+        if self.attr != other.attr:
+            return False
+        return self.key_value_nodes == other.key_value_nodes
+
+
+class SetNode(Node):
+    """Node for set. self.element_nodes is a list of nodes. Needs pos_start and pos_end when init."""
+    __slots__ = ("element_nodes",)
+
+    def __init__(self, element_nodes: list[Node], pos_start: _Position, pos_end: _Position):
+        self.element_nodes = element_nodes
+        self.pos_start = pos_start
+        self.pos_end = pos_end
+
+    def __repr__(self):
+        return f'set:{str(self.element_nodes)}'
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SetNode):
+            return False
+        if self.attr != other.attr:
+            return False
+        return self.element_nodes == other.element_nodes
+
+
 # VAR NODES
 class VarAssignNode(Node):
     """Node for variable assign
     I’m too bored to rewrite examples. TODO: rewrite examples"""
+    __slots__ = ("var_names", "value_nodes", "equal", "op_method_name")
+
     def __init__(
             self,
             var_names: list[list[_Token | Node]],
@@ -119,6 +276,7 @@ class VarAssignNode(Node):
         self.var_names = var_names
         self.value_nodes = value_nodes
         self.equal = equal
+        self.op_method_name = ASSIGN_OP_METHODS.get(self.equal.type)
 
         self.pos_start = self.var_names[0][0].pos_start
         if self.value_nodes is not None:
@@ -144,6 +302,8 @@ class VarAccessNode(Node):
     example: `foo`: var_name_tokens_list is [Token(TT_IDENTIFIER, 'foo')]
     example 2: `foo ? bar`: var_name_tokens_list is [Token(TT_IDENTIFIER, 'foo'), Token(TT_IDENTIFIER, 'bar')]
     """
+    __slots__ = ("var_name_tokens_list",)
+
     def __init__(self, var_name_tokens_list: list[_Token | Node], attr: bool = False):
         self.var_name_tokens_list = var_name_tokens_list
         self.attr = attr
@@ -164,6 +324,8 @@ class VarAccessNode(Node):
 
 class VarDeleteNode(Node):
     """Node for variable delete, such as `del foo` where var_name_token is Token(TT_IDENTIFIER, 'foo')"""
+    __slots__ = ("var_name_token",)
+
     def __init__(self, var_name_token: _Token):
         self.var_name_token = var_name_token
         self.pos_start = self.var_name_token.pos_start
@@ -185,10 +347,14 @@ class BinOpNode(Node):
     """Node for binary operations.
     Todo: rewrite examples
     """
+    __slots__ = ("left_node", "op_token", "right_node", "op_method_name", "number_operator")
+
     def __init__(self, left_node: Node | list[Node], op_token: _Token, right_node: Node | list[Node]):
         self.left_node = left_node
         self.op_token = op_token
         self.right_node = right_node
+        self.op_method_name = _bin_op_method_name(self.op_token)
+        self.number_operator = NUMBER_OPERATORS.get(self.op_method_name or "")
 
         if isinstance(self.left_node, list):
             self.pos_start = self.left_node[0].pos_start
@@ -219,8 +385,15 @@ class BinOpCompNode(Node):
     Yeah, you can use ReadNodes here x)
     But IDK who makes that, because results of 'read' statement are often put into a variable...
     """
+    __slots__ = ("nodes_and_tokens_list", "op_method_names")
+
     def __init__(self, nodes_and_tokens_list: list[Node | _Token | list[Node]]):
         self.nodes_and_tokens_list = nodes_and_tokens_list
+        # one method name per operator token
+        self.op_method_names = [
+            _bin_op_method_name(op_token) for op_token in self.nodes_and_tokens_list[1::2]
+            if isinstance(op_token, _Token)
+        ]
 
         if isinstance(self.nodes_and_tokens_list[0], list):
             self.pos_start = self.nodes_and_tokens_list[0][0].pos_start
@@ -250,9 +423,12 @@ class UnaryOpNode(Node):
         node is the node after the operator. In these examples, these are both NumberNode, the first with the number
                                              tok Token(TT_INT, 1) and the second with Token(TT_INT, 12)
     """
+    __slots__ = ("op_token", "node", "op_kind")
+
     def __init__(self, op_token: _Token, node: Node | list[Node]):
         self.op_token = op_token
         self.node = node
+        self.op_kind = _unary_op_kind(self.op_token)
 
         self.pos_start = self.op_token.pos_start
         if isinstance(self.node, list):
@@ -273,6 +449,8 @@ class UnaryOpNode(Node):
 
 class AbsNode(Node):
     """Node for the legacy absolute value syntax (|-12|)"""
+    __slots__ = ("node_to_abs",)
+
     def __init__(self, node_to_abs: Node | list[Node]):
         self.node_to_abs = node_to_abs
 
@@ -301,6 +479,8 @@ class IfNode(Node):
     condition and expression are both Nodes, and should_return_node is a bool
     An else case is a Node
     """
+    __slots__ = ("cases", "else_case")
+
     def __init__(self, cases: list[tuple[Node, Node]], else_case: Node | None, debug: bool = False):
         self.cases: list[tuple[Node, Node]] = cases
         self.else_case: Node | None = else_case
@@ -331,6 +511,8 @@ class AssertNode(Node):
     In this example, assertion is a VarAccessNode (identifier: False), and errmsg is a StringNode.
     errmsg can be None, like in `assert False`.
     """
+    __slots__ = ("assertion", "errmsg")
+
     def __init__(self, assertion: Node, pos_start: _Position, pos_end: _Position, errmsg: Node | None = None):
         self.assertion = assertion
         if errmsg is None:
@@ -367,6 +549,9 @@ class ForNode(Node):
         step_value_node is None or a VarAccessNode (identifier: d)
         body_node is the node after the 'then'
     """
+    __slots__ = ("var_name_token", "start_value_node", "end_value_node", "step_value_node", "body_node", "label",
+                 "value_is_used")
+
     def __init__(
             self,
             var_name_token: _Token,
@@ -383,6 +568,7 @@ class ForNode(Node):
         self.step_value_node = step_value_node
         self.body_node = body_node
         self.label = label
+        self.value_is_used = True  # see mark_value_as_unused
 
         self.pos_start = self.var_name_token.pos_start
         self.pos_end = self.body_node.pos_end
@@ -414,6 +600,8 @@ class ForNodeList(Node):
         body_node is the node after the 'then'
         list_node is a VarAccessNode (identifier: b)
     """
+    __slots__ = ("var_name_token", "list_node", "body_node", "label", "value_is_used")
+
     def __init__(self, var_name_token: _Token, body_node: Node, list_node: Node | ListNode,
                  label: str | None = None):
         # if list = [1, 2, 3]
@@ -423,6 +611,7 @@ class ForNodeList(Node):
         self.list_node = list_node
         self.body_node = body_node
         self.label = label
+        self.value_is_used = True  # see mark_value_as_unused
 
         # Position
         self.pos_start = self.var_name_token.pos_start
@@ -451,10 +640,13 @@ class WhileNode(Node):
     Here, condition_node is a VarAccessNode (identifier: True)
           body_node is a CallNode (identifier: foo, no args)*
     """
+    __slots__ = ("condition_node", "body_node", "label", "value_is_used")
+
     def __init__(self, condition_node: Node, body_node: Node, label: str | None = None):
         self.condition_node: Node = condition_node
         self.body_node: Node = body_node
         self.label = label
+        self.value_is_used = True  # see mark_value_as_unused
 
         self.pos_start = self.condition_node.pos_start
         self.pos_end = self.body_node.pos_end
@@ -481,10 +673,13 @@ class DoWhileNode(Node):
     Here, body_node is a CallNode (identifier: foo, no args)
           condition_node is a VarAccessNode (identifier: True)
     """
+    __slots__ = ("body_node", "condition_node", "label", "value_is_used")
+
     def __init__(self, body_node: Node, condition_node: Node, label: str | None = None):
         self.body_node = body_node
         self.condition_node = condition_node
         self.label = label
+        self.value_is_used = True  # see mark_value_as_unused
 
         self.pos_start = self.condition_node.pos_start
         self.pos_end = self.body_node.pos_end
@@ -510,9 +705,12 @@ class LoopNode(Node):
     Example: loop foo()
     Here, body_node is a CallNode (identifier: foo, no args)*
     """
+    __slots__ = ("body_node", "label", "value_is_used")
+
     def __init__(self, pos_start: _Position, body_node: Node, label: str | None = None):
         self.body_node: Node = body_node
         self.label = label
+        self.value_is_used = True  # see mark_value_as_unused
 
         self.pos_start = pos_start
         self.pos_end = self.body_node.pos_end
@@ -534,6 +732,8 @@ class LoopNode(Node):
 
 class BreakNode(Node):
     """Node for `break` statement"""
+    __slots__ = ("node_to_return", "label")
+
     def __init__(self, pos_start: _Position, pos_end: _Position,
                  node_to_return: Node | list[Node] | None = None,
                  label: str | None = None):
@@ -561,6 +761,8 @@ class BreakNode(Node):
 
 class ContinueNode(Node):
     """Node for `continue` statement"""
+    __slots__ = ("label",)
+
     def __init__(self, pos_start: _Position, pos_end: _Position, label: str | None = None):
         self.pos_start = pos_start
         self.pos_end = pos_end
@@ -587,17 +789,23 @@ class FuncDefNode(Node):
               param_names_tokens is [Token(TT_IDENTIFIER, 'bar')]
               body_node is CallNode (identifier: foo, args: bar)
     should_auto_return is bool (it happens in one-line functions)
+    is_generator is True if the body contains a `yield` statement
     If, in the function definition, the name is not defined (like in `def()->void()`), var_name_token is None
 
     Optional params are under the form (name, default value)
     """
+    __slots__ = ("var_name_token", "param_names_tokens", "optional_params", "body_node", "should_auto_return",
+                 "is_generator")
+
     def __init__(self, var_name_token: _Token | None, param_names_tokens: list[_Token], body_node: Node,
-                 should_auto_return: bool, optional_params: list[tuple[_Token, Node]] = []):
+                 should_auto_return: bool, optional_params: list[tuple[_Token, Node]] = [],
+                 is_generator: bool = False):
         self.var_name_token = var_name_token
         self.param_names_tokens = param_names_tokens
         self.optional_params = optional_params
         self.body_node = body_node
         self.should_auto_return = should_auto_return
+        self.is_generator = is_generator
 
         if self.var_name_token is not None:  # a name is given: we take its pos_start as our pos_start
             self.pos_start = self.var_name_token.pos_start
@@ -622,7 +830,8 @@ class FuncDefNode(Node):
             self.param_names_tokens == other.param_names_tokens and
             self.optional_params == other.optional_params and
             self.body_node == other.body_node and
-            self.should_auto_return == other.should_auto_return
+            self.should_auto_return == other.should_auto_return and
+            self.is_generator == other.is_generator
         )
 
 
@@ -635,6 +844,8 @@ class ClassNode(Node):
     should_auto_return is bool (it happens in one-line functions)
     If, in the function definition, the name is not defined (like in `def()->void()`), var_name_token is None
     """
+    __slots__ = ("var_name_token", "parent_var_name_token", "body_node", "should_auto_return")
+
     def __init__(self, var_name_token: _Token | None, parent_var_name_token: _Token | None, body_node: Node,
                  should_auto_return: bool, pos_start: _Position):
         self.var_name_token = var_name_token
@@ -670,6 +881,8 @@ class CallNode(Node):
           arg_nodes is [VarAccessNode (identifier: bar), NumberNode (num: 1)]
     If there is no arguments given, arg_nodes is empty.
     """
+    __slots__ = ("node_to_call", "arg_nodes")
+
     def __init__(
             self,
             node_to_call: Node,
@@ -700,6 +913,8 @@ class ReturnNode(Node):
     """Node for `return` structure.
     node_to_return is the node after the 'return' keyword. It may be None
     """
+    __slots__ = ("node_to_return",)
+
     def __init__(self, node_to_return: Node | None, pos_start: _Position, pos_end: _Position):
         self.node_to_return: Node | None = node_to_return
 
@@ -717,11 +932,36 @@ class ReturnNode(Node):
         return self.node_to_return == other.node_to_return
 
 
+class YieldNode(Node):
+    """Node for `yield` statement.
+    node_to_yield is the node after the 'yield' keyword. It may be None
+    """
+    __slots__ = ("node_to_yield",)
+
+    def __init__(self, node_to_yield: Node | None, pos_start: _Position, pos_end: _Position):
+        self.node_to_yield: Node | None = node_to_yield
+
+        self.pos_start = pos_start
+        self.pos_end = pos_end
+
+    def __repr__(self):
+        return f'yield:({self.node_to_yield})'
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, YieldNode):
+            return False
+        if self.attr != other.attr:
+            return False
+        return self.node_to_yield == other.node_to_yield
+
+
 # MODULE NODES
 class ImportNode(Node):
     """Node for `import` structure.
     identifier is the name of the module to import. It is a token. Example: Token(TT_IDENTIFIER, 'math')
     """
+    __slots__ = ("identifiers", "as_identifier")
+
     def __init__(self, identifiers: list[_Token], pos_start: _Position, pos_end: _Position,
                  as_identifier: _Token | None = None):
         self.identifiers: list[_Token] = identifiers
@@ -748,6 +988,8 @@ class ExportNode(Node):
     """Node for `export` structure.
     identifier is the name of the module to import. It is a token. Example: Token(TT_IDENTIFIER, 'lorem_ipsum')
     """
+    __slots__ = ("expr_or_identifier", "as_identifier")
+
     def __init__(self, expr_or_identifier: Node | _Token, as_identifier: _Token | None,
                  pos_start: _Position, pos_end: _Position):
         self.expr_or_identifier: Node | _Token = expr_or_identifier
@@ -787,6 +1029,8 @@ class WriteNode(Node):
     Note that when interpreting, if to_token type is TT_TO_AND_OVERWRITE, it overwrites one line if a line number is
         given, and all the file if it isn't the case.
     """
+    __slots__ = ("expr_to_write", "file_name_expr", "to_token", "line_number")
+
     def __init__(
             self,
             expr_to_write: Node,
@@ -840,6 +1084,8 @@ class ReadNode(Node):
               line_number is Python int 6
 
     """
+    __slots__ = ("file_name_expr", "identifier", "line_number")
+
     def __init__(self, file_name_expr: Node, identifier: _Token | None, line_number: int | str,
                  pos_start: _Position, pos_end: _Position):
         self.file_name_expr = file_name_expr
@@ -866,6 +1112,8 @@ class ReadNode(Node):
 # MISC
 class DollarPrintNode(Node):
     """$identifier"""
+    __slots__ = ("identifier",)
+
     def __init__(self, identifier: _Token, pos_start: _Position, pos_end: _Position):
         self.identifier = identifier
 
@@ -885,6 +1133,8 @@ class DollarPrintNode(Node):
 
 class DefaultNode(Node):
     """<default> node"""
+    __slots__ = ()
+
     def __init__(self, pos_start: _Position, pos_end: _Position):
         self.pos_start = pos_start
         self.pos_end = pos_end
@@ -903,8 +1153,27 @@ class DefaultNode(Node):
 # SPECIAL NODES
 class NoNode(Node):
     """If the file to execute is empty or filled by back lines, this node is the only node of the node list."""
+    __slots__ = ()
+
     def __repr__(self):
         return "NoNode"
 
     def __eq__(self, other: object) -> bool:
         return isinstance(other, NoNode) and self.attr == other.attr
+
+
+def mark_value_as_unused(node: Node):
+    """`node` is a node whose value is never used, like the body of a multi-line function. Marks the loops whose value
+    is therefore never used either, so that the interpreter does not build the list of the values of their body."""
+    if isinstance(node, ListNode):
+        for element_node, _ in node.element_nodes:
+            mark_value_as_unused(element_node)
+    elif isinstance(node, IfNode):
+        for _, case_body_node in node.cases:
+            mark_value_as_unused(case_body_node)
+        if node.else_case is not None:
+            mark_value_as_unused(node.else_case)
+    elif isinstance(node, ForNode) or isinstance(node, ForNodeList) or isinstance(node, WhileNode) \
+            or isinstance(node, DoWhileNode) or isinstance(node, LoopNode):
+        node.value_is_used = False
+        mark_value_as_unused(node.body_node)
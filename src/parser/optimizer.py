@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""AST optimizer: constant folding and dead-branch elimination.
+The optimizer runs between the parser and the interpreter. It never changes the result of a program: when an operation
+on constants gives an error (like `1/0`), the node is left untouched so the error is raised at runtime, with the
+positions of the original code."""
+
+# IMPORTS
+# nougaro modules imports
+from src.lexer.position import DEFAULT_POSITION
+from src.lexer.token import Token
+from src.lexer.token_types import TT
+from src.parser.nodes import *
+from src.runtime.context import Context
+from src.runtime.values.basevalues.value import Value
+from src.runtime.values.basevalues.basevalues import Number, String
+# built-in python imports
+# no imports
+
+# above these limits, folding would make the source bigger or freeze the optimizer (think of `2 ^ 10 ^ 10`)
+MAX_FOLDED_STRING_LENGTH = 4096
+MAX_FOLDED_POW_EXPONENT = 256
+
+
+# ##########
+# OPTIMIZER
+# ##########
+# noinspection PyPep8Naming
+class Optimizer:
+    """Constant folding and dead-branch elimination.
+    `optimize` returns the optimized node. Child nodes are optimized in place."""
+    def __init__(self):
+        self._methods = {
+            "AssertNode": self.optimize_AssertNode,
+            "AbsNode": self.optimize_AbsNode,
+            "BinOpCompNode": self.optimize_BinOpCompNode,
+            "BinOpNode": self.optimize_BinOpNode,
+            "BreakNode": self.optimize_BreakNode,
+            "CallNode": self.optimize_CallNode,
+            "ClassNode": self.optimize_ClassNode,
+            "DictNode": self.optimize_DictNode,
+            "SetNode": self.optimize_SetNode,
+            "DoWhileNode": self.optimize_DoWhileNode,
+            "ExportNode": self.optimize_ExportNode,
+            "ForNode": self.optimize_ForNode,
+            "ForNodeList": self.optimize_ForNodeList,
+            "FuncDefNode": self.optimize_FuncDefNode,
+            "IfNode": self.optimize_IfNode,
+            "ListNode": self.optimize_ListNode,
+            "LoopNode": self.optimize_LoopNode,
+            "NumberENumberNode": self.optimize_NumberENumberNode,
+            "ReadNode": self.optimize_ReadNode,
+            "ReturnNode": self.optimize_ReturnNode,
+            "UnaryOpNode": self.optimize_UnaryOpNode,
+            "VarAssignNode": self.optimize_VarAssignNode,
+            "WhileNode": self.optimize_WhileNode,
+            "WriteNode": self.optimize_WriteNode,
+            "YieldNode": self.optimize_YieldNode,
+        }
+        self._context = Context("<optimizer>", DEFAULT_POSITION.copy())
+
+    def optimize(self, node: Node) -> Node:
+        """Optimize a node and return the optimized node. Nodes without children are returned as is."""
+        method = self._methods.get(type(node).__name__)
+        if method is None:
+            return node
+        return method(node)
+
+    def _optimize_operand(self, operand: Node | list[Node]) -> Node | list[Node]:
+        """Operands of operators can be lists of nodes (`a.b.c`). A list of one node is the same as the node itself."""
+        if isinstance(operand, list):
+            if len(operand) == 1:
+                return self.optimize(operand[0])
+            return [self.optimize(operand[0])] + [self.optimize(node) for node in operand[1:]]
+        return self.optimize(operand)
+
+    # CONSTANTS
+    def _constant_value(self, node: Node | list[Node]) -> Value | None:
+        """Returns the value of a constant node (number or string), or None if the node is not constant."""
+        if isinstance(node, list):
+            if len(node) != 1:
+                return None
+            node = node[0]
+        if isinstance(node, NumberNode):
+            assert node.token.value is not None and not isinstance(node.token.value, str)
+            value = Number(node.token.value, node.pos_start, node.pos_end)
+        elif isinstance(node, StringNode):
+            assert isinstance(node.token.value, str)
+            value = String(node.token.value, node.pos_start, node.pos_end)
+        else:
+            return None
+        return value.set_context(self._context)
+
+    @staticmethod
+    def _node_from_value(value: Value | None, node: Node) -> Node | None:
+        """Returns a constant node with the same positions as `node`, or None if the value can not be folded."""
+        if isinstance(value, Number):
+            if isinstance(value.value, int):
+                token_type = TT["INT"]
+            else:
+                token_type = TT["FLOAT"]
+            new_node = NumberNode(Token(token_type, node.pos_start, node.pos_end, value.value))
+        elif isinstance(value, String) and len(value.value) <= MAX_FOLDED_STRING_LENGTH:
+            new_node = StringNode(Token(TT["STRING"], node.pos_start, node.pos_end, value.value))
+        else:
+            return None
+        return new_node
+
+    @staticmethod
+    def _is_too_expensive(method_name: str, left: Value, right: Value) -> bool:
+        """Check if the result would be too big to be folded."""
+        if method_name == "powered_by" and isinstance(left, Number) and isinstance(right, Number):
+            return abs(right.value) > MAX_FOLDED_POW_EXPONENT and abs(left.value) > 1
+        if method_name == "multiplied_by":
+            if isinstance(left, String) and isinstance(right, Number) and isinstance(right.value, int):
+                return len(left.value) * right.value > MAX_FOLDED_STRING_LENGTH
+            if isinstance(right, String) and isinstance(left, Number) and isinstance(left.value, int):
+                return len(right.value) * left.value > MAX_FOLDED_STRING_LENGTH
+        return False
+
+    def _fold_bin_op(self, left: Value, method_name: str | None, right: Value) -> Value | None:
+        """Returns the result of `left op right`, or None if it can not (or should not) be computed now.
+        `method_name` is the name of the Value method of the operator, see src.parser.nodes.BIN_OP_METHODS"""
+        if method_name is None or self._is_too_expensive(method_name, left, right):
+            return None
+        result, error = getattr(left, method_name)(right)
+        if error is not None:
+            return None
+        return result
+
+    # OPERATOR NODES
+    def optimize_NumberENumberNode(self, node: NumberENumberNode) -> Node:
+        num = node.num_token.value
+        exponent = node.exponent_token.value
+        assert num is not None and not isinstance(num, str)
+        assert exponent is not None and not isinstance(exponent, str)
+        if abs(exponent) > MAX_FOLDED_POW_EXPONENT:
+            return node
+        return self._node_from_value(Number(num * (10 ** exponent), node.pos_start, node.pos_end), node) or node
+
+    def optimize_BinOpNode(self, node: BinOpNode) -> Node:
+        node.left_node = self._optimize_operand(node.left_node)
+        node.right_node = self._optimize_operand(node.right_node)
+        left = self._constant_value(node.left_node)
+        if left is None:
+            return node
+
+        # `and` and `or` do not evaluate their right operand when the left one is enough
+        if node.op_method_name == "and_" and left.is_false():
+            return self._node_from_value(Number(False, node.pos_start, node.pos_end), node) or node
+        if node.op_method_name == "or_" and left.is_true():
+            return self._node_from_value(Number(True, node.pos_start, node.pos_end), node) or node
+
+        right = self._constant_value(node.right_node)
+        if right is None:
+            return node
+        return self._node_from_value(self._fold_bin_op(left, node.op_method_name, right), node) or node
+
+    def optimize_BinOpCompNode(self, node: BinOpCompNode) -> Node:
+        for index, element in enumerate(node.nodes_and_tokens_list):
+            if index % 2 == 0:
+                assert not isinstance(element, Token)
+                node.nodes_and_tokens_list[index] = self._optimize_operand(element)
+        if len(node.nodes_and_tokens_list) == 1:
+            return node
+
+        values: list[Value] = []
+        for element in node.nodes_and_tokens_list[::2]:
+            assert not isinstance(element, Token)
+            value = self._constant_value(element)
+            if value is None:
+                return node
+            values.append(value)
+
+        test_result = None
+        for index, method_name in enumerate(node.op_method_names):
+            test_result = self._fold_bin_op(values[index], method_name, values[index + 1])
+            if test_result is None:
+                return node
+            if test_result.is_false():  # the test is false so far: no need to continue
+                break
+        return self._node_from_value(test_result, node) or node
+
+    def optimize_UnaryOpNode(self, node: UnaryOpNode) -> Node:
+        node.node = self._optimize_operand(node.node)
+        value = self._constant_value(node.node)
+        if value is None:
+            return node
+
+        error = None
+        if node.op_kind == UNARY_OP_MINUS:
+            value, error = value.multiplied_by(Number(-1, node.op_token.pos_start, node.op_token.pos_end))
+        elif node.op_kind == UNARY_OP_NOT:
+            value = Number(not value.is_true(), node.pos_start, node.pos_end)
+        elif node.op_kind == UNARY_OP_BITWISENOT:
+            value, error = value.bitwise_not()
+        elif node.op_kind != UNARY_OP_PLUS:
+            return node
+
+        if error is not None:
+            return node
+        return self._node_from_value(value, node) or node
+
+    def optimize_AbsNode(self, node: AbsNode) -> Node:
+        node.node_to_abs = self._optimize_operand(node.node_to_abs)
+        return node
+
+    # VALUE AND VAR NODES
+    def optimize_ListNode(self, node: ListNode) -> Node:
+        node.element_nodes = [(self.optimize(element), mul) for element, mul in node.element_nodes]
+        return node
+
+    def optimize_DictNode(self, node: DictNode) -> Node:
+        node.key_value_nodes = [(self.optimize(key), self.optimize(value)) for key, value in node.key_value_nodes]
+        return node
+
+    def optimize_SetNode(self, node: SetNode) -> Node:
+        node.element_nodes = [self.optimize(element) for element in node.element_nodes]
+        return node
+
+    def optimize_VarAssignNode(self, node: VarAssignNode) -> Node:
+        if node.value_nodes is not None:
+            node.value_nodes = [self.optimize(value_node) for value_node in node.value_nodes]
+        return node
+
+    # TEST NODES
+    def optimize_IfNode(self, node: IfNode) -> Node:
+        """Remove the cases that can never be executed.
+        If a condition is always true, the following cases and the else case are removed."""
+        cases: list[tuple[Node, Node]] = []
+        else_case = node.else_case
+        for condition, body in node.cases:
+            condition = self.optimize(condition)
+            condition_value = self._constant_value(condition)
+            if condition_value is None:
+                cases.append((condition, self.optimize(body)))
+                continue
+            if condition_value.is_true():
+                else_case = body
+                break
+
+        if else_case is not None:
+            else_case = self.optimize(else_case)
+        if len(cases) == 0:
+            if else_case is not None:
+                return else_case
+            # all the cases are false and there is no else: the if statement returns None.
+            # we keep the first condition so that the positions of the returned value stay the same.
+            node.cases = [node.cases[0]]
+            node.else_case = None
+            return node
+        node.cases = cases
+        node.else_case = else_case
+        return node
+
+    def optimize_AssertNode(self, node: AssertNode) -> Node:
+        node.assertion = self.optimize(node.assertion)
+        node.errmsg = self.optimize(node.errmsg)
+        return node
+
+    # LOOP NODES
+    def optimize_ForNode(self, node: ForNode) -> Node:
+        node.start_value_node = self.optimize(node.start_value_node)
+        node.end_value_node = self.optimize(node.end_value_node)
+        if node.step_value_node is not None:
+            node.step_value_node = self.optimize(node.step_value_node)
+        node.body_node = self.optimize(node.body_node)
+        return node
+
+    def optimize_ForNodeList(self, node: ForNodeList) -> Node:
+        node.list_node = self.optimize(node.list_node)
+        node.body_node = self.optimize(node.body_node)
+        return node
+
+    def optimize_WhileNode(self, node: WhileNode) -> Node:
+        node.condition_node = self.optimize(node.condition_node)
+        node.body_node = self.optimize(node.body_node)
+        return node
+
+    def optimize_DoWhileNode(self, node: DoWhileNode) -> Node:
+        node.condition_node = self.optimize(node.condition_node)
+        node.body_node = self.optimize(node.body_node)
+        return node
+
+    def optimize_LoopNode(self, node: LoopNode) -> Node:
+        node.body_node = self.optimize(node.body_node)
+        return node
+
+    def optimize_BreakNode(self, node: BreakNode) -> Node:
+        if node.node_to_return is not None:
+            node.node_to_return = self._optimize_operand(node.node_to_return)
+        return node
+
+    # FUNCTION NODES
+    def optimize_FuncDefNode(self, node: FuncDefNode) -> Node:
+        node.optional_params = [(name, self.optimize(default)) for name, default in node.optional_params]
+        node.body_node = self.optimize(node.body_node)
+        return node
+
+    def optimize_ClassNode(self, node: ClassNode) -> Node:
+        node.body_node = self.optimize(node.body_node)
+        return node
+
+    def optimize_CallNode(self, node: CallNode) -> Node:
+        node.node_to_call = self.optimize(node.node_to_call)
+        node.arg_nodes = [(self.optimize(arg), mul) for arg, mul in node.arg_nodes]
+        return node
+
+    def optimize_ReturnNode(self, node: ReturnNode) -> Node:
+        if node.node_to_return is not None:
+            node.node_to_return = self.optimize(node.node_to_return)
+        return node
+
+    def optimize_YieldNode(self, node: YieldNode) -> Node:
+        if node.node_to_yield is not None:
+            node.node_to_yield = self.optimize(node.node_to_yield)
+        return node
+
+    # MODULE AND FILE NODES
+    def optimize_ExportNode(self, node: ExportNode) -> Node:
+        if isinstance(node.expr_or_identifier, Node):
+            node.expr_or_identifier = self.optimize(node.expr_or_identifier)
+        return node
+
+    def optimize_WriteNode(self, node: WriteNode) -> Node:
+        node.expr_to_write = self.optimize(node.expr_to_write)
+        node.file_name_expr = self.optimize(node.file_name_expr)
+        return node
+
+    def optimize_ReadNode(self, node: ReadNode) -> Node:
+        node.file_name_expr = self.optimize(node.file_name_expr)
+        return node
@@ -36,6 +36,7 @@ class Parser:
         self.current_token: Token | None = None  # Token is imported in src.nodes
         self.advance()
         self.then_s: list[tuple[Position, Position]] = []  # pos start then pos end
+        self.yield_count: int | None = None  # number of `yield` in the function being parsed (None outside functions)
 
     def parse(self):
         """Parse tokens and return a result that contain a main node"""
@@ -302,6 +303,7 @@ class Parser:
     def statement(self) -> ParseResult:  # only one statement
         """
         statement     : KEYWORD:RETURN expr?
+                      : KEYWORD:YIELD expr?
                       : KEYWORD:IMPORT IDENTIFIER (DOT IDENTIFIER)?* (KEYWORD:AS IDENTIFIER)?
                       : KEYWORD:EXPORT expr AS IDENTIFIER
                       : KEYWORD:EXPORT IDENTIFIER (KEYWORD:AS IDENTIFIER)?
@@ -330,6 +332,26 @@ class Parser:
 
             return result.success(ReturnNode(expr, pos_start, self.current_token.pos_start.copy()))
 
+        # KEYWORD:YIELD expr?
+        if self.current_token.matches(TT["KEYWORD"], 'yield'):
+            if self.yield_count is None:
+                return result.failure(InvalidSyntaxError(
+                    self.current_token.pos_start, self.current_token.pos_end,
+                    "'yield' outside of a function.",
+                    "src.parser.parser.Parser.statement"
+                ))
+            self.yield_count += 1
+            result.register_advancement()
+            self.advance()
+
+            # expr?
+            expr = result.try_register(self.expr())  # we try to register an expression
+            if expr is None:  # there is no expr : we reverse
+                self.reverse(result.to_reverse_count)
+            assert not isinstance(expr, list)
+
+            return result.success(YieldNode(expr, pos_start, self.current_token.pos_start.copy()))
+
         # KEYWORD:IMPORT IDENTIFIER
         if self.current_token.matches(TT["KEYWORD"], 'import'):
             result = self.advance_and_check_for(result, "expected identifier after 'import'.",
@@ -1134,6 +1156,7 @@ class Parser:
               : LPAREN NEWLINE?* expr NEWLINE?* RPAREN
               : DOLLAR IDENTIFIER
               : list_expr
+              : dict_expr
               : if_expr
               : for_expr
               : while_expr
@@ -1164,6 +1187,9 @@ class Parser:
         # list_expr
         elif token.type == TT["LSQUARE"]:
             expr = result.register(self.list_expr())
+        # dict_expr
+        elif token.type == TT["LBRACE"]:
+            expr = result.register(self.dict_expr())
         # if_expr
         elif token.matches(TT["KEYWORD"], 'if'):
             expr = result.register(self.if_expr())
@@ -1437,6 +1463,79 @@ class Parser:
             element_nodes, pos_start, pos_end
         ))
 
+    def dict_expr(self) -> ParseResult:
+        """
+        dict_expr  : LBRACE NEWLINE?* (expr COLON NEWLINE?* expr (COMMA NEWLINE?* expr COLON NEWLINE?* expr)?*)?
+                     NEWLINE?* RBRACE
+                   : LBRACE NEWLINE?* expr (COMMA NEWLINE?* expr)?* NEWLINE?* RBRACE
+        """
+        result = ParseResult()
+        # the python list that will contain the (key, value) nodes of the nougaro dict
+        key_value_nodes: list[tuple[Node, Node]] = []
+        # the python list that will contain the element nodes of the nougaro set, if this is a set
+        element_nodes: list[Node] = []
+        is_set = False
+        assert self.current_token is not None
+        pos_start = self.current_token.pos_start.copy()
+        first_tok_pos_end = self.current_token.pos_end.copy()
+
+        result = self.check_for_and_advance(result, "expected '{'.", "LBRACE", None, "dict_expr")
+        if result.error is not None:
+            return result
+
+        self.skip_newlines(result)
+
+        while self.current_token.type != TT["RBRACE"]:
+            if len(key_value_nodes) != 0 or len(element_nodes) != 0:  # (COMMA NEWLINE?* expr COLON NEWLINE?* expr)?*
+                result = self.check_for_and_advance(
+                    result, "'{' was never closed.", "COMMA", None, "dict_expr", pos_start, first_tok_pos_end
+                )
+                if result.error is not None:
+                    return result
+                self.skip_newlines(result)
+
+            # expr COLON NEWLINE?* expr
+            key = result.register(self.expr())
+            if result.error is not None:
+                return result
+            assert key is not None
+            assert not isinstance(key, list)
+
+            # the first element decides if this is a dict or a set
+            if len(key_value_nodes) == 0 and len(element_nodes) == 0 and self.current_token.type != TT["COLON"]:
+                is_set = True
+            if is_set:
+                element_nodes.append(key)
+                self.skip_newlines(result)
+                continue
+
+            result = self.check_for_and_advance(result, "expected ':'.", "COLON", None, "dict_expr")
+            if result.error is not None:
+                return result
+            self.skip_newlines(result)
+
+            value = result.register(self.expr())
+            if result.error is not None:
+                return result
+            assert value is not None
+            assert not isinstance(value, list)
+
+            key_value_nodes.append((key, value))
+            self.skip_newlines(result)
+
+        pos_end = self.current_token.pos_end.copy()
+        result.register_advancement()
+        self.advance()
+        if is_set:
+            return result.success(SetNode(element_nodes, pos_start, pos_end))
+        return result.success(DictNode(key_value_nodes, pos_start, pos_end))
+
+    def skip_newlines(self, result: ParseResult):
+        """Advance while the current token is a NEWLINE"""
+        while self.current_token is not None and self.current_token.type == TT["NEWLINE"]:
+            result.register_advancement()
+            self.advance()
+
     def if_expr(self) -> ParseResult:
         """
         if_expr : KEYWORD:IF expr KEYWORD:THEN
@@ -2097,50 +2196,59 @@ class Parser:
             if result.error is not None:
                 return result
 
-        # ARROW expr
-        if self.current_token.type == TT["ARROW"]:
-            result.register_advancement()
-            self.advance()
+        # we count the `yield` statements of this function (and not those of the functions defined inside it)
+        outer_yield_count = self.yield_count
+        self.yield_count = 0
+        try:
+            # ARROW expr
+            if self.current_token.type == TT["ARROW"]:
+                result.register_advancement()
+                self.advance()
 
-            # expr
-            body = result.register(self.expr())
+                # expr
+                body = result.register(self.expr())
+                if result.error is not None:
+                    return result
+                assert body is not None
+                assert not isinstance(body, list)
+
+                return result.success(FuncDefNode(
+                    var_name_token,
+                    param_names_tokens,
+                    body,
+                    should_auto_return=True,
+                    optional_params=optional_params,
+                    is_generator=self.yield_count != 0
+                ))
+
+            result = self.check_for_and_advance(result, "expected '->' or new line.", "NEWLINE", None, "func_def")
+
+            self.then_s.append((def_tok.pos_start, def_tok.pos_end))
+
+            # statements
+            body = result.register(self.statements(stop=[(TT["KEYWORD"], 'end')]))
             if result.error is not None:
                 return result
             assert body is not None
+
+            # KEYWORD:END
+            self.check_for_and_advance(result, "expected 'end'.", "KEYWORD", "end",
+                                       "func_def", del_a_then=True)
+            if result.error is not None:
+                return result
             assert not isinstance(body, list)
 
+            mark_value_as_unused(body)  # the value of the body of a multi-line function is never used
             return result.success(FuncDefNode(
                 var_name_token,
                 param_names_tokens,
                 body,
-                should_auto_return=True,
-                optional_params=optional_params
+                False,
+                optional_params,
+                is_generator=self.yield_count != 0
             ))
-
-        result = self.check_for_and_advance(result, "expected '->' or new line.", "NEWLINE", None, "func_def")
-
-        self.then_s.append((def_tok.pos_start, def_tok.pos_end))
-
-        # statements
-        body = result.register(self.statements(stop=[(TT["KEYWORD"], 'end')]))
-        if result.error is not None:
-            return result
-        assert body is not None
-
-        # KEYWORD:END
-        self.check_for_and_advance(result, "expected 'end'.", "KEYWORD", "end",
-                                   "func_def", del_a_then=True)
-        if result.error is not None:
-            return result
-        assert not isinstance(body, list)
-
-        return result.success(FuncDefNode(
-            var_name_token,
-            param_names_tokens,
-            body,
-            False,
-            optional_params
-        ))
+        finally:
+            self.yield_count = outer_yield_count
 
     def class_def(self) -> ParseResult:
         """
@@ -10,27 +10,29 @@
 # IMPORTS
 # nougaro modules imports
 from src.errors.errors import RunTimeError, RTNotDefinedError, RTTypeError, RTAttributeError, InvalidSyntaxError
-from src.errors.errors import RTAssertionError, RTIndexError, RTFileNotFoundError, RTRecursionError
+from src.errors.errors import RTAssertionError, RTIndexError, RTFileNotFoundError, RTRecursionError, RTKeyError
 from src.lexer.token_types import TT, TOKENS_NOT_TO_QUOTE
 from src.lexer.token import Token
 from src.lexer.position import Position, DEFAULT_POSITION
 from src.parser.nodes import *
 from src.runtime.values.basevalues.basevalues import Number, String, List, NoneValue, Value, Module, Constructor
-from src.runtime.values.basevalues.basevalues import Object, DefaultValue
+from src.runtime.values.basevalues.basevalues import Object, DefaultValue, SymbolTableDump, Dict, Set, Array, Range
+from src.runtime.values.basevalues.basevalues import Deque
 from src.runtime.values.functions.function import Function, Method
 from src.runtime.values.functions.base_function import BaseFunction
+from src.runtime.values.functions.generator import Generator
 from src.runtime.runtime_result import RTResult
 from src.runtime.context import Context
 from src.runtime.symbol_table import SymbolTable
 from src.misc import clear_screen, RunFunction, print_in_red
-from src.noug_version import LIB_VERSION
+from src.noug_version import LIB_VERSION, OLDEST_LIB_VERSION
 import src.conffiles
 # built-in python imports
 from inspect import signature
 from collections import Counter
+from typing import Iterable, Generator as PythonGenerator
 import os.path
 import importlib
-import pprint
 
 _ORIGIN_FILE = "src.runtime.interpreter.Interpreter"
 
@@ -40,6 +42,8 @@ _ORIGIN_FILE = "src.runtime.interpreter.Interpreter"
 # ##########
 # noinspection PyPep8Naming
 class Interpreter:
+    _methods_parameters_count: dict[str, int] = {}
+
     def __init__(self, run: RunFunction, noug_dir_: str, args: list[String], work_dir: str,
                  lexer_metas: dict[str, str | bool], file_name: str = ""):
         debug = src.conffiles.access_data("debug")
@@ -52,7 +56,10 @@ class Interpreter:
         self.work_dir = work_dir
         self.file_name = file_name
         self.lexer_metas = lexer_metas
+        # ids of the nodes that contain `yield`, when the interpreter runs the body of a generator (see `iter_visit`)
+        self.yielding_nodes: frozenset[int] = frozenset()
         self._methods = None
+        self._iter_methods = None
         self.init_methods()
         assert self._methods is not None
 
@@ -67,6 +74,8 @@ class Interpreter:
             "ClassNode": self.visit_ClassNode,
             "ContinueNode": self.visit_ContinueNode,
             "DefaultNode": self.visit_DefaultNode,
+            "DictNode": self.visit_DictNode,
+            "SetNode": self.visit_SetNode,
             "DoWhileNode": self.visit_DoWhileNode,
             "DollarPrintNode": self.visit_DollarPrintNode,
             "ExportNode": self.visit_ExportNode,
@@ -88,31 +97,44 @@ class Interpreter:
             "VarAssignNode": self.visit_VarAssignNode,
             "VarDeleteNode": self.visit_VarDeleteNode,
             "WhileNode": self.visit_WhileNode,
-            "WriteNode": self.visit_WriteNode
+            "WriteNode": self.visit_WriteNode,
+            "YieldNode": self.visit_YieldNode
+        }
+        self._iter_methods = {
+            "DoWhileNode": self.iter_DoWhileNode,
+            "ForNode": self.iter_ForNode,
+            "ForNodeList": self.iter_ForNodeList,
+            "IfNode": self.iter_IfNode,
+            "ListNode": self.iter_ListNode,
+            "LoopNode": self.iter_LoopNode,
+            "WhileNode": self.iter_WhileNode,
+            "YieldNode": self.iter_YieldNode
         }
+        # the number of parameters of each method is computed once, not at every visit
+        if len(Interpreter._methods_parameters_count) == 0:
+            for method_name, method in self._methods.items():
+                Interpreter._methods_parameters_count[method_name] = len(signature(method).parameters)
 
     @staticmethod
     def update_symbol_table(ctx: Context):
+        """Make sure `__symbol_table__` describes the symbol table of `ctx`. Its content is computed lazily."""
         assert ctx.symbol_table is not None
-        symbols_copy: dict[str, Value] = ctx.symbol_table.symbols.copy()
-        if '__symbol_table__' in symbols_copy.keys():
-            del symbols_copy['__symbol_table__']
+        symbol_table_dump = ctx.symbol_table.symbols.get('__symbol_table__')
+        if isinstance(symbol_table_dump, SymbolTableDump) and symbol_table_dump.symbol_table is ctx.symbol_table:
+            return
         ctx.symbol_table.set(
             '__symbol_table__',
-            String(pprint.pformat(symbols_copy), DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
+            SymbolTableDump(ctx.symbol_table, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
         )
 
     def visit(self, node: Node, ctx: Context, methods_instead_of_funcs: bool, other_ctx: Context | None = None,
               main_visit: bool = False) -> RTResult:
         """Visit a node."""
-        method_name = f'{type(node).__name__}'
+        method_name = type(node).__name__
         assert self._methods is not None
         method = self._methods.get(method_name, self.no_visit_method)
-        if other_ctx is None:
-            other_ctx = ctx.copy()
 
-        PARAMETERS = signature(method).parameters
-        match len(PARAMETERS):
+        match self._methods_parameters_count.get(method_name, 2):
             # un-comment if you add some static methods without any parameters
             # case 0:  # def method(self) is 1 param, def staticmethod() is 0 param
             #     result = method()  # type: ignore
@@ -121,6 +143,8 @@ class Interpreter:
             case 3:
                 result = method(node, ctx, methods_instead_of_funcs=methods_instead_of_funcs)  # type: ignore
             case 4:
+                if other_ctx is None:
+                    other_ctx = ctx.copy()
                 result = method(node, ctx, other_ctx, methods_instead_of_funcs=methods_instead_of_funcs)  # type: ignore
             case _:
                 result = method(node, ctx)  # type: ignore
@@ -154,6 +178,21 @@ class Interpreter:
                 ))
         return result
 
+    @staticmethod
+    def _operate(left: Value, op_method_name: str, right: Value) -> tuple[Value | None, RunTimeError | None]:
+        """Returns `left op right`, where op is given by the name of its Value method (see
+        src.parser.nodes.BIN_OP_METHODS). Numbers are computed directly, without calling the Value method."""
+        if type(left) is Number and type(right) is Number:
+            number_operator = NUMBER_OPERATORS.get(op_method_name)
+            if number_operator is not None:
+                try:
+                    return Number(
+                        number_operator(left.value, right.value), left.pos_start, right.pos_end
+                    ).set_context(left.context), None
+                except (ArithmeticError, TypeError):
+                    pass  # the Value method gives the proper error
+        return getattr(left, op_method_name)(right)
+
     def _undefined(
             self,
             pos_start: Position,
@@ -352,10 +391,43 @@ class Interpreter:
                         ctx,
                         origin_file=f"{_ORIGIN_FILE}.visit_ListNode"
                     ))
-                elements.extend(extend_list_.elements)
+                elements.extend(extend_list_.iter_values())
 
         return result.success(List(elements, node.pos_start, node.pos_end).set_context(ctx))
 
+    def visit_DictNode(self, node: DictNode, ctx: Context, methods_instead_of_funcs: bool) -> RTResult:
+        """Visit DictNode"""
+        result = RTResult()
+        dict_ = Dict({}, node.pos_start, node.pos_end).set_context(ctx)
+
+        for key_node, value_node in node.key_value_nodes:  # we visit every key and every value from the dict
+            key = result.register(self.visit(key_node, ctx, methods_instead_of_funcs))
+            if result.should_return() or key is None:  # if there is an error
+                return result
+            value = result.register(self.visit(value_node, ctx, methods_instead_of_funcs))
+            if result.should_return() or value is None:  # if there is an error
+                return result
+            error = dict_.set(key, value)
+            if error is not None:
+                return result.failure(error)
+
+        return result.success(dict_)
+
+    def visit_SetNode(self, node: SetNode, ctx: Context, methods_instead_of_funcs: bool) -> RTResult:
+        """Visit SetNode"""
+        result = RTResult()
+        set_ = Set({}, node.pos_start, node.pos_end).set_context(ctx)
+
+        for element_node in node.element_nodes:  # we visit every element from the set
+            element = result.register(self.visit(element_node, ctx, methods_instead_of_funcs))
+            if result.should_return() or element is None:  # if there is an error
+                return result
+            error = set_.add(element)
+            if error is not None:
+                return result.failure(error)
+
+        return result.success(set_)
+
     def visit_BinOpNode(self, node: BinOpNode, ctx: Context, methods_instead_of_funcs: bool) -> RTResult:
         """Visit BinOpNode"""
         res = RTResult()
@@ -364,11 +436,12 @@ class Interpreter:
             return res
         assert isinstance(left, Value)
 
-        if node.op_token.matches(TT["KEYWORD"], 'and') and left.is_false():
+        op_method_name = node.op_method_name
+        if op_method_name == "and_" and left.is_false():
             # operator is "and" and the value is false
             return res.success(Number(False, node.pos_start, node.pos_end))
 
-        if node.op_token.matches(TT["KEYWORD"], 'or') and left.is_true():
+        if op_method_name == "or_" and left.is_true():
             # operator is "or" and the value is true
             return res.success(Number(True, node.pos_start, node.pos_end))
 
@@ -377,46 +450,22 @@ class Interpreter:
             return res
         assert isinstance(right, Value)
 
-        # we check for what is the operator token, then we execute the corresponding method
-        if node.op_token.type == TT["PLUS"]:
-            result, error = left.added_to(right)
-        elif node.op_token.type == TT["MINUS"]:
-            result, error = left.subbed_by(right)
-        elif node.op_token.type == TT["MUL"]:
-            result, error = left.multiplied_by(right)
-        elif node.op_token.type == TT["DIV"]:
-            result, error = left.divided_by(right)
-        elif node.op_token.type == TT["PERC"]:
-            result, error = left.modded_by(right)
-        elif node.op_token.type == TT["FLOORDIV"]:
-            result, error = left.floor_divided_by(right)
-        elif node.op_token.type == TT["POW"]:
-            result, error = left.powered_by(right)
-        elif node.op_token.type == TT["EE"]:
-            result, error = left.get_comparison_eq(right)
-        elif node.op_token.type == TT["NE"]:
-            result, error = left.get_comparison_ne(right)
-        elif node.op_token.type == TT["LT"]:
-            result, error = left.get_comparison_lt(right)
-        elif node.op_token.type == TT["GT"]:
-            result, error = left.get_comparison_gt(right)
-        elif node.op_token.type == TT["LTE"]:
-            result, error = left.get_comparison_lte(right)
-        elif node.op_token.type == TT["GTE"]:
-            result, error = left.get_comparison_gte(right)
-        elif node.op_token.matches(TT["KEYWORD"], 'and'):
-            result, error = left.and_(right)
-        elif node.op_token.matches(TT["KEYWORD"], 'or'):
-            result, error = left.or_(right)
-        elif node.op_token.matches(TT["KEYWORD"], 'xor'):
-            result, error = left.xor_(right)
-        elif node.op_token.type == TT["BITWISEAND"]:
-            result, error = left.bitwise_and(right)
-        elif node.op_token.type == TT["BITWISEOR"]:
-            result, error = left.bitwise_or(right)
-        elif node.op_token.type == TT["BITWISEXOR"]:
-            result, error = left.bitwise_xor(right)
-        else:
+        # fast paths: number ⊕ number and str + str
+        left_type = type(left)
+        if left_type is type(right):
+            if left_type is Number and node.number_operator is not None:
+                try:
+                    return res.success(Number(
+                        node.number_operator(left.value, right.value), node.pos_start, node.pos_end  # type: ignore
+                    ).set_context(left.context))
+                except (ArithmeticError, TypeError):
+                    pass  # the Value method gives the proper error
+            elif left_type is String and op_method_name == "added_to":
+                return res.success(String(
+                    left.value + right.value, node.pos_start, node.pos_end  # type: ignore
+                ).set_context(left.context))
+
+        if op_method_name is None:
             print(ctx)
             print("NOUGARO INTERNAL ERROR: Result is not defined after executing "
                   f"{_ORIGIN_FILE}.visit_BinOpNode because of an invalid token.\n"
@@ -424,6 +473,8 @@ class Interpreter:
                   "Please report this bug at https://jd-develop.github.io/nougaro/bugreport.html with the information "
                   "above")
             raise Exception(f"Result is not defined after executing {_ORIGIN_FILE}.visit_BinOpNode")
+        # we execute the Value method corresponding to the operator
+        result, error = getattr(left, op_method_name)(right)
 
         if error is not None:  # there is an error
             return res.failure(error)
@@ -477,21 +528,8 @@ class Interpreter:
             except IndexError:
                 break
 
-            if op_token.type == TT["EE"]:
-                test_result, error = element.get_comparison_eq(right)
-            elif op_token.type == TT["NE"]:
-                test_result, error = element.get_comparison_ne(right)
-            elif op_token.type == TT["LT"]:
-                test_result, error = element.get_comparison_lt(right)
-            elif op_token.type == TT["GT"]:
-                test_result, error = element.get_comparison_gt(right)
-            elif op_token.type == TT["LTE"]:
-                test_result, error = element.get_comparison_lte(right)
-            elif op_token.type == TT["GTE"]:
-                test_result, error = element.get_comparison_gte(right)
-            elif op_token.matches(TT["KEYWORD"], 'in'):
-                test_result, error = element.is_in(right)
-            else:
+            op_method_name = node.op_method_names[index // 2]
+            if op_method_name is None:
                 print(ctx)
                 print(
                     f"NOUGARO INTERNAL ERROR: Result is not defined after executing "
@@ -502,6 +540,7 @@ class Interpreter:
                     f"information above")
                 raise Exception("Result is not defined after executing "
                                 f"{_ORIGIN_FILE}.visit_BinOpCompNode")
+            test_result, error = self._operate(element, op_method_name, right)
             if error is not None:  # there is an error
                 return res.failure(error)
             assert test_result is not None
@@ -531,13 +570,17 @@ class Interpreter:
 
         error = None
 
-        if node.op_token.type == TT["MINUS"]:
-            value, error = value.multiplied_by(
-                Number(-1, node.op_token.pos_start, node.op_token.pos_end)
-            )  # -x is like x*-1
-        elif node.op_token.matches(TT["KEYWORD"], 'not'):
+        op_kind = node.op_kind
+        if op_kind == UNARY_OP_MINUS:
+            if type(value) is Number:
+                value = Number(-value.value, value.pos_start, value.pos_end).set_context(value.context)
+            else:
+                value, error = value.multiplied_by(
+                    Number(-1, node.op_token.pos_start, node.op_token.pos_end)
+                )  # -x is like x*-1
+        elif op_kind == UNARY_OP_NOT:
             value = Number(not value.is_true(), node.pos_start, node.pos_end)
-        elif node.op_token.type == TT["BITWISENOT"]:
+        elif op_kind == UNARY_OP_BITWISENOT:
             value, error = value.bitwise_not()
 
         if error is not None:  # there is an error
@@ -613,10 +656,6 @@ class Interpreter:
 
         if equal in [TT["INCREMENT"], TT["DECREMENT"]]:
             values = [Number(1, node.equal.pos_start, node.equal.pos_end)] * len(var_names)
-            if equal == TT["INCREMENT"]:
-                equal = TT["PLUSEQ"]
-            else:
-                equal = TT["MINUSEQ"]
 
         if len(var_names) != len(values):
             return result.failure(RunTimeError(
@@ -737,42 +776,8 @@ class Interpreter:
             elif variable_exists:  # edit variable
                 assert isinstance(var_actual_value, Value)  # a little cheesy
                 var_actual_value.set_pos(var_name[0].pos_start, var_name[-1].pos_end)
-                if equal == TT["PLUSEQ"]:
-                    final_value, error = var_actual_value.added_to(values[i])
-                elif equal == TT["MINUSEQ"]:
-                    final_value, error = var_actual_value.subbed_by(values[i])
-                elif equal == TT["MULTEQ"]:
-                    final_value, error = var_actual_value.multiplied_by(values[i])
-                elif equal == TT["DIVEQ"]:
-                    final_value, error = var_actual_value.divided_by(values[i])
-                elif equal == TT["POWEQ"]:
-                    final_value, error = var_actual_value.powered_by(values[i])
-                elif equal == TT["FLOORDIVEQ"]:
-                    final_value, error = var_actual_value.floor_divided_by(values[i])
-                elif equal == TT["PERCEQ"]:
-                    final_value, error = var_actual_value.modded_by(values[i])
-                elif equal == TT["OREQ"]:
-                    final_value, error = var_actual_value.or_(values[i])
-                elif equal == TT["XOREQ"]:
-                    final_value, error = var_actual_value.xor_(values[i])
-                elif equal == TT["ANDEQ"]:
-                    final_value, error = var_actual_value.and_(values[i])
-                elif equal == TT["BITWISEANDEQ"]:
-                    final_value, error = var_actual_value.bitwise_and(values[i])
-                elif equal == TT["BITWISEOREQ"]:
-                    final_value, error = var_actual_value.bitwise_or(values[i])
-                elif equal == TT["BITWISEXOREQ"]:
-                    final_value, error = var_actual_value.bitwise_xor(values[i])
-                elif equal == TT["EEEQ"]:
-                    final_value, error = var_actual_value.get_comparison_eq(values[i])
-                elif equal == TT["LTEQ"]:
-                    final_value, error = var_actual_value.get_comparison_lt(values[i])
-                elif equal == TT["GTEQ"]:
-                    final_value, error = var_actual_value.get_comparison_gt(values[i])
-                elif equal == TT["LTEEQ"]:
-                    final_value, error = var_actual_value.get_comparison_lte(values[i])
-                elif equal == TT["GTEEQ"]:
-                    final_value, error = var_actual_value.get_comparison_gte(values[i])
+                if node.op_method_name is not None:
+                    final_value, error = self._operate(var_actual_value, node.op_method_name, values[i])
                 else:  # this is not supposed to happen
                     print(
                         f"Note: there was a problem in {_ORIGIN_FILE}.visit_VarAssignNode.\n"
@@ -971,7 +976,8 @@ class Interpreter:
                 return result
             assert value is not None
 
-            elements.append(value)
+            if node.value_is_used:  # see src.parser.nodes.mark_value_as_unused
+                elements.append(value)
 
         if outer_loop_should_continue:
             assert result.break_or_continue_pos is not None
@@ -987,32 +993,55 @@ class Interpreter:
             List(elements, node.pos_start, node.pos_end).set_context(ctx)
         )
 
-    def visit_ForNodeList(self, node: ForNodeList, ctx: Context, methods_instead_of_funcs: bool) -> RTResult:
-        """Visit ForNodeList. for i in list then"""
-        result = RTResult()
-        elements: list[Value] = []
-
-        iterable_ = result.register(self.visit(node.list_node, ctx, methods_instead_of_funcs))  # we get the list
-        if result.should_return():  # check for errors
-            return result
-
+    @staticmethod
+    def _python_iterable(iterable_: Value | None, node: ForNodeList,
+                         ctx: Context) -> tuple[Iterable[Value | int | float | str] | None, RunTimeError | None]:
+        """Returns the python iterable a `for i in list` loop iterates over"""
         if isinstance(iterable_, List):
-            python_iterable = iterable_.elements
+            python_iterable = iterable_.storage.items  # numbers and strs may be unboxed (see ListStorage)
+        elif isinstance(iterable_, Dict):
+            python_iterable = iterable_.keys()  # the loop iterates over a copy of the keys
+        elif isinstance(iterable_, Set):
+            python_iterable = iterable_.values()  # the loop iterates over a copy of the elements
+        elif isinstance(iterable_, Array):
+            python_iterable = iterable_.data  # the numbers are boxed one at a time
+        elif isinstance(iterable_, Range):
+            python_iterable = iterable_.range_  # the numbers are computed and boxed one at a time
+        elif isinstance(iterable_, Deque):
+            python_iterable = list(iterable_.elements)  # the loop iterates over a copy of the elements
+        elif isinstance(iterable_, Generator):
+            python_iterable = iterable_.iterate()  # the body of the generator runs until the next `yield`
         elif isinstance(iterable_, String):
             try:
                 python_iterable = iterable_.to_python_str()
             except UnicodeEncodeError as e:
-                return result.failure(RunTimeError(
+                return None, RunTimeError(
                     iterable_.pos_start, iterable_.pos_end,
                     str(e), ctx, origin_file=f"{_ORIGIN_FILE}.visit_ForNodeList"
-                ))
-        else:  # this is not a list nor a str
+                )
+        else:  # this is not an iterable value
             assert iterable_ is not None
-            return result.failure(RTTypeError(
+            return None, RTTypeError(
                 node.list_node.pos_start, node.list_node.pos_end,
-                f"expected a list or a str after 'in', but found {iterable_.type_}.",
+                f"expected a list, a dict, a set, an array, a range, a deque, a generator or a str after 'in', but "
+                f"found {iterable_.type_}.",
                 ctx, f"{_ORIGIN_FILE}.visit_ForNodeList"
-            ))
+            )
+        return python_iterable, None
+
+    def visit_ForNodeList(self, node: ForNodeList, ctx: Context, methods_instead_of_funcs: bool) -> RTResult:
+        """Visit ForNodeList. for i in list then"""
+        result = RTResult()
+        elements: list[Value] = []
+
+        iterable_ = result.register(self.visit(node.list_node, ctx, methods_instead_of_funcs))  # we get the list
+        if result.should_return():  # check for errors
+            return result
+
+        python_iterable, error = self._python_iterable(iterable_, node, ctx)
+        if error is not None:
+            return result.failure(error)
+        assert python_iterable is not None
 
         assert ctx.symbol_table is not None
         assert isinstance(node.var_name_token.value, str)
@@ -1023,6 +1052,8 @@ class Interpreter:
             # we set the variable to the actual list element
             if isinstance(element, str):
                 element = String(element, iterable_.pos_start, iterable_.pos_end)
+            elif isinstance(element, int) or isinstance(element, float):
+                element = Number(element, iterable_.pos_start, iterable_.pos_end)
             ctx.symbol_table.set(node.var_name_token.value, element)
             self.update_symbol_table(ctx)
             value = result.register(self.visit(node.body_node, ctx, methods_instead_of_funcs))
@@ -1050,7 +1081,11 @@ class Interpreter:
             if value is None:
                 value = NoneValue(node.body_node.pos_start, node.body_node.pos_end, False)
 
-            elements.append(value)
+            if node.value_is_used:  # see src.parser.nodes.mark_value_as_unused
+                elements.append(value)
+
+        if isinstance(iterable_, Generator) and iterable_.error is not None:  # the body of the generator failed
+            return result.failure(iterable_.error)
 
         if outer_loop_should_continue:
             assert result.break_or_continue_pos is not None
@@ -1104,7 +1139,8 @@ class Interpreter:
             if value is None:
                 value = NoneValue(node.body_node.pos_start, node.body_node.pos_end, False)
 
-            elements.append(value)
+            if node.value_is_used:  # see src.parser.nodes.mark_value_as_unused
+                elements.append(value)
 
             condition = result.register(self.visit(node.condition_node, ctx, methods_instead_of_funcs))
             if result.should_return():  # check for errors
@@ -1158,7 +1194,8 @@ class Interpreter:
             if value is None:
                 value = NoneValue(node.body_node.pos_start, node.body_node.pos_end, False)
 
-            elements.append(value)
+            if node.value_is_used:  # see src.parser.nodes.mark_value_as_unused
+                elements.append(value)
 
             condition = result.register(self.visit(node.condition_node, ctx, methods_instead_of_funcs))
             if result.should_return():  # check for errors
@@ -1215,7 +1252,8 @@ class Interpreter:
             if value is None:
                 value = NoneValue(node.body_node.pos_start, node.body_node.pos_end, False)
 
-            elements.append(value)
+            if node.value_is_used:  # see src.parser.nodes.mark_value_as_unused
+                elements.append(value)
 
         if outer_loop_should_continue:
             assert result.break_or_continue_pos is not None
@@ -1271,12 +1309,12 @@ class Interpreter:
         if not methods_instead_of_funcs:
             func_value = Function(
                 func_name, body_node, param_names, node.should_auto_return, node.pos_start, node.pos_end,
-                optional_params=optional_params
+                optional_params=optional_params, is_generator=node.is_generator
             ).set_context(ctx)
         else:
             func_value = Method(
                 func_name, body_node, param_names, node.should_auto_return, node.pos_start, node.pos_end,
-                optional_params=optional_params
+                optional_params=optional_params, is_generator=node.is_generator
             ).set_context(ctx)
 
         if func_name is not None:
@@ -1374,7 +1412,7 @@ class Interpreter:
                         outer_context,
                         origin_file=f"{_ORIGIN_FILE}.visit_CallNode"
                     ))
-                args.extend(list_.elements)
+                args.extend(list_.iter_values())
 
             if call_with_module_context:
                 use_context = value_to_call.module_context
@@ -1429,7 +1467,9 @@ class Interpreter:
 
             return self._init_constructor(value_to_call, outer_context, result, node)
 
-        elif isinstance(value_to_call, List):  # the value is a list
+        elif isinstance(value_to_call, List) or isinstance(value_to_call, Array) or isinstance(value_to_call, Range) \
+                or isinstance(value_to_call, Deque):
+            # the value is a list, an array, a range or a deque
             # get the element at the given index
             if len(node.arg_nodes) == 0:
                 return result.failure(RunTimeError(
@@ -1457,7 +1497,7 @@ class Interpreter:
                 except IndexError:
                     return result.failure(RTIndexError(
                         node.arg_nodes[0][0].pos_start, node.arg_nodes[0][0].pos_end,
-                        f'list index {index} out of range.',
+                        f'{value_to_call.type_} index {index} out of range.',
                         outer_context, f"{_ORIGIN_FILE}.visit_CallNode"
                     ))
 
@@ -1481,7 +1521,7 @@ class Interpreter:
                     except IndexError:
                         return result.failure(RTIndexError(
                             arg_node[0].pos_start, arg_node[0].pos_end,
-                            f'list index {index} out of range.',
+                            f'{value_to_call.type_} index {index} out of range.',
                             outer_context, f"{_ORIGIN_FILE}.Visit_CallNode"
                         ))
 
@@ -1489,6 +1529,36 @@ class Interpreter:
                     List(return_value_list, node.pos_start, node.pos_end).set_context(outer_context)
                 )
 
+        elif isinstance(value_to_call, Dict):  # the value is a dict
+            # get the value(s) corresponding to the given key(s)
+            if len(node.arg_nodes) == 0:
+                return result.failure(RunTimeError(
+                    node.pos_start, node.pos_end,
+                    f"please give at least one key.",
+                    outer_context, origin_file=f"{_ORIGIN_FILE}.visit_CallNode"
+                ))
+
+            return_value_list: list[Value] = []
+            for arg_node in node.arg_nodes:  # for every key
+                key = result.register(self.visit(arg_node[0], outer_context, methods_instead_of_funcs))
+                if result.should_return():
+                    return result
+                assert key is not None
+                value = value_to_call.get(key)
+                if value is None:
+                    return result.failure(RTKeyError(
+                        arg_node[0].pos_start, arg_node[0].pos_end,
+                        f"key {key.__repr__()} is not in the dict.",
+                        outer_context, f"{_ORIGIN_FILE}.visit_CallNode"
+                    ))
+                return_value_list.append(value)
+
+            if len(return_value_list) == 1:
+                return result.success(return_value_list[0].copy().set_pos(node.pos_start, node.pos_end))
+            return result.success(
+                List(return_value_list, node.pos_start, node.pos_end).set_context(outer_context)
+            )
+
         elif isinstance(value_to_call, String):  # the value is a string
             # get the element at the given index
             if len(node.arg_nodes) == 0:
@@ -1644,6 +1714,15 @@ class Interpreter:
 
         return result.success_return(value.set_context(ctx), node.pos_start, node.pos_end)
 
+    def visit_YieldNode(self, node: YieldNode, ctx: Context) -> RTResult:
+        """Visit YieldNode. The `yield` statements of a generator are run by `iter_YieldNode`: this one is only reached
+        when `yield` is inside an expression."""
+        return RTResult().failure(RunTimeError(
+            node.pos_start, node.pos_end,
+            "'yield' can only be a statement of a generator, of its conditions or of its loops.", ctx,
+            origin_file=f"{_ORIGIN_FILE}.visit_YieldNode"
+        ))
+
     @staticmethod
     def visit_ContinueNode(node: ContinueNode) -> RTResult:
         """Visit ContinueNode"""
@@ -1769,12 +1848,12 @@ class Interpreter:
                     origin_file=f"{_ORIGIN_FILE}.visit_ImportNode\n"
                     "(troubleshooting: is python importlib working?)"
                 ))
-            if lib_version != LIB_VERSION:
+            if not OLDEST_LIB_VERSION <= lib_version <= LIB_VERSION:
                 return result.failure(RunTimeError(
                     identifier.pos_start, identifier.pos_end,
                     f"module '{name_to_import}' is not compatible with the current version of Nougaro. "
                     f"Its library version is {lib_version}, while this version of Nougaro only "
-                    f"supports library version {LIB_VERSION}.",
+                    f"supports library versions {OLDEST_LIB_VERSION} to {LIB_VERSION}.",
                     ctx, origin_file=f"{_ORIGIN_FILE}.visit_ImportNode"
                 ))
             if self.debug:
@@ -2048,3 +2127,283 @@ class Interpreter:
                 [NoneValue(POSITION.copy(), POSITION.copy(), False)], POSITION.copy(), POSITION.copy()
             ).set_context(ctx)
         )
+
+    # GENERATORS
+    # The body of a generator is run by the `iter_` methods below. They are python generators that yield the values of
+    # the `yield` statements and return the RTResult of their node, so the body is paused at every `yield` with all its
+    # state (loops, conditions) kept in their frames. Only the nodes that contain `yield` are visited like this, the
+    # others are visited by `visit`.
+    def iter_visit(self, node: Node, ctx: Context,
+                   methods_instead_of_funcs: bool) -> PythonGenerator[Value, None, RTResult]:
+        """Visit a node of the body of a generator"""
+        if id(node) in self.yielding_nodes:
+            assert self._iter_methods is not None
+            method = self._iter_methods.get(type(node).__name__)
+            if method is not None:
+                return (yield from method(node, ctx, methods_instead_of_funcs))
+        return self.visit(node, ctx, methods_instead_of_funcs)
+
+    def _iter_loop_body(self, node: ForNode | ForNodeList | WhileNode | DoWhileNode | LoopNode, ctx: Context,
+                        methods_instead_of_funcs: bool, result: RTResult,
+                        elements: list[Value]) -> PythonGenerator[Value, None, str | None]:
+        """Runs the body of a loop once, like the `visit_` methods of the loops do. Returns None if the loop goes on,
+        'continue' if it goes on because of a `continue` statement, 'outer continue' or 'outer break' if the loop
+        should end because of a `continue` or a `break` of an outer loop, 'break' if this loop is broken, and 'return'
+        if there is an error or a `return` statement."""
+        value = result.register((yield from self.iter_visit(node.body_node, ctx, methods_instead_of_funcs)))
+        if result.loop_should_continue:
+            if self.lexer_metas.get("appendNoneOnContinue") is not None:
+                elements.append(NoneValue(node.body_node.pos_start, node.body_node.pos_end, False))
+            if result.continue_label is not None and node.label != result.continue_label:
+                return 'outer continue'
+            return 'continue'
+
+        if result.loop_should_break:
+            if self.lexer_metas.get("appendNoneOnBreak") is not None:
+                elements.append(NoneValue(node.body_node.pos_start, node.body_node.pos_end, False))
+            if result.break_label is not None and node.label != result.break_label:
+                return 'outer break'
+            return 'break'
+
+        if result.should_return(True):  # error or 'return' statement
+            return 'return'
+
+        if value is None:
+            value = NoneValue(node.body_node.pos_start, node.body_node.pos_end, False)
+        if node.value_is_used:  # see src.parser.nodes.mark_value_as_unused
+            elements.append(value)
+        return None
+
+    @staticmethod
+    def _end_iter_loop(node: ForNode | ForNodeList | WhileNode | DoWhileNode | LoopNode, ctx: Context,
+                       result: RTResult, elements: list[Value], status: str | None) -> RTResult:
+        """Returns the result of a loop run by one of the `iter_` methods, like the `visit_` methods of the loops do"""
+        if status == 'outer continue':
+            assert result.break_or_continue_pos is not None
+            pos_start, pos_end = result.break_or_continue_pos
+            return result.success_continue(pos_start, pos_end, result.continue_label)
+        if status == 'outer break':
+            assert result.break_or_continue_pos is not None
+            pos_start, pos_end = result.break_or_continue_pos
+            return result.success_break(pos_start, pos_end, result.break_value, result.break_label)
+        if status == 'break' and result.break_value is not None:
+            return result.success(result.break_value)
+        return result.success(List(elements, node.pos_start, node.pos_end).set_context(ctx))
+
+    def iter_YieldNode(self, node: YieldNode, ctx: Context,
+                       methods_instead_of_funcs: bool) -> PythonGenerator[Value, None, RTResult]:
+        """Gives the value of the `yield` statement to the loop that iterates over the generator"""
+        result = RTResult()
+        if node.node_to_yield is not None:  # 'yield foo'
+            value = result.register(self.visit(node.node_to_yield, ctx, methods_instead_of_funcs))
+            if result.should_return():  # check for errors
+                return result
+            assert value is not None
+        else:  # only 'yield'
+            value = NoneValue(node.pos_start, node.pos_end)
+
+        yield value.copy().set_context(ctx)  # the body is paused here until the next value is asked for
+        return result.success(NoneValue(node.pos_start, node.pos_end, False))
+
+    def iter_ListNode(self, node: ListNode, ctx: Context,
+                      methods_instead_of_funcs: bool) -> PythonGenerator[Value, None, RTResult]:
+        """Same as visit_ListNode (the statements of a body are in a ListNode)"""
+        result = RTResult()
+        elements: list[Value] = []
+
+        for element_node, mul in node.element_nodes:
+            value = result.register((yield from self.iter_visit(element_node, ctx, methods_instead_of_funcs)))
+            if result.should_return() or value is None:  # if there is an error
+                return result
+            if not mul:
+                elements.append(value)
+                continue
+            if not isinstance(value, List):
+                return result.failure(RTTypeError(
+                    value.pos_start, value.pos_end,
+                    f"expected a list value after '*', but got {value.type_}.",
+                    ctx,
+                    origin_file=f"{_ORIGIN_FILE}.iter_ListNode"
+                ))
+            elements.extend(value.iter_values())
+
+        return result.success(List(elements, node.pos_start, node.pos_end).set_context(ctx))
+
+    def iter_IfNode(self, node: IfNode, ctx: Context,
+                    methods_instead_of_funcs: bool) -> PythonGenerator[Value, None, RTResult]:
+        """Same as visit_IfNode"""
+        result = RTResult()
+        for condition, body_expr in node.cases:
+            condition_value = result.register((yield from self.iter_visit(condition, ctx, methods_instead_of_funcs)))
+            if result.should_return():  # check for errors
+                return result
+            assert condition_value is not None
+
+            if condition_value.is_true():
+                expr_value = result.register((yield from self.iter_visit(body_expr, ctx, methods_instead_of_funcs)))
+                if result.should_return():  # check for errors
+                    return result
+                assert expr_value is not None
+                return result.success(expr_value)
+
+        if node.else_case is not None:
+            else_value = result.register((yield from self.iter_visit(node.else_case, ctx, methods_instead_of_funcs)))
+            if result.should_return():  # check for errors
+                return result
+            assert else_value is not None
+            return result.success(else_value)
+
+        return result.success(NoneValue(node.pos_start, node.pos_end, False).set_context(ctx))
+
+    def iter_ForNode(self, node: ForNode, ctx: Context,
+                     methods_instead_of_funcs: bool) -> PythonGenerator[Value, None, RTResult]:
+        """Same as visit_ForNode. for i = start to end then"""
+        result = RTResult()
+        elements: list[Value] = []
+
+        bounds: list[int] = []
+        for bound_name, bound_node in (
+                ("start", node.start_value_node), ("end", node.end_value_node), ("step", node.step_value_node)
+        ):
+            if bound_node is None:  # no step value: default is 1
+                bounds.append(1)
+                continue
+            bound = result.register((yield from self.iter_visit(bound_node, ctx, methods_instead_of_funcs)))
+            if result.should_return():  # check for errors
+                return result
+            assert bound is not None
+            if not (isinstance(bound, Number) and isinstance(bound.value, int)):
+                return result.failure(RTTypeError(
+                    bound.pos_start, bound.pos_end,
+                    f"{bound_name} value should be an integer, not {bound.type_}.",
+                    ctx, origin_file=f"{_ORIGIN_FILE}.iter_ForNode"
+                ))
+            bounds.append(bound.value)
+        i, end, step = bounds
+
+        assert ctx.symbol_table is not None
+        assert isinstance(node.var_name_token.value, str)
+        status = None
+        while i < end if step >= 0 else i > end:
+            ctx.symbol_table.set(
+                node.var_name_token.value, Number(i, node.var_name_token.pos_start, node.var_name_token.pos_end)
+            )  # we set the iterating variable
+            self.update_symbol_table(ctx)
+            i += step
+
+            status = yield from self._iter_loop_body(node, ctx, methods_instead_of_funcs, result, elements)
+            if status == 'return':
+                return result
+            if status not in (None, 'continue'):
+                break
+
+        return self._end_iter_loop(node, ctx, result, elements, status)
+
+    def iter_ForNodeList(self, node: ForNodeList, ctx: Context,
+                         methods_instead_of_funcs: bool) -> PythonGenerator[Value, None, RTResult]:
+        """Same as visit_ForNodeList. for i in list then"""
+        result = RTResult()
+        elements: list[Value] = []
+
+        iterable_ = result.register((yield from self.iter_visit(node.list_node, ctx, methods_instead_of_funcs)))
+        if result.should_return():  # check for errors
+            return result
+
+        python_iterable, error = self._python_iterable(iterable_, node, ctx)
+        if error is not None:
+            return result.failure(error)
+        assert python_iterable is not None and iterable_ is not None
+
+        assert ctx.symbol_table is not None
+        assert isinstance(node.var_name_token.value, str)
+        status = None
+        for element in python_iterable:
+            if isinstance(element, str):
+                element = String(element, iterable_.pos_start, iterable_.pos_end)
+            elif isinstance(element, int) or isinstance(element, float):
+                element = Number(element, iterable_.pos_start, iterable_.pos_end)
+            ctx.symbol_table.set(node.var_name_token.value, element)
+            self.update_symbol_table(ctx)
+
+            status = yield from self._iter_loop_body(node, ctx, methods_instead_of_funcs, result, elements)
+            if status == 'return':
+                return result
+            if status not in (None, 'continue'):
+                break
+
+        if isinstance(iterable_, Generator) and iterable_.error is not None:  # the body of the generator failed
+            return result.failure(iterable_.error)
+        return self._end_iter_loop(node, ctx, result, elements, status)
+
+    def iter_WhileNode(self, node: WhileNode, ctx: Context,
+                       methods_instead_of_funcs: bool) -> PythonGenerator[Value, None, RTResult]:
+        """Same as visit_WhileNode"""
+        result = RTResult()
+        elements: list[Value] = []
+
+        condition = result.register((yield from self.iter_visit(node.condition_node, ctx, methods_instead_of_funcs)))
+        if result.should_return():  # check for errors
+            return result
+        assert condition is not None
+
+        status = None
+        while condition.is_true():
+            status = yield from self._iter_loop_body(node, ctx, methods_instead_of_funcs, result, elements)
+            if status == 'return':
+                return result
+            if status == 'continue':
+                continue
+            if status is not None:
+                break
+
+            condition = result.register(
+                (yield from self.iter_visit(node.condition_node, ctx, methods_instead_of_funcs))
+            )
+            if result.should_return():  # check for errors
+                return result
+            assert condition is not None
+
+        return self._end_iter_loop(node, ctx, result, elements, status)
+
+    def iter_DoWhileNode(self, node: DoWhileNode, ctx: Context,
+                         methods_instead_of_funcs: bool) -> PythonGenerator[Value, None, RTResult]:
+        """Same as visit_DoWhileNode"""
+        result = RTResult()
+        elements: list[Value] = []
+
+        status = None
+        while True:
+            status = yield from self._iter_loop_body(node, ctx, methods_instead_of_funcs, result, elements)
+            if status == 'return':
+                return result
+            if status == 'continue':
+                continue
+            if status is not None:
+                break
+
+            condition = result.register(
+                (yield from self.iter_visit(node.condition_node, ctx, methods_instead_of_funcs))
+            )
+            if result.should_return():  # check for errors
+                return result
+            assert condition is not None
+
+            if not condition.is_true():  # the condition isn't true: we break the loop
+                break
+
+        return self._end_iter_loop(node, ctx, result, elements, status)
+
+    def iter_LoopNode(self, node: LoopNode, ctx: Context,
+                      methods_instead_of_funcs: bool) -> PythonGenerator[Value, None, RTResult]:
+        """Same as visit_LoopNode"""
+        result = RTResult()
+        elements: list[Value] = []
+
+        while True:
+            status = yield from self._iter_loop_body(node, ctx, methods_instead_of_funcs, result, elements)
+            if status == 'return':
+                return result
+            if status not in (None, 'continue'):
+                break
+
+        return self._end_iter_loop(node, ctx, result, elements, status)
@@ -15,10 +15,16 @@ from src.runtime.values.basevalues.value import Value
 from src.runtime.runtime_result import RTResult
 from src.runtime.symbol_table import SymbolTable
 from src.runtime.context import Context
-from src.errors.errors import RunTimeError, RTArithmeticError, RTIndexError, RTOverflowError
-from src.lexer.position import Position as _Position
+from src.errors.errors import RunTimeError, RTArithmeticError, RTIndexError, RTOverflowError, RTTypeError
+from src.lexer.position import Position as _Position, DEFAULT_POSITION
 # built-in python imports
+from typing import Any, Hashable, Callable, Iterable, Iterator, Mapping
+import array
+import collections
+import itertools
 import math
+import operator
+import pprint
 
 
 # IMPORTANT NOTE: THE DOC FOR ALL THE FUNCTIONS IN THIS FILE ARE IN value.py :)
@@ -175,15 +181,14 @@ class String(Value):
 
     def is_in(self, other: Value):
         if isinstance(other, List):
-            for x in other.elements:
-                if self.get_comparison_eq(x)[0].is_true():
-                    return Number(True, self.pos_start, other.pos_end).set_context(self.context), None
-            return Number(False, self.pos_start, other.pos_end).set_context(self.context), None
+            return Number(other.contains(self), self.pos_start, other.pos_end).set_context(self.context), None
         elif isinstance(other, String):
             return Number(
                 self.value in other.value,
                 self.pos_start, self.pos_end
             ).set_context(self.context), None
+        elif isinstance(other, Dict) or isinstance(other, Set):
+            return Number(other.contains(self), self.pos_start, other.pos_end).set_context(self.context), None
         else:
             return None, self.can_not_be_in(other)
 
@@ -196,6 +201,29 @@ class String(Value):
         return copy
 
 
+class SymbolTableDump(String):
+    """The value of `__symbol_table__`: a str containing all the symbols of a symbol table (except itself).
+    The str is computed only when it is used, so that updating `__symbol_table__` after every assignment is cheap."""
+    def __init__(self, symbol_table: SymbolTable, pos_start: _Position, pos_end: _Position):
+        Value.__init__(self, pos_start, pos_end)
+        self.symbol_table = symbol_table
+        self.type_ = "str"
+        self._value: str | None = None  # set when the value is assigned: the dump is then a normal str
+
+    @property
+    def value(self) -> str:
+        if self._value is not None:
+            return self._value
+        symbols_copy: dict[str, Value] = self.symbol_table.symbols.copy()
+        if '__symbol_table__' in symbols_copy.keys():
+            del symbols_copy['__symbol_table__']
+        return pprint.pformat(symbols_copy)
+
+    @value.setter
+    def value(self, value: str):
+        self._value = value
+
+
 class Number(Value):
     def __init__(self, value: int | float | bool, pos_start: _Position, pos_end: _Position):
         super().__init__(pos_start, pos_end)
@@ -230,6 +258,8 @@ class Number(Value):
                     self.context,
                     origin_file="src.values.basevalues.Number.added_to"
                 )
+        elif isinstance(other, Array):
+            return other.elementwise(self, operator.add, "added_to", reflected=True)
         else:
             return None, self.illegal_operation(other)
 
@@ -246,6 +276,8 @@ class Number(Value):
                     self.context,
                     origin_file="src.values.basevalues.Number.subbed_by"
                 )
+        elif isinstance(other, Array):
+            return other.elementwise(self, operator.sub, "subbed_by", reflected=True)
         else:
             return None, self.illegal_operation(other)
 
@@ -257,8 +289,10 @@ class Number(Value):
                 return String(other.value * self.value, self.pos_start, other.pos_end).set_context(self.context), None
             elif isinstance(other, List) and isinstance(self.value, int):
                 new_list = other.copy()
-                new_list.elements = new_list.elements * self.value
+                new_list.storage = new_list.storage.repeated(self.value)
                 return new_list, None
+            elif isinstance(other, Array):
+                return other.elementwise(self, operator.mul, "multiplied_by", reflected=True)
             else:
                 return None, self.illegal_operation(other)
         except OverflowError as e:
@@ -293,6 +327,8 @@ class Number(Value):
                     "src.values.basevalues.Number.divided_by"
                 )
             return Number(val, self.pos_start, other.pos_end).set_context(self.context), None
+        elif isinstance(other, Array):
+            return other.divide_elementwise(self, reflected=True)
         else:
             return None, self.illegal_operation(other)
 
@@ -479,15 +515,18 @@ class Number(Value):
 
     def is_in(self, other: Value):
         if isinstance(other, List):
-            for x in other.elements:
-                if self.get_comparison_eq(x)[0].is_true():
-                    return Number(True, self.pos_start, other.pos_end).set_context(self.context), None
-            return Number(False, self.pos_start, other.pos_end).set_context(self.context), None
+            return Number(other.contains(self), self.pos_start, other.pos_end).set_context(self.context), None
         elif isinstance(other, String):
             return Number(
                 str(self.value) in other.value,
                 self.pos_start, other.pos_end
             ).set_context(self.context), None
+        elif isinstance(other, Dict) or isinstance(other, Set):
+            return Number(other.contains(self), self.pos_start, other.pos_end).set_context(self.context), None
+        elif isinstance(other, Array):
+            return Number(self.value in other.data, self.pos_start, other.pos_end).set_context(self.context), None
+        elif isinstance(other, Range):
+            return Number(other.contains(self.value), self.pos_start, other.pos_end).set_context(self.context), None
         else:
             return None, self.can_not_be_in(other)
 
@@ -506,48 +545,282 @@ class Number(Value):
         return copy
 
 
+class ListStorage:
+    """The elements of a List. Like a python list, it is shared between the copies of a List.
+
+    Storage strategies: when all the elements are plain numbers (or all are plain strs), `strategy` is Number (or
+    String) and `items` only contains their python values. They are boxed in a new Number (or String) every time they
+    are accessed. The first element that does not fit switches the storage to the generic strategy (`strategy` is None
+    and `items` contains the values themselves). This is done in place, so every List sharing this storage (and every
+    loop iterating over `items`) sees the change.
+
+    The dict key of the storage (see `hash_key`) is kept until the storage changes: every method below that changes
+    `items` forgets it. Code that changes `items` directly must call `changed`."""
+    __slots__ = ("strategy", "items", "cached_key")
+
+    def __init__(self, strategy: type[Number] | type[String] | None, items: list[Any]):
+        self.strategy = strategy
+        self.items = items
+        self.cached_key: ListKey | None = None
+
+    def changed(self):
+        """Forgets the cached dict key. Must be called after `items` is changed."""
+        self.cached_key = None
+
+    @staticmethod
+    def strategy_of(value: Value) -> type[Number] | type[String] | None:
+        """Returns the strategy that can store `value` unboxed, or None if there is none"""
+        type_ = type(value)
+        if (type_ is Number or type_ is String) and len(value.attributes) == 0:
+            return type_
+        return None
+
+    @classmethod
+    def from_values(cls, values: list[Value]) -> ListStorage:
+        """Returns a storage containing `values`, with the most compact strategy"""
+        if len(values) == 0:
+            return cls(None, values)
+        strategy = cls.strategy_of(values[0])
+        if strategy is None:
+            return cls(None, values)
+        for value in values:
+            if type(value) is not strategy or len(value.attributes) != 0:
+                return cls(None, values)
+        return cls(strategy, [value.value for value in values])
+
+    def box(self, item: Any, pos_start: _Position, pos_end: _Position, context: Context | None) -> Value:
+        """Returns the value corresponding to an element of `items`"""
+        if self.strategy is None:
+            return item
+        return self.strategy(item, pos_start, pos_end).set_context(context)
+
+    def boxed(self, pos_start: _Position, pos_end: _Position, context: Context | None) -> Iterator[Value]:
+        """Iterates over the values, without changing the strategy"""
+        if self.strategy is None:
+            return iter(self.items)
+        strategy = self.strategy
+        return (strategy(item, pos_start, pos_end).set_context(context) for item in self.items)
+
+    def generalize(self, pos_start: _Position, pos_end: _Position, context: Context | None) -> list[Value]:
+        """Switches to the generic strategy and returns the python list of the values"""
+        self.cached_key = None  # the caller may change the values
+        if self.strategy is not None:
+            strategy = self.strategy
+            self.items[:] = [strategy(item, pos_start, pos_end).set_context(context) for item in self.items]
+            self.strategy = None
+        return self.items
+
+    def _fits(self, value: Value) -> bool:
+        """Returns True if `value` can be added to the items without leaving the current strategy. An empty generic
+        storage takes the strategy of `value` if it has one."""
+        if self.strategy is None:
+            if len(self.items) != 0:
+                return False
+            strategy = self.strategy_of(value)
+            if strategy is None:
+                return False
+            self.strategy = strategy
+            # the python list given to List() may still be used by the caller: we do not put raw items in it
+            self.items = []
+            return True
+        return self.strategy_of(value) is self.strategy
+
+    def append(self, value: Value, pos_start: _Position, pos_end: _Position, context: Context | None):
+        self.cached_key = None
+        if self._fits(value):
+            self.items.append(value.value)
+        else:
+            self.generalize(pos_start, pos_end, context).append(value)
+
+    def insert(self, index: int, value: Value, pos_start: _Position, pos_end: _Position, context: Context | None):
+        self.cached_key = None
+        if self._fits(value):
+            self.items.insert(index, value.value)
+        else:
+            self.generalize(pos_start, pos_end, context).insert(index, value)
+
+    def set(self, index: int, value: Value, pos_start: _Position, pos_end: _Position, context: Context | None):
+        """Replaces the element at `index`. Raises IndexError if the index is out of range."""
+        self.cached_key = None
+        if self.strategy is not None and self.strategy_of(value) is self.strategy:
+            self.items[index] = value.value
+        else:
+            self.generalize(pos_start, pos_end, context)[index] = value
+
+    def pop(self, index: int, pos_start: _Position, pos_end: _Position, context: Context | None) -> Value:
+        """Removes and returns the element at `index`. Raises IndexError if the index is out of range."""
+        self.cached_key = None
+        return self.box(self.items.pop(index), pos_start, pos_end, context)
+
+    def extend(self, other: ListStorage, pos_start: _Position, pos_end: _Position, context: Context | None):
+        self.cached_key = None
+        if other.strategy is not None:
+            if self.strategy is other.strategy:
+                self.items.extend(other.items)
+                return
+            if self.strategy is None and len(self.items) == 0:
+                self.strategy = other.strategy
+                self.items = list(other.items)
+                return
+        values = list(other.boxed(pos_start, pos_end, context))
+        self.generalize(pos_start, pos_end, context).extend(values)
+
+    def contains(self, value: Value) -> bool | None:
+        """Returns True if `value` is equal to one of the elements, or None if the storage is generic (the elements
+        have to be compared one by one)"""
+        if self.strategy is None:
+            return None
+        if type(value) is not self.strategy:  # a number is never equal to a str, and conversely
+            return False
+        return any(map(operator.eq, self.items, itertools.repeat(value.value)))
+
+    def is_eq(self, other: ListStorage) -> bool:
+        """Structural equality of the elements. Unboxed elements are compared as python values."""
+        if self is other:
+            return True
+        if len(self.items) != len(other.items):
+            return False
+        if self.strategy is not None and other.strategy is not None:
+            # numbers are never equal to strs. operator.eq is used instead of `==` between the lists, which considers
+            # that identical elements are equal (nan would be equal to itself)
+            return self.strategy is other.strategy and all(map(operator.eq, self.items, other.items))
+        if self.strategy is None and other.strategy is None:
+            return all(map(values_eq, self.items, other.items))
+        return all(map(
+            values_eq,
+            self.boxed(DEFAULT_POSITION, DEFAULT_POSITION, None), other.boxed(DEFAULT_POSITION, DEFAULT_POSITION, None)
+        ))
+
+    def hash_key(self) -> ListKey | None:
+        """Returns the dict key of the elements (see `hash_key`), or None if one of them can not be a key. The key is
+        cached, unless the storage contains lists (they may change without this storage knowing it): their own keys
+        are cached instead."""
+        if self.cached_key is not None:
+            return self.cached_key
+        if self.strategy is not None:
+            self.cached_key = ListKey((List, *self.items))
+            return self.cached_key
+        keys: list[Hashable] = []
+        contains_lists = False
+        for element in self.items:
+            key = hash_key(element)
+            if key is None:
+                return None
+            if isinstance(key, ListKey):
+                contains_lists = True
+            keys.append(key)
+        list_key = ListKey((List, *keys))
+        if not contains_lists:
+            self.cached_key = list_key
+        return list_key
+
+    def copy(self) -> ListStorage:
+        copy = ListStorage(self.strategy, self.items.copy())
+        copy.cached_key = self.cached_key
+        return copy
+
+    def repeated(self, times: int) -> ListStorage:
+        return ListStorage(self.strategy, self.items * times)
+
+
 class List(Value):
     def __init__(self, elements: list[Value], pos_start: _Position, pos_end: _Position):
         super().__init__(pos_start, pos_end)
-        self.elements = elements
+        self.storage = ListStorage.from_values(elements)
         self.type_ = 'list'
         self.update_should_print()
 
+    @property
+    def elements(self) -> list[Value]:
+        """The python list of the values of the list. It switches the storage to the generic strategy (see
+        ListStorage): the methods below do not, and should be used instead when possible."""
+        return self.storage.generalize(self.pos_start, self.pos_end, self.context)
+
+    @elements.setter
+    def elements(self, elements: list[Value]):
+        self.storage = ListStorage.from_values(elements)
+
     def __repr__(self):
-        return f'[{", ".join([x.__str__() for x in self.elements])}]'
+        return f'[{", ".join([x.__str__() for x in self.iter_values()])}]'
 
     def to_python_str(self) -> str:
         return self.__repr__()
 
+    def __len__(self):
+        return len(self.storage.items)
+
     def __getitem__(self, item: int):
         """If there is foo[bar] in the python code and that foo is a Nougaro List, it works ^^ !!"""
-        return self.elements[item]
+        return self.storage.box(self.storage.items[item], self.pos_start, self.pos_end, self.context)
+
+    def iter_values(self) -> Iterator[Value]:
+        """Iterates over the values of the list without changing its storage strategy"""
+        return self.storage.boxed(self.pos_start, self.pos_end, self.context)
+
+    def append_element(self, value: Value):
+        self.storage.append(value, self.pos_start, self.pos_end, self.context)
+        self._element_added(value)
+
+    def insert_element(self, index: int, value: Value):
+        self.storage.insert(index, value, self.pos_start, self.pos_end, self.context)
+        self._element_added(value)
+
+    def set_element(self, index: int, value: Value):
+        """Raises IndexError if the index is out of range"""
+        self.storage.set(index, value, self.pos_start, self.pos_end, self.context)
+
+    def pop_element(self, index: int) -> Value:
+        """Raises IndexError if the index is out of range"""
+        element = self.storage.pop(index, self.pos_start, self.pos_end, self.context)
+        self._element_removed(element)
+        return element
+
+    def extend_elements(self, other: List):
+        self.storage.extend(other.storage, self.pos_start, self.pos_end, self.context)
+
+    def contains(self, value: Value) -> bool:
+        """Returns True if `value` is equal to one of the elements"""
+        contained = self.storage.contains(value)
+        if contained is not None:
+            return contained
+        return any(map(values_eq, itertools.repeat(value), self.storage.items))
 
     def update_should_print(self):
         should_print = False
 
-        if len(self.elements) == 0:
+        if len(self.storage.items) == 0 or self.storage.strategy is not None:  # numbers and strs are printed
             should_print = True
         else:
-            for e in self.elements:
+            for e in self.storage.items:
                 if e.should_print:
                     should_print = True
                     break
 
         self.should_print = should_print
 
+    def _element_added(self, value: Value):
+        """Updates `should_print` after `value` was added, without looking at the other elements"""
+        if len(self.storage.items) == 1:
+            self.should_print = self.storage.strategy is not None or value.should_print
+        elif value.should_print:
+            self.should_print = True
+
+    def _element_removed(self, value: Value):
+        """Updates `should_print` after `value` was removed. The other elements are looked at only if `value` may have
+        been the only one that should be printed."""
+        if value.should_print or len(self.storage.items) == 0:
+            self.update_should_print()
+
     def added_to(self, other: Value):
         new_list = self.copy()
-        new_list.elements.append(other)
-        new_list.update_should_print()
+        new_list.append_element(other)
         return new_list, None
 
     def subbed_by(self, other: Value):
         if isinstance(other, Number) and isinstance(other.value, int):
             new_list = self.copy()
             try:
-                new_list.elements.pop(other.value)
-                new_list.update_should_print()
+                new_list.pop_element(other.value)
                 return new_list, None
             except IndexError:
                 assert self.context is not None
@@ -562,14 +835,14 @@ class List(Value):
     def multiplied_by(self, other: Value):
         if isinstance(other, List):
             new_list = self.copy()
-            new_list.elements.extend(other.elements)
+            new_list.extend_elements(other)
             new_list.update_should_print()
             new_list.set_pos(self.pos_start, other.pos_end)
             return new_list, None
         elif isinstance(other, Number) and isinstance(other.value, int):
             if other.is_int():
                 new_list = self.copy()
-                new_list.elements = new_list.elements * other.value
+                new_list.storage = new_list.storage.repeated(other.value)
                 new_list.update_should_print()
                 new_list.set_pos(self.pos_start, other.pos_end)
                 return new_list, None
@@ -581,7 +854,7 @@ class List(Value):
     def divided_by(self, other: Value):
         if isinstance(other, Number) and isinstance(other.value, int):
             try:
-                return self.elements[other.value], None
+                return self[other.value], None
             except IndexError:
                 assert self.context is not None
                 return None, RTIndexError(
@@ -593,27 +866,13 @@ class List(Value):
             return None, self.illegal_operation(other)
 
     def to_str(self):
-        return String(str(self.elements), self.pos_start, self.pos_end).set_context(self.context), None
+        return String(str(list(self.iter_values())), self.pos_start, self.pos_end).set_context(self.context), None
 
     def to_list(self):
         return self.copy(), None
 
     def is_eq(self, other: Value):
-        # think this is very slow
-        # TODO: maybe find something to improve speed of this method (is_eq in List)
-        if isinstance(other, List):
-            if len(self.elements) != len(other.elements):
-                return False
-            for index, element in enumerate(self.elements):
-                comparison, error = element.get_comparison_eq(other.elements[index])
-                if error is not None:
-                    comparison = Number(0, self.pos_start, self.pos_end)
-                assert comparison is not None
-                if not comparison.is_true():
-                    return False
-            return True
-        else:
-            return False
+        return isinstance(other, List) and self.storage.is_eq(other.storage)
 
     def get_comparison_eq(self, other: Value):
         is_eq = self.is_eq(other)
@@ -656,15 +915,19 @@ class List(Value):
                 self.to_str()[0].value in other.value,
                 self.pos_start, other.pos_end
             ).set_context(self.context), None
+        elif isinstance(other, Dict) or isinstance(other, Set) or isinstance(other, List):
+            return Number(other.contains(self), self.pos_start, other.pos_end).set_context(self.context), None
         else:
             return None, self.can_not_be_in(other)
 
     def is_true(self):
-        return bool(len(self.elements))
+        return bool(len(self))
 
     def copy(self):
-        """Return a copy of self"""
-        copy = List(self.elements, self.pos_start, self.pos_end)
+        """Return a copy of self (sharing the same storage)"""
+        copy = List([], self.pos_start, self.pos_end)
+        copy.storage = self.storage
+        copy.should_print = self.should_print
         copy.set_context(self.context)
         copy.module_context = self.module_context
         copy.attributes = self.attributes.copy()
@@ -672,7 +935,9 @@ class List(Value):
 
     def true_copy(self):
         """Return a copy of self where elements is also a copy"""
-        copy = List(self.elements.copy(), self.pos_start, self.pos_end)
+        copy = List([], self.pos_start, self.pos_end)
+        copy.storage = self.storage.copy()
+        copy.should_print = self.should_print
         copy.set_context(self.context)
         copy.module_context = self.module_context
         copy.attributes = self.attributes.copy()
@@ -682,12 +947,729 @@ class List(Value):
         return self.copy()
 
 
+def array_data(numbers: Iterable[int | float], ints: bool) -> array.array:
+    """Returns the buffer of an Array: 64-bits ints ('q') if `ints` is True, else floats ('d').
+    Raises OverflowError if an int does not fit in 64 bits."""
+    return array.array('q' if ints else 'd', numbers)
+
+
+class Array(Value):
+    def __init__(self, data: array.array, pos_start: _Position, pos_end: _Position):
+        """`data` is an array.array of 64-bits ints ('q') or of floats ('d'). See `array_data`."""
+        super().__init__(pos_start, pos_end)
+        self.data = data
+        self.type_ = 'array'
+
+    def __repr__(self):
+        return f'array([{", ".join([str(x) for x in self.data])}])'
+
+    def to_python_str(self) -> str:
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, item: int):
+        """Same as List.__getitem__. The element is boxed in a Number."""
+        return Number(self.data[item], self.pos_start, self.pos_end).set_context(self.context)
+
+    def is_int_array(self) -> bool:
+        return self.data.typecode == 'q'
+
+    def elementwise(self, other: Value, operation: Callable[[int | float, int | float], int | float],
+                    method_name: str, int_result: bool = True, reflected: bool = False):
+        """Computes `operation` between every element of self and `other` (a Number or an Array of the same length).
+        If `reflected` is True, `other` is the left operand (a Number). The result is an int array if both operands
+        are ints and `int_result` is True."""
+        if isinstance(other, Number):
+            scalars = itertools.repeat(other.value, len(self.data))
+            if reflected:
+                numbers = map(operation, scalars, self.data)
+            else:
+                numbers = map(operation, self.data, scalars)
+            ints = int_result and self.is_int_array() and other.is_int()
+        elif isinstance(other, Array):
+            if len(self.data) != len(other.data):
+                assert self.context is not None
+                return None, RTIndexError(
+                    self.pos_start, other.pos_end,
+                    f"can not compute an operation between arrays of different lengths ({len(self.data)} and "
+                    f"{len(other.data)}).",
+                    self.context, f"src.values.basevalues.Array.{method_name}"
+                )
+            numbers = map(operation, self.data, other.data)
+            ints = int_result and self.is_int_array() and other.is_int_array()
+        else:
+            return None, self.illegal_operation(other)
+
+        pos_start, pos_end = (other.pos_start, self.pos_end) if reflected else (self.pos_start, other.pos_end)
+        try:
+            data = array_data(numbers, ints)
+        except OverflowError:
+            assert self.context is not None
+            return None, RTOverflowError(
+                pos_start, pos_end, "the ints of an array must be between -2^63 and 2^63-1.", self.context,
+                f"src.values.basevalues.Array.{method_name}"
+            )
+        return Array(data, pos_start, pos_end).set_context(self.context), None
+
+    def divide_elementwise(self, other: Value, reflected: bool = False):
+        """Same as `elementwise` with a division. The result is always a float array."""
+        divisors = self if reflected else other
+        if (isinstance(divisors, Number) and divisors.value == 0) or \
+                (isinstance(divisors, Array) and 0 in divisors.data):
+            assert self.context is not None
+            return None, RTArithmeticError(
+                divisors.pos_start, divisors.pos_end,
+                'division by zero is not possible.',
+                self.context,
+                "src.values.basevalues.Array.divided_by"
+            )
+        return self.elementwise(other, operator.truediv, "divided_by", int_result=False, reflected=reflected)
+
+    def added_to(self, other: Value):
+        return self.elementwise(other, operator.add, "added_to")
+
+    def subbed_by(self, other: Value):
+        return self.elementwise(other, operator.sub, "subbed_by")
+
+    def multiplied_by(self, other: Value):
+        return self.elementwise(other, operator.mul, "multiplied_by")
+
+    def divided_by(self, other: Value):
+        return self.divide_elementwise(other)
+
+    def to_str(self):
+        return String(self.__repr__(), self.pos_start, self.pos_end).set_context(self.context), None
+
+    def to_list(self):
+        elements: list[Value] = [Number(x, self.pos_start, self.pos_end) for x in self.data]
+        return List(elements, self.pos_start, self.pos_end).set_context(self.context), None
+
+    def is_eq(self, other: Value):
+        return isinstance(other, Array) and self.data == other.data
+
+    def get_comparison_eq(self, other: Value):
+        return Number(self.is_eq(other), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        return Number(not self.is_eq(other), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def get_comparison_gt(self, other: Value):
+        return None, self.can_not_compare(other)
+
+    def get_comparison_gte(self, other: Value):
+        return None, self.can_not_compare(other)
+
+    def get_comparison_lt(self, other: Value):
+        return None, self.can_not_compare(other)
+
+    def get_comparison_lte(self, other: Value):
+        return None, self.can_not_compare(other)
+
+    def and_(self, other: Value):
+        return Number(self.is_true() and other.is_true(), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def or_(self, other: Value):
+        return Number(self.is_true() or other.is_true(), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def xor_(self, other: Value):
+        """ Exclusive or (xor) """
+        xor = (
+            not self.is_true() and other.is_true()
+        ) or (
+            self.is_true() and not other.is_true()
+        )
+        return Number(xor, self.pos_start, other.pos_end).set_context(self.context), None
+
+    def is_true(self):
+        return len(self.data) > 0
+
+    def copy(self):
+        """Return a copy of self"""
+        copy = Array(self.data, self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+    def true_copy(self):
+        """Return a copy of self where data is also a copy"""
+        copy = Array(array.array(self.data.typecode, self.data), self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+
+class Range(Value):
+    def __init__(self, range_: range, pos_start: _Position, pos_end: _Position):
+        """`range_` is a python range: its elements are never stored, they are computed when they are needed."""
+        super().__init__(pos_start, pos_end)
+        self.range_ = range_
+        self.type_ = 'range'
+
+    def __repr__(self):
+        if self.range_.step == 1:
+            return f'range({self.range_.start}, {self.range_.stop})'
+        return f'range({self.range_.start}, {self.range_.stop}, {self.range_.step})'
+
+    def to_python_str(self) -> str:
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self.range_)
+
+    def length(self) -> int:
+        """Same as `len(self)`, but works even if the length does not fit in 64 bits"""
+        start, stop, step = self.range_.start, self.range_.stop, self.range_.step
+        if step > 0:
+            return max(0, (stop - start + step - 1) // step)
+        return max(0, (start - stop - step - 1) // -step)
+
+    def __getitem__(self, item: int):
+        """Same as List.__getitem__. The element is computed, then boxed in a Number."""
+        return Number(self.range_[item], self.pos_start, self.pos_end).set_context(self.context)
+
+    def contains(self, value: int | float) -> bool:
+        """Returns True if `value` is in the range, without iterating over it (floats that are ints are in it)"""
+        if isinstance(value, float):
+            if not value.is_integer():
+                return False
+            value = int(value)
+        return value in self.range_
+
+    def to_str(self):
+        return String(self.__repr__(), self.pos_start, self.pos_end).set_context(self.context), None
+
+    def to_list(self):
+        elements: list[Value] = [Number(x, self.pos_start, self.pos_end) for x in self.range_]
+        return List(elements, self.pos_start, self.pos_end).set_context(self.context), None
+
+    def is_eq(self, other: Value):
+        """Two ranges are equal if they have the same elements (like in python, range(0) == range(2, 2))"""
+        return isinstance(other, Range) and self.range_ == other.range_
+
+    def get_comparison_eq(self, other: Value):
+        return Number(self.is_eq(other), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        return Number(not self.is_eq(other), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def and_(self, other: Value):
+        return Number(self.is_true() and other.is_true(), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def or_(self, other: Value):
+        return Number(self.is_true() or other.is_true(), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def xor_(self, other: Value):
+        """ Exclusive or (xor) """
+        xor = (
+            not self.is_true() and other.is_true()
+        ) or (
+            self.is_true() and not other.is_true()
+        )
+        return Number(xor, self.pos_start, other.pos_end).set_context(self.context), None
+
+    def is_true(self):
+        return bool(self.range_)
+
+    def copy(self):
+        """Return a copy of self (ranges are immutable, so the python range is shared)"""
+        copy = Range(self.range_, self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+
+def values_eq(value: Value, other: Value) -> bool:
+    """Returns True if `value == other`. Numbers, strs and lists are compared without creating a Number for the
+    result."""
+    type_ = type(value)
+    if type_ is Number:
+        return isinstance(other, Number) and value.value == other.value
+    if type_ is String:
+        return isinstance(other, String) and value.value == other.value
+    if isinstance(value, List):
+        return isinstance(other, List) and value.storage.is_eq(other.storage)
+    comparison, error = value.get_comparison_eq(other)
+    return error is None and comparison is not None and comparison.is_true()
+
+
+class ListKey(tuple):
+    """The dict key of a list (see `hash_key`). Its python hash is computed once."""
+    def __hash__(self):
+        try:
+            return self.__dict__["hash"]
+        except KeyError:
+            self.__dict__["hash"] = hash_ = tuple.__hash__(self)
+            return hash_
+
+
+def hash_key(value: Value) -> Hashable | None:
+    """Returns the python key used to store `value` in a Dict, or None if `value` can not be a key.
+    Numbers, strs and None are used as is (so `1` and `1.0` are the same key, like `1 == 1.0`), lists are frozen into
+    tuples (see ListStorage.hash_key)."""
+    if isinstance(value, Number) or isinstance(value, String):
+        return value.value
+    if isinstance(value, NoneValue):
+        return (NoneValue,)
+    if isinstance(value, List):
+        return value.storage.hash_key()
+    return None
+
+
+def key_copy(value: Value) -> Value:
+    """Returns `value`, or a deep copy of it if it is a list. The keys of a Dict and the elements of a Set are stored and
+    given back as copies, so that changing a list used as a key can not make it differ from its hash."""
+    if not isinstance(value, List):
+        return value
+    copy = value.true_copy()
+    if copy.storage.strategy is None:  # the elements may be lists themselves
+        copy.storage.items = list(map(key_copy, copy.storage.items))
+    return copy
+
+
+class Dict(Value):
+    def __init__(self, entries: dict[Hashable, tuple[Value, Value]], pos_start: _Position, pos_end: _Position):
+        """`entries` maps the result of `hash_key(key)` to the tuple (key, value)"""
+        super().__init__(pos_start, pos_end)
+        self.entries = entries
+        self.type_ = 'dict'
+
+    def __repr__(self):
+        return f'{{{", ".join([f"{key.__str__()}: {value.__str__()}" for key, value in self.entries.values()])}}}'
+
+    def to_python_str(self) -> str:
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def unhashable(self, key: Value) -> RunTimeError:
+        """Returns a RTTypeError with message 'type of key is unhashable'"""
+        assert self.context is not None
+        return RTTypeError(
+            key.pos_start, key.pos_end, f"{key.type_} can not be used as a dict key.", self.context,
+            origin_file="src.runtime.values.basevalues.basevalues.Dict.unhashable"
+        )
+
+    def contains(self, key: Value) -> bool:
+        hashed_key = hash_key(key)
+        return hashed_key is not None and hashed_key in self.entries
+
+    def get(self, key: Value) -> Value | None:
+        """Returns the value corresponding to `key`, or None if there is none"""
+        hashed_key = hash_key(key)
+        if hashed_key is None:
+            return None
+        entry = self.entries.get(hashed_key)
+        if entry is None:
+            return None
+        return entry[1]
+
+    def set(self, key: Value, value: Value) -> RunTimeError | None:
+        """Sets the value corresponding to `key`. Returns an error if `key` can not be a key."""
+        hashed_key = hash_key(key)
+        if hashed_key is None:
+            return self.unhashable(key)
+        self.entries[hashed_key] = (key_copy(key), value)
+        return None
+
+    def delete(self, key: Value) -> bool:
+        """Deletes `key` from the dict. Returns False if there was no such key."""
+        hashed_key = hash_key(key)
+        if hashed_key is None or hashed_key not in self.entries:
+            return False
+        del self.entries[hashed_key]
+        return True
+
+    def keys(self) -> list[Value]:
+        return [key_copy(key) for key, _ in self.entries.values()]
+
+    def values(self) -> list[Value]:
+        return [value for _, value in self.entries.values()]
+
+    def items(self) -> list[tuple[Value, Value]]:
+        return [(key_copy(key), value) for key, value in self.entries.values()]
+
+    def to_str(self):
+        return String(self.__repr__(), self.pos_start, self.pos_end).set_context(self.context), None
+
+    def to_list(self):
+        return List(self.keys(), self.pos_start, self.pos_end).set_context(self.context), None
+
+    def is_eq(self, other: Value):
+        if not isinstance(other, Dict) or len(self.entries) != len(other.entries):
+            return False
+        for hashed_key, (_, value) in self.entries.items():
+            other_entry = other.entries.get(hashed_key)
+            if other_entry is None:
+                return False
+            comparison, error = value.get_comparison_eq(other_entry[1])
+            if error is not None or comparison is None or not comparison.is_true():
+                return False
+        return True
+
+    def get_comparison_eq(self, other: Value):
+        return Number(self.is_eq(other), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        return Number(not self.is_eq(other), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def get_comparison_gt(self, other: Value):
+        return None, self.can_not_compare(other)
+
+    def get_comparison_gte(self, other: Value):
+        return None, self.can_not_compare(other)
+
+    def get_comparison_lt(self, other: Value):
+        return None, self.can_not_compare(other)
+
+    def get_comparison_lte(self, other: Value):
+        return None, self.can_not_compare(other)
+
+    def and_(self, other: Value):
+        return Number(self.is_true() and other.is_true(), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def or_(self, other: Value):
+        return Number(self.is_true() or other.is_true(), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def xor_(self, other: Value):
+        """ Exclusive or (xor) """
+        xor = (
+            not self.is_true() and other.is_true()
+        ) or (
+            self.is_true() and not other.is_true()
+        )
+        return Number(xor, self.pos_start, other.pos_end).set_context(self.context), None
+
+    def is_true(self):
+        return len(self.entries) > 0
+
+    def copy(self):
+        """Return a copy of self"""
+        copy = Dict(self.entries, self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+    def true_copy(self):
+        """Return a copy of self where entries is also a copy"""
+        copy = Dict(self.entries.copy(), self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+
+class Set(Value):
+    def __init__(self, elements: dict[Hashable, Value], pos_start: _Position, pos_end: _Position):
+        """`elements` maps the result of `hash_key(element)` to the element"""
+        super().__init__(pos_start, pos_end)
+        self.elements = elements
+        self.type_ = 'set'
+
+    def __repr__(self):
+        if len(self.elements) == 0:
+            return 'set()'
+        return f'{{{", ".join([x.__str__() for x in self.elements.values()])}}}'
+
+    def to_python_str(self) -> str:
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self.elements)
+
+    def unhashable(self, element: Value) -> RunTimeError:
+        """Returns a RTTypeError with message 'type of element is unhashable'"""
+        assert self.context is not None
+        return RTTypeError(
+            element.pos_start, element.pos_end, f"{element.type_} can not be an element of a set.", self.context,
+            origin_file="src.runtime.values.basevalues.basevalues.Set.unhashable"
+        )
+
+    def contains(self, element: Value) -> bool:
+        hashed_element = hash_key(element)
+        return hashed_element is not None and hashed_element in self.elements
+
+    def add(self, element: Value) -> RunTimeError | None:
+        """Adds `element` to the set. Returns an error if `element` can not be in a set."""
+        hashed_element = hash_key(element)
+        if hashed_element is None:
+            return self.unhashable(element)
+        if hashed_element not in self.elements:
+            self.elements[hashed_element] = key_copy(element)
+        return None
+
+    def discard(self, element: Value) -> bool:
+        """Removes `element` from the set. Returns False if it was not in the set."""
+        hashed_element = hash_key(element)
+        if hashed_element is None or hashed_element not in self.elements:
+            return False
+        del self.elements[hashed_element]
+        return True
+
+    def values(self) -> list[Value]:
+        return list(map(key_copy, self.elements.values()))
+
+    def _new_set(self, elements: dict[Hashable, Value], other: Value) -> Set:
+        return Set(elements, self.pos_start, other.pos_end).set_context(self.context)
+
+    def bitwise_or(self, other: Value):  # union
+        if isinstance(other, Set):
+            return self._new_set(self.elements | other.elements, other), None
+        return None, self.illegal_operation(other)
+
+    def bitwise_and(self, other: Value):  # intersection
+        if isinstance(other, Set):
+            return self._new_set(
+                {key: element for key, element in self.elements.items() if key in other.elements}, other
+            ), None
+        return None, self.illegal_operation(other)
+
+    def subbed_by(self, other: Value):  # difference
+        if isinstance(other, Set):
+            return self._new_set(
+                {key: element for key, element in self.elements.items() if key not in other.elements}, other
+            ), None
+        return None, self.illegal_operation(other)
+
+    def bitwise_xor(self, other: Value):  # symmetric difference
+        if isinstance(other, Set):
+            elements = {key: element for key, element in self.elements.items() if key not in other.elements}
+            elements.update({key: element for key, element in other.elements.items() if key not in self.elements})
+            return self._new_set(elements, other), None
+        return None, self.illegal_operation(other)
+
+    def to_str(self):
+        return String(self.__repr__(), self.pos_start, self.pos_end).set_context(self.context), None
+
+    def to_list(self):
+        return List(self.values(), self.pos_start, self.pos_end).set_context(self.context), None
+
+    def is_eq(self, other: Value):
+        return isinstance(other, Set) and self.elements.keys() == other.elements.keys()
+
+    def get_comparison_eq(self, other: Value):
+        return Number(self.is_eq(other), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        return Number(not self.is_eq(other), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def get_comparison_lt(self, other: Value):  # strict subset
+        if isinstance(other, Set):
+            return Number(
+                self.elements.keys() < other.elements.keys(), self.pos_start, other.pos_end
+            ).set_context(self.context), None
+        return None, self.can_not_compare(other)
+
+    def get_comparison_lte(self, other: Value):  # subset
+        if isinstance(other, Set):
+            return Number(
+                self.elements.keys() <= other.elements.keys(), self.pos_start, other.pos_end
+            ).set_context(self.context), None
+        return None, self.can_not_compare(other)
+
+    def get_comparison_gt(self, other: Value):  # strict superset
+        if isinstance(other, Set):
+            return Number(
+                self.elements.keys() > other.elements.keys(), self.pos_start, other.pos_end
+            ).set_context(self.context), None
+        return None, self.can_not_compare(other)
+
+    def get_comparison_gte(self, other: Value):  # superset
+        if isinstance(other, Set):
+            return Number(
+                self.elements.keys() >= other.elements.keys(), self.pos_start, other.pos_end
+            ).set_context(self.context), None
+        return None, self.can_not_compare(other)
+
+    def and_(self, other: Value):
+        return Number(self.is_true() and other.is_true(), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def or_(self, other: Value):
+        return Number(self.is_true() or other.is_true(), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def xor_(self, other: Value):
+        """ Exclusive or (xor) """
+        xor = (
+            not self.is_true() and other.is_true()
+        ) or (
+            self.is_true() and not other.is_true()
+        )
+        return Number(xor, self.pos_start, other.pos_end).set_context(self.context), None
+
+    def is_true(self):
+        return len(self.elements) > 0
+
+    def copy(self):
+        """Return a copy of self"""
+        copy = Set(self.elements, self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+    def true_copy(self):
+        """Return a copy of self where elements is also a copy"""
+        copy = Set(self.elements.copy(), self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+
+class StringBuilder(Value):
+    def __init__(self, parts: list[str], pos_start: _Position, pos_end: _Position):
+        """`parts` are the python strs appended to the builder. They are joined only when the str is built."""
+        super().__init__(pos_start, pos_end)
+        self.parts = parts
+        self.type_ = 'string_builder'
+
+    def __repr__(self):
+        return f"<string_builder ({len(self)} characters)>"
+
+    def to_python_str(self) -> str:
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self.build())
+
+    def append(self, part: str):
+        self.parts.append(part)
+
+    def build(self) -> str:
+        """Returns the str built from the parts. The parts are replaced by the result, so building again is fast."""
+        if len(self.parts) == 0:
+            return ""
+        if len(self.parts) > 1:
+            self.parts[:] = ["".join(self.parts)]
+        return self.parts[0]
+
+    def to_str(self):
+        return String(self.build(), self.pos_start, self.pos_end).set_context(self.context), None
+
+    def is_same_builder(self, other: Value) -> bool:
+        """Returns True if `other` is this builder or a copy of it"""
+        return isinstance(other, StringBuilder) and other.parts is self.parts
+
+    def get_comparison_eq(self, other: Value):
+        return Number(self.is_same_builder(other), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        return Number(not self.is_same_builder(other), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def is_true(self):
+        return any(len(part) != 0 for part in self.parts)
+
+    def copy(self):
+        """Return a copy of self (sharing the same parts)"""
+        copy = StringBuilder(self.parts, self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+
+class Deque(Value):
+    def __init__(self, elements: collections.deque[Value], pos_start: _Position, pos_end: _Position):
+        """`elements` is a python deque: adding or removing an element at either end takes constant time."""
+        super().__init__(pos_start, pos_end)
+        self.elements = elements
+        self.type_ = 'deque'
+
+    def __repr__(self):
+        return f'deque([{", ".join([x.__str__() for x in self.elements])}])'
+
+    def to_python_str(self) -> str:
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __getitem__(self, item: int):
+        """Same as List.__getitem__. Indexing is fast near both ends and slower in the middle."""
+        return self.elements[item]
+
+    def append_element(self, value: Value):
+        self.elements.append(value)
+
+    def insert_element(self, index: int, value: Value):
+        if index == 0:
+            self.elements.appendleft(value)
+        else:
+            self.elements.insert(index, value)
+
+    def pop_element(self, index: int) -> Value:
+        """Raises IndexError if the index is out of range"""
+        if index == -1:
+            return self.elements.pop()
+        if index == 0:
+            return self.elements.popleft()
+        element = self.elements[index]
+        del self.elements[index]
+        return element
+
+    def to_str(self):
+        return String(self.__repr__(), self.pos_start, self.pos_end).set_context(self.context), None
+
+    def to_list(self):
+        return List(list(self.elements), self.pos_start, self.pos_end).set_context(self.context), None
+
+    def is_eq(self, other: Value):
+        if not isinstance(other, Deque) or len(self.elements) != len(other.elements):
+            return False
+        for element, other_element in zip(self.elements, other.elements):
+            comparison, error = element.get_comparison_eq(other_element)
+            if error is not None or comparison is None or not comparison.is_true():
+                return False
+        return True
+
+    def get_comparison_eq(self, other: Value):
+        return Number(self.is_eq(other), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        return Number(not self.is_eq(other), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def and_(self, other: Value):
+        return Number(self.is_true() and other.is_true(), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def or_(self, other: Value):
+        return Number(self.is_true() or other.is_true(), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def xor_(self, other: Value):
+        """ Exclusive or (xor) """
+        xor = (
+            not self.is_true() and other.is_true()
+        ) or (
+            self.is_true() and not other.is_true()
+        )
+        return Number(xor, self.pos_start, other.pos_end).set_context(self.context), None
+
+    def is_true(self):
+        return bool(self.elements)
+
+    def copy(self):
+        """Return a copy of self (sharing the same python deque)"""
+        copy = Deque(self.elements, self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+
 class Module(Value):
-    def __init__(self, name: str, functions_and_constants: dict[str, Value], pos_start: _Position, pos_end: _Position):
+    def __init__(self, name: str, functions_and_constants: Mapping[str, Value], pos_start: _Position,
+                 pos_end: _Position):
         super().__init__(pos_start, pos_end)
         self.name = name
         self.type_ = "module"
-        self.attributes = functions_and_constants.copy()
+        # the table of the lib is not copied (it may be a LazyTable, see lib_to_make_libs): the attributes that are
+        # set on the module are written in the first map
+        self.attributes = collections.ChainMap({}, functions_and_constants)
 
     def __repr__(self):
         return f"<module {self.name}>"
@@ -962,12 +1944,16 @@ class NoneValue(Value):
 
     def is_in(self, other: Value):
         if isinstance(other, List):
+            if other.storage.strategy is not None:  # the list only contains numbers or strs
+                return Number(False, self.pos_start, other.pos_end).set_context(self.context), None
             for element in other.elements:
                 if isinstance(element, NoneValue):
                     return Number(True, self.pos_start, other.pos_end).set_context(self.context), None
             return Number(False, self.pos_start, other.pos_end).set_context(self.context), None
         elif isinstance(other, String):
             return Number('none' in other.value.lower(), self.pos_start, other.pos_end).set_context(self.context), None
+        elif isinstance(other, Dict) or isinstance(other, Set):
+            return Number(other.contains(self), self.pos_start, other.pos_end).set_context(self.context), None
         else:
             return None, self.can_not_be_in(other)
 
@@ -1041,7 +2027,7 @@ class DefaultValue(Value):
 
     def is_in(self, other: Value):
         if isinstance(other, List):
-            for element in other.elements:
+            for element in other.iter_values():
                 if isinstance(element, DefaultValue):
                     return Number(True, self.pos_start, other.pos_end).set_context(self.context), None
             return Number(False, self.pos_start, other.pos_end).set_context(self.context), None
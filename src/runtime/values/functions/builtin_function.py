@@ -15,30 +15,128 @@ from src.lexer.position import DEFAULT_POSITION
 from src.runtime.values.basevalues.value import Value
 from src.runtime.values.functions.base_builtin_func import BaseBuiltInFunction
 from src.runtime.values.functions.base_function import BaseFunction
+from src.runtime.values.functions.function import Function, Method
+from src.runtime.values.functions.generator import Generator
+from src.runtime.values.functions.memoized_function import MemoCache, MemoizedFunction
 from src.runtime.context import Context
 from src.runtime.runtime_result import RTResult
 from src.runtime.values.basevalues.basevalues import String, List, NoneValue, Module, Number, Object, Constructor
+from src.runtime.values.basevalues.basevalues import Dict, Set, Array, array_data, StringBuilder, Range, Deque
 from src.misc import RunFunction, nice_str_from_idk, BuiltinFunctionDict, print_in_green, print_in_red, clear_screen
 from src.misc import is_keyword, is_tok_type
 from src.errors.errors import RTTypeErrorF, RTTypeError, RTIndexError, RTFileNotFoundError, RunTimeError, PythonError
+from src.errors.errors import RTKeyError, RTOverflowError, RTRecursionError
 from src.runtime.values.tools.py2noug import py2noug
 from src.runtime.values.functions.sort_builtin_function import sort as _sort_a_nougaro_list
 import src.conffiles
 # built-in python imports
+import collections
+import operator
 import os
 import random
 import sys
 import subprocess
 import pathlib
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Literal, Callable, Iterable
 if TYPE_CHECKING:
     from src.runtime.interpreter import Interpreter
 
+# what is needed to call a function given as an argument to a built-in function (see `function_caller`)
+CallEnv = tuple[type["Interpreter"], RunFunction, str, dict[str, str | bool], str | None]
+
+
+def _python_iterable(iterable_: Value) -> Iterable[Value | int | float | str] | None:
+    """Returns the python iterable over the elements of `iterable_`, as in a `for x in iterable_` loop, or None if
+    `iterable_` is not iterable. Numbers and strs may not be boxed, see `_box`."""
+    if isinstance(iterable_, List):
+        return iterable_.storage.items  # numbers and strs may be unboxed (see ListStorage)
+    if isinstance(iterable_, Dict):
+        return iterable_.keys()
+    if isinstance(iterable_, Set):
+        return iterable_.values()
+    if isinstance(iterable_, Array):
+        return iterable_.data
+    if isinstance(iterable_, Range):
+        return iterable_.range_
+    if isinstance(iterable_, Deque):
+        return list(iterable_.elements)  # a python deque can not be changed while iterating over it
+    if isinstance(iterable_, Generator):
+        return iterable_.iterate()  # the error of the generator, if any, is then in `iterable_.error`
+    if isinstance(iterable_, String):
+        return iterable_.value
+    return None
+
+
+def _box(element: Value | int | float | str, iterable_: Value) -> Value:
+    """Boxes an element given by `_python_iterable(iterable_)`"""
+    if isinstance(element, str):
+        return String(element, iterable_.pos_start, iterable_.pos_end)
+    if isinstance(element, int) or isinstance(element, float):
+        return Number(element, iterable_.pos_start, iterable_.pos_end)
+    return element
+
+
+def function_caller(function: BaseFunction, exec_ctx: Context, call_env: CallEnv,
+                    cli_args: list[String]) -> Callable[[list[Value]], RTResult]:
+    """Returns a python function that calls `function` with a list of arguments. It is used by the built-in
+    functions that call a function on every element of an iterable (like `map`): nougaro functions are run with the
+    same interpreter for every call, and built-in functions are directly called, without the environment that
+    `execute` sets up for calls from nougaro code. `call_env` is the environment given to the `execute` method of the
+    built-in function that calls `function`."""
+    interpreter_, run, noug_dir, lexer_metas, work_dir = call_env
+    exec_from = f"{exec_ctx.display_name}"
+    if isinstance(function, Function) and not isinstance(function, Method):
+        function = function.copy()
+        if function.call_with_module_context:
+            function.context = function.module_context
+        interpreter = interpreter_(run, noug_dir, cli_args, work_dir if work_dir is not None else noug_dir,
+                                   lexer_metas)
+
+        def call_function(args: list[Value]) -> RTResult:
+            return function.call(args, interpreter, exec_from, cli_args)
+        return call_function
+
+    if isinstance(function, BuiltInFunction):
+        method_dict = function.builtin_functions[function.name]
+        method = method_dict["function"]
+        if not (method_dict["run_noug_dir"] or method_dict["noug_dir"]) and method.__code__.co_argcount == 2:
+            optional_params: list[tuple[str, Value | None]] = [
+                (param, None) for param in method_dict["optional_params"]
+            ]
+
+            def call_builtin(args: list[Value]) -> RTResult:
+                result = RTResult()
+                builtin_ctx = function.generate_new_context()
+                result.register(function.check_and_populate_args(
+                    method_dict["param_names"], args, builtin_ctx, optional_params=optional_params,
+                    should_respect_args_number=method_dict["should_respect_args_number"]
+                ))
+                if result.should_return():
+                    return result
+                return method(function, builtin_ctx)
+            return call_builtin
+
+    use_context = None
+    if function.call_with_module_context:
+        use_context = function.module_context
+    elif isinstance(function, Method):  # `this` is set, as in Interpreter.visit_CallNode
+        assert exec_ctx.symbol_table is not None and function.object_ is not None
+        use_context = exec_ctx
+        exec_ctx.symbol_table.set("this", function.object_)
+
+    def call(args: list[Value]) -> RTResult:
+        return function.execute(
+            args, interpreter_, run, noug_dir, lexer_metas, exec_from, use_context, cli_args, work_dir
+        )
+    return call
+
 
 class BuiltInFunction(BaseBuiltInFunction):
     def __init__(self, name: str, call_with_module_context: bool = False):
         super().__init__(name, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy(), call_with_module_context)
         self.cli_args = []
+        # what is needed to call a function given as an argument (see `_caller`), set in `execute`
+        self.call_env: CallEnv | None = None
 
     def __repr__(self):
         if self.name == "exit":
@@ -69,6 +167,7 @@ class BuiltInFunction(BaseBuiltInFunction):
             self.cli_args = cli_args.copy()
             new_cli_args: list[Value] = list(map(nice_str_from_idk, cli_args))
             exec_ctx.symbol_table.set("__args__", List(new_cli_args, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()))
+        self.call_env = (interpreter_, run, noug_dir, lexer_metas, work_dir)
 
         # get the method name and the method
         try:
@@ -143,6 +242,47 @@ class BuiltInFunction(BaseBuiltInFunction):
         copy.attributes = self.attributes.copy()
         return copy
 
+    def _caller(self, function: BaseFunction, exec_ctx: Context) -> Callable[[list[Value]], RTResult]:
+        """Returns a python function that calls `function` with a list of arguments (see `function_caller`)"""
+        assert self.call_env is not None
+        return function_caller(function, exec_ctx, self.call_env, self.cli_args)
+
+    def _call_for_each(self, function: Value, iterable_: Value, exec_ctx: Context, fname: str,
+                       callback: Callable[[Value, Value], bool]) -> RTResult:
+        """Calls `function` on every element of `iterable_`, then calls `callback(element, return_value)`. Stops if
+        `callback` returns False. Returns an empty RTResult if there was no error."""
+        result = RTResult()
+        if not isinstance(function, BaseFunction):
+            return result.failure(RTTypeErrorF(
+                function.pos_start, function.pos_end, "first", fname, "function", function,
+                exec_ctx, f"src.runtime.values.functions.builtin_function.BuiltInFunction.execute_{fname}"
+            ))
+        python_iterable = _python_iterable(iterable_)
+        if python_iterable is None:
+            return result.failure(RTTypeErrorF(
+                iterable_.pos_start, iterable_.pos_end, "second", fname, "iterable", iterable_,
+                exec_ctx, f"src.runtime.values.functions.builtin_function.BuiltInFunction.execute_{fname}"
+            ))
+
+        call = self._caller(function, exec_ctx)
+        try:
+            for element in python_iterable:
+                element = _box(element, iterable_)
+                return_value = result.register(call([element]))
+                if result.should_return():
+                    return result
+                assert return_value is not None
+                if not callback(element, return_value):
+                    break
+        except RecursionError as e:
+            return result.failure(RTRecursionError(
+                function.pos_start, function.pos_end, str(e), exec_ctx,
+                f"src.runtime.values.functions.builtin_function.BuiltInFunction.execute_{fname}"
+            ))
+        if isinstance(iterable_, Generator) and iterable_.error is not None:  # the body of the generator failed
+            return result.failure(iterable_.error)
+        return result
+
     builtin_functions: dict[str, BuiltinFunctionDict] = {}
 
     # ==================
@@ -504,6 +644,78 @@ class BuiltInFunction(BaseBuiltInFunction):
         "noug_dir": False
     }
 
+    def execute_is_dict(self, exec_ctx: Context):
+        """Check if 'value' is a Dict"""
+        # Params:
+        # * value
+        # we get the value and check if it is a dict
+        assert exec_ctx.symbol_table is not None
+        is_dict = isinstance(exec_ctx.symbol_table.getf('value'), Dict)
+        return RTResult().success(Number(is_dict, self.pos_start, self.pos_end))
+
+    builtin_functions["is_dict"] = {
+        "function": execute_is_dict,
+        "param_names": ["value"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_is_set(self, exec_ctx: Context):
+        """Check if 'value' is a Set"""
+        # Params:
+        # * value
+        # we get the value and check if it is a set
+        assert exec_ctx.symbol_table is not None
+        is_set = isinstance(exec_ctx.symbol_table.getf('value'), Set)
+        return RTResult().success(Number(is_set, self.pos_start, self.pos_end))
+
+    builtin_functions["is_set"] = {
+        "function": execute_is_set,
+        "param_names": ["value"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_is_deque(self, exec_ctx: Context):
+        """Check if 'value' is a Deque"""
+        # Params:
+        # * value
+        # we get the value and check if it is a deque
+        assert exec_ctx.symbol_table is not None
+        is_deque = isinstance(exec_ctx.symbol_table.getf('value'), Deque)
+        return RTResult().success(Number(is_deque, self.pos_start, self.pos_end))
+
+    builtin_functions["is_deque"] = {
+        "function": execute_is_deque,
+        "param_names": ["value"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_is_array(self, exec_ctx: Context):
+        """Check if 'value' is an Array"""
+        # Params:
+        # * value
+        # we get the value and check if it is an array
+        assert exec_ctx.symbol_table is not None
+        is_array = isinstance(exec_ctx.symbol_table.getf('value'), Array)
+        return RTResult().success(Number(is_array, self.pos_start, self.pos_end))
+
+    builtin_functions["is_array"] = {
+        "function": execute_is_array,
+        "param_names": ["value"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
     def execute_is_str(self, exec_ctx: Context):
         """Check if 'value' is a String"""
         # Params:
@@ -613,7 +825,7 @@ class BuiltInFunction(BaseBuiltInFunction):
     }
 
     def execute_append(self, exec_ctx: Context):
-        """Append 'value' to 'list'"""
+        """Append 'value' to 'list' (or to a string builder)"""
         # Params:
         # * list
         # * value
@@ -622,16 +834,27 @@ class BuiltInFunction(BaseBuiltInFunction):
         list_ = exec_ctx.symbol_table.getf('list')
         value = exec_ctx.symbol_table.getf('value')
 
-        if not isinstance(list_, List):  # we check if the list is a list
+        if isinstance(list_, StringBuilder):  # we append a str to the string builder
+            if not isinstance(value, String):
+                assert value is not None
+                return RTResult().failure(RTTypeErrorF(
+                    value.pos_start, value.pos_end, "second", "append", "str", value,
+                    exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_append"
+                ))
+            list_.append(value.value)
+            return RTResult().success(list_)
+
+        if not isinstance(list_, List) and not isinstance(list_, Deque):  # we check if the list is a list
             assert list_ is not None
-            return RTResult().failure(RTTypeErrorF(
-                list_.pos_start, list_.pos_end, "first", "append", "list", list_,
+            return RTResult().failure(RTTypeError(
+                list_.pos_start, list_.pos_end,
+                f"type of the first argument of builtin function ‘append’ should be ‘list’, ‘deque’ or "
+                f"‘string_builder’, got ‘{list_.type_}’ instead.",
                 exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_append"
             ))
 
         assert value is not None
-        list_.elements.append(value)  # we append the element to the list (changes in the symbol table too)
-        list_.update_should_print()
+        list_.append_element(value)  # we append the element to the list (changes in the symbol table too)
         return RTResult().success(list_)
 
     builtin_functions["append"] = {
@@ -654,11 +877,11 @@ class BuiltInFunction(BaseBuiltInFunction):
         list_ = exec_ctx.symbol_table.getf('list')
         index = exec_ctx.symbol_table.getf('index')
 
-        if not isinstance(list_, List):  # we check if the list is a list
+        if not isinstance(list_, List) and not isinstance(list_, Deque):  # we check if the list is a list
             assert list_ is not None
             return RTResult().failure(RTTypeErrorF(
                 list_.pos_start, list_.pos_end, "first", "pop", "list", list_,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_pop"
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_pop", or_="deque"
             ))
 
         if index is None:
@@ -671,8 +894,7 @@ class BuiltInFunction(BaseBuiltInFunction):
             ))
 
         try:  # we try to pop the element
-            element = list_.elements.pop(index.value)
-            list_.update_should_print()
+            element = list_.pop_element(index.value)
         except IndexError:  # except if the index is out of range
             error_pos_start = list_.pos_start
             error_pos_end = index.pos_end
@@ -705,15 +927,15 @@ class BuiltInFunction(BaseBuiltInFunction):
         index = exec_ctx.symbol_table.getf('index')
 
         # we check if everything OK
-        if not isinstance(list_, List):
+        if not isinstance(list_, List) and not isinstance(list_, Deque):
             assert list_ is not None
             return RTResult().failure(RTTypeErrorF(
                 list_.pos_start, list_.pos_end, "first", "insert", "list", list_,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_insert"
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_insert", or_="deque"
             ))
 
         if index is None:
-            index = Number(len(list_.elements), self.pos_start, self.pos_end)
+            index = Number(len(list_), self.pos_start, self.pos_end)
 
         if not isinstance(index, Number) or not isinstance(index.value, int):
             return RTResult().failure(RTTypeErrorF(
@@ -723,8 +945,7 @@ class BuiltInFunction(BaseBuiltInFunction):
 
         # if everything OK, we insert the element to the list at the right index
         assert value is not None
-        list_.elements.insert(index.value, value)
-        list_.update_should_print()
+        list_.insert_element(index.value, value)
         return RTResult().success(list_)
 
     builtin_functions["insert"] = {
@@ -772,8 +993,8 @@ class BuiltInFunction(BaseBuiltInFunction):
                     exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_extend"
                 ))
             if delete_duplicates.is_true():  # we have to delete duplicates
-                list1_e = list1.elements
-                list2_e = list2.elements
+                list1_e = list(list1.iter_values())
+                list2_e = list(list2.iter_values())
                 final_list = list1_e.copy()  # we append all the elements of the first list to the final one
                 for e in list2_e:
                     can_append = True
@@ -789,7 +1010,7 @@ class BuiltInFunction(BaseBuiltInFunction):
                         final_list.append(e)
                 return RTResult().success(List(final_list, self.pos_start, self.pos_end))
 
-        list1.elements.extend(list2.elements)  # we finally extend
+        list1.extend_elements(list2)  # we finally extend
         list1.update_should_print()
         return RTResult().success(list1)
 
@@ -812,13 +1033,23 @@ class BuiltInFunction(BaseBuiltInFunction):
         index_ = exec_ctx.symbol_table.getf('index')
 
         assert list_ is not None
+        assert index_ is not None
+        if isinstance(list_, Dict):  # the index is a key of the dict
+            value = list_.get(index_)
+            if value is None:
+                return RTResult().failure(RTKeyError(
+                    list_.pos_start, index_.pos_end,
+                    f"key {index_.__repr__()} is not in the dict.",
+                    exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_get"
+                ))
+            return RTResult().success(value)
+
         if not isinstance(list_, List):  # we check if the list is a list
             return RTResult().failure(RTTypeErrorF(
                 list_.pos_start, list_.pos_end, "first", "get", "list", list_,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_get"
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_get", or_="dict"
             ))
 
-        assert index_ is not None
         if not isinstance(index_, Number) or not isinstance(index_.value, int):  # we check if the index is a number
             return RTResult().failure(RTTypeErrorF(
                 index_.pos_start, index_.pos_end, "second", "get", "integer", index_,
@@ -856,11 +1087,20 @@ class BuiltInFunction(BaseBuiltInFunction):
         value = exec_ctx.symbol_table.getf('value')
 
         assert list_ is not None
+        if isinstance(list_, Dict):  # the index is a key of the dict, that is added if it does not exist
+            assert index_ is not None
+            assert value is not None
+            error = list_.set(index_, value)
+            if error is not None:
+                return RTResult().failure(error)
+            return RTResult().success(list_)
+
         # we check the values
         if not isinstance(list_, List):
             return RTResult().failure(RTTypeErrorF(
                 list_.pos_start, list_.pos_end, "first", "replace", "list", list_,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_replace"
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_replace",
+                or_="dict"
             ))
 
         assert index_ is not None
@@ -873,7 +1113,7 @@ class BuiltInFunction(BaseBuiltInFunction):
         assert value is not None
         # everything OK : we replace the element
         try:
-            list_.elements[index_.value] = value
+            list_.set_element(index_.value, value)
             list_.update_should_print()
         except IndexError:  # except if the index is out of range
             return RTResult().failure(RTIndexError(
@@ -893,6 +1133,575 @@ class BuiltInFunction(BaseBuiltInFunction):
         "noug_dir": False
     }
 
+    def _get_dict_arg(self, exec_ctx: Context, function_name: str) -> tuple[Dict, None] | tuple[None, RTResult]:
+        """Returns the 'dict' argument of a built-in function, or an error if it is not a dict"""
+        assert exec_ctx.symbol_table is not None
+        dict_ = exec_ctx.symbol_table.getf('dict')
+        assert dict_ is not None
+        if not isinstance(dict_, Dict):
+            return None, RTResult().failure(RTTypeErrorF(
+                dict_.pos_start, dict_.pos_end, "first", function_name, "dict", dict_,
+                exec_ctx, f"src.runtime.values.functions.builtin_function.BuiltInFunction.execute_{function_name}"
+            ))
+        return dict_, None
+
+    def execute_keys(self, exec_ctx: Context):
+        """Returns the list of the keys of 'dict'"""
+        # Params:
+        # * dict
+        dict_, error = self._get_dict_arg(exec_ctx, "keys")
+        if error is not None:
+            return error
+        assert dict_ is not None
+        return RTResult().success(List(dict_.keys(), self.pos_start, self.pos_end))
+
+    builtin_functions["keys"] = {
+        "function": execute_keys,
+        "param_names": ["dict"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_values(self, exec_ctx: Context):
+        """Returns the list of the values of 'dict'"""
+        # Params:
+        # * dict
+        dict_, error = self._get_dict_arg(exec_ctx, "values")
+        if error is not None:
+            return error
+        assert dict_ is not None
+        return RTResult().success(List(dict_.values(), self.pos_start, self.pos_end))
+
+    builtin_functions["values"] = {
+        "function": execute_values,
+        "param_names": ["dict"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_items(self, exec_ctx: Context):
+        """Returns the list of the [key, value] pairs of 'dict'"""
+        # Params:
+        # * dict
+        dict_, error = self._get_dict_arg(exec_ctx, "items")
+        if error is not None:
+            return error
+        assert dict_ is not None
+        items: list[Value] = [
+            List([key, value], self.pos_start, self.pos_end) for key, value in dict_.items()
+        ]
+        return RTResult().success(List(items, self.pos_start, self.pos_end))
+
+    builtin_functions["items"] = {
+        "function": execute_items,
+        "param_names": ["dict"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_delete(self, exec_ctx: Context):
+        """Delete 'key' from 'dict'"""
+        # Params:
+        # * dict
+        # * key
+        dict_, error = self._get_dict_arg(exec_ctx, "delete")
+        if error is not None:
+            return error
+        assert dict_ is not None
+        assert exec_ctx.symbol_table is not None
+        key = exec_ctx.symbol_table.getf('key')
+        assert key is not None
+        if not dict_.delete(key):
+            return RTResult().failure(RTKeyError(
+                key.pos_start, key.pos_end,
+                f"key {key.__repr__()} is not in the dict.",
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_delete"
+            ))
+        return RTResult().success(dict_)
+
+    builtin_functions["delete"] = {
+        "function": execute_delete,
+        "param_names": ["dict", "key"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def _get_set_arg(self, exec_ctx: Context, function_name: str) -> tuple[Set, None] | tuple[None, RTResult]:
+        """Returns the 'set' argument of a built-in function, or an error if it is not a set"""
+        assert exec_ctx.symbol_table is not None
+        set_ = exec_ctx.symbol_table.getf('set')
+        assert set_ is not None
+        if not isinstance(set_, Set):
+            return None, RTResult().failure(RTTypeErrorF(
+                set_.pos_start, set_.pos_end, "first", function_name, "set", set_,
+                exec_ctx, f"src.runtime.values.functions.builtin_function.BuiltInFunction.execute_{function_name}"
+            ))
+        return set_, None
+
+    def execute_add(self, exec_ctx: Context):
+        """Add 'value' to 'set'"""
+        # Params:
+        # * set
+        # * value
+        set_, error = self._get_set_arg(exec_ctx, "add")
+        if error is not None:
+            return error
+        assert set_ is not None
+        assert exec_ctx.symbol_table is not None
+        value = exec_ctx.symbol_table.getf('value')
+        assert value is not None
+        add_error = set_.add(value)
+        if add_error is not None:
+            return RTResult().failure(add_error)
+        return RTResult().success(set_)
+
+    builtin_functions["add"] = {
+        "function": execute_add,
+        "param_names": ["set", "value"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_discard(self, exec_ctx: Context):
+        """Remove 'value' from 'set' if it is in it"""
+        # Params:
+        # * set
+        # * value
+        set_, error = self._get_set_arg(exec_ctx, "discard")
+        if error is not None:
+            return error
+        assert set_ is not None
+        assert exec_ctx.symbol_table is not None
+        value = exec_ctx.symbol_table.getf('value')
+        assert value is not None
+        set_.discard(value)
+        return RTResult().success(set_)
+
+    builtin_functions["discard"] = {
+        "function": execute_discard,
+        "param_names": ["set", "value"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_sum(self, exec_ctx: Context):
+        """Returns the sum of the numbers of an iterable (a list, an array, a range, ...)"""
+        # Params:
+        # * list
+        assert exec_ctx.symbol_table is not None
+        list_ = exec_ctx.symbol_table.getf('list')
+        assert list_ is not None
+        if isinstance(list_, Array):
+            return RTResult().success(Number(sum(list_.data), self.pos_start, self.pos_end))
+        if isinstance(list_, Range):  # sum of an arithmetic sequence, computed without iterating over it
+            length = list_.length()
+            sum_ = 0 if length == 0 else length * (2 * list_.range_.start + (length - 1) * list_.range_.step) // 2
+            return RTResult().success(Number(sum_, self.pos_start, self.pos_end))
+        if isinstance(list_, List) and list_.storage.strategy is Number:  # the numbers are already unboxed
+            python_iterable = list_.storage.items
+        else:
+            python_iterable = _python_iterable(list_)
+        if python_iterable is None or isinstance(list_, String):
+            return RTResult().failure(RTTypeErrorF(
+                list_.pos_start, list_.pos_end, "first", "sum", "iterable of numbers", list_,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_sum"
+            ))
+
+        numbers: list[int | float] = []
+        for element in python_iterable:
+            if isinstance(element, int) or isinstance(element, float):
+                numbers.append(element)
+                continue
+            element = _box(element, list_)  # strs may not be boxed
+            if not isinstance(element, Number):
+                return RTResult().failure(RTTypeError(
+                    element.pos_start, element.pos_end,
+                    f"first argument of builtin function ‘sum’ must be an iterable of numbers, but found an element "
+                    f"of type ‘{element.type_}’.",
+                    exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_sum"
+                ))
+            numbers.append(element.value)
+        if isinstance(list_, Generator) and list_.error is not None:  # the body of the generator failed
+            return RTResult().failure(list_.error)
+        try:
+            sum_ = sum(numbers)
+        except OverflowError as e:
+            return RTResult().failure(RTOverflowError(
+                list_.pos_start, list_.pos_end, str(e),
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_sum"
+            ))
+        return RTResult().success(Number(sum_, self.pos_start, self.pos_end))
+
+    builtin_functions["sum"] = {
+        "function": execute_sum,
+        "param_names": ["list"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_map(self, exec_ctx: Context):
+        """Returns the list of the values returned by 'function' called on every element of 'iterable'"""
+        # Params:
+        # * function
+        # * iterable
+        assert exec_ctx.symbol_table is not None
+        function = exec_ctx.symbol_table.getf('function')
+        iterable_ = exec_ctx.symbol_table.getf('iterable')
+        assert function is not None and iterable_ is not None
+
+        elements: list[Value] = []
+
+        def add_return_value(_: Value, return_value: Value) -> bool:
+            elements.append(return_value)
+            return True
+
+        result = RTResult()
+        result.register(self._call_for_each(function, iterable_, exec_ctx, "map", add_return_value))
+        if result.should_return():
+            return result
+        return result.success(List(elements, self.pos_start, self.pos_end).set_context(exec_ctx))
+
+    builtin_functions["map"] = {
+        "function": execute_map,
+        "param_names": ["function", "iterable"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_filter(self, exec_ctx: Context):
+        """Returns the list of the elements of 'iterable' for which 'function' returns a true value"""
+        # Params:
+        # * function
+        # * iterable
+        assert exec_ctx.symbol_table is not None
+        function = exec_ctx.symbol_table.getf('function')
+        iterable_ = exec_ctx.symbol_table.getf('iterable')
+        assert function is not None and iterable_ is not None
+
+        elements: list[Value] = []
+
+        def add_element_if_true(element: Value, return_value: Value) -> bool:
+            if return_value.is_true():
+                elements.append(element)
+            return True
+
+        result = RTResult()
+        result.register(self._call_for_each(function, iterable_, exec_ctx, "filter", add_element_if_true))
+        if result.should_return():
+            return result
+        return result.success(List(elements, self.pos_start, self.pos_end).set_context(exec_ctx))
+
+    builtin_functions["filter"] = {
+        "function": execute_filter,
+        "param_names": ["function", "iterable"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_reduce(self, exec_ctx: Context):
+        """Calls 'function(accumulator, element)' on every element of 'iterable', from left to right, the accumulator
+        being the previous return value. The first accumulator is 'initial', or the first element of 'iterable'."""
+        # Params:
+        # * function
+        # * iterable
+        # Optional params:
+        # * initial
+        assert exec_ctx.symbol_table is not None
+        function = exec_ctx.symbol_table.getf('function')
+        iterable_ = exec_ctx.symbol_table.getf('iterable')
+        initial = exec_ctx.symbol_table.getf('initial')
+        assert function is not None and iterable_ is not None
+
+        result = RTResult()
+        if not isinstance(function, BaseFunction):
+            return result.failure(RTTypeErrorF(
+                function.pos_start, function.pos_end, "first", "reduce", "function", function,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_reduce"
+            ))
+        python_iterable = _python_iterable(iterable_)
+        if python_iterable is None:
+            return result.failure(RTTypeErrorF(
+                iterable_.pos_start, iterable_.pos_end, "second", "reduce", "iterable", iterable_,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_reduce"
+            ))
+
+        call = self._caller(function, exec_ctx)
+        accumulator = initial
+        try:
+            for element in python_iterable:
+                element = _box(element, iterable_)
+                if accumulator is None:
+                    accumulator = element
+                    continue
+                accumulator = result.register(call([accumulator, element]))
+                if result.should_return():
+                    return result
+        except RecursionError as e:
+            return result.failure(RTRecursionError(
+                function.pos_start, function.pos_end, str(e), exec_ctx,
+                "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_reduce"
+            ))
+        if isinstance(iterable_, Generator) and iterable_.error is not None:  # the body of the generator failed
+            return result.failure(iterable_.error)
+
+        if accumulator is None:
+            return result.failure(RunTimeError(
+                iterable_.pos_start, iterable_.pos_end,
+                "builtin function ‘reduce’ can not reduce an empty iterable without an initial value.",
+                exec_ctx, origin_file="src.runtime.values.functions.builtin_function.BuiltInFunction.execute_reduce"
+            ))
+        return result.success(accumulator)
+
+    builtin_functions["reduce"] = {
+        "function": execute_reduce,
+        "param_names": ["function", "iterable"],
+        "optional_params": ["initial"],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_zip(self, exec_ctx: Context):
+        """Returns the list of the pairs [element of 'iterable1', element of 'iterable2'], stopping at the end of the
+        shortest iterable"""
+        # Params:
+        # * iterable1
+        # * iterable2
+        assert exec_ctx.symbol_table is not None
+        iterable1 = exec_ctx.symbol_table.getf('iterable1')
+        iterable2 = exec_ctx.symbol_table.getf('iterable2')
+        assert iterable1 is not None and iterable2 is not None
+
+        python_iterable1 = _python_iterable(iterable1)
+        if python_iterable1 is None:
+            return RTResult().failure(RTTypeErrorF(
+                iterable1.pos_start, iterable1.pos_end, "first", "zip", "iterable", iterable1,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_zip"
+            ))
+        python_iterable2 = _python_iterable(iterable2)
+        if python_iterable2 is None:
+            return RTResult().failure(RTTypeErrorF(
+                iterable2.pos_start, iterable2.pos_end, "second", "zip", "iterable", iterable2,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_zip"
+            ))
+
+        pairs: list[Value] = [
+            List([_box(element1, iterable1), _box(element2, iterable2)], self.pos_start, self.pos_end)
+            for element1, element2 in zip(python_iterable1, python_iterable2)
+        ]
+        for iterable_ in (iterable1, iterable2):
+            if isinstance(iterable_, Generator) and iterable_.error is not None:  # the body of the generator failed
+                return RTResult().failure(iterable_.error)
+        return RTResult().success(List(pairs, self.pos_start, self.pos_end).set_context(exec_ctx))
+
+    builtin_functions["zip"] = {
+        "function": execute_zip,
+        "param_names": ["iterable1", "iterable2"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_enumerate(self, exec_ctx: Context):
+        """Returns the list of the pairs [index, element of 'iterable'], the indexes starting at 'start' (default 0)"""
+        # Params:
+        # * iterable
+        # Optional params:
+        # * start
+        assert exec_ctx.symbol_table is not None
+        iterable_ = exec_ctx.symbol_table.getf('iterable')
+        start = exec_ctx.symbol_table.getf('start')
+        assert iterable_ is not None
+
+        python_iterable = _python_iterable(iterable_)
+        if python_iterable is None:
+            return RTResult().failure(RTTypeErrorF(
+                iterable_.pos_start, iterable_.pos_end, "first", "enumerate", "iterable", iterable_,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_enumerate"
+            ))
+        if start is None:
+            start = Number(0, self.pos_start, self.pos_end)
+        if not isinstance(start, Number) or not isinstance(start.value, int):
+            return RTResult().failure(RTTypeErrorF(
+                start.pos_start, start.pos_end, "second", "enumerate", "int", start,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_enumerate"
+            ))
+
+        pairs: list[Value] = [
+            List([Number(index, self.pos_start, self.pos_end), _box(element, iterable_)], self.pos_start, self.pos_end)
+            for index, element in enumerate(python_iterable, start.value)
+        ]
+        if isinstance(iterable_, Generator) and iterable_.error is not None:  # the body of the generator failed
+            return RTResult().failure(iterable_.error)
+        return RTResult().success(List(pairs, self.pos_start, self.pos_end).set_context(exec_ctx))
+
+    builtin_functions["enumerate"] = {
+        "function": execute_enumerate,
+        "param_names": ["iterable"],
+        "optional_params": ["start"],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_memoize(self, exec_ctx: Context):
+        """Returns a function that calls 'function' and remembers the returned values: calling it again with the same
+        arguments returns the same value without calling 'function'. When there are 'maxsize' values, the least
+        recently used one is forgotten. The function should not have side effects.
+        Like python's `functools.lru_cache`, the remembered value itself is returned, not a copy: changing a list
+        returned by the memoized function changes the value returned by the next calls with the same arguments."""
+        # Params:
+        # * function
+        # Optional params:
+        # * maxsize
+        assert exec_ctx.symbol_table is not None
+        function = exec_ctx.symbol_table.getf('function')
+        maxsize = exec_ctx.symbol_table.getf('maxsize')
+        assert function is not None
+
+        if not isinstance(function, BaseFunction):
+            return RTResult().failure(RTTypeErrorF(
+                function.pos_start, function.pos_end, "first", "memoize", "function", function,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_memoize"
+            ))
+        if isinstance(maxsize, NoneValue):
+            maxsize = None
+        if maxsize is not None and not (isinstance(maxsize, Number) and isinstance(maxsize.value, int)):
+            return RTResult().failure(RTTypeErrorF(
+                maxsize.pos_start, maxsize.pos_end, "second", "memoize", "int", maxsize,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_memoize"
+            ))
+        if maxsize is not None and maxsize.value < 0:
+            return RTResult().failure(RunTimeError(
+                maxsize.pos_start, maxsize.pos_end, "the maximum size of the cache can not be negative.",
+                exec_ctx, origin_file="src.runtime.values.functions.builtin_function.BuiltInFunction.execute_memoize"
+            ))
+
+        # the argument was given the context of this call: the function should see the variables of the caller
+        function = function.copy().set_context(exec_ctx.parent)
+        if isinstance(function, MemoizedFunction):  # memoize(memoize(f)) has one cache
+            function = function.function
+        cache = MemoCache(None if maxsize is None else maxsize.value)
+        return RTResult().success(
+            MemoizedFunction(function, cache, self.pos_start, self.pos_end).set_context(exec_ctx.parent)
+        )
+
+    builtin_functions["memoize"] = {
+        "function": execute_memoize,
+        "param_names": ["function"],
+        "optional_params": ["maxsize"],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_memo_info(self, exec_ctx: Context):
+        """Returns a dict with the number of calls of a memoized function that found their value in the cache
+        ('hits'), that did not ('misses'), the number of values in the cache ('size') and its maximum size ('maxsize',
+        None if it is not bounded)"""
+        # Params:
+        # * function
+        assert exec_ctx.symbol_table is not None
+        function = exec_ctx.symbol_table.getf('function')
+        assert function is not None
+        if not isinstance(function, MemoizedFunction):
+            return RTResult().failure(RTTypeErrorF(
+                function.pos_start, function.pos_end, "first", "memo_info", "memoized function", function,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_memo_info"
+            ))
+        cache = function.cache
+        info = {"hits": cache.hits, "misses": cache.misses, "size": len(cache.entries), "maxsize": cache.maxsize}
+        return RTResult().success(py2noug(info, self.pos_start, self.pos_end))
+
+    builtin_functions["memo_info"] = {
+        "function": execute_memo_info,
+        "param_names": ["function"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_memo_clear(self, exec_ctx: Context):
+        """Empties the cache of a memoized function and resets its counters"""
+        # Params:
+        # * function
+        assert exec_ctx.symbol_table is not None
+        function = exec_ctx.symbol_table.getf('function')
+        assert function is not None
+        if not isinstance(function, MemoizedFunction):
+            return RTResult().failure(RTTypeErrorF(
+                function.pos_start, function.pos_end, "first", "memo_clear", "memoized function", function,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_memo_clear"
+            ))
+        function.cache.clear()
+        return RTResult().success(NoneValue(self.pos_start, self.pos_end, False))
+
+    builtin_functions["memo_clear"] = {
+        "function": execute_memo_clear,
+        "param_names": ["function"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_dot(self, exec_ctx: Context):
+        """Returns the dot product of two arrays of the same length"""
+        # Params:
+        # * array1
+        # * array2
+        assert exec_ctx.symbol_table is not None
+        array1 = exec_ctx.symbol_table.getf('array1')
+        array2 = exec_ctx.symbol_table.getf('array2')
+        assert array1 is not None and array2 is not None
+        if not isinstance(array1, Array):
+            return RTResult().failure(RTTypeErrorF(
+                array1.pos_start, array1.pos_end, "first", "dot", "array", array1,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_dot"
+            ))
+        if not isinstance(array2, Array):
+            return RTResult().failure(RTTypeErrorF(
+                array2.pos_start, array2.pos_end, "second", "dot", "array", array2,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_dot"
+            ))
+        if len(array1.data) != len(array2.data):
+            return RTResult().failure(RTIndexError(
+                array1.pos_start, array2.pos_end,
+                "the two arguments of built-in function ‘dot’ must have the same length.",
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_dot"
+            ))
+        dot_product = sum(map(operator.mul, array1.data, array2.data))
+        return RTResult().success(Number(dot_product, self.pos_start, self.pos_end))
+
+    builtin_functions["dot"] = {
+        "function": execute_dot,
+        "param_names": ["array1", "array2"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
     def execute_max(self, exec_ctx: Context):
         """Calculates the max value of a list"""
         # Params:
@@ -904,10 +1713,14 @@ class BuiltInFunction(BaseBuiltInFunction):
         assert exec_ctx.symbol_table is not None
         list_ = exec_ctx.symbol_table.getf('list')
         assert list_ is not None
+        if isinstance(list_, Array):  # arrays only contain numbers
+            if len(list_.data) == 0:
+                return RTResult().success(NoneValue(self.pos_start, self.pos_end))
+            return RTResult().success(Number(max(list_.data), self.pos_start, self.pos_end))
         if not isinstance(list_, List):
             return RTResult().failure(RTTypeErrorF(
                 list_.pos_start, list_.pos_end, "first", "max", "list", list_,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_max"
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_max", or_="array"
             ))
 
         # then we get "ignore_not_num"
@@ -923,7 +1736,7 @@ class BuiltInFunction(BaseBuiltInFunction):
 
         # then we check if the list is good
         if ignore_not_num.is_false():
-            if not all(isinstance(e, Number) for e in list_.elements):
+            if list_.storage.strategy is not Number and not all(isinstance(e, Number) for e in list_.iter_values()):
                 return RTResult().failure(RTTypeError(
                     list_.pos_start, list_.pos_end,
                     "first argument of builtin function `max` must be a list containing only numbers. "
@@ -932,7 +1745,10 @@ class BuiltInFunction(BaseBuiltInFunction):
                 ))
 
         # we transform our list
-        list_ = [e.value for e in list_.elements if isinstance(e, Number)]
+        if list_.storage.strategy is Number:  # the numbers are already unboxed
+            list_ = list_.storage.items
+        else:
+            list_ = [e.value for e in list_.iter_values() if isinstance(e, Number)]
 
         if len(list_) == 0:
             return RTResult().success(NoneValue(self.pos_start, self.pos_end))
@@ -959,12 +1775,15 @@ class BuiltInFunction(BaseBuiltInFunction):
         # first we get the list
         assert exec_ctx.symbol_table is not None
         list_ = exec_ctx.symbol_table.getf('list')
-
         assert list_ is not None
+        if isinstance(list_, Array):  # arrays only contain numbers
+            if len(list_.data) == 0:
+                return RTResult().success(NoneValue(self.pos_start, self.pos_end))
+            return RTResult().success(Number(min(list_.data), self.pos_start, self.pos_end))
         if not isinstance(list_, List):
             return RTResult().failure(RTTypeErrorF(
                 list_.pos_start, list_.pos_end, "first", "min", "list", list_,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_min"
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_min", or_="array"
             ))
 
         # then we get "ignore_not_num"
@@ -980,7 +1799,7 @@ class BuiltInFunction(BaseBuiltInFunction):
 
         # then we check if the list is good
         if ignore_not_num.is_false():
-            if not all(isinstance(e, Number) for e in list_.elements):
+            if list_.storage.strategy is not Number and not all(isinstance(e, Number) for e in list_.iter_values()):
                 return RTResult().failure(RTTypeError(
                     list_.pos_start, list_.pos_end,
                     "first argument of builtin function `min` must be a list containing only numbers. "
@@ -989,7 +1808,10 @@ class BuiltInFunction(BaseBuiltInFunction):
                 ))
 
         # we transform our list
-        list_ = [e.value for e in list_.elements if isinstance(e, Number)]
+        if list_.storage.strategy is Number:  # the numbers are already unboxed
+            list_ = list_.storage.items
+        else:
+            list_ = [e.value for e in list_.iter_values() if isinstance(e, Number)]
 
         if len(list_) == 0:
             return RTResult().success(NoneValue(self.pos_start, self.pos_end))
@@ -1049,6 +1871,103 @@ class BuiltInFunction(BaseBuiltInFunction):
         "noug_dir": False
     }
 
+    def execute_join(self, exec_ctx: Context):
+        """Joins a list of strs into a str, with 'separator' between them."""
+        # Params:
+        # * list
+        # Optional params:
+        # * separator
+        # we get our args
+        assert exec_ctx.symbol_table is not None
+        list_ = exec_ctx.symbol_table.getf('list')
+        separator = exec_ctx.symbol_table.getf('separator')
+
+        # we check the types
+        if not isinstance(list_, List):
+            assert list_ is not None
+            return RTResult().failure(RTTypeErrorF(
+                list_.pos_start, list_.pos_end, "first", "join", "list", list_,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_join"
+            ))
+        if separator is None:
+            separator = String('', self.pos_start, self.pos_end)  # if there is no separator given, we join directly
+        if not isinstance(separator, String):
+            return RTResult().failure(RTTypeErrorF(
+                separator.pos_start, separator.pos_end, "second", "join", "str", separator,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_join"
+            ))
+
+        if list_.storage.strategy is String:  # the strs are already unboxed
+            strs = list_.storage.items
+        else:
+            strs: list[str] = []
+            for element in list_.iter_values():
+                if not isinstance(element, String):
+                    return RTResult().failure(RTTypeError(
+                        element.pos_start, element.pos_end,
+                        f"first argument of builtin function ‘join’ must be a list of strs, but found an element of "
+                        f"type ‘{element.type_}’.",
+                        exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_join"
+                    ))
+                strs.append(element.value)
+        return RTResult().success(String(separator.value.join(strs), self.pos_start, self.pos_end))
+
+    builtin_functions["join"] = {
+        "function": execute_join,
+        "param_names": ["list"],
+        "optional_params": ["separator"],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_string_builder(self, exec_ctx: Context):
+        """Creates a string builder, to which strs can be appended efficiently"""
+        # Optional params:
+        # * str
+        assert exec_ctx.symbol_table is not None
+        str_ = exec_ctx.symbol_table.getf('str')
+        if str_ is None:
+            return RTResult().success(StringBuilder([], self.pos_start, self.pos_end).set_context(exec_ctx))
+        if not isinstance(str_, String):
+            return RTResult().failure(RTTypeErrorF(
+                str_.pos_start, str_.pos_end, "first", "string_builder", "str", str_,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_string_builder"
+            ))
+        return RTResult().success(StringBuilder([str_.value], self.pos_start, self.pos_end).set_context(exec_ctx))
+
+    builtin_functions["string_builder"] = {
+        "function": execute_string_builder,
+        "param_names": [],
+        "optional_params": ["str"],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_build(self, exec_ctx: Context):
+        """Returns the str built by a string builder"""
+        # Params:
+        # * builder
+        assert exec_ctx.symbol_table is not None
+        builder = exec_ctx.symbol_table.getf('builder')
+        if not isinstance(builder, StringBuilder):
+            assert builder is not None
+            return RTResult().failure(RTTypeErrorF(
+                builder.pos_start, builder.pos_end, "first", "build", "string_builder", builder,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_build"
+            ))
+        return RTResult().success(String(builder.build(), self.pos_start, self.pos_end))
+
+    builtin_functions["build"] = {
+        "function": execute_build,
+        "param_names": ["builder"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
     def execute_exit(self, exec_ctx: Context):
         """Stops the Nougaro Interpreter"""
         # Optional params:
@@ -1200,23 +2119,247 @@ class BuiltInFunction(BaseBuiltInFunction):
         "noug_dir": False
     }
 
+    def execute_dict(self, exec_ctx: Context):
+        """Python 'dict()': creates a dict from a list of [key, value] pairs"""
+        # Optional params :
+        # * value
+        assert exec_ctx.symbol_table is not None
+        value = exec_ctx.symbol_table.getf('value')  # we get the value
+        if value is None:
+            return RTResult().success(Dict({}, self.pos_start, self.pos_end).set_context(exec_ctx))
+        if isinstance(value, Dict):
+            return RTResult().success(value.true_copy())
+        if not isinstance(value, List):
+            return RTResult().failure(RTTypeErrorF(
+                value.pos_start, value.pos_end, "first", "dict", "list", value,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_dict", or_="dict"
+            ))
+
+        dict_ = Dict({}, self.pos_start, self.pos_end).set_context(exec_ctx)
+        for pair in value.iter_values():
+            if not isinstance(pair, List) or len(pair) != 2:
+                return RTResult().failure(RTTypeError(
+                    pair.pos_start, pair.pos_end,
+                    f"the elements of the first argument of built-in function ‘dict’ should be lists of two "
+                    f"elements, got {pair.__repr__()}.",
+                    exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_dict"
+                ))
+            error = dict_.set(pair[0], pair[1])
+            if error is not None:
+                return RTResult().failure(error)
+        return RTResult().success(dict_)
+
+    builtin_functions["dict"] = {
+        "function": execute_dict,
+        "param_names": [],
+        "optional_params": ["value"],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_set(self, exec_ctx: Context):
+        """Python 'set()': creates a set from the elements of a list, the keys of a dict or the characters of a str"""
+        # Optional params :
+        # * value
+        assert exec_ctx.symbol_table is not None
+        value = exec_ctx.symbol_table.getf('value')  # we get the value
+        if value is None:
+            return RTResult().success(Set({}, self.pos_start, self.pos_end).set_context(exec_ctx))
+        if isinstance(value, Set):
+            return RTResult().success(value.true_copy())
+        if isinstance(value, Dict):
+            elements = value.keys()
+        elif isinstance(value, List):
+            elements = value.iter_values()
+        elif isinstance(value, String):
+            elements = [
+                String(char, value.pos_start, value.pos_end).set_context(exec_ctx) for char in value.value
+            ]
+        else:
+            return RTResult().failure(RTTypeError(
+                value.pos_start, value.pos_end,
+                f"type of the first argument of builtin function ‘set’ should be ‘list’, ‘dict’, ‘set’ or ‘str’, "
+                f"got ‘{value.type_}’ instead.",
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_set"
+            ))
+
+        set_ = Set({}, self.pos_start, self.pos_end).set_context(exec_ctx)
+        for element in elements:
+            error = set_.add(element)
+            if error is not None:
+                return RTResult().failure(error)
+        return RTResult().success(set_)
+
+    builtin_functions["set"] = {
+        "function": execute_set,
+        "param_names": [],
+        "optional_params": ["value"],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_deque(self, exec_ctx: Context):
+        """Creates a deque (a list that can be changed at both ends in constant time) from the elements of an iterable"""
+        # Optional params :
+        # * value
+        assert exec_ctx.symbol_table is not None
+        value = exec_ctx.symbol_table.getf('value')  # we get the value
+        if value is None:
+            return RTResult().success(Deque(collections.deque(), self.pos_start, self.pos_end).set_context(exec_ctx))
+        python_iterable = _python_iterable(value)
+        if python_iterable is None:
+            return RTResult().failure(RTTypeErrorF(
+                value.pos_start, value.pos_end, "first", "deque", "iterable", value,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_deque"
+            ))
+        elements = collections.deque(_box(element, value) for element in python_iterable)
+        if isinstance(value, Generator) and value.error is not None:  # the body of the generator failed
+            return RTResult().failure(value.error)
+        return RTResult().success(Deque(elements, self.pos_start, self.pos_end).set_context(exec_ctx))
+
+    builtin_functions["deque"] = {
+        "function": execute_deque,
+        "param_names": [],
+        "optional_params": ["value"],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_array(self, exec_ctx: Context):
+        """Creates an array from a list of numbers"""
+        # Optional params :
+        # * value
+        assert exec_ctx.symbol_table is not None
+        value = exec_ctx.symbol_table.getf('value')  # we get the value
+        if value is None:
+            return RTResult().success(Array(array_data([], True), self.pos_start, self.pos_end).set_context(exec_ctx))
+        if isinstance(value, Array):
+            return RTResult().success(value.true_copy())
+        if isinstance(value, Range):  # the ints are computed directly into the buffer
+            try:
+                data = array_data(value.range_, True)
+            except OverflowError:
+                return RTResult().failure(RTOverflowError(
+                    value.pos_start, value.pos_end,
+                    "the ints of an array must be between -2^63 and 2^63-1.",
+                    exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_array"
+                ))
+            return RTResult().success(Array(data, self.pos_start, self.pos_end).set_context(exec_ctx))
+        if not isinstance(value, List):
+            return RTResult().failure(RTTypeErrorF(
+                value.pos_start, value.pos_end, "first", "array", "list", value,
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_array", or_="array"
+            ))
+
+        numbers: list[int | float] = []
+        if value.storage.strategy is Number:  # the numbers are already unboxed
+            numbers = value.storage.items
+        else:
+            for element in value.iter_values():
+                if not isinstance(element, Number):
+                    return RTResult().failure(RTTypeError(
+                        element.pos_start, element.pos_end,
+                        f"first argument of builtin function ‘array’ must be a list of numbers, but found an element "
+                        f"of type ‘{element.type_}’.",
+                        exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_array"
+                    ))
+                numbers.append(element.value)
+        try:
+            data = array_data(numbers, all(isinstance(number, int) for number in numbers))
+        except OverflowError:
+            return RTResult().failure(RTOverflowError(
+                value.pos_start, value.pos_end,
+                "the ints of an array must be between -2^63 and 2^63-1.",
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_array"
+            ))
+        return RTResult().success(Array(data, self.pos_start, self.pos_end).set_context(exec_ctx))
+
+    builtin_functions["array"] = {
+        "function": execute_array,
+        "param_names": [],
+        "optional_params": ["value"],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
+    def execute_range(self, exec_ctx: Context):
+        """Python 'range()': range(end), range(start, end) or range(start, end, step). The ints are not stored."""
+        # Params :
+        # * start
+        # Optional params :
+        # * end
+        # * step
+        assert exec_ctx.symbol_table is not None
+        start = exec_ctx.symbol_table.getf('start')
+        end = exec_ctx.symbol_table.getf('end')
+        step = exec_ctx.symbol_table.getf('step')
+
+        for arg_num, arg in (("first", start), ("second", end), ("third", step)):
+            if arg is not None and not (isinstance(arg, Number) and isinstance(arg.value, int)):
+                return RTResult().failure(RTTypeErrorF(
+                    arg.pos_start, arg.pos_end, arg_num, "range", "int", arg,
+                    exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_range"
+                ))
+        assert isinstance(start, Number)
+        if end is None:  # range(end)
+            range_ = range(start.value)
+        elif step is None:
+            range_ = range(start.value, end.value)
+        else:
+            if step.value == 0:
+                return RTResult().failure(RunTimeError(
+                    step.pos_start, step.pos_end,
+                    "the step of a range can not be 0.",
+                    exec_ctx, origin_file="src.runtime.values.functions.builtin_function.BuiltInFunction.execute_range"
+                ))
+            range_ = range(start.value, end.value, step.value)
+        return RTResult().success(Range(range_, self.pos_start, self.pos_end).set_context(exec_ctx))
+
+    builtin_functions["range"] = {
+        "function": execute_range,
+        "param_names": ["start"],
+        "optional_params": ["end", "step"],
+        "should_respect_args_number": True,
+        "run_noug_dir": False,
+        "noug_dir": False
+    }
+
     def execute_len(self, exec_ctx: Context):
-        """Returns the length of a list or a str"""
+        """Returns the length of a list, a dict, a set, an array, a range, a deque, a string builder or a str"""
         # Params :
         # * list
         assert exec_ctx.symbol_table is not None
         value_ = exec_ctx.symbol_table.getf('value')  # we get the value
 
-        # we check if the value is a list or a str
-        if not isinstance(value_, List) and not isinstance(value_, String):
+        # we check if the value is a list, a dict, a set, an array, a range, a deque, a string builder or a str
+        if not isinstance(value_, List) and not isinstance(value_, String) and not isinstance(value_, Dict) \
+                and not isinstance(value_, Set) and not isinstance(value_, Array) \
+                and not isinstance(value_, StringBuilder) and not isinstance(value_, Range) \
+                and not isinstance(value_, Deque):
             assert value_ is not None
-            return RTResult().failure(RTTypeErrorF(
-                value_.pos_start, value_.pos_end, "first", "len", "list", value_,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_len", or_="str"
+            return RTResult().failure(RTTypeError(
+                value_.pos_start, value_.pos_end,
+                f"type of the first argument of builtin function ‘len’ should be ‘list’, ‘str’, ‘dict’, ‘set’, "
+                f"‘array’, ‘range’, ‘deque’ or ‘string_builder’, got ‘{value_.type_}’ instead.",
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_len"
             ))
 
         if isinstance(value_, List):
+            return RTResult().success(Number(len(value_), self.pos_start, self.pos_end))
+        elif isinstance(value_, Dict):
+            return RTResult().success(Number(len(value_.entries), self.pos_start, self.pos_end))
+        elif isinstance(value_, Set):
             return RTResult().success(Number(len(value_.elements), self.pos_start, self.pos_end))
+        elif isinstance(value_, Array):
+            return RTResult().success(Number(len(value_.data), self.pos_start, self.pos_end))
+        elif isinstance(value_, StringBuilder) or isinstance(value_, Deque):
+            return RTResult().success(Number(len(value_), self.pos_start, self.pos_end))
+        elif isinstance(value_, Range):
+            return RTResult().success(Number(value_.length(), self.pos_start, self.pos_end))
         else:
             return RTResult().success(Number(len(value_.value), self.pos_start, self.pos_end))
 
@@ -1843,11 +2986,22 @@ class BuiltInFunction(BaseBuiltInFunction):
     }
 
     def execute_sort(self, exec_ctx: Context):
-        """Like python’s sort()"""
+        """Like python’s sort(). The key function is called once per element, and the comparator returns a negative
+        number, zero or a positive number (like in C)."""
+        # Params:
+        # * list_
+        # Optional params:
+        # * mode
+        # * key
+        # * reverse
+        # * comparator
         assert exec_ctx.symbol_table is not None
         result = RTResult()
         list_ = exec_ctx.symbol_table.getf("list_")
         mode = exec_ctx.symbol_table.getf("mode")
+        key = exec_ctx.symbol_table.getf("key")
+        reverse = exec_ctx.symbol_table.getf("reverse")
+        comparator = exec_ctx.symbol_table.getf("comparator")
 
         if not isinstance(list_, List):
             assert list_ is not None
@@ -1855,20 +3009,43 @@ class BuiltInFunction(BaseBuiltInFunction):
                 list_.pos_start, list_.pos_end, "first", "sort", "list", list_,
                 exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_sort"
             ))
-        if mode is None:
+        if mode is None or isinstance(mode, NoneValue):
             mode = String("timsort", self.pos_start, self.pos_end)
         if not isinstance(mode, String):
             return result.failure(RTTypeErrorF(
                 mode.pos_start, mode.pos_end, "second", "sort", "str", mode,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_sort"
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_sort", or_="None"
             ))
 
-        return _sort_a_nougaro_list(list_, mode, result, exec_ctx, self.pos_start, self.pos_end)
+        callers: list[Callable[[list[Value]], RTResult] | None] = []
+        for function, arg_num in ((key, "third"), (comparator, "fifth")):
+            if function is None or isinstance(function, NoneValue):
+                callers.append(None)
+            elif isinstance(function, BaseFunction):
+                callers.append(self._caller(function, exec_ctx))
+            else:
+                return result.failure(RTTypeErrorF(
+                    function.pos_start, function.pos_end, arg_num, "sort", "function", function,
+                    exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_sort",
+                    or_="None"
+                ))
+        key_caller, comparator_caller = callers
+
+        try:
+            return _sort_a_nougaro_list(
+                list_, mode, result, exec_ctx, self.pos_start, self.pos_end,
+                key=key_caller, reverse=reverse is not None and reverse.is_true(), comparator=comparator_caller
+            )
+        except RecursionError as e:
+            return result.failure(RTRecursionError(
+                list_.pos_start, list_.pos_end, str(e), exec_ctx,
+                "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_sort"
+            ))
 
     builtin_functions["sort"] = {
         "function": execute_sort,
         "param_names": ["list_"],
-        "optional_params": ["mode"],
+        "optional_params": ["mode", "key", "reverse", "comparator"],
         "should_respect_args_number": True,
         "run_noug_dir": False,
         "noug_dir": False
@@ -1889,7 +3066,8 @@ class BuiltInFunction(BaseBuiltInFunction):
             ))
 
         if isinstance(list_or_str, List):
-            list_or_str.elements.reverse()
+            list_or_str.storage.items.reverse()
+            list_or_str.storage.changed()
         elif isinstance(list_or_str, String):
             temp_list = list(list_or_str.value)
             temp_list.reverse()
@@ -14,6 +14,7 @@ from __future__ import annotations
 from src.lexer.position import Position, DEFAULT_POSITION
 from src.parser.nodes import Node
 from src.runtime.values.functions.base_function import BaseFunction
+from src.runtime.values.functions.generator import Generator, GeneratorFrame, find_yielding_nodes
 from src.runtime.values.basevalues.value import Value
 from src.runtime.values.basevalues.basevalues import NoneValue, String, List, Number
 from src.runtime.runtime_result import RTResult
@@ -30,12 +31,17 @@ if TYPE_CHECKING:
 class Function(BaseFunction):
     def __init__(self, name: str | None, body_node: Node, param_names: list[str], should_auto_return: bool,
                  pos_start: Position, pos_end: Position, call_with_module_context: bool = False,
-                 optional_params: list[tuple[str, Value | None]] | None = None):
+                 optional_params: list[tuple[str, Value | None]] | None = None, is_generator: bool = False,
+                 yielding_nodes: frozenset[int] | None = None):
         super().__init__(name, pos_start, pos_end, call_with_module_context)
         self.body_node = body_node
         self.param_names = param_names
         self.optional_params = optional_params
         self.should_auto_return = should_auto_return
+        self.is_generator = is_generator  # the body contains `yield`: calling the function returns a Generator
+        if is_generator and yielding_nodes is None:
+            yielding_nodes = find_yielding_nodes(body_node)
+        self.yielding_nodes = yielding_nodes  # the nodes of the body that contain `yield` (see `Interpreter.iter_visit`)
 
     def __repr__(self):
         return f'<function {self.name}>'
@@ -64,8 +70,6 @@ class Function(BaseFunction):
         if work_dir is None:
             work_dir = noug_dir
         # execute the function
-        # create the result
-        result = RTResult()
         if cli_args is None:
             cli_args = []
 
@@ -74,6 +78,12 @@ class Function(BaseFunction):
 
         if use_context is not None:
             self.context = use_context
+        return self.call(args, interpreter, exec_from, cli_args)
+
+    def call(self, args: list[Value], interpreter: Interpreter, exec_from: str, cli_args: list[String]) -> RTResult:
+        """Runs the function with an existing interpreter. Built-in functions that call a function on every element of
+        a list (like `map`) create the interpreter once and call this method directly."""
+        result = RTResult()
         # generate the context and update symbol table
         exec_context = self.generate_new_context(True)
         assert exec_context.symbol_table is not None
@@ -93,6 +103,19 @@ class Function(BaseFunction):
         if result.should_return():
             return result
 
+        if self.is_generator:  # the body is run when the values of the generator are asked for
+            # the body needs its own interpreter, that knows the nodes of the body that contain `yield`, as `interpreter`
+            # is shared with the caller and with the other generators
+            body_interpreter = type(interpreter)(
+                interpreter.run, interpreter.noug_dir, interpreter.args, interpreter.work_dir, interpreter.lexer_metas,
+                interpreter.file_name
+            )
+            assert self.yielding_nodes is not None
+            body_interpreter.yielding_nodes = self.yielding_nodes
+            frame = GeneratorFrame(self.body_node, body_interpreter, exec_context)
+            generator = Generator(self.name, frame, self.pos_start, self.pos_end).set_context(self.context)
+            return result.success(generator)
+
         # run the body node with the interpreter and check for errors
         value = result.register(interpreter.visit(self.body_node, exec_context, methods_instead_of_funcs=False))
         if result.should_return() and result.function_return_value is None:
@@ -119,7 +142,9 @@ class Function(BaseFunction):
             self.pos_start,
             self.pos_end,
             self.call_with_module_context,
-            self.optional_params
+            self.optional_params,
+            self.is_generator,
+            self.yielding_nodes
         )
         copy.module_context = self.module_context
         copy.set_context(self.context)
@@ -131,10 +156,11 @@ class Method(Function):
     """Parent class for methods (functions in classes)"""
     def __init__(self, name: str | None, body_node: Node, param_names: list[str], should_auto_return: bool,
                  pos_start: Position, pos_end: Position, call_with_module_context: bool = False,
-                 optional_params: list[tuple[str, Value | None]] | None = None):
+                 optional_params: list[tuple[str, Value | None]] | None = None, is_generator: bool = False,
+                 yielding_nodes: frozenset[int] | None = None):
         super().__init__(
             name, body_node, param_names, should_auto_return, pos_start, pos_end, call_with_module_context,
-            optional_params=optional_params
+            optional_params=optional_params, is_generator=is_generator, yielding_nodes=yielding_nodes
         )
         self.type_ = "method"
         self.object_: Value | None = None
@@ -147,7 +173,7 @@ class Method(Function):
         copy = Method(
             self.name, self.body_node, self.param_names, self.should_auto_return,
             self.pos_start, self.pos_end, self.call_with_module_context,
-            optional_params=self.optional_params)
+            optional_params=self.optional_params, is_generator=self.is_generator, yielding_nodes=self.yielding_nodes)
         copy.object_ = self.object_
         copy.module_context = self.module_context
         copy.set_context(self.context)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Generators are returned by the functions that contain `yield`. The body of the function is run by its own
+interpreter as a resumable frame (see `Interpreter.iter_visit`): the nodes that contain `yield` are visited by python
+generators, so the body is paused at every `yield` with its loops and conditions where they are, until the next value
+is asked for. Everything runs in the thread of the program.
+
+A paused body is only referred to by its generator value: it is freed with the last copy of the generator, by
+reference counting or by the garbage collector if the generator is stored in a variable that its own body can access
+(e.g. a local variable of the function that called the generator function, as functions see the variables of their
+caller)."""
+
+# IMPORTS
+# __future__ import (must be first)
+from __future__ import annotations
+# nougaro modules imports
+from src.lexer.position import Position
+from src.parser.nodes import Node, FuncDefNode, YieldNode
+from src.runtime.values.basevalues.value import Value
+from src.runtime.values.basevalues.basevalues import List, Number, String
+from src.runtime.runtime_result import RTResult
+from src.runtime.context import Context
+from src.errors.errors import RunTimeError
+# built-in python imports
+from typing import Iterator
+# special typing imports
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.runtime.interpreter import Interpreter
+
+
+def find_yielding_nodes(node: Node) -> frozenset[int]:
+    """Returns the ids of the nodes of a function body that contain a `yield` statement of this function (the `yield`
+    nodes included). The bodies of the functions defined in the body are not looked in."""
+    yielding_nodes: set[int] = set()
+
+    def contains_yield(node_: Node) -> bool:
+        if isinstance(node_, FuncDefNode):
+            return False
+        found = isinstance(node_, YieldNode)
+        for cls in type(node_).__mro__:
+            for attr in getattr(cls, '__slots__', ()):
+                child = getattr(node_, attr, None)
+                children = child if isinstance(child, (list, tuple)) else (child,)
+                for element in children:
+                    # elements of ListNodes and cases of IfNodes are tuples of nodes
+                    for sub_element in element if isinstance(element, tuple) else (element,):
+                        if isinstance(sub_element, Node) and contains_yield(sub_element):
+                            found = True
+        if found:
+            yielding_nodes.add(id(node_))
+        return found
+
+    contains_yield(node)
+    return frozenset(yielding_nodes)
+
+
+class GeneratorFrame:
+    """The body of a generator, paused at its last `yield`. Shared by a generator value and its copies."""
+    def __init__(self, body_node: Node, interpreter: Interpreter, exec_context: Context):
+        self.body = interpreter.iter_visit(body_node, exec_context, methods_instead_of_funcs=False)
+        self.running = False
+        self.finished = False
+
+    def next_(self) -> tuple[Value | None, RunTimeError | None]:
+        """Runs the body until the next `yield`. Returns (value, None), (None, error) or (None, None) if the generator
+        is over."""
+        if self.finished:
+            return None, None
+        self.running = True
+        try:
+            return next(self.body), None
+        except StopIteration as e:  # the body ended: its RTResult is the value of the exception
+            self.finished = True
+            result: RTResult = e.value
+            return None, result.error
+        except BaseException:  # e.g. KeyboardInterrupt: the body can not be resumed where it was
+            self.finished = True
+            raise
+        finally:
+            self.running = False
+
+
+class Generator(Value):
+    def __init__(self, name: str, frame: GeneratorFrame, pos_start: Position, pos_end: Position):
+        super().__init__(pos_start, pos_end)
+        self.name = name
+        self.frame = frame
+        self.type_ = 'generator'
+        self.error: RunTimeError | None = None  # error of the last iteration, see `iterate`
+
+    def __repr__(self):
+        return f'<generator {self.name}>'
+
+    def to_python_str(self) -> str:
+        return self.__repr__()
+
+    def iterate(self) -> Iterator[Value]:
+        """Yields the values of the generator, from where it was paused. If the body of the generator fails, the
+        iteration stops and the error is put in `self.error`."""
+        self.error = None
+        while True:
+            if self.frame.running:  # e.g. the body of the generator iterates over the generator itself
+                assert self.context is not None
+                self.error = RunTimeError(
+                    self.pos_start, self.pos_end, f"generator '{self.name}' is already running.", self.context,
+                    origin_file="src.runtime.values.functions.generator.Generator.iterate"
+                )
+                return
+            value, error = self.frame.next_()
+            if error is not None:
+                self.error = error
+                return
+            if value is None:
+                return
+            yield value
+
+    def to_str(self):
+        return String(self.__repr__(), self.pos_start, self.pos_end).set_context(self.context), None
+
+    def to_list(self):
+        elements: list[Value] = list(self.iterate())
+        if self.error is not None:
+            return None, RTResult().failure(self.error)
+        return List(elements, self.pos_start, self.pos_end).set_context(self.context), None
+
+    def is_same_generator(self, other: Value) -> bool:
+        """Returns True if `other` is this generator or a copy of it"""
+        return isinstance(other, Generator) and other.frame is self.frame
+
+    def get_comparison_eq(self, other: Value):
+        return Number(self.is_same_generator(other), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        return Number(not self.is_same_generator(other), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def is_true(self):
+        return True
+
+    def copy(self):
+        """Return a copy of self (sharing the same state)"""
+        copy = Generator(self.name, self.frame, self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Memoized functions are returned by `memoize(func, maxsize?)`. They remember the values returned by `func` for the
+arguments they were called with. The arguments are compared like the keys of a dict (see `hash_key`).
+The remembered values are not copied when they are returned (like with python's `functools.lru_cache`): a list
+returned by a memoized function is shared by the calls with the same arguments."""
+
+# IMPORTS
+# __future__ import (must be first)
+from __future__ import annotations
+# nougaro modules imports
+from src.lexer.position import Position
+from src.runtime.values.basevalues.value import Value
+from src.runtime.values.basevalues.basevalues import Number, String, hash_key
+from src.runtime.values.functions.base_function import BaseFunction
+from src.runtime.runtime_result import RTResult
+from src.runtime.context import Context
+from src.errors.errors import RTTypeError
+from src.misc import RunFunction
+# built-in python imports
+from typing import Hashable
+import collections
+# special typing imports
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.runtime.interpreter import Interpreter
+
+
+class MemoCache:
+    """The values returned by a memoized function, from the least to the most recently used. It is shared by the copies
+    of the function value."""
+    def __init__(self, maxsize: int | None):
+        self.entries: collections.OrderedDict[Hashable, Value] = collections.OrderedDict()
+        self.maxsize = maxsize  # None if the cache is not bounded
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Value | None:
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Value):
+        if self.maxsize == 0:
+            return
+        self.entries[key] = value
+        if self.maxsize is not None and len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)  # the least recently used value
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class MemoizedFunction(BaseFunction):
+    def __init__(self, function: BaseFunction, cache: MemoCache, pos_start: Position, pos_end: Position):
+        super().__init__(function.name, pos_start, pos_end)
+        self.function = function
+        self.cache = cache
+
+    def __repr__(self):
+        return f'<memoized {self.function.__repr__()[1:]}'
+
+    def to_python_str(self):
+        return self.__repr__()
+
+    def is_eq(self, other: Value):
+        return isinstance(other, MemoizedFunction) and self.cache is other.cache
+
+    def get_comparison_eq(self, other: Value):
+        return Number(self.is_eq(other), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        return Number(not self.is_eq(other), self.pos_start, other.pos_end).set_context(self.context), None
+
+    def execute(self, args: list[Value], interpreter_: type[Interpreter], run: RunFunction,
+                noug_dir: str, lexer_metas: dict[str, str | bool], exec_from: str = "<invalid>",
+                use_context: Context | None = None, cli_args: list[String] | None = None,
+                work_dir: str | None = None):
+        result = RTResult()
+        keys: list[Hashable] = []
+        for arg in args:
+            key = hash_key(arg)
+            if key is None:
+                assert self.context is not None
+                return result.failure(RTTypeError(
+                    arg.pos_start, arg.pos_end,
+                    f"{arg.type_} can not be an argument of the memoized function '{self.name}'.", self.context,
+                    origin_file="src.runtime.values.functions.memoized_function.MemoizedFunction.execute"
+                ))
+            keys.append(key)
+        cache_key = tuple(keys)
+
+        value = self.cache.get(cache_key)
+        if value is not None:
+            return result.success(value.copy())
+
+        if self.function.call_with_module_context:
+            use_context = self.function.module_context
+        value = result.register(self.function.execute(
+            args, interpreter_, run, noug_dir, lexer_metas, exec_from, use_context, cli_args, work_dir
+        ))
+        if result.should_return():  # errors are not remembered
+            return result
+        assert value is not None
+        self.cache.set(cache_key, value)
+        return result.success(value.copy())
+
+    def copy(self):
+        """Return a copy of self (sharing the same cache)"""
+        copy = MemoizedFunction(self.function, self.cache, self.pos_start, self.pos_end)
+        copy.module_context = self.module_context
+        copy.set_context(self.context)
+        copy.attributes = self.attributes.copy()
+        return copy
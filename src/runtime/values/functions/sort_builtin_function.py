@@ -13,15 +13,83 @@ from src.lexer.position import Position, DEFAULT_POSITION
 from src.runtime.context import Context
 from src.runtime.values.basevalues.value import Value
 from src.runtime.runtime_result import RTResult
-from src.runtime.values.basevalues.basevalues import List, Number, String
+from src.runtime.values.basevalues.basevalues import List, Number, String, ListStorage
 from src.errors.errors import RTTypeError, RunTimeError
-from src.runtime.values.tools.py2noug import noug2py
 # built-in python imports
-from typing import Coroutine, Any
+from typing import Coroutine, Any, Callable
+import functools
 import sys
 import random  # for bogosort
 
 
+class _ComparatorError(Exception):
+    """Raised to stop sorting when the comparator fails"""
+    def __init__(self, error: RunTimeError):
+        super().__init__()
+        self.error = error
+
+
+def _sort_key(value: Value) -> Any:
+    """Returns the python value used to sort `value`: numbers and strs are unboxed, lists become tuples. Other values
+    are returned as is (they can not be compared, so sorting a list of them fails if it has more than one element)."""
+    if isinstance(value, Number) or isinstance(value, String):
+        return value.value
+    if isinstance(value, List):
+        if value.storage.strategy is not None:
+            return tuple(value.storage.items)
+        return tuple(map(_sort_key, value.storage.items))
+    return value
+
+
+def _timsort(list_: List, result: RTResult, exec_ctx: Context, key: Callable[[list[Value]], RTResult] | None,
+             reverse: bool, comparator: Callable[[list[Value]], RTResult] | None) -> list[Value] | None:
+    """Sorts with the python sort algorithm (stable). The key function is called once per element, and its results
+    are unboxed (see `_sort_key`) before sorting. Returns None if there is an error (it is then registered in
+    `result`)."""
+    values: list[Value] = list(list_.iter_values())
+    if comparator is not None:
+        def compare(value: Value, other: Value) -> int | float:
+            comparison = result.register(comparator([value, other]))
+            if result.should_return():
+                assert result.error is not None
+                raise _ComparatorError(result.error)
+            if not isinstance(comparison, Number):
+                assert comparison is not None
+                raise _ComparatorError(RTTypeError(
+                    comparison.pos_start, comparison.pos_end,
+                    f"the comparator of ‘sort’ must return a number, but returned {comparison.type_}.", exec_ctx,
+                    origin_file="src.runtime.values.functions.sort_builtin_function._timsort"
+                ))
+            return comparison.value
+
+        try:
+            return sorted(values, key=functools.cmp_to_key(compare), reverse=reverse)
+        except _ComparatorError as e:
+            result.failure(e.error)
+            return None
+
+    if key is None:
+        keys = list(map(_sort_key, values))
+    else:
+        keys = []
+        for value in values:
+            key_value = result.register(key([value]))
+            if result.should_return():
+                return None
+            assert key_value is not None
+            keys.append(_sort_key(key_value))
+    try:
+        order = sorted(range(len(values)), key=keys.__getitem__, reverse=reverse)
+    except TypeError as e:
+        result.failure(RTTypeError(
+            list_.pos_start, list_.pos_end,
+            str(e), exec_ctx,
+            origin_file="src.runtime.values.functions.sort_builtin_function.sort"
+        ))
+        return None
+    return [values[i] for i in order]
+
+
 def _get_comparison_gt(list_to_sort_: list[Value], index_: int) -> tuple[Number, None] | tuple[None, RunTimeError]:
     if index_ + 1 < len(list_to_sort_):
         comp, error_ = list_to_sort_[index_].get_comparison_gt(list_to_sort_[index_ + 1])
@@ -82,20 +150,32 @@ def _slow_sort(list_to_sort: list[Value], start_idx: int, end_idx: int,
 
 def sort(
         list_: List, mode_noug: String, result: RTResult, exec_ctx: Context,
-        pos_start: Position, pos_end: Position
+        pos_start: Position, pos_end: Position, key: Callable[[list[Value]], RTResult] | None = None,
+        reverse: bool = False, comparator: Callable[[list[Value]], RTResult] | None = None
 ) -> RTResult:
+    """`key` and `comparator` call a nougaro function with a list of arguments (see BuiltInFunction._caller). They
+    can only be used in timsort mode."""
     mode = mode_noug.value
-    list_to_sort: list[Value] = list_.elements
+    if mode != "timsort" and (key is not None or comparator is not None):
+        return result.failure(RunTimeError(
+            mode_noug.pos_start, mode_noug.pos_end,
+            "a key function or a comparator can only be used with the 'timsort' mode.",
+            exec_ctx, origin_file="src.runtime.values.functions.sort_builtin_function.sort"
+        ))
+    if mode == "timsort" and list_.storage.strategy is not None and key is None and comparator is None:
+        # only numbers or only strs: they are sorted unboxed
+        sorted_list = List([], pos_start, pos_end)
+        sorted_list.storage = ListStorage(list_.storage.strategy, sorted(list_.storage.items, reverse=reverse))
+        return result.success(sorted_list)
+
     if mode == "timsort":  # default python sort algorithm
-        try:
-            sorted_ = sorted(list_to_sort, key=lambda val: noug2py(val, False))
-        except TypeError as e:
-            return result.failure(RTTypeError(
-                list_.pos_start, list_.pos_end,
-                str(e), exec_ctx,
-                origin_file="src.runtime.values.functions.sort_builtin_function.sort"
-            ))
-    elif mode == "stalin":  # stalin sort
+        sorted_ = _timsort(list_, result, exec_ctx, key, reverse, comparator)
+        if sorted_ is None:
+            return result
+        return result.success(List(sorted_, pos_start, pos_end))
+
+    list_to_sort: list[Value] = list(list_.iter_values())
+    if mode == "stalin":  # stalin sort
         sorted_ = _true_list_copy(list_to_sort)
         for i in range(len(sorted_)):
             if i == len(sorted_):
@@ -207,4 +287,6 @@ def sort(
             exec_ctx, origin_file="src.runtime.values.functions.sort_builtin_function.sort"
         ))
 
+    if reverse:
+        sorted_.reverse()
     return result.success(List(sorted_, pos_start, pos_end))
@@ -10,86 +10,234 @@
 # IMPORTS
 # nougaro modules imports
 from src.lexer.position import Position as _Position, DEFAULT_POSITION
-from src.misc import is_num
-from src.runtime.values.basevalues.basevalues import String, Number, List, Value, NoneValue
+from src.runtime.values.basevalues.basevalues import String, Number, List, Value, NoneValue, Dict, Set, Array, Range
+from src.runtime.values.basevalues.basevalues import Deque, ListStorage, hash_key
 # built-in python imports
-from typing import Any
+from typing import Any, Iterator
+import array
+import collections
+import contextlib
+import gc
+import itertools
+
+
+# The conversions below are iterative, so that deeply nested values do not reach the recursion limit of python. A
+# mutable container that appears several times in the converted value (or that contains itself) is converted once:
+# the converted values share it, like the original ones. Python tuples and frozensets become mutable nougaro lists and
+# sets, so every occurrence of them is converted on its own: sharing them would link values that are not linked in
+# python. The containers are converted after their elements, so that the
+# elements are complete when they are put in a dict or a set.
+
+# the positions of the values converted by py2noug when no positions are given
+_POS_START = DEFAULT_POSITION.copy()
+_POS_END = DEFAULT_POSITION.copy()
+_NUMBER_TYPES = {int, float, bool}
+
+
+@contextlib.contextmanager
+def _gc_paused():
+    """Pauses the cyclic garbage collector of python while a container is converted. The conversion creates a lot of
+    objects and no garbage: the collections triggered by these allocations would go through the whole converted value
+    again and again for nothing."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _py2noug_leaf(value: Any, pos_start: _Position, pos_end: _Position) -> Value | None:
+    """Converts a python value that does not contain other values. Returns None if `value` is a container (a list, a
+    tuple, a dict, a set or a deque)."""
+    type_ = type(value)
+    if type_ is str:
+        return String(value, pos_start, pos_end)
+    if type_ is int or type_ is float or type_ is bool:
+        return Number(value, pos_start, pos_end)
+    if value is None:
+        return NoneValue(pos_start, pos_end)
+    if isinstance(value, Value):
+        return value
+    if isinstance(value, str):
+        return String(value, pos_start, pos_end)
+    if isinstance(value, int) or isinstance(value, float):
+        return Number(value, pos_start, pos_end)
+    if isinstance(value, list) or isinstance(value, tuple) or isinstance(value, dict) or isinstance(value, set) \
+            or isinstance(value, frozenset) or isinstance(value, collections.deque):
+        return None
+    if isinstance(value, array.array) and value.typecode in ('q', 'd'):
+        return Array(value, pos_start, pos_end)
+    if isinstance(value, range):
+        return Range(value, pos_start, pos_end)
+    return Value(pos_start, pos_end)  # we just return a base value if there is no equivalent...
+
+
+def _new_noug_container(value: Any, pos_start: _Position, pos_end: _Position) -> tuple[Value, bool]:
+    """Returns the nougaro container that will contain the elements of the python container `value`, and True if it
+    already contains them: the numbers or the strs of a list are stored unboxed (see ListStorage) without converting
+    them one by one."""
+    if isinstance(value, list) or isinstance(value, tuple):
+        new_list = List([], pos_start, pos_end)
+        if len(value) != 0:
+            types = set(map(type, value))
+            if types <= _NUMBER_TYPES:
+                new_list.storage = ListStorage(Number, list(value))
+                return new_list, True
+            if len(types) == 1 and str in types:
+                new_list.storage = ListStorage(String, list(value))
+                return new_list, True
+        return new_list, len(value) == 0
+    if isinstance(value, dict):
+        return Dict({}, pos_start, pos_end), len(value) == 0
+    if isinstance(value, set) or isinstance(value, frozenset):
+        return Set({}, pos_start, pos_end), len(value) == 0
+    return Deque(collections.deque(), pos_start, pos_end), len(value) == 0
+
+
+def _fill_noug_container(container: Value, elements: list[Value]) -> Value:
+    """Puts the converted elements of a python container in the nougaro container created by `_new_noug_container`.
+    The elements of a dict are its keys and values, one after the other. Returns the container, or a base value if an
+    element can not be a key of a nougaro dict or set."""
+    if isinstance(container, List):
+        container.storage = ListStorage.from_values(elements)
+        container.update_should_print()
+    elif isinstance(container, Dict):
+        for i in range(0, len(elements), 2):
+            key = hash_key(elements[i])
+            if key is None:  # the key is not hashable in Nougaro
+                return Value(container.pos_start, container.pos_end)
+            container.entries[key] = (elements[i], elements[i + 1])
+    elif isinstance(container, Set):
+        for element in elements:
+            key = hash_key(element)
+            if key is None:  # the element is not hashable in Nougaro
+                return Value(container.pos_start, container.pos_end)
+            if key not in container.elements:
+                container.elements[key] = element
+    else:
+        assert isinstance(container, Deque)
+        container.elements.extend(elements)
+    return container
+
+
+def _is_mutable(container: Any) -> bool:
+    """Returns False if `container` is a tuple or a frozenset (see the comment at the top of this file)"""
+    return not (isinstance(container, tuple) or isinstance(container, frozenset))
+
+
+def _py_elements(value: Any) -> Iterator[Any]:
+    """Iterates over the elements of a python container (the keys and the values of a dict, one after the other)"""
+    if isinstance(value, dict):
+        return itertools.chain.from_iterable(value.items())
+    return iter(value)
 
 
 # This next line should be uncommented when the project (fully) switches to
 # python 3.12, and the type of the "value" argument in the "py2noug" function
 # should be defined as "val"
 # (TODO)
-# type val = Value | str | int | float | bool | list[val] | dict[val, val] | tuple[val, ...] | None
+# type val = Value | str | int | float | bool | list[val] | dict[val, val] | tuple[val, ...] | set[val] | None
 def py2noug(
-        value: Value | str | int | float | bool | list[Any] | dict[Any, Any] | tuple[Any, ...] | None,
-        pos_start: _Position, pos_end: _Position
+        value: Value | str | int | float | bool | list[Any] | dict[Any, Any] | tuple[Any, ...] | set[Any] | None,
+        pos_start: _Position | None = None, pos_end: _Position | None = None
 ) -> Value:
-    """Converts python values to nougaro ones"""
-    if isinstance(value, Value):
-        return value
-    elif isinstance(value, str):
-        return String(value, pos_start, pos_end)
-    elif is_num(value):
-        # sometimes, type checking strict is very dumb
-        assert isinstance(value, int) or isinstance(value, float)
-        return Number(value, pos_start, pos_end)
-    elif isinstance(value, bool):
-        return Number(value, pos_start, pos_end)
-    elif isinstance(value, list) or isinstance(value, tuple):
-        list_ = list(value)  # we want a list instead of a tuple
-        new_list: list[Value] = []
-        for elt in list_:
-            new_list.append(py2noug(elt, pos_start, pos_end))
-        return List(new_list, pos_start, pos_end)
-    elif isinstance(value, dict):
-        list_ = list(value.items())
-        new_list: list[Value] = []
-        for elt in list_:
-            new_list.append(py2noug(elt, pos_start, pos_end))
-        return List(new_list, pos_start, pos_end)
-    elif value is None:
-        return NoneValue(pos_start, pos_end)
-    else:
-        return Value(pos_start, pos_end)  # we just return a base value if there is no equivalent...
-
-
-# todo: move this to unittests
-_list1: Value = List(
-    [
-        String("a", DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()),
-        List([
-            String("b", DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()),
-            Number(12, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
-            ], DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
-    ], DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()
-)
-_list2: Value = List(
-    [Number(13, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()),
-     String("c", DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
-    ], DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()
-)
-_list_to_comp_with: list[Value] = [
-    _list1,
-    _list2
-]
-
-_test_, _err = py2noug(
-    {"a": ["b", 12], 13: "c"}, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()
-).get_comparison_eq(
-    List(_list_to_comp_with, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
-)
-assert _test_ is not None
-assert _test_.is_true()
-assert _err is None
+    """Converts python values to nougaro ones. All the converted values have the same positions."""
+    if pos_start is None:
+        pos_start = _POS_START
+    if pos_end is None:
+        pos_end = _POS_END
+    leaf = _py2noug_leaf(value, pos_start, pos_end)
+    if leaf is not None:
+        return leaf
 
+    root, complete = _new_noug_container(value, pos_start, pos_end)
+    if complete:
+        return root
+    with _gc_paused():
+        return _py2noug_containers(value, root, pos_start, pos_end)
 
-def noug2py(value: Value, none_instead_of_raw_value: bool = True) -> Any:
-    """Converts nougaro values to python ones."""
+
+def _py2noug_containers(value: Any, root: Value, pos_start: _Position, pos_end: _Position) -> Value:
+    """Converts the python container `value` and what it contains. `root` is the result of `_new_noug_container`."""
+    # id of a mutable python container -> its nougaro container
+    converted: dict[int, Value] = {id(value): root} if _is_mutable(value) else {}
+    # the containers being converted: (python container, nougaro container, remaining elements, converted elements)
+    stack: list[tuple[Any, Value, Iterator[Any], list[Value]]] = [(value, root, _py_elements(value), [])]
+    while True:
+        python_container, container, elements, new_elements = stack[-1]
+        for element in elements:
+            type_ = type(element)
+            if type_ is str:
+                new_element: Value | None = String(element, pos_start, pos_end)
+            elif type_ is int or type_ is float:
+                new_element = Number(element, pos_start, pos_end)
+            elif type_ is list or type_ is tuple or type_ is dict:
+                new_element = None
+            else:
+                new_element = _py2noug_leaf(element, pos_start, pos_end)
+            if new_element is None:  # a container
+                new_element = converted.get(id(element))
+                if new_element is None:
+                    new_element, complete = _new_noug_container(element, pos_start, pos_end)
+                    if _is_mutable(element):
+                        converted[id(element)] = new_element
+                    if not complete:  # its elements are converted before the next elements of `python_container`
+                        stack.append((element, new_element, _py_elements(element), []))
+                        break
+            new_elements.append(new_element)
+        else:  # all the elements of `python_container` are converted
+            stack.pop()
+            container = _fill_noug_container(container, new_elements)
+            if _is_mutable(python_container):
+                converted[id(python_container)] = container
+            if len(stack) == 0:
+                return container
+            stack[-1][3].append(container)
+
+
+def _freeze(list_: list[Any]) -> tuple[Any, ...]:
+    """Converts a python list (and the lists it contains) to a tuple"""
+    frozen: dict[int, tuple[Any, ...]] = {}  # id of a list -> its tuple
+    stack: list[tuple[list[Any], Iterator[Any], list[Any]]] = [(list_, iter(list_), [])]
+    in_stack = {id(list_)}
+    while True:
+        current, elements, new_elements = stack[-1]
+        for element in elements:
+            if isinstance(element, list):
+                if id(element) in frozen:
+                    element = frozen[id(element)]
+                elif id(element) in in_stack:
+                    raise ValueError("a list that contains itself can not be converted to a tuple")
+                else:
+                    stack.append((element, iter(element), []))
+                    in_stack.add(id(element))
+                    break
+            new_elements.append(element)
+        else:
+            stack.pop()
+            in_stack.remove(id(current))
+            tuple_ = frozen[id(current)] = tuple(new_elements)
+            if len(stack) == 0:
+                return tuple_
+            stack[-1][2].append(tuple_)
+
+
+_CONTAINER = object()  # returned by _noug2py_leaf for the containers
+
+
+def _noug2py_leaf(value: Value, none_instead_of_raw_value: bool) -> Any:
+    """Converts a nougaro value that does not contain other values. Returns _CONTAINER if `value` is a container (a
+    list that is not unboxed, a dict, a set or a deque)."""
     if isinstance(value, String) or isinstance(value, Number):
         return value.value
-    elif isinstance(value, List):
-        return [noug2py(e) for e in value.elements]
+    elif isinstance(value, List) or isinstance(value, Dict) or isinstance(value, Set) or isinstance(value, Deque):
+        return _CONTAINER
+    elif isinstance(value, Array):
+        return value.data.tolist()
+    elif isinstance(value, Range):
+        return list(value.range_)
     elif isinstance(value, NoneValue):
         return None
     else:
@@ -97,3 +245,86 @@ def noug2py(value: Value, none_instead_of_raw_value: bool = True) -> Any:
             return None
         else:
             return value
+
+
+def _new_py_container(value: Value) -> tuple[Any, Iterator[Value] | None]:
+    """Returns the python container that will contain the elements of a nougaro container, and an iterator over the
+    elements (the keys and the values of a dict, one after the other), or None if it already contains them."""
+    if isinstance(value, List):
+        if value.storage.strategy is not None:  # the python values are already there
+            return value.storage.items.copy(), None
+        return [], iter(value.storage.items)
+    if isinstance(value, Dict):
+        return {}, itertools.chain.from_iterable(value.entries.values())
+    if isinstance(value, Set):
+        return set(), iter(value.elements.values())
+    assert isinstance(value, Deque)
+    return collections.deque(), iter(value.elements)
+
+
+def _fill_py_container(container: Any, elements: list[Any]):
+    """Puts the converted elements of a nougaro container in the python container created by `_new_py_container`"""
+    if isinstance(container, list) or isinstance(container, collections.deque):
+        container.extend(elements)
+    elif isinstance(container, dict):
+        for i in range(0, len(elements), 2):
+            key = elements[i]
+            if isinstance(key, list):  # lists are not hashable in python
+                key = _freeze(key)
+            container[key] = elements[i + 1]
+    else:
+        for element in elements:
+            if isinstance(element, list):  # lists are not hashable in python
+                element = _freeze(element)
+            container.add(element)
+
+
+def _identity(value: Value) -> int:
+    """The lists that share their storage are the same list: they are converted once"""
+    return id(value.storage) if isinstance(value, List) else id(value)
+
+
+def noug2py(value: Value, none_instead_of_raw_value: bool = True) -> Any:
+    """Converts nougaro values to python ones."""
+    leaf = _noug2py_leaf(value, none_instead_of_raw_value)
+    if leaf is not _CONTAINER:
+        return leaf
+
+    root, elements = _new_py_container(value)
+    if elements is None:
+        return root
+    with _gc_paused():
+        return _noug2py_containers(value, root, elements)
+
+
+def _noug2py_containers(value: Value, root: Any, elements: Iterator[Value]) -> Any:
+    """Converts the nougaro container `value` and what it contains. `root` and `elements` are the result of
+    `_new_py_container`."""
+    converted: dict[int, Any] = {_identity(value): root}  # identity of a nougaro container -> its python container
+    # the containers being converted: (python container, remaining elements, converted elements)
+    stack: list[tuple[Any, Iterator[Value], list[Any]]] = [(root, elements, [])]
+    while True:
+        container, elements, new_elements = stack[-1]
+        for element in elements:
+            type_ = type(element)
+            if type_ is Number or type_ is String:
+                new_elements.append(element.value)
+                continue
+            new_element = _noug2py_leaf(element, True)
+            if new_element is _CONTAINER:
+                identity = _identity(element)
+                if identity in converted:
+                    new_element = converted[identity]
+                else:
+                    new_element, element_elements = _new_py_container(element)
+                    converted[identity] = new_element
+                    if element_elements is not None:
+                        stack.append((new_element, element_elements, []))
+                        break
+            new_elements.append(new_element)
+        else:  # all the elements of `container` are converted
+            stack.pop()
+            _fill_py_container(container, new_elements)
+            if len(stack) == 0:
+                return container
+            stack[-1][2].append(container)
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Nougaro server: a warm interpreter listening on a Unix socket (`nougaro --server`).
+
+The server process imports the interpreter once. Every request is then run in a forked child, which starts from the
+pre-warmed state of the server (default symbol table, imported modules, config) but can not modify it. The child runs
+the arguments sent by the client exactly as `shell.py` would, and its stdout and stderr are sent back to the client.
+
+As a request runs code as the user that runs the server, only this user can use it: the socket is created in a
+directory that only this user can access ($XDG_RUNTIME_DIR, or a `nougaro-<uid>` directory in the temporary directory),
+it can only be read and written by this user, and the server refuses the connections of the other users. The client
+also refuses to talk to a server run by another user.
+
+This module only uses the python standard library, so that the client (client.py) stays fast to start.
+
+Protocol: the client sends one JSON line {"argv": [...], "cwd": "..."}. The server answers with frames made of a one-byte
+type, a 4-bytes big endian length, and the data: OUTPUT_FRAME frames contain raw output bytes, and the last frame is an
+EXIT_FRAME containing the exit code of the request (4-bytes big endian signed integer)."""
+
+# IMPORTS
+# nougaro modules imports
+# built-in python imports
+from typing import Callable, BinaryIO
+import json
+import os
+import signal
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import threading
+import traceback
+
+# ##########
+# CONSTANTS
+# ##########
+OUTPUT_FRAME = b"o"
+EXIT_FRAME = b"x"
+HEADER_SIZE = 5
+READ_SIZE = 65536
+if os.environ.get("XDG_RUNTIME_DIR"):  # a directory that only the user can access
+    DEFAULT_SOCKET_PATH = os.path.join(os.environ["XDG_RUNTIME_DIR"], "nougaro.sock")
+elif hasattr(os, "getuid"):  # created by the server, see `serve`
+    DEFAULT_SOCKET_PATH = os.path.join(tempfile.gettempdir(), f"nougaro-{os.getuid()}", "nougaro.sock")
+else:
+    DEFAULT_SOCKET_PATH = os.path.join(tempfile.gettempdir(), "nougaro", "nougaro.sock")
+
+
+# ##########
+# TOOLS
+# ##########
+def is_available() -> bool:
+    """Returns True if the server can run on this system (it needs Unix sockets, fork and the credentials of the
+    processes that connect to a socket)"""
+    return hasattr(socket, "AF_UNIX") and hasattr(os, "fork") and \
+        (hasattr(socket, "SO_PEERCRED") or hasattr(socket, "LOCAL_PEERCRED"))
+
+
+def peer_uid(connection: socket.socket) -> int:
+    """Returns the uid of the process at the other end of a connected Unix socket"""
+    if hasattr(socket, "SO_PEERCRED"):  # Linux: struct ucred {pid, uid, gid}
+        credentials = connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+        return struct.unpack("3i", credentials)[1]
+    # macOS and BSDs: struct xucred {version, uid, number of groups, groups}, at the SOL_LOCAL (0) level
+    credentials = connection.getsockopt(0, socket.LOCAL_PEERCRED, struct.calcsize("2Ih16I"))
+    return struct.unpack_from("2I", credentials)[1]
+
+
+def make_private_directory(directory: str):
+    """Creates `directory` if it does not exist. Raises PermissionError if it is not a directory that only the user
+    can access."""
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    directory_stat = os.lstat(directory)
+    if not stat.S_ISDIR(directory_stat.st_mode) or directory_stat.st_uid != os.getuid() \
+            or stat.S_IMODE(directory_stat.st_mode) & 0o077 != 0:
+        raise PermissionError(f"'{directory}' should be a directory that only you can access")
+
+
+def _frame(frame_type: bytes, data: bytes) -> bytes:
+    return frame_type + len(data).to_bytes(4, "big") + data
+
+
+def _receive_exactly(connection: socket.socket, size: int) -> bytes | None:
+    """Returns exactly `size` bytes, or None if the connection was closed before"""
+    data = b""
+    while len(data) < size:
+        chunk = connection.recv(size - len(data))
+        if chunk == b"":
+            return None
+        data += chunk
+    return data
+
+
+def _exit_code(code: object) -> int:
+    """Converts the code of a SystemExit to an exit code, like the python interpreter does"""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+# ##########
+# SERVER
+# ##########
+def serve(socket_path: str, handle_request: Callable[[list[str]], None]):
+    """Listens on `socket_path` and runs `handle_request(argv)` in a forked child for every request of the user that
+    runs the server. Raises FileExistsError if another server already listens on `socket_path`, and PermissionError if
+    `socket_path` is a file that is not a socket of the user, or if the directory of the default socket path can be
+    accessed by other users."""
+    if socket_path == DEFAULT_SOCKET_PATH:
+        make_private_directory(os.path.dirname(socket_path))
+    try:
+        socket_stat = os.lstat(socket_path)
+    except FileNotFoundError:
+        pass
+    else:
+        if not stat.S_ISSOCK(socket_stat.st_mode) or socket_stat.st_uid != os.getuid():
+            raise PermissionError(f"'{socket_path}' already exists and is not one of your sockets")
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                probe.connect(socket_path)
+        except OSError:  # nobody listens: this is a socket left by a server that was killed
+            os.remove(socket_path)
+        else:
+            raise FileExistsError(f"a server is already listening on '{socket_path}'")
+
+    # the children are never waited for, so we let the kernel reap them
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    # `kill` stops the server cleanly (the socket file is removed)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    bound = False
+    try:
+        old_umask = os.umask(0o077)  # only the user can connect to the socket
+        try:
+            server_socket.bind(socket_path)
+        finally:
+            os.umask(old_umask)
+        bound = True
+        server_socket.listen()
+        while True:
+            connection, _ = server_socket.accept()
+            uid = peer_uid(connection)
+            if uid != os.getuid():
+                print(f"[nougaro] refused a connection from the user {uid}.", file=sys.stderr)
+                connection.close()
+                continue
+            sys.stdout.flush()
+            sys.stderr.flush()
+            if os.fork() == 0:  # child
+                server_socket.close()
+                # the child may need to wait for its own subprocesses
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                try:
+                    _run_request(connection, handle_request)
+                finally:
+                    os._exit(0)
+            connection.close()
+    finally:
+        server_socket.close()
+        if bound and os.path.exists(socket_path):
+            os.remove(socket_path)
+
+
+def _forward_output(read_fd: int, connection: socket.socket):
+    """Sends everything written in the pipe to the client, until the pipe is closed"""
+    connected = True
+    while True:
+        data = os.read(read_fd, READ_SIZE)
+        if data == b"":
+            break
+        if connected:
+            try:
+                connection.sendall(_frame(OUTPUT_FRAME, data))
+            except OSError:  # the client left, but we still have to empty the pipe
+                connected = False
+    os.close(read_fd)
+
+
+def _run_request(connection: socket.socket, handle_request: Callable[[list[str]], None]):
+    """Runs one request in the current (child) process"""
+    request_line = connection.makefile("rb").readline()
+    try:
+        request = json.loads(request_line)
+        argv = [str(arg) for arg in request["argv"]]
+        os.chdir(request["cwd"])
+    except (ValueError, KeyError, TypeError, OSError) as e:
+        message = f"[nougaro] invalid request: {e}\n".encode("UTF-8")
+        connection.sendall(_frame(OUTPUT_FRAME, message) + _frame(EXIT_FRAME, (1).to_bytes(4, "big", signed=True)))
+        return
+
+    # stdout and stderr (including the ones of the subprocesses) are redirected to a pipe forwarded to the client,
+    # and there is no stdin: `input()` gets an EOF
+    read_fd, write_fd = os.pipe()
+    os.dup2(write_fd, 1)
+    os.dup2(write_fd, 2)
+    os.close(write_fd)
+    null_fd = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(null_fd, 0)
+    os.close(null_fd)
+    forwarder = threading.Thread(target=_forward_output, args=(read_fd, connection))
+    forwarder.start()
+
+    exit_code = 0
+    try:
+        handle_request(argv)
+    except SystemExit as e:
+        exit_code = _exit_code(e.code)
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.close(1)
+    os.close(2)
+    forwarder.join()
+    try:
+        connection.sendall(_frame(EXIT_FRAME, exit_code.to_bytes(4, "big", signed=True)))
+    except OSError:
+        pass
+    connection.close()
+
+
+# ##########
+# CLIENT
+# ##########
+def send_request(argv: list[str], socket_path: str = DEFAULT_SOCKET_PATH, cwd: str | None = None,
+                 output: BinaryIO | None = None) -> int:
+    """Sends `argv` to the server, writes its output in `output` (default: stdout) and returns the exit code.
+    Raises OSError if there is no server listening on `socket_path`, and PermissionError if the server is run by
+    another user."""
+    if output is None:
+        output = sys.stdout.buffer
+    if cwd is None:
+        cwd = os.getcwd()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        if peer_uid(connection) != os.getuid():
+            raise PermissionError(f"the server listening on '{socket_path}' is run by another user")
+        connection.sendall(json.dumps({"argv": argv, "cwd": cwd}).encode("UTF-8") + b"\n")
+        while True:
+            header = _receive_exactly(connection, HEADER_SIZE)
+            if header is None:
+                output.write(b"[nougaro] the server closed the connection.\n")
+                return 1
+            data = _receive_exactly(connection, int.from_bytes(header[1:], "big"))
+            if data is None:
+                output.write(b"[nougaro] the server closed the connection.\n")
+                return 1
+            if header[:1] == EXIT_FRAME:
+                return int.from_bytes(data, "big", signed=True)
+            output.write(data)
+            output.flush()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+from src.runtime.values.functions.generator import Generator, GeneratorFrame
+# other tests files imports
+# python imports
+import gc
+import os
+import threading
+import unittest
+import weakref
+
+GENERATOR = "def generator_test_function()\n" \
+            "    yield 1\n" \
+            "    yield 2\n" \
+            "    var x = 1 / 0\n" \
+            "end\n"
+ABANDON = "for i = 0 to 3000 then\n" \
+          "    var generator_test_value = generator_test_function()\n" \
+          "    for x in generator_test_value then break\n" \
+          "end\n"
+# the generator is stored in a local variable of the function, that its own body can access
+ABANDON_IN_FUNCTION = "def abandon_test_function()\n" \
+                      "    var generator_test_value = generator_test_function()\n" \
+                      "    for x in generator_test_value then break\n" \
+                      "end\n" \
+                      "for i = 0 to 3000 then abandon_test_function()\n"
+
+
+def count_frames() -> int:
+    """Returns the number of paused generator bodies that are still in memory"""
+    gc.collect()
+    return sum(isinstance(object_, GeneratorFrame) for object_ in gc.get_objects())
+
+
+class TestGenerator(unittest.TestCase):
+    def test_errors(self):
+        noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+        session = src.nougaro.Session(noug_dir)
+        _, error = session.run(GENERATOR)
+        self.assertIsNone(error)
+
+        # the error of the body is given to the loop that iterates over the generator
+        _, error = session.run("for x in generator_test_function() then x")
+        assert error is not None
+        self.assertIn("division by zero", error.as_string())
+
+        # a generator whose body iterates over the generator itself
+        _, error = session.run("def self_iterating_test_function()\n"
+                               "    for x in generator_test_value then yield x\n"
+                               "end\n"
+                               "var generator_test_value = self_iterating_test_function()\n"
+                               "list(generator_test_value)")
+        assert error is not None
+        self.assertIn("is already running", error.as_string())
+
+        _, error = session.run("yield 1")
+        assert error is not None
+        self.assertIn("'yield' outside of a function", error.as_string())
+
+    def test_abandoned_generators(self):
+        noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+        session = src.nougaro.Session(noug_dir)
+        _, error = session.run(GENERATOR)
+        self.assertIsNone(error)
+        thread_count = threading.active_count()
+        # frames of other tests may be freed in the meantime, as values keep the context they were last accessed from
+        frame_count = count_frames()
+
+        # a paused generator can be resumed while a variable refers to it...
+        _, error = session.run("var generator_test_value = generator_test_function()\n"
+                               "for x in generator_test_value then break")
+        self.assertIsNone(error)
+        value, error = session.run("generator_test_value")
+        self.assertIsNone(error)
+        frame = weakref.ref(value.elements[0].frame)
+        del value
+        value, error = session.run("for x in generator_test_value then x")
+        assert error is not None
+        self.assertIn("division by zero", error.as_string())  # after 2
+        # ... and is freed with its last reference
+        _, error = session.run("var generator_test_value = 0")
+        self.assertIsNone(error)
+        gc.collect()
+        self.assertIsNone(frame())
+
+        # the value of a loop at the top level keeps the generators abandoned by the loop until it is deleted
+        value, error = session.run(ABANDON)
+        self.assertIsNone(error)
+        self.assertEqual(threading.active_count(), thread_count)
+        del value
+        _, error = session.run("var generator_test_value = 0")
+        self.assertIsNone(error)
+        self.assertLessEqual(count_frames(), frame_count)
+
+        # generators that their own body can access are freed too. Only the last one may be kept a bit longer: accessing
+        # `generator_test_function` sets its context to the context of the last call of `abandon_test_function`
+        value, error = session.run(ABANDON_IN_FUNCTION)
+        self.assertIsNone(error)
+        self.assertEqual(threading.active_count(), thread_count)
+        del value
+        self.assertLessEqual(count_frames(), frame_count + 1)
+
+    def test_interruption(self):
+        noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+        session = src.nougaro.Session(noug_dir)
+        _, error = session.run(GENERATOR + "var generator_test_value = generator_test_function()")
+        self.assertIsNone(error)
+        value, error = session.run("generator_test_value")
+        self.assertIsNone(error)
+        generator = value.elements[0]
+        assert isinstance(generator, Generator)
+
+        def interrupted_body():
+            raise KeyboardInterrupt
+            yield
+
+        # ^C while the body runs: the generator is over and is not running any more
+        generator.frame.body = interrupted_body()
+        with self.assertRaises(KeyboardInterrupt):
+            generator.frame.next_()
+        self.assertFalse(generator.frame.running)
+        self.assertEqual(generator.frame.next_(), (None, None))
+        value, error = session.run("list(generator_test_value)")
+        self.assertIsNone(error)
+        self.assertEqual(value.elements[0].to_python_str(), "[]")
@@ -47,3 +47,9 @@ class TestLexer(unittest.TestCase):
         self.assertTrue(tokens[2].matches(TT["KEYWORD"], "assert"))
         self.assertTrue(tokens[3].matches(TT["IDENTIFIER"], "True"))
         self.assertEqual(tokens[4].type, TT["EOF"])
+
+    def test_identifiers_are_interned(self):
+        lx = src.lexer.lexer.Lexer("", "var some_name = some_name")
+        tokens, error = lx.make_tokens()
+        self.assertIsNone(error)
+        self.assertIs(tokens[1].value, tokens[3].value)
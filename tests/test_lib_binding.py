@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+from lib_.lib_to_make_libs import ARG_TYPES
+from lib_ import _conffiles_, math_, unicodedata_
+from src.noug_version import OLDEST_LIB_VERSION
+from src.runtime.values.basevalues.basevalues import List, NoneValue, Number
+import src.conffiles
+# other tests files imports
+# python imports
+import math
+import os
+import unittest
+
+
+class TestLibBinding(unittest.TestCase):
+    def test_typed_arguments(self):
+        noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+        session = src.nougaro.Session(noug_dir)
+        _, error = session.run("import math\nimport statistics\nimport random\nimport unicodedata")
+        self.assertIsNone(error)
+
+        # the numbers of an unboxed list are given to the function without being copied
+        value, error = session.run("var numbers = [3, 1, 2]\nnumbers")
+        assert isinstance(value, List) and error is None
+        numbers = value.elements[-1]
+        assert isinstance(numbers, List)
+        self.assertIs(ARG_TYPES["list[number]"].bind(numbers), numbers.storage.items)
+
+        value, error = session.run("statistics.median(numbers)")
+        assert isinstance(value, List) and error is None
+        self.assertEqual(value.elements[0].value, 2)
+        value, error = session.run("random.generator() != random.generator()")  # optional param not given
+        assert isinstance(value, List) and error is None
+        self.assertEqual(value.elements[0].value, 1)
+
+        # the error messages are generated from the types of the params
+        _, error = session.run("math.sqrt('a')")
+        assert error is not None
+        self.assertIn("should be ‘number’ or ‘list or array’, got ‘str’ instead", error.details)
+        _, error = session.run("statistics.mean([1, 'a'])")
+        assert error is not None
+        self.assertIn("must only contain numbers, but found an element of type 'str'", error.details)
+        _, error = session.run("math.gcd(array([1.5]), 2)")
+        assert error is not None
+        self.assertIn("must only contain ints, but found an element of type 'float'", error.details)
+        _, error = session.run("random.randints(1, 6, 2.5)")
+        assert error is not None
+        self.assertIn("third argument of builtin function ‘random.randints’ should be ‘int’", error.details)
+
+        # a default value is the same as an optional argument that is not given
+        value, error = session.run("statistics.quantiles([1, 2, 3, 4], <default>, 'inclusive')")
+        assert isinstance(value, List) and error is None
+        self.assertEqual([number.value for number in value.elements[0].elements], [1.75, 2.5, 3.25])
+        self.assertIsInstance(value.elements[0].elements[0], Number)
+
+    def test_lazy_tables(self):
+        noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+        session = src.nougaro.Session(noug_dir)
+        _, error = session.run("import unicodedata\nimport math")
+        self.assertIsNone(error)
+
+        # the functions are created when they are used for the first time, then they are cached
+        self.assertNotIn("is_normalized", unicodedata_.WHAT_TO_IMPORT.values)
+        self.assertIn("is_normalized", unicodedata_.WHAT_TO_IMPORT)
+        value, error = session.run("unicodedata.is_normalized('NFC', 'a')")
+        assert isinstance(value, List) and error is None
+        self.assertEqual(value.elements[0].value, 1)
+        function = unicodedata_.WHAT_TO_IMPORT.values["is_normalized"]
+        self.assertIs(unicodedata_.WHAT_TO_IMPORT["is_normalized"], function)
+        self.assertEqual(list(math_.WHAT_TO_IMPORT)[:5], ["pi", "tau", "sqrt_pi", "sqrt_tau", "e"])
+
+        # the attributes set on a module are not set in the table of the lib, nor in the other modules
+        value, error = session.run("var math.pi = 3\nmath.pi\nimport math as other_math\nother_math.pi")
+        assert isinstance(value, List) and error is None
+        self.assertEqual(value.elements[1].value, 3)
+        self.assertEqual(value.elements[-1].value, math.pi)
+        _, error = session.run("math.does_not_exist")
+        assert error is not None
+        self.assertIn("has no attribute 'does_not_exist'", error.details)
+
+    def test_version_4_lib(self):
+        noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+        session = src.nougaro.Session(noug_dir)
+        # _conffiles is a version 4 lib: its table is a plain dict, and its functions read their arguments in the
+        # symbol table
+        self.assertEqual(_conffiles_.__LIB_VERSION__, OLDEST_LIB_VERSION)
+        self.assertIs(type(_conffiles_.WHAT_TO_IMPORT), dict)
+        value, error = session.run(
+            "import _conffiles\n"
+            "_conffiles.CONFIG_DIRECTORY\n"
+            "_conffiles.access_data('file that does not exist in the test', True)"
+        )
+        assert isinstance(value, List) and error is None
+        self.assertEqual(value.elements[1].value, src.conffiles.CONFIG_DIRECTORY)
+        self.assertIsInstance(value.elements[2], NoneValue)
+        _, error = session.run("_conffiles.access_data(1)")
+        assert error is not None
+        self.assertIn("first argument of builtin function ‘_conffiles.access_data’ should be ‘str’", error.details)
+
+        # the attributes set on the module are not set in the table of the lib
+        value, error = session.run("var _conffiles.CONFIG_DIRECTORY = 1\n_conffiles.CONFIG_DIRECTORY")
+        assert isinstance(value, List) and error is None
+        self.assertEqual(value.elements[-1].value, 1)
+        self.assertIs(_conffiles_.WHAT_TO_IMPORT["CONFIG_DIRECTORY"], _conffiles_.CONFIG_DIRECTORY)
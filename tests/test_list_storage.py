@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+from src.lexer.position import DEFAULT_POSITION
+from src.runtime.values.basevalues.basevalues import Number, String, List, NoneValue, hash_key
+# other tests files imports
+# python imports
+import os
+import unittest
+
+
+def _number(value: int | float) -> Number:
+    return Number(value, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
+
+
+class TestListStorage(unittest.TestCase):
+    def test_strategies(self):
+        list_ = List([_number(1), _number(2.5)], DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
+        self.assertIs(list_.storage.strategy, Number)
+        self.assertEqual(list_.storage.items, [1, 2.5])
+        self.assertIsInstance(list_[1], Number)
+        self.assertEqual(list_[1].value, 2.5)
+
+        # a copy shares the storage, even when it switches to the generic strategy
+        copy = list_.copy()
+        copy.append_element(_number(3))
+        self.assertEqual(list_.storage.items, [1, 2.5, 3])
+        copy.append_element(String("a", DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()))
+        self.assertIsNone(list_.storage.strategy)
+        self.assertEqual(list_.__repr__(), '[1, 2.5, 3, "a"]')
+
+        # an empty list takes the strategy of its first element
+        empty = List([], DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
+        empty.append_element(String("a", DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()))
+        self.assertIs(empty.storage.strategy, String)
+        self.assertTrue(empty.storage.contains(String("a", DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())))
+        self.assertFalse(empty.storage.contains(_number(1)))
+
+        generic = List([_number(1), NoneValue(DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())],
+                       DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
+        self.assertIsNone(generic.storage.strategy)
+        self.assertIsNone(generic.storage.contains(_number(1)))
+        self.assertTrue(generic.contains(_number(1.0)))
+
+    def test_equality_and_keys(self):
+        ints = List([_number(1), _number(2)], DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
+        boxed = List([_number(1), _number(2), NoneValue(DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())],
+                     DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
+        boxed.pop_element(-1)
+        self.assertIsNone(boxed.storage.strategy)
+        self.assertTrue(ints.is_eq(boxed) and boxed.is_eq(ints))
+        self.assertEqual(hash_key(ints), hash_key(boxed))
+        nested = List([ints, boxed], DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
+        self.assertTrue(nested.contains(boxed))
+
+        # the key of an unboxed list is cached until the list changes
+        key = hash_key(ints)
+        self.assertIs(hash_key(ints), key)
+        ints.append_element(_number(3))
+        self.assertNotEqual(hash_key(ints), key)
+        self.assertFalse(ints.is_eq(boxed))
+        self.assertNotEqual(hash_key(nested), hash_key(List([boxed, boxed], DEFAULT_POSITION.copy(),
+                                                            DEFAULT_POSITION.copy())))
+
+    def test_builtins_on_unboxed_strs(self):
+        noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+        session = src.nougaro.Session(noug_dir)
+        # the strs of the list are stored unboxed: the error is reported on the boxed element
+        for code in ('sum(["a"])', 'sum(["a", "b"])', 'sum([1, "a"])'):
+            value, error = session.run(code)
+            self.assertIsNone(value)
+            assert error is not None
+            self.assertIn("must be an iterable of numbers, but found an element of type ‘str’", error.details)
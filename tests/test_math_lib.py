@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+# other tests files imports
+# python imports
+import os
+import unittest
+
+
+class TestMathLib(unittest.TestCase):
+    def test_math_errors(self):
+        noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+        session = src.nougaro.Session(noug_dir)
+        _, error = session.run("import math")
+        self.assertIsNone(error)
+
+        # numbers and lists of numbers give the same errors
+        for call in ("math.sqrt(10 ^ 400)", "math.sqrt([10 ^ 400])", "math.sin(10 ^ 400)", "math.degrees(10 ^ 400)",
+                     "math.root(10 ^ 400, 3)", "math.atan([1, 10 ^ 400])"):
+            _, error = session.run(call)
+            assert error is not None, call
+            self.assertEqual(error.error_name, "OverflowError", call)
+            self.assertIn("int too large to convert to float", error.details, call)
+        for call in ("math.root(8, 0)", "math.root([8], 0)"):
+            _, error = session.run(call)
+            assert error is not None, call
+            self.assertEqual(error.error_name, "ArithmeticError", call)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+import src.lexer.lexer
+import src.parser.parser
+import src.parser.nodes
+from src.parser.optimizer import Optimizer
+# other tests files imports
+# python imports
+import unittest
+
+
+def optimize(code: str) -> src.parser.nodes.Node:
+    """Returns the first optimized statement of `code`."""
+    tokens, error = src.lexer.lexer.Lexer("<test>", code).make_tokens()
+    assert error is None and tokens is not None
+    ast = src.parser.parser.Parser(tokens).parse()
+    assert ast.error is None and ast.node is not None
+    node = Optimizer().optimize(ast.node)
+    assert isinstance(node, src.parser.nodes.ListNode)
+    return node.element_nodes[0][0]
+
+
+class TestOptimizer(unittest.TestCase):
+    def test_constant_folding(self):
+        node = optimize("1 + 2 * 3")
+        self.assertIsInstance(node, src.parser.nodes.NumberNode)
+        self.assertEqual(node.token.value, 7)
+        # the folded node keeps the positions of the whole expression
+        self.assertEqual(node.pos_start.index, 0)
+        self.assertEqual(node.pos_end.index, 9)
+
+        node = optimize("-(\"a\" * 2 == \"aa\")")
+        self.assertIsInstance(node, src.parser.nodes.NumberNode)
+        self.assertEqual(node.token.value, -1)
+
+        # errors are kept for runtime, and non-constant expressions are not folded
+        self.assertIsInstance(optimize("1 / 0"), src.parser.nodes.BinOpNode)
+        self.assertIsInstance(optimize("1 + a"), src.parser.nodes.BinOpNode)
+        self.assertIsInstance(optimize("2 ^ 100000"), src.parser.nodes.BinOpNode)
+
+    def test_dead_branch_elimination(self):
+        node = optimize("if 0 then a elif 1 - 1 then b elif c then d elif 1 then e else f")
+        self.assertIsInstance(node, src.parser.nodes.IfNode)
+        self.assertEqual(len(node.cases), 1)
+        self.assertEqual(node.cases[0][0].var_name_tokens_list[0].value, "c")
+        self.assertEqual(node.else_case.var_name_tokens_list[0].value, "e")
+
+        node = optimize("if 0 then a else b")
+        self.assertIsInstance(node, src.parser.nodes.VarAccessNode)
+        self.assertEqual(node.var_name_tokens_list[0].value, "b")
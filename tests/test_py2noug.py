@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+from src.lexer.position import DEFAULT_POSITION
+from src.runtime.values.basevalues.basevalues import Dict, List, Number, String, Value
+from src.runtime.values.tools.py2noug import py2noug, noug2py
+# other tests files imports
+# python imports
+import collections
+import unittest
+
+
+class TestPy2Noug(unittest.TestCase):
+    def test_conversions(self):
+        dict_to_compare_with = Dict({}, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
+        dict_to_compare_with.set(
+            String("a", DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()),
+            List([
+                String("b", DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()),
+                Number(12, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
+            ], DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
+        )
+        dict_to_compare_with.set(
+            Number(13, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()),
+            String("c", DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy())
+        )
+        comparison, error = py2noug({"a": ["b", 12], 13: "c"}).get_comparison_eq(dict_to_compare_with)
+        assert comparison is not None and error is None
+        self.assertTrue(comparison.is_true())
+
+        python_value = {"a": [1, "b", None], (1, (2,)): {3, 4}, "c": collections.deque([[5.5], True]), "d": []}
+        self.assertEqual(noug2py(py2noug(python_value)), {
+            "a": [1, "b", None], (1, (2,)): {3, 4}, "c": collections.deque([[5.5], True]), "d": []
+        })
+        # values that can not be keys in Nougaro
+        self.assertIs(type(py2noug({frozenset([1]): 2})), Value)
+        self.assertIs(type(py2noug({1: object()}).get(py2noug(1))), Value)
+
+    def test_deep_and_shared_values(self):
+        nested: list = []
+        for _ in range(10**5):  # far more than the recursion limit
+            nested = [nested]
+        converted = py2noug(nested)
+        self.assertIsInstance(converted, List)
+        depth = 0
+        python_value = noug2py(converted)
+        while python_value:
+            python_value = python_value[0]
+            depth += 1
+        self.assertEqual(depth, 10**5)
+
+        # a container that appears several times is converted once
+        shared = [1, [2]]
+        converted = py2noug([shared, shared, (shared,)])
+        assert isinstance(converted, List)
+        self.assertIs(converted[0], converted[1])
+        self.assertIs(converted[2][0], converted[0])
+        python_value = noug2py(converted)
+        self.assertIs(python_value[0], python_value[1])
+
+        # but tuples become lists, that can be changed: every occurrence is converted on its own
+        converted = py2noug(((), ()))
+        assert isinstance(converted, List)
+        self.assertIsNot(converted[0], converted[1])
+        row = (0, 0)
+        converted = py2noug([row] * 3 + [(row, [1, 2])] * 2)
+        assert isinstance(converted, List)
+        converted[0].append_element(Number(1, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()))
+        converted[3][0].append_element(Number(1, DEFAULT_POSITION.copy(), DEFAULT_POSITION.copy()))
+        self.assertEqual(noug2py(converted), [[0, 0, 1], [0, 0], [0, 0], [[0, 0, 1], [1, 2]], [[0, 0], [1, 2]]])
+
+        # a list that contains itself
+        cycle: list = []
+        cycle.append(cycle)
+        converted = py2noug(cycle)
+        assert isinstance(converted, List)
+        self.assertIs(converted[0], converted)
+        python_value = noug2py(converted)
+        self.assertIs(python_value[0], python_value)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+import src.server
+# other tests files imports
+# python imports
+import io
+import os
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+
+@unittest.skipUnless(src.server.is_available(), "the server needs Unix sockets and fork")
+class TestServer(unittest.TestCase):
+    def test_server_runs_requests_in_isolation(self):
+        noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+        with tempfile.TemporaryDirectory() as directory:
+            socket_path = os.path.join(directory, "nougaro.sock")
+            server = subprocess.Popen(
+                [sys.executable, os.path.join(noug_dir, "shell.py"), "--server", socket_path],
+                stdout=subprocess.DEVNULL
+            )
+            try:
+                deadline = time.monotonic() + 30
+                while not os.path.exists(socket_path):
+                    self.assertLess(time.monotonic(), deadline, "the server did not start")
+                    time.sleep(0.01)
+
+                # only the user can connect to the socket
+                self.assertEqual(stat.S_IMODE(os.stat(socket_path).st_mode) & 0o077, 0)
+
+                output = io.BytesIO()
+                exit_code = src.server.send_request(["-c", "var server_test_value = 40; server_test_value + 2"],
+                                                    socket_path, output=output)
+                self.assertEqual(exit_code, 0)
+                self.assertEqual(output.getvalue(), b"[40, 42]\n")
+
+                # every request starts from the state of the server, not from the one of the previous request
+                output = io.BytesIO()
+                exit_code = src.server.send_request(["-d", "print(server_test_value)"], socket_path, output=output)
+                self.assertEqual(exit_code, 1)
+                self.assertIn(b"NotDefinedError", output.getvalue())
+
+                self.assertEqual(src.server.send_request(["-d", "exit(4)"], socket_path, output=io.BytesIO()), 4)
+            finally:
+                server.terminate()
+                server.wait()
+            self.assertFalse(os.path.exists(socket_path))
+
+    def test_socket_path_checks(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # a file that is not a socket is never replaced by the socket of the server
+            file_path = os.path.join(directory, "nougaro.sock")
+            with open(file_path, "w") as file:
+                file.write("not a socket")
+            with self.assertRaises(PermissionError):
+                src.server.serve(file_path, lambda argv: None)
+            self.assertTrue(os.path.isfile(file_path))
+
+            # the directory of the default socket path is created for the user only...
+            private_directory = os.path.join(directory, "private")
+            src.server.make_private_directory(private_directory)
+            self.assertEqual(stat.S_IMODE(os.stat(private_directory).st_mode), 0o700)
+            src.server.make_private_directory(private_directory)
+            # ... and is refused if other users can access it
+            os.chmod(private_directory, 0o755)
+            with self.assertRaises(PermissionError):
+                src.server.make_private_directory(private_directory)
+
+    def test_peer_uid(self):
+        first, second = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        with first, second:
+            self.assertEqual(src.server.peer_uid(first), os.getuid())
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+import src.nougaro
+from src.runtime.values.basevalues.basevalues import Number, List, String, SymbolTableDump
+# other tests files imports
+# python imports
+import os
+import unittest
+
+
+class TestSession(unittest.TestCase):
+    def test_session_remembers_values(self):
+        noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+        session = src.nougaro.Session(noug_dir)
+
+        value, error = session.run("var session_test_value = 20")
+        self.assertIsNone(error)
+        value, error = session.run("def session_test_function(x) -> x + session_test_value")
+        self.assertIsNone(error)
+        value, error = session.run("session_test_function(22)")
+        self.assertIsNone(error)
+        assert isinstance(value, List)
+        self.assertIsInstance(value.elements[0], Number)
+        self.assertEqual(value.elements[0].value, 42)
+
+        value, error = session.run("'session_test_value' in __symbol_table__")
+        self.assertIsNone(error)
+        assert isinstance(value, List)
+        self.assertEqual(value.elements[0].value, 1)
+
+        value, error = session.run("undefined_variable_in_session_test")
+        self.assertIsNone(value)
+        self.assertIsNotNone(error)
+
+    def test_symbol_table_dump(self):
+        noug_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+        session = src.nougaro.Session(noug_dir)
+        value, error = session.run("__symbol_table__")
+        self.assertIsNone(error)
+        assert isinstance(value, List)
+        dump = value.elements[0]
+        assert isinstance(dump, SymbolTableDump)
+
+        # the dump is computed when it is used...
+        _, error = session.run("var session_test_dump_value = 1")
+        self.assertIsNone(error)
+        self.assertIn("session_test_dump_value", dump.value)
+        copy = dump.copy()
+        self.assertIsInstance(copy, String)
+        self.assertEqual(copy.value, dump.value)
+        # ... and can be assigned like the value of any str
+        dump.value = "assigned"
+        self.assertEqual(dump.to_python_str(), "assigned")
+        _, error = session.run("var session_test_dump_value = 2")
+        self.assertIsNone(error)
+        self.assertEqual(dump.value, "assigned")
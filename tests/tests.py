@@ -11,6 +11,14 @@
 # nougaro modules imports
 # other tests files imports
 from tests.test_lexer import TestLexer
+from tests.test_optimizer import TestOptimizer
+from tests.test_session import TestSession
+from tests.test_server import TestServer
+from tests.test_list_storage import TestListStorage
+from tests.test_generator import TestGenerator
+from tests.test_math_lib import TestMathLib
+from tests.test_lib_binding import TestLibBinding
+from tests.test_py2noug import TestPy2Noug
 # python imports
 import sys
 import unittest
@@ -20,6 +28,26 @@ def suite():
     s = unittest.TestSuite()
     s.addTest(TestLexer('test_invalid_char'))
     s.addTest(TestLexer('test_identifiers_and_keywords'))
+    s.addTest(TestLexer('test_identifiers_are_interned'))
+    s.addTest(TestOptimizer('test_constant_folding'))
+    s.addTest(TestOptimizer('test_dead_branch_elimination'))
+    s.addTest(TestSession('test_session_remembers_values'))
+    s.addTest(TestSession('test_symbol_table_dump'))
+    s.addTest(TestServer('test_server_runs_requests_in_isolation'))
+    s.addTest(TestServer('test_socket_path_checks'))
+    s.addTest(TestServer('test_peer_uid'))
+    s.addTest(TestListStorage('test_strategies'))
+    s.addTest(TestListStorage('test_equality_and_keys'))
+    s.addTest(TestListStorage('test_builtins_on_unboxed_strs'))
+    s.addTest(TestGenerator('test_errors'))
+    s.addTest(TestGenerator('test_abandoned_generators'))
+    s.addTest(TestGenerator('test_interruption'))
+    s.addTest(TestMathLib('test_math_errors'))
+    s.addTest(TestLibBinding('test_typed_arguments'))
+    s.addTest(TestLibBinding('test_lazy_tables'))
+    s.addTest(TestLibBinding('test_version_4_lib'))
+    s.addTest(TestPy2Noug('test_conversions'))
+    s.addTest(TestPy2Noug('test_deep_and_shared_values'))
     return s
 
 